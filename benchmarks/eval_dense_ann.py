@@ -0,0 +1,171 @@
+"""Dense-leg search benchmark: recall vs latency of ``TG_DENSE_INDEX=ivf`` against the exact path.
+
+Builds a synthetic clustered corpus of unit vectors (code embeddings cluster by topic, which is
+what makes a coarse quantizer work at all), wraps it in a real :class:`DenseIndex` through a stub
+encoder, and for each mode measures per-query latency and recall@k against the exact top-k. The
+pre-``argpartition`` full Python sort is timed too, as the baseline the exact path replaced.
+
+Run:
+    python benchmarks/eval_dense_ann.py [--chunks 200000] [--dim 256] [--queries 50] [--top-k 10]
+        [--nprobe-sweep 8,64]
+Exit 0 if ivf recall@k >= IVF_GATE_RECALL, else 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from tensor_grep.core import retrieval_dense
+from tensor_grep.core.retrieval_chunker import Chunk
+from tensor_grep.core.retrieval_dense import DenseIndex
+
+IVF_GATE_RECALL: float = 0.90
+_MODE_ENV = retrieval_dense.DENSE_INDEX_ENV_VAR
+_NPROBE_ENV = "TG_DENSE_IVF_NPROBE"
+
+
+class _LookupModel:
+    """Encodes ``"c<i>"`` / ``"q<i>"`` to the i-th precomputed corpus / query vector."""
+
+    def __init__(self, corpus: np.ndarray, queries: np.ndarray) -> None:
+        self._vectors = {"c": corpus, "q": queries}
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        return np.stack([self._vectors[text[0]][int(text[1:])] for text in texts])
+
+
+@dataclass(frozen=True)
+class ModeResult:
+    mode: str
+    nprobe: int | None
+    build_ms: float
+    query_ms: float
+    recall_at_k: float
+
+
+def synthetic_corpus(
+    chunks: int, dim: int, queries: int, *, clusters: int = 1024, seed: int = 7
+) -> tuple[np.ndarray, np.ndarray]:
+    """``chunks`` clustered unit vectors plus ``queries`` noisy copies of random corpus rows."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    corpus = centers[rng.integers(0, clusters, size=chunks)]
+    corpus += 1.0 * rng.standard_normal((chunks, dim)).astype(np.float32)
+    picks = rng.integers(0, chunks, size=queries)
+    query_vectors = corpus[picks] + 0.8 * rng.standard_normal((queries, dim)).astype(np.float32)
+    return corpus, query_vectors
+
+
+def _legacy_query(index: DenseIndex, text: str, top_k: int) -> list[tuple[int, float]]:
+    query_matrix = retrieval_dense._encode_matrix(index.model, [text])
+    query_vec = retrieval_dense._l2_normalize(query_matrix)[0]
+    scores = index._matrix @ query_vec
+    return sorted(enumerate(scores.tolist()), key=lambda item: (-item[1], item[0]))[:top_k]
+
+
+def run_eval(
+    corpus: np.ndarray,
+    query_vectors: np.ndarray,
+    *,
+    top_k: int = 10,
+    nprobes: Sequence[int | None] = (None,),
+) -> tuple[float, list[ModeResult]]:
+    """Legacy full-sort ms/query, then one :class:`ModeResult` for exact and one per ``nprobes``
+    entry for ivf (``None`` = the default ``TG_DENSE_IVF_NPROBE``)."""
+    model = _LookupModel(corpus, query_vectors)
+    chunks = [
+        Chunk(file_path=f"c{i}", start_line=1, end_line=1, text=f"c{i}") for i in range(len(corpus))
+    ]
+    texts = [f"q{i}" for i in range(len(query_vectors))]
+    index = DenseIndex(chunks, model)
+    saved = {name: os.environ.get(name) for name in (_MODE_ENV, _NPROBE_ENV)}
+
+    started = time.perf_counter()
+    for text in texts:
+        _legacy_query(index, text, top_k)
+    legacy_ms = (time.perf_counter() - started) * 1000.0 / len(texts)
+
+    results: list[ModeResult] = []
+    truth: list[set[int]] = []
+    try:
+        for mode, nprobe in [("exact", None), *(("ivf", nprobe) for nprobe in nprobes)]:
+            os.environ[_MODE_ENV] = mode
+            if nprobe is None:
+                os.environ.pop(_NPROBE_ENV, None)
+            else:
+                os.environ[_NPROBE_ENV] = str(nprobe)
+            started = time.perf_counter()
+            if index.mode == "ivf":
+                index._ivf_index()
+            build_ms = (time.perf_counter() - started) * 1000.0
+            started = time.perf_counter()
+            ranked = [
+                [chunk_id for chunk_id, _ in index.query(text, top_k=top_k)] for text in texts
+            ]
+            query_ms = (time.perf_counter() - started) * 1000.0 / len(texts)
+            if not truth:
+                truth = [set(ids) for ids in ranked]
+            recall = sum(
+                len(expected & set(ids)) / max(1, len(expected))
+                for expected, ids in zip(truth, ranked, strict=True)
+            ) / len(texts)
+            effective = None
+            if index.mode == "ivf":
+                effective = retrieval_dense._ivf_nprobe(index._ivf_index().n_lists)
+            results.append(ModeResult(index.mode, effective, build_ms, query_ms, recall))
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+    return legacy_ms, results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Dense-leg exact vs IVF recall/latency benchmark")
+    parser.add_argument("--chunks", type=int, default=200_000, help="corpus size (rows)")
+    parser.add_argument("--dim", type=int, default=256, help="embedding width")
+    parser.add_argument("--queries", type=int, default=50, help="queries to average over")
+    parser.add_argument("--top-k", type=int, default=10, help="rank cutoff for recall")
+    parser.add_argument(
+        "--nprobe-sweep",
+        default="8,64",
+        help="extra comma-separated TG_DENSE_IVF_NPROBE values to report after the default",
+    )
+    args = parser.parse_args(argv)
+
+    sweep = [int(value) for value in args.nprobe_sweep.split(",") if value.strip()]
+    corpus, query_vectors = synthetic_corpus(args.chunks, args.dim, args.queries)
+    legacy_ms, results = run_eval(corpus, query_vectors, top_k=args.top_k, nprobes=[None, *sweep])
+
+    print(
+        f"dense search (chunks={args.chunks}, dim={args.dim}, top_k={args.top_k}, "
+        f"n={args.queries} queries):"
+    )
+    print(f"  legacy full sort  query={legacy_ms:8.2f} ms")
+    for result in results:
+        label = result.mode if result.nprobe is None else f"{result.mode} nprobe={result.nprobe}"
+        print(
+            f"  {label:<17} query={result.query_ms:8.2f} ms  build={result.build_ms:9.1f} ms  "
+            f"recall@k={result.recall_at_k:.3f}"
+        )
+    # Gate the default nprobe -- what TG_DENSE_INDEX=ivf users actually get.
+    ivf = results[1]
+    if ivf.mode != "ivf":
+        print(f"ivf not engaged below {retrieval_dense._IVF_MIN_CHUNKS} chunks; nothing to gate")
+        return 0
+    passed = ivf.recall_at_k >= IVF_GATE_RECALL
+    print(f"ivf gate (recall@k >= {IVF_GATE_RECALL}): {'PASS' if passed else 'FAIL'}")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
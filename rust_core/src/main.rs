@@ -1160,6 +1160,12 @@ pub enum Commands {
         #[arg(trailing_var_arg = true, allow_hyphen_values = true)]
         args: Vec<String>,
     },
+    /// Build and maintain the repository trigram index
+    #[command(name = "index", disable_help_flag = true)]
+    Index {
+        #[arg(trailing_var_arg = true, allow_hyphen_values = true)]
+        args: Vec<String>,
+    },
     /// List GPU devices and routing readiness
     #[command(name = "devices", disable_help_flag = true)]
     Devices {
@@ -7586,6 +7592,7 @@ fn run_command_cli(cli: CommandCli) -> anyhow::Result<()> {
         Commands::ReviewBundle { args } => handle_python_passthrough("review-bundle", args),
         Commands::Evidence { args } => handle_python_passthrough("evidence", args),
         Commands::Ledger { args } => handle_python_passthrough("ledger", args),
+        Commands::Index { args } => handle_python_passthrough("index", args),
         Commands::Devices { args } => handle_python_passthrough("devices", args),
         Commands::Context { args } => handle_python_passthrough("context", args),
         Commands::RouteTest { args } => handle_python_passthrough("route-test", args),
@@ -14530,15 +14537,7 @@ fn handle_sidecar_command(
 }
 
 fn handle_python_passthrough(command: &str, args: Vec<String>) -> anyhow::Result<()> {
-    match execute_python_passthrough_command(command, args) {
-        Ok(exit_code) => {
-            if exit_code != 0 {
-                std::process::exit(exit_code.max(1));
-            }
-            Ok(())
-        }
-        Err(err) => exit_with_sidecar_error(err),
-    }
+    exit_on_python_passthrough_failure(execute_python_passthrough_command(command, args))
 }
 
 fn handle_python_passthrough_with_stdin(
@@ -14546,13 +14545,14 @@ fn handle_python_passthrough_with_stdin(
     args: Vec<String>,
     stdin_bytes: Vec<u8>,
 ) -> anyhow::Result<()> {
-    match execute_python_passthrough_command_with_stdin(command, args, stdin_bytes) {
-        Ok(exit_code) => {
-            if exit_code != 0 {
-                std::process::exit(exit_code.max(1));
-            }
-            Ok(())
-        }
+    let outcome = execute_python_passthrough_command_with_stdin(command, args, stdin_bytes);
+    exit_on_python_passthrough_failure(outcome)
+}
+
+fn exit_on_python_passthrough_failure(outcome: Result<i32, SidecarError>) -> anyhow::Result<()> {
+    match outcome {
+        Ok(0) => Ok(()),
+        Ok(exit_code) => std::process::exit(exit_code.max(1)),
         Err(err) => exit_with_sidecar_error(err),
     }
 }
@@ -304,7 +304,7 @@ def _search_flag_tokens_for_sweep(command: list[str]) -> set[str]:
 # plain-text (`--no-json` is even in the inverse-flag set), and NO tg route writes either JSON key
 # to stderr -- so a JSON-key-only check has a treatment arm that can never fire on the routes this
 # consumer actually runs. The plain-text disclosure is `tg: rg exited 2, keeping partial results:
-# {reason}` (ripgrep_backend.py:143, :324, :443, and the timeout variant at :187), so the sentinel
+# {reason}` (ripgrep_backend.py:159, :539, :658, and the timeout variant at :183), so the sentinel
 # below is the phrase that route really emits.
 _INCOMPLETENESS_MARKERS = (
     "result_incomplete",
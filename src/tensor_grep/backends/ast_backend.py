@@ -4,8 +4,9 @@ import logging
 import os
 import re
 from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, ClassVar, cast
 
 from tensor_grep.backends.base import BackendExecutionError, ComputeBackend
 from tensor_grep.core.config import SearchConfig
@@ -139,6 +140,19 @@ def get_supported_languages() -> list[str]:
     return list(_SUPPORTED_AST_LANGUAGES)
 
 
+@dataclass
+class _FileSearchState:
+    """What one file's searches share: its parse and node-type index, each built at most once."""
+
+    file_path: str
+    lang: str
+    lines: list[str] | None = None
+    tree: Any = None
+    node_type_index: dict[str, list[NodeSpan]] | None = None
+    index_loaded: bool = False
+    index_built: bool = False
+
+
 class AstBackend(ComputeBackend):
     """
     A native, in-process structural-search backend: parses source code into an Abstract Syntax
@@ -723,6 +737,27 @@ class AstBackend(ComputeBackend):
     def search(
         self, file_path: str, pattern: str, config: SearchConfig | None = None
     ) -> SearchResult:
+        lang = self._search_language(file_path, config)
+        return self._search_parsed_file(_FileSearchState(file_path, lang), pattern, config)
+
+    def search_patterns(
+        self, file_path: str, patterns: list[str], config: SearchConfig | None = None
+    ) -> dict[str, SearchResult]:
+        """`search` for several patterns in one file, parsing it and indexing it at most once.
+
+        `tg scan` calls this once per candidate file with the member patterns of every rule routed
+        here, instead of once per (pattern, file). Simple node-type patterns are all answered from
+        one node-type index (a single tree traversal); query patterns run against the same tree.
+        Each value equals what `search(file_path, pattern, config)` returns.
+        """
+        lang = self._search_language(file_path, config)
+        state = _FileSearchState(file_path, lang)
+        return {
+            pattern: self._search_parsed_file(state, pattern, config)
+            for pattern in dict.fromkeys(patterns)
+        }
+
+    def _search_language(self, file_path: str, config: SearchConfig | None) -> str:
         if not self.is_available():
             # Backend Fail-Closed Contract (base.py): a real failure must raise
             # BackendExecutionError, never fall through to a silent-empty result.
@@ -742,7 +777,12 @@ class AstBackend(ComputeBackend):
             lang = config.lang
         elif file_path.endswith(".js") or file_path.endswith(".ts"):
             lang = "javascript"
+        return lang
 
+    def _search_parsed_file(
+        self, state: _FileSearchState, pattern: str, config: SearchConfig | None
+    ) -> SearchResult:
+        file_path, lang = state.file_path, state.lang
         persistent_cached_result = self._load_persistent_cached_result(
             file_path,
             lang,
@@ -754,11 +794,17 @@ class AstBackend(ComputeBackend):
             return self._cap_to_max_count(persistent_cached_result, config)
 
         if self._is_simple_node_type_pattern(pattern):
-            node_type_index = self._load_persistent_node_type_index(file_path, lang)
+            if not state.index_loaded:
+                state.node_type_index = self._load_persistent_node_type_index(file_path, lang)
+                state.index_loaded = True
+            node_type_index = state.node_type_index
             if node_type_index is not None and pattern in node_type_index:
-                lines = self._get_cached_lines(file_path, lang)
+                lines = state.lines
+                if lines is None:
+                    lines = self._get_cached_lines(file_path, lang)
                 if lines is None:
                     lines = Path(file_path).read_text(encoding="utf-8").splitlines()
+                state.lines = lines
                 result = self._build_matches_from_node_spans(
                     file_path,
                     lines,
@@ -777,14 +823,22 @@ class AstBackend(ComputeBackend):
                     return self._cap_to_max_count(result, config)
 
         parser = self._get_parser(lang)
-        _source_bytes, lines, tree = self._get_parsed_source(parser, file_path, lang)
+        if state.tree is None:
+            _source_bytes, state.lines, state.tree = self._get_parsed_source(
+                parser, file_path, lang
+            )
+        lines, tree = cast(list[str], state.lines), state.tree
         if self._is_simple_node_type_pattern(pattern):
-            node_type_index = self._build_node_type_index(tree.root_node)
-            self._persist_node_type_index(file_path, lang, node_type_index)
+            if not state.index_built:
+                # One traversal indexes every node kind, so the remaining simple patterns for
+                # this file are answered from it (and from the in-memory index afterwards).
+                state.node_type_index = self._build_node_type_index(tree.root_node)
+                self._persist_node_type_index(file_path, lang, state.node_type_index)
+                state.index_loaded = state.index_built = True
             result = self._build_matches_from_node_spans(
                 file_path,
                 lines,
-                node_type_index.get(pattern, []),
+                cast(dict[str, list[NodeSpan]], state.node_type_index).get(pattern, []),
                 "ast_structural_index",
             )
             if result.total_matches > 0:
@@ -1,17 +1,24 @@
 import hashlib
-import json
 import logging
 import os
 import re
+import threading
 import time
 import warnings
 from collections import OrderedDict, deque
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import ClassVar
 
 from tensor_grep.backends.base import BackendExecutionError, ComputeBackend
 from tensor_grep.cli.subprocess_policy import configured_ripgrep_timeout_seconds
 from tensor_grep.core.config import SearchConfig
+from tensor_grep.core.line_trigram_index import (
+    MappedLineTrigramIndex,
+    is_racy_signature,
+    line_start_offsets,
+    write_line_trigram_index,
+)
 from tensor_grep.core.result import (
     MatchLine,
     SearchResult,
@@ -32,7 +39,10 @@ _DEFAULT_CPU_LITERAL_INDEX_CACHE_MAX_ENTRIES = 512
 # cancellation) until the source file's mtime/size next changed. `_load_literal_index`
 # rejects any payload whose `format_version` does not match, forcing a transparent
 # recompute (and on-disk overwrite) on first use after upgrade.
-_CPU_LITERAL_INDEX_CACHE_FORMAT_VERSION = 2
+# Bumped 2 -> 3: the on-disk cache moved from pretty-printed JSON (a full copy of `lines` plus
+# the trigram dict) to the mmap-able binary layout in core/line_trigram_index.py, which stores
+# line offsets into the source file instead of the lines themselves.
+_CPU_LITERAL_INDEX_CACHE_FORMAT_VERSION = 3
 
 
 def compute_native_walk_deadline() -> float:
@@ -79,10 +89,14 @@ class CPUBackend(ComputeBackend):
     _shared_literal_index_cache: ClassVar[
         OrderedDict[tuple[str, bool], tuple[tuple[int, int], list[str], dict[str, list[int]]]]
     ] = OrderedDict()
+    # The CLI's per-file executor searches several files concurrently; guards the LRU's
+    # get/move_to_end/pop sequences, which are not atomic as a whole.
+    _shared_literal_index_cache_lock: ClassVar[threading.Lock] = threading.Lock()
 
     @classmethod
     def _clear_shared_caches(cls) -> None:
-        cls._shared_literal_index_cache.clear()
+        with cls._shared_literal_index_cache_lock:
+            cls._shared_literal_index_cache.clear()
 
     @staticmethod
     def _configured_positive_int(env_var: str, default: int) -> int:
@@ -108,10 +122,12 @@ class CPUBackend(ComputeBackend):
         cache_key: tuple[str, bool],
         cache_entry: tuple[tuple[int, int], list[str], dict[str, list[int]]],
     ) -> None:
-        cls._shared_literal_index_cache.pop(cache_key, None)
-        cls._shared_literal_index_cache[cache_key] = cache_entry
-        while len(cls._shared_literal_index_cache) > cls._literal_index_cache_max_entries():
-            cls._shared_literal_index_cache.popitem(last=False)
+        max_entries = cls._literal_index_cache_max_entries()
+        with cls._shared_literal_index_cache_lock:
+            cls._shared_literal_index_cache.pop(cache_key, None)
+            cls._shared_literal_index_cache[cache_key] = cache_entry
+            while len(cls._shared_literal_index_cache) > max_entries:
+                cls._shared_literal_index_cache.popitem(last=False)
 
     @staticmethod
     def _build_file_signature(file_path: str) -> tuple[int, int]:
@@ -168,10 +184,11 @@ class CPUBackend(ComputeBackend):
         # a new reader never opens the old one, no cross-version read in either direction.
         # A pre-#262 `{digest}.json` (no `-vN` suffix) is now permanently orphaned rather
         # than overwritten -- bounded by ordinary cache size, not a leak, and reaping it
-        # would defeat the point (an old reader still using it needs it to stay put).
+        # would defeat the point (an old reader still using it needs it to stay put). The
+        # same holds for the v2 `-v2.json` files left behind by the binary-format switch.
         return (
             cls._get_prefilter_cache_dir()
-            / f"{digest}-v{_CPU_LITERAL_INDEX_CACHE_FORMAT_VERSION}.json"
+            / f"{digest}-v{_CPU_LITERAL_INDEX_CACHE_FORMAT_VERSION}.tgi"
         )
 
     @staticmethod
@@ -221,42 +238,35 @@ class CPUBackend(ComputeBackend):
 
     def _load_literal_index(
         self, file_path: str, ignore_case: bool
-    ) -> tuple[list[str], dict[str, list[int]]] | None:
+    ) -> tuple[Sequence[str], Mapping[str, list[int]]] | None:
+        """In-memory hit -> the built lines/dict; on-disk hit -> an mmap-backed view.
+
+        The on-disk view is a :class:`MappedLineTrigramIndex` (its ``lines`` decode candidate
+        lines from the source file on demand). It is deliberately NOT promoted into the
+        in-memory LRU: every cached view would pin two mapped file descriptors, and re-mapping
+        on the next query costs a header read. Callers close it once the search is done.
+        """
         cache_key = (file_path, ignore_case)
         cache_signature = self._build_file_signature(file_path)
-        cached = self._shared_literal_index_cache.get(cache_key)
-        if cached and cached[0] == cache_signature:
-            self._shared_literal_index_cache.move_to_end(cache_key)
-            return cached[1], cached[2]
-        if cached:
-            self._shared_literal_index_cache.pop(cache_key, None)
+        with self._shared_literal_index_cache_lock:
+            cached = self._shared_literal_index_cache.get(cache_key)
+            if cached and cached[0] == cache_signature:
+                self._shared_literal_index_cache.move_to_end(cache_key)
+                return cached[1], cached[2]
+            if cached:
+                self._shared_literal_index_cache.pop(cache_key, None)
         if not self._is_persistent_prefilter_enabled():
             return None
-        cache_path = self._get_prefilter_cache_path(file_path, ignore_case)
-        if not cache_path.exists():
-            return None
-        try:
-            payload = json.loads(cache_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            return None
-        if payload.get("format_version") != _CPU_LITERAL_INDEX_CACHE_FORMAT_VERSION:
-            # Stale (pre-#262, or any future incompatible) cache -- treat as a miss so the
-            # caller recomputes and overwrites this file with the current format.
-            return None
-        if payload.get("file_signature") != list(cache_signature):
-            return None
-        raw_lines = payload.get("lines")
-        raw_index = payload.get("trigram_index")
-        if not isinstance(raw_lines, list) or not isinstance(raw_index, dict):
+        # A foreign, truncated, or stale (signature mismatch) file opens as None -- a miss, so
+        # the caller recomputes and atomically replaces it with the current format.
+        mapped = MappedLineTrigramIndex.open(
+            self._get_prefilter_cache_path(file_path, ignore_case),
+            source_path=file_path,
+            file_signature=cache_signature,
+        )
+        if mapped is None:
             return None
-        lines = [str(line) for line in raw_lines]
-        trigram_index: dict[str, list[int]] = {}
-        for trigram, values in raw_index.items():
-            if not isinstance(trigram, str) or not isinstance(values, list):
-                return None
-            trigram_index[trigram] = [int(v) for v in values]
-        self._remember_literal_index(cache_key, (cache_signature, lines, trigram_index))
-        return lines, trigram_index
+        return mapped.lines, mapped
 
     def _store_literal_index(
         self,
@@ -264,8 +274,15 @@ class CPUBackend(ComputeBackend):
         ignore_case: bool,
         lines: list[str],
         trigram_index: dict[str, list[int]],
+        *,
+        source_bytes: bytes | None = None,
+        file_signature: tuple[int, int] | None = None,
     ) -> None:
-        cache_signature = self._build_file_signature(file_path)
+        """Cache the index built from ``source_bytes`` under ``file_signature``, the stat taken
+        BEFORE those bytes were read: a write racing the read then leaves a newer stamp on disk,
+        so the next lookup misses instead of trusting the torn read. A racy stamp (see
+        `is_racy_signature`) is kept in memory only, never persisted."""
+        cache_signature = file_signature or self._build_file_signature(file_path)
         self._remember_literal_index(
             (file_path, ignore_case),
             (
@@ -274,24 +291,23 @@ class CPUBackend(ComputeBackend):
                 trigram_index,
             ),
         )
-        if not self._is_persistent_prefilter_enabled():
+        if not self._is_persistent_prefilter_enabled() or is_racy_signature(cache_signature):
             return
-        cache_path = self._get_prefilter_cache_path(file_path, ignore_case)
-        payload = {
-            "format_version": _CPU_LITERAL_INDEX_CACHE_FORMAT_VERSION,
-            "file_signature": list(cache_signature),
-            "lines": lines,
-            "trigram_index": trigram_index,
-        }
         try:
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            cache_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+            if source_bytes is None:
+                source_bytes = Path(file_path).read_bytes()
+            write_line_trigram_index(
+                self._get_prefilter_cache_path(file_path, ignore_case),
+                file_signature=cache_signature,
+                line_offsets=line_start_offsets(source_bytes),
+                trigram_index=trigram_index,
+            )
         except OSError:
             return
 
     @classmethod
     def _candidate_line_indexes(
-        cls, trigram_index: dict[str, list[int]], literal: str
+        cls, trigram_index: Mapping[str, list[int]], literal: str
     ) -> list[int]:
         trigrams = [literal[i : i + 3] for i in range(len(literal) - 2)]
         candidate_sets = []
@@ -610,7 +626,8 @@ class CPUBackend(ComputeBackend):
         prefilter_literal = None
         routing_reason = "cpu_python_regex"
         ignore_case = bool(config.ignore_case or (config.smart_case and pattern.islower()))
-        source_lines: list[str] | None = None
+        source_lines: Sequence[str] | None = None
+        mapped_index: MappedLineTrigramIndex | None = None
         candidate_line_indexes: set[int] | None = None
         if not (
             config.fixed_strings
@@ -624,6 +641,7 @@ class CPUBackend(ComputeBackend):
         ):
             prefilter_literal = self._extract_required_literal(pattern)
             if prefilter_literal:
+                trigram_index: Mapping[str, list[int]]
                 cached_index = self._load_literal_index(file_path, ignore_case)
                 if cached_index is None:
                     # `Path.read_text(...).splitlines()` (the old code here) reads in Python's
@@ -633,16 +651,27 @@ class CPUBackend(ComputeBackend):
                     # stdout-writing layer (task #262). Read raw bytes and split on a bare `\n`
                     # only (never `str.splitlines()`, same reasoning) so a genuine trailing `\r`
                     # survives, matching how the Rust engine and real `rg` both treat it.
-                    decoded = path.read_bytes().decode("utf-8", errors="replace")
-                    source_lines = split_source_lines(decoded)
+                    signature = self._build_file_signature(file_path)
+                    raw = path.read_bytes()
+                    built_lines = split_source_lines(raw.decode("utf-8", errors="replace"))
                     normalized_lines = (
-                        [line.lower() for line in source_lines] if ignore_case else source_lines
+                        [line.lower() for line in built_lines] if ignore_case else built_lines
+                    )
+                    built_index = self._build_line_trigram_index(normalized_lines)
+                    self._store_literal_index(
+                        file_path,
+                        ignore_case,
+                        built_lines,
+                        built_index,
+                        source_bytes=raw,
+                        file_signature=signature,
                     )
-                    trigram_index = self._build_line_trigram_index(normalized_lines)
-                    self._store_literal_index(file_path, ignore_case, source_lines, trigram_index)
+                    source_lines, trigram_index = built_lines, built_index
                     routing_reason = "cpu_python_regex_prefilter"
                 else:
                     source_lines, trigram_index = cached_index
+                    if isinstance(trigram_index, MappedLineTrigramIndex):
+                        mapped_index = trigram_index
                     routing_reason = "cpu_python_regex_prefilter_cache"
                 literal = prefilter_literal.lower() if ignore_case else prefilter_literal
                 candidate_line_indexes = set(self._candidate_line_indexes(trigram_index, literal))
@@ -660,15 +689,15 @@ class CPUBackend(ComputeBackend):
             before_queue: deque[tuple[int, str]] = deque(maxlen=before_lines)
             context_after_remaining = 0
             if source_lines is not None:
-                line_iter = (
-                    (idx + 1, f"{line}\n".encode()) for idx, line in enumerate(source_lines)
+                # Only the trigram candidates are ever materialized: on an mmap-backed cache
+                # hit each `source_lines[idx]` slices and decodes just that line.
+                line_indexes = (
+                    sorted(candidate_line_indexes)
+                    if candidate_line_indexes is not None
+                    else range(len(source_lines))
                 )
+                line_iter = ((idx + 1, f"{source_lines[idx]}\n".encode()) for idx in line_indexes)
                 for line_idx, line_bytes in line_iter:
-                    if (
-                        candidate_line_indexes is not None
-                        and (line_idx - 1) not in candidate_line_indexes
-                    ):
-                        continue
                     # Try using python regex to decode byte string, else try the decoded string
                     matched = False
                     try:
@@ -809,6 +838,9 @@ class CPUBackend(ComputeBackend):
                                 before_queue.append((line_idx, line_text))
         except Exception as exc:
             raise RuntimeError(f"CPU backend search failed for {file_path}: {exc}") from exc
+        finally:
+            if mapped_index is not None:
+                mapped_index.close()
 
         return SearchResult(
             matches=matches,
@@ -1,8 +1,13 @@
 import base64
 import binascii
+import json
 import subprocess
 import sys
+import tempfile
+import threading
+from collections.abc import Iterator
 from pathlib import Path
+from typing import IO, Any
 
 from tensor_grep.backends.base import BackendExecutionError, ComputeBackend
 from tensor_grep.cli.rg_root_ignore import root_ignore_file_args
@@ -35,6 +40,263 @@ def _decode_rg_field(field: dict[str, object] | None) -> str:
         return ""
 
 
+class _RgJsonTally:
+    """Decodes rg ``--json`` records one at a time, keeping only the per-file match tallies."""
+
+    def __init__(self, file_path: str | list[str]) -> None:
+        self._file_path = file_path
+        self.matched_file_paths: list[str] = []
+        self.match_counts_by_file: dict[str, int] = {}
+        self.total_matches = 0
+
+    def _record_path(self, data_match: dict[str, Any]) -> str:
+        _path_obj = data_match.get("path", {})
+        path_str = _decode_rg_field(_path_obj)
+        # Preserve the single-file fallback: if rg gave no path.text, prefer the
+        # real caller-supplied path over a lossy U+FFFD decode (keeps match.file
+        # openable for _resolve_match_path). Non-UTF-8 filenames in a directory
+        # scan may still yield a lossy path; correct raw-bytes path is out of scope.
+        if "text" not in _path_obj and isinstance(self._file_path, str):
+            path_str = self._file_path
+        return path_str
+
+    def decode(self, line: str) -> MatchLine | None:
+        """The MatchLine for one match/context record; None for every other line."""
+        if not line.strip():
+            return None
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        if data.get("type") == "match":
+            data_match = data["data"]
+            line_number = data_match.get("line_number", 0)
+            # Decode text-or-bytes: non-UTF-8 files arrive as lines.bytes (base64),
+            # not lines.text — reading only .text produced a phantom empty match.
+            # strip_line_terminator (not .rstrip("\n\r")): rg's own "lines" field
+            # includes the source line's real trailing `\r` for a CRLF file (verified
+            # directly against `rg.exe --json`) -- `.rstrip("\n\r")` ate that `\r` too,
+            # a genuine tg-vs-rg `--json` divergence task #262 uncovered.
+            text = strip_line_terminator(_decode_rg_field(data_match.get("lines")))
+            path_str = self._record_path(data_match)
+            # Stash rg's per-occurrence byte offsets (submatches[]) for --vimgrep/
+            # --column output shaping. Counting stays one-per-matching-line (below) so
+            # total_matches / parity with the other backends is unchanged.
+            _subs = data_match.get("submatches") or None
+            self.total_matches += 1
+            if path_str:
+                # O(1) first-seen detection via the counts dict — the previous
+                # `path_str not in matched_file_paths` was an O(n) scan per match,
+                # degrading a common-token search on a large repo to O(matches x files).
+                new_count = self.match_counts_by_file.get(path_str, 0) + 1
+                self.match_counts_by_file[path_str] = new_count
+                if new_count == 1:
+                    self.matched_file_paths.append(path_str)
+            return MatchLine(
+                line_number=line_number,
+                text=text,
+                file=path_str,
+                submatches=tuple(_subs) if _subs else None,
+            )
+        if data.get("type") == "context":
+            data_match = data["data"]
+            line_number = data_match.get("line_number", 0)
+            text = strip_line_terminator(_decode_rg_field(data_match.get("lines")))
+            return MatchLine(line_number=line_number, text=text, file=self._record_path(data_match))
+        return None
+
+
+def _rg_json_result(
+    matches: list[MatchLine],
+    matched_file_paths: list[str],
+    match_counts_by_file: dict[str, int],
+    total_matches: int,
+    *,
+    returncode: int,
+    stderr: str,
+) -> SearchResult:
+    # Parse-first, THEN branch on the exit code. rg exit 2 = a SOFT per-file error (e.g.
+    # one unreadable/missing path among many); if it still emitted matches for the readable
+    # files, KEEP them + flag incomplete so we exit 2 like rg AND surface a "suppression !=
+    # absence" marker. Only a genuine total failure (exit >2, or exit 2 with nothing parsed)
+    # stays fail-closed with the byte-identical BackendExecutionError message.
+    partial = returncode == 2 and total_matches > 0
+    if returncode > 1 and not partial:
+        raise BackendExecutionError(
+            f"rg failed with exit code {returncode}: {stderr.strip() or 'no stderr output'}"
+        )
+    search_result = SearchResult(
+        matches=matches,
+        matched_file_paths=matched_file_paths,
+        match_counts_by_file=match_counts_by_file,
+        total_files=len(matched_file_paths),
+        total_matches=total_matches,
+        routing_backend="RipgrepBackend",
+        routing_reason="rg_json",
+        routing_distributed=False,
+        routing_worker_count=1,
+    )
+    if partial:
+        reason = stderr.strip() or "rg exit 2 (partial results)"
+        sys.stderr.write(f"tg: rg exited 2, keeping partial results: {reason}\n")
+        search_result.result_incomplete = True
+        search_result.incomplete_reason = reason
+        # Task #276 slice 1: rg's own exit-2-with-partial-output soft error is always a
+        # per-path access problem (missing/permission-denied/etc among the searched
+        # paths) -- rg has no notion of "scan_limit"/"deadline" in its own exit code, so
+        # "unreadable_path" is the correct class for every occurrence of this branch.
+        search_result.incomplete_reason_class = "unreadable_path"
+    return search_result
+
+
+def _rg_json_timeout_result(
+    matches: list[MatchLine],
+    matched_file_paths: list[str],
+    match_counts_by_file: dict[str, int],
+    total_matches: int,
+    *,
+    timeout_seconds: float,
+) -> SearchResult:
+    reason = (
+        f"rg aggregate search exceeded the {timeout_seconds:g}s timeout and was "
+        "stopped; returning partial results. Scope the search to a smaller path, "
+        "or raise TG_RG_TIMEOUT_SECONDS."
+    )
+    sys.stderr.write(f"tg: rg aggregate search timed out, keeping partial results: {reason}\n")
+    return SearchResult(
+        matches=matches,
+        matched_file_paths=matched_file_paths,
+        match_counts_by_file=match_counts_by_file,
+        total_files=len(matched_file_paths),
+        total_matches=total_matches,
+        routing_backend="RipgrepBackend",
+        routing_reason="rg_json",
+        routing_distributed=False,
+        routing_worker_count=1,
+        result_incomplete=True,
+        incomplete_reason=reason,
+        incomplete_reason_class="timeout",
+    )
+
+
+def popen_rg_json(cmd: list[str], stderr: IO[bytes]) -> subprocess.Popen[bytes]:
+    """Start the rg a `RipgrepJsonStream` reads: stdout piped, stderr into ``stderr``.
+
+    The stream's only way of spawning rg, so a test can hand it a canned process instead.
+    """
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+
+
+class RipgrepJsonStream:
+    """The match/context lines of one ``rg --json`` run, decoded as rg writes them.
+
+    Iterating starts rg and yields each MatchLine as soon as its record arrives, so memory holds
+    one record at a time rather than rg's whole output. A consumer that stops iterating kills rg
+    rather than waiting for it. A run past ``timeout_seconds`` is killed and ``timed_out`` set,
+    keeping what it already wrote.
+
+    Once iteration ends, ``returncode``/``stderr`` and the tallies (``total_matches``,
+    ``matched_file_paths``, ``match_counts_by_file``) describe the run; `search_result` applies
+    `RipgrepBackend.search`'s exit-code rules to the lines the caller kept.
+    """
+
+    def __init__(
+        self,
+        cmd: list[str],
+        file_path: str | list[str],
+        *,
+        timeout_seconds: float | None = None,
+    ) -> None:
+        self._cmd = cmd
+        self._tally = _RgJsonTally(file_path)
+        self._timeout_seconds = timeout_seconds
+        self._started = False
+        self.returncode: int | None = None
+        self.stderr = ""
+        self.timed_out = False
+
+    @property
+    def total_matches(self) -> int:
+        return self._tally.total_matches
+
+    @property
+    def matched_file_paths(self) -> list[str]:
+        return self._tally.matched_file_paths
+
+    @property
+    def match_counts_by_file(self) -> dict[str, int]:
+        return self._tally.match_counts_by_file
+
+    def __iter__(self) -> Iterator[MatchLine]:
+        if self._started:
+            raise RuntimeError("a RipgrepJsonStream can only be iterated once")
+        self._started = True
+        return self._run(self._cmd)
+
+    def _run(self, cmd: list[str]) -> Iterator[MatchLine]:
+        with tempfile.TemporaryFile() as stderr_sink:
+            process = popen_rg_json(cmd, stderr_sink)
+            timer = (
+                threading.Timer(self._timeout_seconds, self._expire, (process,))
+                if self._timeout_seconds is not None
+                else None
+            )
+            if timer is not None:
+                timer.daemon = True
+                timer.start()
+            exhausted = False
+            try:
+                assert process.stdout is not None
+                # Bytes lines split on rg's NDJSON record delimiter (\n) only -- never on the
+                # U+2028/U+2029/U+0085 rg emits unescaped inside a match's line text.
+                for raw in process.stdout:
+                    match = self._tally.decode(raw.decode("utf-8", errors="replace"))
+                    if match is not None:
+                        yield match
+                else:
+                    exhausted = True
+            finally:
+                if timer is not None:
+                    timer.cancel()
+                if not exhausted and not self.timed_out:
+                    # The consumer stopped (closed the generator, or raised): nothing rg would
+                    # still write is wanted, so do not let it finish scanning the tree.
+                    process.kill()
+                assert process.stdout is not None
+                process.stdout.close()
+                self.returncode = process.wait()
+                stderr_sink.seek(0)
+                self.stderr = stderr_sink.read().decode("utf-8", errors="replace")
+
+    def _expire(self, process: subprocess.Popen[bytes]) -> None:
+        if process.poll() is None:
+            self.timed_out = True
+            process.kill()
+
+    def search_result(self, matches: list[MatchLine]) -> SearchResult:
+        """``matches`` (the yielded lines the caller kept) as `RipgrepBackend.search` returns them.
+
+        Raises `BackendExecutionError` for a genuine rg failure, exactly like `search`.
+        """
+        tally = self._tally
+        if self.timed_out:
+            return _rg_json_timeout_result(
+                matches,
+                tally.matched_file_paths,
+                tally.match_counts_by_file,
+                tally.total_matches,
+                timeout_seconds=self._timeout_seconds or configured_ripgrep_timeout_seconds(),
+            )
+        return _rg_json_result(
+            matches,
+            tally.matched_file_paths,
+            tally.match_counts_by_file,
+            tally.total_matches,
+            returncode=self.returncode or 0,
+            stderr=self.stderr,
+        )
+
+
 class RipgrepBackend(ComputeBackend):
     """
     A backend that seamlessly delegates to the native `rg` (ripgrep) binary
@@ -103,187 +365,19 @@ class RipgrepBackend(ComputeBackend):
 
         cmd = self._build_cmd(file_path=file_path, pattern=pattern, config=config, json_mode=True)
         try:
-            # We use check=False because rg exits with 1 if no matches are found
-            result = run_subprocess(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=False,
-                encoding="utf-8",
-                timeout_seconds=configured_ripgrep_timeout_seconds(),
-            )
-            matches, matched_file_paths, match_counts_by_file, total_matches = (
-                self._parse_ndjson_matches(result.stdout, file_path)
-            )
-
-            # Parse-first, THEN branch on the exit code. rg exit 2 = a SOFT per-file error (e.g.
-            # one unreadable/missing path among many); if it still emitted matches for the readable
-            # files, KEEP them + flag incomplete so we exit 2 like rg AND surface a "suppression !=
-            # absence" marker. Only a genuine total failure (exit >2, or exit 2 with nothing parsed)
-            # stays fail-closed with the byte-identical BackendExecutionError message.
-            partial = result.returncode == 2 and total_matches > 0
-            if result.returncode > 1 and not partial:
-                stderr = result.stderr.strip()
-                raise BackendExecutionError(
-                    f"rg failed with exit code {result.returncode}: {stderr or 'no stderr output'}"
-                )
-            search_result = SearchResult(
-                matches=matches,
-                matched_file_paths=matched_file_paths,
-                match_counts_by_file=match_counts_by_file,
-                total_files=len(matched_file_paths),
-                total_matches=total_matches,
-                routing_backend="RipgrepBackend",
-                routing_reason="rg_json",
-                routing_distributed=False,
-                routing_worker_count=1,
-            )
-            if partial:
-                reason = result.stderr.strip() or "rg exit 2 (partial results)"
-                sys.stderr.write(f"tg: rg exited 2, keeping partial results: {reason}\n")
-                search_result.result_incomplete = True
-                search_result.incomplete_reason = reason
-                # Task #276 slice 1: rg's own exit-2-with-partial-output soft error is always a
-                # per-path access problem (missing/permission-denied/etc among the searched
-                # paths) -- rg has no notion of "scan_limit"/"deadline" in its own exit code, so
-                # "unreadable_path" is the correct class for every occurrence of this branch.
-                search_result.incomplete_reason_class = "unreadable_path"
-            return search_result
-
-        except subprocess.TimeoutExpired as e:
-            # Audit H2 (Fable review of #400): the aggregate JSON path previously had NO
-            # handler for a timed-out rg subprocess, so this fell into the broad `except
-            # Exception` below, got wrapped as a RuntimeError, and propagated as an
-            # UNCAUGHT traceback all the way through main.py's search command (exit 1, no
-            # JSON envelope, all partial results silently lost) -- violating the Backend
-            # Fail-Closed Contract (AGENTS.md). That gave agents THREE different "timed
-            # out" signals depending on route: exit 124 from the rg passthrough
-            # (search_passthrough, below -- kept as-is: 124 is the coreutils `timeout`
-            # convention and is load-bearing rg-parity for the streaming/interactive path,
-            # so it is NOT changed here), exit 2 + result_incomplete from the native walk
-            # deadline (main.py, added in #400), and an uncaught traceback + exit 1 from
-            # here. Fix: treat it like rg's own soft partial-failure (exit 2) above --
-            # `subprocess.run(capture_output=True)` attaches whatever stdout rg had
-            # already flushed before being killed to the TimeoutExpired exception, so
-            # best-effort re-use the SAME NDJSON parser to recover any complete match
-            # records instead of discarding them; fall back to an empty-but-well-formed
-            # envelope if nothing parses. Either way: result_incomplete=True + a reason,
-            # NEVER a crash, NEVER a silent empty. main.py's existing
-            # `sys.exit(2 if all_results.result_incomplete else ...)` then exits 2 for
-            # this path too, consistent with the native-walk-deadline signal.
-            timeout_seconds = (
-                e.timeout if e.timeout is not None else configured_ripgrep_timeout_seconds()
-            )
-            partial_stdout = e.stdout if isinstance(e.stdout, str) else ""
-            matches, matched_file_paths, match_counts_by_file, total_matches = (
-                self._parse_ndjson_matches(partial_stdout, file_path)
-            )
-            reason = (
-                f"rg aggregate search exceeded the {timeout_seconds:g}s timeout and was "
-                "stopped; returning partial results. Scope the search to a smaller path, "
-                "or raise TG_RG_TIMEOUT_SECONDS."
-            )
-            sys.stderr.write(
-                f"tg: rg aggregate search timed out, keeping partial results: {reason}\n"
-            )
-            return SearchResult(
-                matches=matches,
-                matched_file_paths=matched_file_paths,
-                match_counts_by_file=match_counts_by_file,
-                total_files=len(matched_file_paths),
-                total_matches=total_matches,
-                routing_backend="RipgrepBackend",
-                routing_reason="rg_json",
-                routing_distributed=False,
-                routing_worker_count=1,
-                result_incomplete=True,
-                incomplete_reason=reason,
-                incomplete_reason_class="timeout",
+            # Streamed: rg's stdout is decoded record by record as it arrives, so peak memory is
+            # the MatchLines themselves rather than rg's whole JSON output held (and split) twice.
+            # Audit H2 (Fable review of #400): a run past TG_RG_TIMEOUT_SECONDS is killed and
+            # comes back as a result_incomplete envelope (class "timeout") holding every record
+            # rg had already written -- never a traceback, never a silent empty. main.py then
+            # exits 2 for it, like the native walk deadline. The rg passthrough keeps exit 124.
+            stream = RipgrepJsonStream(
+                cmd, file_path, timeout_seconds=configured_ripgrep_timeout_seconds()
             )
+            return stream.search_result(list(stream))
         except Exception as e:
             raise BackendExecutionError(f"Ripgrep backend failed: {e}") from e
 
-    @staticmethod
-    def _parse_ndjson_matches(
-        stdout: str, file_path: str | list[str]
-    ) -> tuple[list[MatchLine], list[str], dict[str, int], int]:
-        """Parse rg ``--json`` NDJSON output into match/context records.
-
-        Shared by the success path and the timeout-recovery path above (a
-        ``subprocess.TimeoutExpired`` carries whatever stdout rg had already flushed before
-        being killed via ``e.stdout``) so a timed-out aggregate search can still surface any
-        complete match records instead of discarding them.
-        """
-        import json
-
-        matches: list[MatchLine] = []
-        matched_file_paths: list[str] = []
-        match_counts_by_file: dict[str, int] = {}
-        total_matches = 0
-
-        # split on rg's NDJSON record delimiter (\n) — NOT str.splitlines(), which also
-        # breaks on U+2028/U+2029/U+0085 that rg emits UNESCAPED inside a match's line text,
-        # fracturing the JSON record so it fails json.loads and is silently dropped.
-        for line in stdout.split("\n"):
-            if not line.strip():
-                continue
-            try:
-                data = json.loads(line)
-                if data.get("type") == "match":
-                    data_match = data["data"]
-                    line_number = data_match.get("line_number", 0)
-                    # Decode text-or-bytes: non-UTF-8 files arrive as lines.bytes (base64),
-                    # not lines.text — reading only .text produced a phantom empty match.
-                    # strip_line_terminator (not .rstrip("\n\r")): rg's own "lines" field
-                    # includes the source line's real trailing `\r` for a CRLF file (verified
-                    # directly against `rg.exe --json`) -- `.rstrip("\n\r")` ate that `\r` too,
-                    # a genuine tg-vs-rg `--json` divergence task #262 uncovered.
-                    text = strip_line_terminator(_decode_rg_field(data_match.get("lines")))
-
-                    _path_obj = data_match.get("path", {})
-                    path_str = _decode_rg_field(_path_obj)
-                    # Preserve the single-file fallback: if rg gave no path.text, prefer the
-                    # real caller-supplied path over a lossy U+FFFD decode (keeps match.file
-                    # openable for _resolve_match_path). Non-UTF-8 filenames in a directory
-                    # scan may still yield a lossy path; correct raw-bytes path is out of scope.
-                    if "text" not in _path_obj and isinstance(file_path, str):
-                        path_str = file_path
-
-                    # Stash rg's per-occurrence byte offsets (submatches[]) for --vimgrep/
-                    # --column output shaping. Counting stays one-per-matching-line (below) so
-                    # total_matches / parity with the other backends is unchanged.
-                    _subs = data_match.get("submatches") or None
-                    matches.append(
-                        MatchLine(
-                            line_number=line_number,
-                            text=text,
-                            file=path_str,
-                            submatches=tuple(_subs) if _subs else None,
-                        )
-                    )
-                    total_matches += 1
-                    if path_str:
-                        # O(1) first-seen detection via the counts dict — the previous
-                        # `path_str not in matched_file_paths` was an O(n) scan per match,
-                        # degrading a common-token search on a large repo to O(matches x files).
-                        new_count = match_counts_by_file.get(path_str, 0) + 1
-                        match_counts_by_file[path_str] = new_count
-                        if new_count == 1:
-                            matched_file_paths.append(path_str)
-                elif data.get("type") == "context":
-                    data_match = data["data"]
-                    line_number = data_match.get("line_number", 0)
-                    text = strip_line_terminator(_decode_rg_field(data_match.get("lines")))
-                    _path_obj = data_match.get("path", {})
-                    path_str = _decode_rg_field(_path_obj)
-                    if "text" not in _path_obj and isinstance(file_path, str):
-                        path_str = file_path
-                    matches.append(MatchLine(line_number=line_number, text=text, file=path_str))
-            except json.JSONDecodeError:
-                pass
-
-        return matches, matched_file_paths, match_counts_by_file, total_matches
-
     def _search_files_with_matches(
         self, file_path: str | list[str], pattern: str, config: SearchConfig
     ) -> SearchResult:
@@ -328,7 +422,7 @@ class RipgrepBackend(ComputeBackend):
             return search_result
         except subprocess.TimeoutExpired as e:
             # L7: rg timed out mid-scan -> recover the file list it already flushed instead of
-            # hard-erroring, mirroring search()'s TimeoutExpired handling. Fail-graceful, not
+            # hard-erroring, mirroring search()'s timeout envelope. Fail-graceful, not
             # fail-crash: a `tg search -l` on a huge tree returns partial + result_incomplete.
             partial_stdout = e.stdout if isinstance(e.stdout, str) else ""
             path_parts = partial_stdout.split("\0") if config.null else partial_stdout.split("\n")
@@ -447,7 +541,7 @@ class RipgrepBackend(ComputeBackend):
             return search_result
         except subprocess.TimeoutExpired as e:
             # L7: recover the partial tally rg had flushed before the timeout instead of
-            # hard-erroring, mirroring search()'s TimeoutExpired handling.
+            # hard-erroring, mirroring search()'s timeout envelope.
             partial_stdout = e.stdout if isinstance(e.stdout, str) else ""
             total_matches, total_files, matched_file_paths, match_counts_by_file = (
                 self._parse_count_stdout(partial_stdout, config, file_path)
@@ -1,12 +1,19 @@
 import hashlib
-import json
 import os
+import threading
 from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import ClassVar
 
 from tensor_grep.backends.base import BackendExecutionError, ComputeBackend
 from tensor_grep.core.config import SearchConfig
+from tensor_grep.core.line_trigram_index import (
+    MappedLineTrigramIndex,
+    is_racy_signature,
+    line_start_offsets,
+    write_line_trigram_index,
+)
 from tensor_grep.core.result import MatchLine, SearchResult, split_source_lines
 
 _STRING_INDEX_CACHE_MAX_ENTRIES_ENV = "TENSOR_GREP_STRING_INDEX_CACHE_MAX_ENTRIES"
@@ -17,7 +24,9 @@ _DEFAULT_STRING_INDEX_CACHE_MAX_ENTRIES = 512
 # old `open(file_path, encoding="utf-8")` read + `str.splitlines()`). `(mtime_ns, size)`
 # cannot detect that change, so `_load_cached_index` rejects any payload whose
 # `format_version` does not match, forcing a transparent recompute on first use.
-_STRING_INDEX_CACHE_FORMAT_VERSION = 2
+# Bumped 2 -> 3 alongside _CPU_LITERAL_INDEX_CACHE_FORMAT_VERSION: the JSON payload was replaced
+# by the shared mmap-able binary layout (core/line_trigram_index.py).
+_STRING_INDEX_CACHE_FORMAT_VERSION = 3
 
 
 class StringZillaBackend(ComputeBackend):
@@ -33,10 +42,13 @@ class StringZillaBackend(ComputeBackend):
             tuple[tuple[int, int], list[str], dict[str, list[int]]],
         ]
     ] = OrderedDict()
+    # Same guard as CPUBackend's: the CLI may search several files concurrently.
+    _shared_index_cache_lock: ClassVar[threading.Lock] = threading.Lock()
 
     @classmethod
     def _clear_shared_caches(cls) -> None:
-        cls._shared_index_cache.clear()
+        with cls._shared_index_cache_lock:
+            cls._shared_index_cache.clear()
 
     @staticmethod
     def _configured_positive_int(env_var: str, default: int) -> int:
@@ -62,10 +74,12 @@ class StringZillaBackend(ComputeBackend):
         cache_key: tuple[str, bool, bool],
         cache_entry: tuple[tuple[int, int], list[str], dict[str, list[int]]],
     ) -> None:
-        cls._shared_index_cache.pop(cache_key, None)
-        cls._shared_index_cache[cache_key] = cache_entry
-        while len(cls._shared_index_cache) > cls._index_cache_max_entries():
-            cls._shared_index_cache.popitem(last=False)
+        max_entries = cls._index_cache_max_entries()
+        with cls._shared_index_cache_lock:
+            cls._shared_index_cache.pop(cache_key, None)
+            cls._shared_index_cache[cache_key] = cache_entry
+            while len(cls._shared_index_cache) > max_entries:
+                cls._shared_index_cache.popitem(last=False)
 
     def is_available(self) -> bool:
         try:
@@ -141,7 +155,7 @@ class StringZillaBackend(ComputeBackend):
         # pre-#262 `{digest}.json` (no `-vN` suffix) is now permanently orphaned rather than
         # overwritten -- bounded by ordinary cache size, not a leak; reaping it would defeat
         # the point (an old reader still using it needs it to stay put).
-        return self._get_index_cache_dir() / f"{digest}-v{_STRING_INDEX_CACHE_FORMAT_VERSION}.json"
+        return self._get_index_cache_dir() / f"{digest}-v{_STRING_INDEX_CACHE_FORMAT_VERSION}.tgi"
 
     def _build_line_trigram_index(self, lines: list[str]) -> dict[str, list[int]]:
         index: dict[str, set[int]] = {}
@@ -208,50 +222,32 @@ class StringZillaBackend(ComputeBackend):
 
     def _load_cached_index(
         self, file_path: str, ignore_case: bool, treat_binary_as_text: bool
-    ) -> tuple[list[str], dict[str, list[int]]] | None:
+    ) -> tuple[Sequence[str], Mapping[str, list[int]]] | None:
+        """In-memory hit -> the built lines/dict; on-disk hit -> an mmap-backed view that the
+        caller closes (see CPUBackend._load_literal_index for why it is not LRU-cached)."""
         cache_key = (file_path, ignore_case, treat_binary_as_text)
         cache_signature = self._build_file_signature(file_path)
-        cached = self._shared_index_cache.get(cache_key)
-        if cached and cached[0] == cache_signature:
-            self._shared_index_cache.move_to_end(cache_key)
-            return cached[1], cached[2]
-        if cached:
-            self._shared_index_cache.pop(cache_key, None)
+        with self._shared_index_cache_lock:
+            cached = self._shared_index_cache.get(cache_key)
+            if cached and cached[0] == cache_signature:
+                self._shared_index_cache.move_to_end(cache_key)
+                return cached[1], cached[2]
+            if cached:
+                self._shared_index_cache.pop(cache_key, None)
 
         if not self._is_index_enabled():
             return None
 
-        cache_path = self._get_index_cache_path(file_path, ignore_case, treat_binary_as_text)
-        if not cache_path.exists():
-            return None
-
-        try:
-            payload = json.loads(cache_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            return None
-
-        if payload.get("format_version") != _STRING_INDEX_CACHE_FORMAT_VERSION:
-            # Stale (pre-#262, or any future incompatible) cache -- treat as a miss so the
-            # caller recomputes and overwrites this file with the current format.
-            return None
-
-        if payload.get("file_signature") != list(cache_signature):
-            return None
-
-        raw_lines = payload.get("lines")
-        raw_index = payload.get("trigram_index")
-        if not isinstance(raw_lines, list) or not isinstance(raw_index, dict):
+        # A foreign, truncated, or stale (signature mismatch) file opens as None -- a miss, so
+        # the caller recomputes and atomically replaces it with the current format.
+        mapped = MappedLineTrigramIndex.open(
+            self._get_index_cache_path(file_path, ignore_case, treat_binary_as_text),
+            source_path=file_path,
+            file_signature=cache_signature,
+        )
+        if mapped is None:
             return None
-
-        lines = [str(line) for line in raw_lines]
-        trigram_index: dict[str, list[int]] = {}
-        for trigram, values in raw_index.items():
-            if not isinstance(trigram, str) or not isinstance(values, list):
-                return None
-            trigram_index[trigram] = [int(v) for v in values]
-
-        self._remember_index(cache_key, (cache_signature, lines, trigram_index))
-        return lines, trigram_index
+        return mapped.lines, mapped
 
     def _persist_index(
         self,
@@ -260,8 +256,13 @@ class StringZillaBackend(ComputeBackend):
         treat_binary_as_text: bool,
         lines: list[str],
         trigram_index: dict[str, list[int]],
+        *,
+        source_bytes: bytes | None = None,
+        file_signature: tuple[int, int] | None = None,
     ) -> None:
-        cache_signature = self._build_file_signature(file_path)
+        """See CPUBackend._store_literal_index: ``file_signature`` is the stat taken before the
+        indexed text was read."""
+        cache_signature = file_signature or self._build_file_signature(file_path)
         self._remember_index(
             (file_path, ignore_case, treat_binary_as_text),
             (
@@ -270,19 +271,18 @@ class StringZillaBackend(ComputeBackend):
                 trigram_index,
             ),
         )
-        if not self._is_index_enabled():
+        if not self._is_index_enabled() or is_racy_signature(cache_signature):
             return
 
-        cache_path = self._get_index_cache_path(file_path, ignore_case, treat_binary_as_text)
-        payload = {
-            "format_version": _STRING_INDEX_CACHE_FORMAT_VERSION,
-            "file_signature": list(cache_signature),
-            "lines": lines,
-            "trigram_index": trigram_index,
-        }
         try:
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            cache_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+            if source_bytes is None:
+                source_bytes = Path(file_path).read_bytes()
+            write_line_trigram_index(
+                self._get_index_cache_path(file_path, ignore_case, treat_binary_as_text),
+                file_signature=cache_signature,
+                line_offsets=line_start_offsets(source_bytes),
+                trigram_index=trigram_index,
+            )
         except OSError:
             return
 
@@ -303,7 +303,10 @@ class StringZillaBackend(ComputeBackend):
         treat_binary_as_text = self._should_search_binary_as_text(config)
         cached = self._load_cached_index(file_path, ignore_case, treat_binary_as_text)
         routing_reason = "stringzilla_fixed_strings_index_cache"
+        source_lines: Sequence[str]
+        trigram_index: Mapping[str, list[int]]
         if cached is None:
+            signature = self._build_file_signature(file_path)
             content = self._load_searchable_text(
                 file_path, treat_binary_as_text=treat_binary_as_text
             )
@@ -319,22 +322,48 @@ class StringZillaBackend(ComputeBackend):
                 )
             # split_source_lines, never `str.splitlines()`: it treats `\r\n` as one break and
             # strips it entirely, eating a CRLF line's genuine trailing `\r` (task #262).
-            source_lines = split_source_lines(content)
+            built_lines = split_source_lines(content)
             normalized_lines = (
-                [line.lower() for line in source_lines] if ignore_case else source_lines
+                [line.lower() for line in built_lines] if ignore_case else built_lines
             )
-            trigram_index = self._build_line_trigram_index(normalized_lines)
+            built_index = self._build_line_trigram_index(normalized_lines)
             self._persist_index(
                 file_path,
                 ignore_case,
                 treat_binary_as_text,
-                source_lines,
-                trigram_index,
+                built_lines,
+                built_index,
+                file_signature=signature,
             )
+            source_lines, trigram_index = built_lines, built_index
             routing_reason = "stringzilla_fixed_strings_index"
         else:
             source_lines, trigram_index = cached
+        try:
+            return self._search_indexed_lines(
+                file_path,
+                pattern,
+                config,
+                ignore_case,
+                source_lines,
+                trigram_index,
+                routing_reason=routing_reason,
+            )
+        finally:
+            if isinstance(trigram_index, MappedLineTrigramIndex):
+                trigram_index.close()
 
+    def _search_indexed_lines(
+        self,
+        file_path: str,
+        pattern: str,
+        config: SearchConfig | None,
+        ignore_case: bool,
+        source_lines: Sequence[str],
+        trigram_index: Mapping[str, list[int]],
+        *,
+        routing_reason: str,
+    ) -> SearchResult:
         postings: list[list[int]] = []
         normalized_pattern = pattern.lower() if ignore_case else pattern
         for trigram in self._extract_trigrams(normalized_pattern):
@@ -12,7 +12,7 @@ module's docstring before adding a bare cross-module reference.
 
 import json
 import re
-from dataclasses import replace
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
@@ -681,6 +681,89 @@ def _regex_rule_targets_file(rule_language: str, file_path: str) -> bool:
     return file_language == normalize_ast_language(rule_language, default=file_language)
 
 
+@dataclass
+class _RuleScanTally:
+    """One rule's running totals while `_run_ast_scan_payload` scans its member patterns."""
+
+    member_patterns: list[str]
+    rule_matches: int = 0
+    matched_files: set[str] = field(default_factory=set)
+    match_counts_by_file: dict[str, int] = field(default_factory=dict)
+    snippets_by_file: dict[str, list[dict[str, object]]] = field(default_factory=dict)
+    rule_occurrences: list[dict[str, object]] = field(default_factory=list)
+    identities: set[tuple[str, int, int]] = field(default_factory=set)
+
+    @property
+    def composite(self) -> bool:
+        return len(self.member_patterns) > 1
+
+
+def _scan_each_file_once(
+    rule_scans: list[tuple[_RuleScanTally, "SearchConfig", "ComputeBackend"]],
+    candidate_files: list[str],
+    *,
+    include_evidence_snippets: bool,
+    max_evidence_snippets_per_file: int,
+    max_evidence_snippet_chars: int,
+) -> None:
+    """Run every per-file rule over ``candidate_files`` in one pass, file by file.
+
+    Rules that share a backend and language are searched together: a backend with
+    `search_patterns` (AstBackend) parses each file once and answers every member pattern of
+    every rule from that tree, and a pattern shared by several rules runs once. Each tally gets
+    the same per-file results, in the same member order, as the old rule-by-rule loop.
+    """
+    from tensor_grep.cli.ast_workflows import _match_node_identity
+
+    groups: dict[
+        tuple[int, str | None], tuple[SearchConfig, ComputeBackend, list[_RuleScanTally]]
+    ] = {}
+    for tally, rule_cfg, backend in rule_scans:
+        groups.setdefault((id(backend), rule_cfg.lang), (rule_cfg, backend, []))[2].append(tally)
+
+    for current_file in candidate_files:
+        for rule_cfg, backend, tallies in groups.values():
+            patterns = list(
+                dict.fromkeys(pattern for tally in tallies for pattern in tally.member_patterns)
+            )
+            if hasattr(backend, "search_patterns"):
+                results = backend.search_patterns(current_file, patterns, config=rule_cfg)
+            else:
+                results = {
+                    pattern: backend.search(current_file, pattern, config=rule_cfg)
+                    for pattern in patterns
+                }
+            for tally in tallies:
+                for member_pattern in tally.member_patterns:
+                    result = results[member_pattern]
+                    if tally.composite:
+                        tally.identities.update(
+                            _match_node_identity(match, fallback_file=current_file)
+                            for match in result.matches
+                        )
+                    else:
+                        tally.rule_matches += result.total_matches
+                    if result.total_files <= 0 and result.total_matches <= 0:
+                        continue
+                    tally.matched_files.add(current_file)
+                    tally.match_counts_by_file[current_file] = (
+                        tally.match_counts_by_file.get(current_file, 0) + result.total_matches
+                    )
+                    for match in result.matches:
+                        tally.rule_occurrences.append({
+                            "file": match.file or current_file,
+                            "line": match.line_number,
+                        })
+                    if include_evidence_snippets:
+                        file_snippets = tally.snippets_by_file.setdefault(current_file, [])
+                        for match in result.matches:
+                            if len(file_snippets) >= max_evidence_snippets_per_file:
+                                break
+                            file_snippets.append(
+                                _truncate_evidence_snippet(match.text, max_evidence_snippet_chars)
+                            )
+
+
 def _run_ast_scan_payload(
     project_cfg: dict[str, object],
     rules: list[dict[str, str]],
@@ -709,6 +792,7 @@ def _run_ast_scan_payload(
         _rule_member_patterns,
         _select_ast_backend_for_rule,
     )
+    from tensor_grep.cli.regex_rule_matcher import RegexRuleMatcher
     from tensor_grep.cli.scan_guardrails import ensure_scan_not_broad
     from tensor_grep.core.config import SearchConfig
     from tensor_grep.core.result import SearchResult
@@ -894,22 +978,18 @@ def _run_ast_scan_payload(
             rule_occurrences=rule_occurrences,
         )
 
+    rule_tallies: list[tuple[dict[str, str], _RuleScanTally]] = []
+    per_file_scans: list[tuple[_RuleScanTally, SearchConfig, ComputeBackend]] = []
     for rule, rule_cfg, backend in other_resolved:
         backend_names_used.add(type(backend).__name__)
-        resolved_matched_files: set[str] = set()
-        resolved_match_counts_by_file: dict[str, int] = {}
-        resolved_snippets_by_file: dict[str, list[dict[str, object]]] = {}
-        resolved_rule_occurrences: list[dict[str, object]] = []
-
         # M16 F1: composite (multi-pattern any-of) rules scan EVERY member and
         # count each matched AST NODE once across members, deduplicating by
         # node SPAN via `_match_node_identity` (file, start_byte, end_byte; the
         # same key the Rust scan core unions) — two distinct nodes on one line
         # each count, matching whole-config ast-grep's per-node `any` count.
         # Single-pattern rules keep the legacy per-node total accounting.
-        member_patterns = _rule_member_patterns(rule)
-        composite = len(member_patterns) > 1
-        resolved_identities: set[tuple[str, int, int]] = set()
+        tally = _RuleScanTally(member_patterns=_rule_member_patterns(rule))
+        rule_tallies.append((rule, tally))
 
         if type(backend).__name__ == "AstGrepWrapperBackend" and hasattr(backend, "search_many"):
             backend_scan_paths = (
@@ -917,107 +997,78 @@ def _run_ast_scan_payload(
                 if scan_has_discovery_filter
                 else resolved_scan_paths
             )
-            if backend_scan_paths:
-                rule_matches = 0
-                for member_pattern in member_patterns:
-                    result = backend.search_many(
-                        backend_scan_paths, member_pattern, config=rule_cfg
+            if not backend_scan_paths:
+                continue
+            for member_pattern in tally.member_patterns:
+                result = backend.search_many(backend_scan_paths, member_pattern, config=rule_cfg)
+                if tally.composite:
+                    tally.identities.update(
+                        _match_node_identity(match) for match in result.matches if match.file
                     )
-                    if composite:
-                        resolved_identities.update(
-                            _match_node_identity(match) for match in result.matches if match.file
-                        )
-                    else:
-                        rule_matches += result.total_matches
-                    resolved_matched_files.update(result.matched_file_paths)
-                    for file_path, count in result.match_counts_by_file.items():
-                        resolved_match_counts_by_file[file_path] = (
-                            resolved_match_counts_by_file.get(file_path, 0) + count
+                else:
+                    tally.rule_matches += result.total_matches
+                tally.matched_files.update(result.matched_file_paths)
+                for file_path, count in result.match_counts_by_file.items():
+                    tally.match_counts_by_file[file_path] = (
+                        tally.match_counts_by_file.get(file_path, 0) + count
+                    )
+                for match in result.matches:
+                    if match.file:
+                        tally.match_counts_by_file[match.file] = (
+                            tally.match_counts_by_file.get(match.file, 0) + 1
                         )
-                    for match in result.matches:
-                        if match.file:
-                            resolved_match_counts_by_file[match.file] = (
-                                resolved_match_counts_by_file.get(match.file, 0) + 1
+                        tally.rule_occurrences.append({
+                            "file": match.file,
+                            "line": match.line_number,
+                        })
+                        if (
+                            include_evidence_snippets
+                            and len(tally.snippets_by_file.get(match.file, []))
+                            < max_evidence_snippets_per_file
+                        ):
+                            tally.snippets_by_file.setdefault(match.file, []).append(
+                                _truncate_evidence_snippet(match.text, max_evidence_snippet_chars)
                             )
-                            resolved_rule_occurrences.append({
-                                "file": match.file,
-                                "line": match.line_number,
-                            })
-                            if (
-                                include_evidence_snippets
-                                and len(resolved_snippets_by_file.get(match.file, []))
-                                < max_evidence_snippets_per_file
-                            ):
-                                resolved_snippets_by_file.setdefault(match.file, []).append(
-                                    _truncate_evidence_snippet(
-                                        match.text, max_evidence_snippet_chars
-                                    )
-                                )
-                    if not resolved_matched_files and result.total_files > 0:
-                        resolved_matched_files.update(
-                            match.file for match in result.matches if match.file
-                        )
-            else:
-                rule_matches = 0
+                if not tally.matched_files and result.total_files > 0:
+                    tally.matched_files.update(match.file for match in result.matches if match.file)
         else:
-            if scanner is None:
-                scanner = DirectoryScanner(cfg)
-            if resolved_candidate_files is None:
-                resolved_candidate_files, _ = _self._collect_candidate_files(
-                    scanner, resolved_scan_paths
-                )
-            rule_matches = 0
-            for member_pattern in member_patterns:
-                for current_file in resolved_candidate_files:
-                    result = backend.search(current_file, member_pattern, config=rule_cfg)
-                    if composite:
-                        resolved_identities.update(
-                            _match_node_identity(match, fallback_file=current_file)
-                            for match in result.matches
-                        )
-                    else:
-                        rule_matches += result.total_matches
-                    if result.total_files > 0 or result.total_matches > 0:
-                        resolved_matched_files.add(current_file)
-                        resolved_match_counts_by_file[current_file] = (
-                            resolved_match_counts_by_file.get(current_file, 0)
-                            + result.total_matches
-                        )
-                        for match in result.matches:
-                            resolved_rule_occurrences.append({
-                                "file": match.file or current_file,
-                                "line": match.line_number,
-                            })
-                        if include_evidence_snippets:
-                            file_snippets = resolved_snippets_by_file.setdefault(current_file, [])
-                            for match in result.matches:
-                                if len(file_snippets) >= max_evidence_snippets_per_file:
-                                    break
-                                file_snippets.append(
-                                    _truncate_evidence_snippet(
-                                        match.text, max_evidence_snippet_chars
-                                    )
-                                )
+            per_file_scans.append((tally, rule_cfg, backend))
+
+    if per_file_scans:
+        if scanner is None:
+            scanner = DirectoryScanner(cfg)
+        if resolved_candidate_files is None:
+            resolved_candidate_files, _ = _self._collect_candidate_files(
+                scanner, resolved_scan_paths
+            )
+        _scan_each_file_once(
+            per_file_scans,
+            resolved_candidate_files,
+            include_evidence_snippets=include_evidence_snippets,
+            max_evidence_snippets_per_file=max_evidence_snippets_per_file,
+            max_evidence_snippet_chars=max_evidence_snippet_chars,
+        )
 
-        if composite:
+    for rule, tally in rule_tallies:
+        if tally.composite:
             # F1: count the span-union — never the summed multiset — and
             # rebuild the per-file counts from the identities so no member
-            # overlap double-counts. Occurrences were appended per member above
+            # overlap double-counts. Occurrences were appended per member
             # (file, line) and are deduplicated downstream in `_append_finding`.
-            rule_matches = len(resolved_identities)
-            resolved_match_counts_by_file = {}
-            for file_path, _start_byte, _end_byte in resolved_identities:
-                resolved_match_counts_by_file[file_path] = (
-                    resolved_match_counts_by_file.get(file_path, 0) + 1
+            tally.rule_matches = len(tally.identities)
+            tally.match_counts_by_file = {}
+            for file_path, _start_byte, _end_byte in tally.identities:
+                tally.match_counts_by_file[file_path] = (
+                    tally.match_counts_by_file.get(file_path, 0) + 1
                 )
 
         _append_finding(
             rule=rule,
-            rule_matches=rule_matches,
-            matched_files=resolved_matched_files,
-            match_counts_by_file=resolved_match_counts_by_file,
-            snippets_by_file=resolved_snippets_by_file,
-            rule_occurrences=resolved_rule_occurrences,
+            rule_matches=tally.rule_matches,
+            matched_files=tally.matched_files,
+            match_counts_by_file=tally.match_counts_by_file,
+            snippets_by_file=tally.snippets_by_file,
+            rule_occurrences=tally.rule_occurrences,
         )
 
     # Task #299: collect files the regex rules could not read, so the payload below can say the
@@ -1027,7 +1078,8 @@ def _run_ast_scan_payload(
     from tensor_grep.cli.repo_map import _UnreadablePathFlag as _ScanUnreadableFlag
 
     scan_unreadable = _ScanUnreadableFlag()
-    for rule in regex_rules:
+    regex_tallies = [_RuleScanTally(member_patterns=[rule["pattern"]]) for rule in regex_rules]
+    if regex_rules:
         backend_names_used.add("RegexRulesetBackend")
         if scanner is None:
             scanner = DirectoryScanner(cfg)
@@ -1035,18 +1087,18 @@ def _run_ast_scan_payload(
             resolved_candidate_files, _ = _self._collect_candidate_files(
                 scanner, resolved_scan_paths
             )
-
-        pattern = re.compile(rule["pattern"])
-        regex_matched_files: set[str] = set()
-        regex_match_counts_by_file: dict[str, int] = {}
-        regex_snippets_by_file: dict[str, list[dict[str, object]]] = {}
-        regex_rule_occurrences: list[dict[str, object]] = []
-        rule_matches = 0
-        rule_language = rule["language"]
+        # One pass per file for the whole ruleset: the file is read once, one literal
+        # prefilter finds the lines each rule can match, and only those lines run the rule.
+        matcher = RegexRuleMatcher([rule["pattern"] for rule in regex_rules])
         for current_file in resolved_candidate_files:
             # H11: scope the regex scan to the rule's language so a python rule does
             # not flag .ts/.js/.rs files, matching how AST rules are scoped.
-            if not _regex_rule_targets_file(rule_language, current_file):
+            rule_indexes = [
+                rule_index
+                for rule_index, rule in enumerate(regex_rules)
+                if _regex_rule_targets_file(rule["language"], current_file)
+            ]
+            if not rule_indexes:
                 continue
             try:
                 lines = (
@@ -1058,41 +1110,48 @@ def _run_ast_scan_payload(
                 # rule contributes no findings for this file, and `tg scan --ruleset` reports the
                 # result with no marker. A security ruleset then reads as "no violations" for a
                 # file nobody opened, and a CI gate keyed on the exit code passes. Record so the
-                # payload can say which files were never examined.
-                scan_unreadable.record(exc)
+                # payload can say which files were never examined -- once per rule it was in
+                # scope for, the attempt count the rule-by-rule reads used to produce.
+                for _rule_index in rule_indexes:
+                    scan_unreadable.record(exc)
                 continue
-            for line_number, line_text in enumerate(lines, start=1):
-                line_matches = list(pattern.finditer(line_text))
-                if not line_matches:
-                    continue
-                match_count = len(line_matches)
-                rule_matches += match_count
-                regex_matched_files.add(current_file)
-                regex_match_counts_by_file[current_file] = (
-                    regex_match_counts_by_file.get(current_file, 0) + match_count
-                )
-                regex_rule_occurrences.append({
-                    "file": current_file,
-                    "line": line_number,
-                })
-                if include_evidence_snippets:
-                    file_snippets = regex_snippets_by_file.setdefault(current_file, [])
-                    for regex_match in line_matches:
-                        if len(file_snippets) >= max_evidence_snippets_per_file:
-                            break
-                        file_snippets.append(
-                            _truncate_evidence_snippet(
-                                regex_match.group(0), max_evidence_snippet_chars
+            candidate_lines = matcher.candidate_lines(lines, rule_indexes)
+            for rule_index, line_indexes in zip(rule_indexes, candidate_lines, strict=True):
+                pattern = matcher.patterns[rule_index]
+                tally = regex_tallies[rule_index]
+                for line_index in line_indexes:
+                    line_matches = list(pattern.finditer(lines[line_index]))
+                    if not line_matches:
+                        continue
+                    match_count = len(line_matches)
+                    tally.rule_matches += match_count
+                    tally.matched_files.add(current_file)
+                    tally.match_counts_by_file[current_file] = (
+                        tally.match_counts_by_file.get(current_file, 0) + match_count
+                    )
+                    tally.rule_occurrences.append({
+                        "file": current_file,
+                        "line": line_index + 1,
+                    })
+                    if include_evidence_snippets:
+                        file_snippets = tally.snippets_by_file.setdefault(current_file, [])
+                        for regex_match in line_matches:
+                            if len(file_snippets) >= max_evidence_snippets_per_file:
+                                break
+                            file_snippets.append(
+                                _truncate_evidence_snippet(
+                                    regex_match.group(0), max_evidence_snippet_chars
+                                )
                             )
-                        )
 
+    for rule, tally in zip(regex_rules, regex_tallies, strict=True):
         _append_finding(
             rule=rule,
-            rule_matches=rule_matches,
-            matched_files=regex_matched_files,
-            match_counts_by_file=regex_match_counts_by_file,
-            snippets_by_file=regex_snippets_by_file,
-            rule_occurrences=regex_rule_occurrences,
+            rule_matches=tally.rule_matches,
+            matched_files=tally.matched_files,
+            match_counts_by_file=tally.match_counts_by_file,
+            snippets_by_file=tally.snippets_by_file,
+            rule_occurrences=tally.rule_occurrences,
         )
 
     payload = {
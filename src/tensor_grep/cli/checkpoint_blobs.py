@@ -0,0 +1,259 @@
+"""Content-addressed blob store behind checkpoint snapshots.
+
+Every checkpoint used to copy the WHOLE scope into its own ``snapshot/`` directory, so an agent
+that checkpoints before every ``tg_rewrite_apply`` kept dozens of near-identical full copies.
+Regular files are now stored once under ``checkpoints/blobs/<aa>/<sha256>-<mode>`` and each
+snapshot entry is a hardlink to its blob; only content the store has never seen is copied.
+The snapshot tree keeps its exact legacy shape, so undo, the containment guards, and
+checkpoints written by the native create path all read it unchanged -- and a hardlinked snapshot stays complete even if its blob name is collected.
+
+A blob is referenced exactly when some snapshot links to it, so the GC pass is a link-count
+sweep: a blob whose ``st_nlink`` has dropped to 1 belongs to no retained checkpoint. Filesystems
+without hardlinks fall back to a plain copy into the snapshot (the legacy cost, nothing worse).
+
+Each checkpoint's ``metadata.json`` carries a manifest (``rel_path -> sha256/mode/size/mtime``).
+Undo compares it against the working tree and rewrites only files whose content or mode
+differs, and the next create reuses a manifest digest for a file whose stat is unchanged and
+whose mtime predates the previous hash pass (the racy-mtime window git's index also guards).
+
+Like ``checkpoint_retention.py``, this module reaches the facade through a deferred,
+module-qualified import so the two never form an import-order-dependent cycle.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import stat
+import time
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+_BLOBS_SUBDIR = "blobs"
+_BLOB_TEMP_PREFIX = ".tmp-"
+# A stat-identical file is only trusted when its mtime is this far older than the hash pass that
+# recorded it: coarse-mtime filesystems (FAT, some network mounts) tick in 2-second steps.
+_RACY_MTIME_MARGIN_NS = 2_000_000_000
+# Orphaned temp files from an interrupted create are only collected once clearly abandoned.
+_STALE_TEMP_SECONDS = 3600.0
+_PUBLISH_ATTEMPTS = 3
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NOFOLLOW", 0)
+
+
+def _blob_store_dir(root: Path) -> Path:
+    from tensor_grep.cli import checkpoint_store
+
+    return checkpoint_store._checkpoint_storage_dir(root) / _BLOBS_SUBDIR
+
+
+def _blob_path(store: Path, digest: str, mode: int) -> Path:
+    return store / digest[:2] / f"{digest}-{mode:o}"
+
+
+def _file_digest(path: Path) -> str:
+    fd = os.open(path, _READ_FLAGS)
+    with os.fdopen(fd, "rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def _cached_digest(
+    status: os.stat_result, previous: dict[str, Any] | None, hashed_at_ns: int
+) -> str | None:
+    if not isinstance(previous, dict):
+        return None
+    digest = previous.get("sha256")
+    if not isinstance(digest, str) or len(digest) != 64:
+        return None
+    if (
+        previous.get("size") != status.st_size
+        or previous.get("mtime_ns") != status.st_mtime_ns
+        or previous.get("mode") != stat.S_IMODE(status.st_mode)
+    ):
+        return None
+    if status.st_mtime_ns + _RACY_MTIME_MARGIN_NS > hashed_at_ns:
+        return None
+    return digest
+
+
+def _previous_manifest(root: Path) -> tuple[dict[str, Any], int]:
+    """``(files, hashed_at_ns)`` of the newest checkpoint's manifest, or ``({}, 0)``.
+
+    Purely an optimization input: an unreadable index or a legacy (manifest-less) checkpoint
+    just means every file is hashed again.
+    """
+    from tensor_grep.cli import checkpoint_store
+
+    try:
+        records = checkpoint_store._load_index(root)
+        if not records:
+            return {}, 0
+        newest = max(records, key=lambda record: record.created_at)
+        metadata_path = checkpoint_store._metadata_path(root, newest.checkpoint_id)
+        metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+    except (OSError, TypeError, ValueError):
+        return {}, 0
+    if not isinstance(metadata, dict):
+        return {}, 0
+    manifest = metadata.get("manifest")
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("files"), dict):
+        return {}, 0
+    hashed_at_ns = manifest.get("hashed_at_ns")
+    return manifest["files"], hashed_at_ns if isinstance(hashed_at_ns, int) else 0
+
+
+def _reusable_paths(
+    root: Path,
+    entries: dict[str, bool],
+    previous_files: dict[str, Any],
+    previous_hashed_at_ns: int,
+) -> set[str]:
+    """Entries whose bytes are already in the store, judged from stat alone (no reads)."""
+    store = _blob_store_dir(root)
+    reusable: set[str] = set()
+    for rel_path, exists in entries.items():
+        if not exists or rel_path not in previous_files:
+            continue
+        try:
+            status = os.lstat(root / rel_path)
+        except OSError:
+            continue
+        if not stat.S_ISREG(status.st_mode):
+            continue
+        digest = _cached_digest(status, previous_files[rel_path], previous_hashed_at_ns)
+        if digest is not None and _blob_path(store, digest, stat.S_IMODE(status.st_mode)).exists():
+            reusable.add(rel_path)
+    return reusable
+
+
+def _store_blob(store: Path, source: Path, mode: int) -> tuple[str, Path]:
+    """Copy ``source`` into the store; return ``(digest, blob)`` of the bytes it received.
+
+    Naming the blob by what was actually copied keeps a file edited since it was first hashed
+    under a name that matches its content. The temp file and the shard directory are created
+    under a retry: a concurrent GC may remove an empty store or shard directory in between.
+    """
+    temp = store / f"{_BLOB_TEMP_PREFIX}{uuid4().hex}"
+    try:
+        for attempt in range(_PUBLISH_ATTEMPTS):
+            store.mkdir(parents=True, exist_ok=True)
+            try:
+                shutil.copy2(source, temp, follow_symlinks=False)
+                break
+            except FileNotFoundError:
+                if attempt + 1 == _PUBLISH_ATTEMPTS or store.is_dir():
+                    raise
+        digest = _file_digest(temp)
+        blob = _blob_path(store, digest, mode)
+        for attempt in range(_PUBLISH_ATTEMPTS):
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.replace(temp, blob)
+                break
+            except FileNotFoundError:
+                if attempt + 1 == _PUBLISH_ATTEMPTS or blob.parent.is_dir():
+                    raise
+        return digest, blob
+    except BaseException:
+        with contextlib.suppress(OSError):
+            temp.unlink()
+        raise
+
+
+def _snapshot_file(
+    store: Path,
+    source: Path,
+    destination: Path,
+    *,
+    previous: dict[str, Any] | None = None,
+    previous_hashed_at_ns: int = 0,
+) -> dict[str, Any] | None:
+    """Materialize ``source`` at ``destination`` from the blob store; return its manifest entry.
+
+    Anything but a regular file (a symlink, a special file) is copied exactly as before -- stored
+    AS a link, never followed -- and gets no manifest entry, so undo always restores it.
+    """
+    status = os.lstat(source)
+    if not stat.S_ISREG(status.st_mode):
+        shutil.copy2(source, destination, follow_symlinks=False)
+        return None
+    mode = stat.S_IMODE(status.st_mode)
+    digest = _cached_digest(status, previous, previous_hashed_at_ns) or _file_digest(source)
+    blob = _blob_path(store, digest, mode)
+    if not blob.exists():
+        digest, blob = _store_blob(store, source, mode)
+    try:
+        os.link(blob, destination)
+    except FileNotFoundError:
+        # A concurrent create's GC collected the blob between our store and link: the snapshot
+        # only needs the bytes, so take them straight from the source.
+        shutil.copy2(source, destination, follow_symlinks=False)
+    except OSError:
+        # No hardlinks here (FAT, some network shares) or the blob hit the filesystem's link
+        # limit (EMLINK -- one empty ``__init__.py`` blob serves every package): private copy.
+        shutil.copy2(blob, destination, follow_symlinks=False)
+    return {
+        "sha256": digest,
+        "mode": mode,
+        "size": status.st_size,
+        "mtime_ns": status.st_mtime_ns,
+    }
+
+
+def _matches_manifest(target: Path, entry: Any) -> bool:
+    """True when ``target`` is a regular file with exactly the manifest's content and mode."""
+    if not isinstance(entry, dict):
+        return False
+    try:
+        status = os.lstat(target)
+        if not stat.S_ISREG(status.st_mode):
+            return False
+        if stat.S_IMODE(status.st_mode) != entry.get("mode") or status.st_size != entry.get("size"):
+            return False
+        return _file_digest(target) == entry.get("sha256")
+    except OSError:
+        return False
+
+
+def _collect_unreferenced_blobs(root: Path) -> int:
+    """GC pass: drop blobs no retained snapshot links to. Best-effort; returns blobs removed.
+
+    Empty shard directories and an empty store are removed too, so a store whose checkpoints
+    are all gone leaves nothing behind. A temp file is only collected once abandoned (ctime,
+    not mtime: ``copy2`` stamps the source's mtime onto it).
+    """
+    store = _blob_store_dir(root)
+    removed = 0
+    stale_before = time.time() - _STALE_TEMP_SECONDS
+    try:
+        children = sorted(store.iterdir())
+    except OSError:
+        return 0
+    for child in children:
+        try:
+            status = os.lstat(child)
+            if stat.S_ISREG(status.st_mode) and child.name.startswith(_BLOB_TEMP_PREFIX):
+                if status.st_ctime < stale_before:
+                    child.unlink()
+                continue
+            if not stat.S_ISDIR(status.st_mode):
+                continue
+            blobs = list(child.iterdir())
+        except OSError:
+            continue
+        for blob in blobs:
+            try:
+                status = os.lstat(blob)
+                if stat.S_ISREG(status.st_mode) and status.st_nlink <= 1:
+                    blob.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        with contextlib.suppress(OSError):
+            child.rmdir()
+    with contextlib.suppress(OSError):
+        store.rmdir()
+    return removed
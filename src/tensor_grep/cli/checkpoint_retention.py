@@ -22,6 +22,7 @@ import shutil
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
     from pathlib import Path
 
     from tensor_grep.cli.checkpoint_store import CheckpointRecord
@@ -87,13 +88,17 @@ def _prune_checkpoint_records(
 
     Thin wrapper over ``_select_retained_checkpoints`` that removes the dropped checkpoints'
     directories immediately, so any existing caller/test that expects synchronous pruning is
-    unchanged. Each dropped checkpoint's entire directory (metadata.json + the full snapshot
-    copy) is removed so disk usage stays bounded — an uncapped store grows by ~one full scope
-    copy per checkpoint.
+    unchanged. Each dropped checkpoint's entire directory (metadata.json + its snapshot tree of
+    blob links) is removed, then blobs no surviving snapshot links to are collected, so disk
+    usage stays bounded.
     """
+    from tensor_grep.cli.checkpoint_blobs import _collect_unreferenced_blobs
+
     retained, dirs_to_delete = _select_retained_checkpoints(root, records, max_records=max_records)
     for directory in dirs_to_delete:
         shutil.rmtree(directory, ignore_errors=True)
+    if dirs_to_delete:
+        _collect_unreferenced_blobs(root)
     return retained
 
 
@@ -141,7 +146,9 @@ def _configured_checkpoint_free_space_margin_bytes() -> int:
     )
 
 
-def _check_checkpoint_disk_budget(root: Path, entries: dict[str, bool]) -> None:
+def _check_checkpoint_disk_budget(
+    root: Path, entries: dict[str, bool], *, stored: Collection[str] = ()
+) -> None:
     """Pre-flight disk-usage budget for create_checkpoint (audit H4).
 
     Stats every entry that will be copied (cheap; no copying yet) and refuses BEFORE any
@@ -150,6 +157,9 @@ def _check_checkpoint_disk_budget(root: Path, entries: dict[str, bool]) -> None:
     less than the configured free-space margin on the destination filesystem. All three caps
     are env-configurable (sane defaults) so a repo with legitimately large tracked assets can
     raise the limit instead of being permanently blocked.
+
+    ``stored`` names entries whose bytes the checkpoint blob store already holds: they still
+    count toward the per-file and per-checkpoint caps, but a hardlink needs no free space.
     """
     from tensor_grep.cli.checkpoint_store import (
         _CHECKPOINT_FREE_SPACE_MARGIN_BYTES_ENV,
@@ -163,6 +173,7 @@ def _check_checkpoint_disk_budget(root: Path, entries: dict[str, bool]) -> None:
     free_margin_bytes = _configured_checkpoint_free_space_margin_bytes()
 
     total_bytes = 0
+    new_bytes = 0
     for rel_path, exists in entries.items():
         if not exists:
             continue
@@ -179,6 +190,8 @@ def _check_checkpoint_disk_budget(root: Path, entries: dict[str, bool]) -> None:
                 "larger files)."
             )
         total_bytes += size
+        if rel_path not in stored:
+            new_bytes += size
         if total_bytes > max_total_bytes:
             raise CheckpointBudgetExceededError(
                 "Checkpoint refused: snapshot size exceeds the per-checkpoint limit of "
@@ -192,10 +205,10 @@ def _check_checkpoint_disk_budget(root: Path, entries: dict[str, bool]) -> None:
         # Cannot introspect free space on this filesystem; do not block the checkpoint on a
         # diagnostic we could not compute -- the per-file/total-bytes caps above still apply.
         return
-    required_bytes = total_bytes + free_margin_bytes
+    required_bytes = new_bytes + free_margin_bytes
     if free_bytes < required_bytes:
         raise CheckpointBudgetExceededError(
             f"Checkpoint refused: only {free_bytes} bytes free, but this checkpoint needs "
-            f"{total_bytes} bytes plus a {free_margin_bytes}-byte safety margin (lower "
+            f"{new_bytes} bytes plus a {free_margin_bytes}-byte safety margin (lower "
             f"{_CHECKPOINT_FREE_SPACE_MARGIN_BYTES_ENV} to change the margin)."
         )
@@ -14,6 +14,14 @@ from typing import Any
 from uuid import uuid4
 
 from tensor_grep.cli._index_lock import atomic_write_bytes, atomic_write_json, index_lock
+from tensor_grep.cli.checkpoint_blobs import (
+    _blob_store_dir,
+    _collect_unreferenced_blobs,
+    _matches_manifest,
+    _previous_manifest,
+    _reusable_paths,
+    _snapshot_file,
+)
 
 # NOTE: only the two names this file actually calls are imported here.
 # `_configured_checkpoint_max`, `_prune_checkpoint_records`,
@@ -40,8 +48,9 @@ _DISCOVERY_CACHE_VERSION = 2
 _DISCOVERY_MAX_DEPTH = 6
 _DISCOVERY_MAX_DIRECTORIES = 10_000
 _DISCOVERY_CACHE_TTL_SECONDS = 300.0
-# round-4 DoS: bound on-disk checkpoint retention. Each checkpoint copies the WHOLE scope into a
-# new snapshot dir, so an uncapped store grows without limit. Keep only the newest N.
+# round-4 DoS: bound on-disk checkpoint retention. Each checkpoint links the WHOLE scope into a
+# new snapshot dir (content shared through checkpoint_blobs), so an uncapped store still grows
+# by one tree of links plus every changed file per checkpoint. Keep only the newest N.
 _CHECKPOINT_MAX_ENV = "TG_CHECKPOINT_MAX"
 _DEFAULT_CHECKPOINT_MAX = 64
 # audit H4: create_checkpoint() copied every entry with no per-file cap, no cumulative-size
@@ -737,6 +746,7 @@ def _write_checkpoint_metadata(
     *,
     scope_kind: str,
     original_path: Path,
+    manifest: dict[str, Any] | None = None,
 ) -> None:
     payload: dict[str, Any] = {
         "version": _CHECKPOINT_VERSION,
@@ -755,6 +765,8 @@ def _write_checkpoint_metadata(
         "skipped_nested_repos": result.skipped_nested_repos,
         "active": True,
     }
+    if manifest is not None:
+        payload["manifest"] = manifest
     _write_json_atomic(_metadata_path(root, result.checkpoint_id), payload)
 
 
@@ -765,10 +777,16 @@ def create_checkpoint(path: str = ".") -> CheckpointCreateResult:
     created_at = datetime.now(UTC).isoformat()
     checkpoint_id = f"ckpt-{datetime.now(UTC).strftime('%Y%m%d%H%M%S')}-{uuid4().hex[:8]}"
     entries, skipped_nested_repos = _snapshot_entries(scope)
+    previous_files, previous_hashed_at_ns = _previous_manifest(root)
 
     # audit H4: refuse BEFORE any snapshot directory exists if the copy would blow a
-    # configured size/free-space budget -- see _check_checkpoint_disk_budget.
-    _check_checkpoint_disk_budget(root, entries)
+    # configured size/free-space budget -- see _check_checkpoint_disk_budget. Content the blob
+    # store already holds costs no new space, so it is left out of the free-space requirement.
+    _check_checkpoint_disk_budget(
+        root,
+        entries,
+        stored=_reusable_paths(root, entries, previous_files, previous_hashed_at_ns),
+    )
 
     # Create the storage root up front so its resolve() is stable: under concurrent first-time
     # creates, resolving _snapshot_path while another writer is still mkdir-ing .tensor-grep/
@@ -801,6 +819,9 @@ def create_checkpoint(path: str = ".") -> CheckpointCreateResult:
         #     checkpoint containing a tracked out-of-root-pointing leaf symlink that undo
         #     must restore as a link (cannot today).
         root_resolved = root.resolve()
+        blob_store = _blob_store_dir(root)
+        manifest_files: dict[str, Any] = {}
+        hashed_at_ns = time.time_ns()
         for rel_path, exists in entries.items():
             if not exists:
                 continue
@@ -808,9 +829,18 @@ def create_checkpoint(path: str = ".") -> CheckpointCreateResult:
             source = resolved_parent / leaf
             destination = snapshot_dir / rel_path
             destination.parent.mkdir(parents=True, exist_ok=True)
-            # follow_symlinks=False: store a symlink AS a link, never copy its (possibly
-            # out-of-root) target content into the snapshot (audit HIGH — symlink disclosure).
-            shutil.copy2(source, destination, follow_symlinks=False)
+            # Regular files are hardlinked from the content-addressed blob store; a symlink is
+            # still stored AS a link (follow_symlinks=False inside), never its (possibly
+            # out-of-root) target content (audit HIGH — symlink disclosure).
+            manifest_entry = _snapshot_file(
+                blob_store,
+                source,
+                destination,
+                previous=previous_files.get(rel_path),
+                previous_hashed_at_ns=previous_hashed_at_ns,
+            )
+            if manifest_entry is not None:
+                manifest_files[rel_path] = manifest_entry
 
         result = CheckpointCreateResult(
             checkpoint_id=checkpoint_id,
@@ -828,6 +858,7 @@ def create_checkpoint(path: str = ".") -> CheckpointCreateResult:
             entries,
             scope_kind=scope.scope_kind,
             original_path=scope.original_path,
+            manifest={"hashed_at_ns": hashed_at_ns, "files": manifest_files},
         )
 
         # audit #178 (surfaced by the #610 gate): the guarded region must also extend through
@@ -868,10 +899,14 @@ def create_checkpoint(path: str = ".") -> CheckpointCreateResult:
         # _prune_checkpoint_records removes a checkpoint. Always re-raise: the interrupt or
         # exception must still propagate to the caller, never be swallowed here.
         shutil.rmtree(snapshot_dir.parent, ignore_errors=True)
+        # Blobs this attempt stored are now linked from nowhere: collect them with it.
+        _collect_unreferenced_blobs(root)
         raise
 
     for directory in dropped_dirs:
         shutil.rmtree(directory, ignore_errors=True)
+    if dropped_dirs:
+        _collect_unreferenced_blobs(root)
     _prime_bounded_discovery_caches_for_root(root)
     return result
 
@@ -1212,6 +1247,12 @@ def undo_checkpoint(checkpoint_id: str, path: str = ".") -> CheckpointUndoResult
 
     metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
     entries: dict[str, bool] = metadata["entries"]
+    # Checkpoints from before the blob store (and from the native create path) carry no
+    # manifest: every entry is then restored, exactly as before.
+    manifest = metadata.get("manifest")
+    manifest_files = manifest.get("files") if isinstance(manifest, dict) else None
+    if not isinstance(manifest_files, dict):
+        manifest_files = {}
     snapshot_dir = _snapshot_path(root, checkpoint_id)
     root_resolved = root.resolve()
     snapshot_dir_resolved = snapshot_dir.resolve()
@@ -1300,6 +1341,9 @@ def undo_checkpoint(checkpoint_id: str, path: str = ".") -> CheckpointUndoResult
         for rel_path, exists in entries.items():
             target = resolved_targets[rel_path]
             if exists:
+                if _matches_manifest(target, manifest_files.get(rel_path)):
+                    # Already byte- and mode-identical to the checkpoint: nothing to restore.
+                    continue
                 source = resolved_sources[rel_path]
                 staged = staging_root / Path(rel_path)
                 staged.parent.mkdir(parents=True, exist_ok=True)
@@ -44,6 +44,7 @@ KNOWN_COMMANDS = {
     "review-bundle",
     "evidence",
     "ledger",
+    "index",
     "devices",
     "context",
     "lsp",
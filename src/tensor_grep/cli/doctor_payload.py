@@ -666,6 +666,21 @@ def _render_doctor_payload(payload: dict[str, Any]) -> str:
     if ast_grep_payload.get("error"):
         lines.append(f"  error: {ast_grep_payload['error']}")
 
+    dense_payload = cast(dict[str, Any], payload.get("dense_model", {}))
+    lines.append(
+        f"dense_model: fetched={dense_payload.get('fetched', False)} dir={dense_payload.get('dir')}"
+    )
+    embedding_payload = cast(dict[str, Any], dense_payload.get("embedding_cache", {}))
+    if embedding_payload.get("exists"):
+        hit_rate = embedding_payload.get("hit_rate")
+        lines.append(
+            f"  embedding_cache: entries={embedding_payload.get('entries')} "
+            f"bytes={embedding_payload.get('bytes')} "
+            f"hit_rate={'n/a' if hit_rate is None else f'{hit_rate:.1%}'}"
+        )
+    elif embedding_payload:
+        lines.append(f"  embedding_cache: empty enabled={embedding_payload.get('enabled')}")
+
     worker_payload = cast(dict[str, Any], payload.get("resident_worker", {}))
     lines.append(
         f"resident_worker: port_file_exists={worker_payload.get('port_file_exists', False)} "
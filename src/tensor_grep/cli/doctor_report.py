@@ -378,6 +378,7 @@ def _doctor_dense_model_status() -> dict[str, Any]:
     A pure filesystem check (mirrors `load_dense_model`'s own "is it fetched" test -- does the
     directory exist -- rather than actually loading the model, so this stays cheap for `tg doctor`)
     reported next to `ast_grep`/`resident_worker`'s optional-capability shape."""
+    from tensor_grep.core.embedding_cache import embedding_cache_status
     from tensor_grep.core.retrieval_dense import default_model_dir
 
     model_dir = default_model_dir()
@@ -389,6 +390,9 @@ def _doctor_dense_model_status() -> dict[str, Any]:
     }
     if not fetched:
         status["install_hint"] = "run `tg install-dense` to fetch the dense-embedding model"
+    else:
+        # Reads only the store's meta JSON -- the embeddings themselves are never opened here.
+        status["embedding_cache"] = embedding_cache_status(model_dir)
     return status
 
 
@@ -0,0 +1,209 @@
+"""`tg find`'s query-adaptive ranking knobs and its dense-leg CLI messages.
+
+Split out of `cli/main.py` (see `docs/design/2026-08-19-split-floor-escape.md`). Holds the pure
+helpers `_execute_find` consults per query -- the dense-leg weight and the RRF combine mode, both
+keyed on the same single-token predicate, the representative-line pick for a ranked chunk, and
+the `tg install-dense` rewrite of the dense leg's raw fetch hint. Nothing here reads `main.py`'s
+globals, so no `_self` indirection is needed; `main.py` rebinds every name for its callers and
+the tests that import them from there.
+"""
+
+import math
+import os
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from tensor_grep.core.retrieval_chunker import Chunk
+
+# CEO#7: the raw fetch-command hint baked into retrieval_dense.py's `DenseUnavailableError` ("not
+# fetched" case) predates the one-shot `tg install-dense` command -- see
+# `_friendly_dense_unavailable_message` below.
+_DENSE_FETCH_RAW_HINT = "python -m tensor_grep.core.retrieval_dense --fetch"
+_DENSE_FETCH_FRIENDLY_HINT = "tg install-dense"
+
+
+def _friendly_dense_unavailable_message(exc: BaseException) -> str:
+    """CLI-boundary rewrite of the dense leg's raw fetch-command hint into the one-shot
+    `tg install-dense` command (CEO#7) a real `tg find` user should run instead.
+
+    Deliberately a string substitution at the CALL SITE, not an edit to the library exception
+    message itself (`retrieval_dense.py`'s `DenseUnavailableError` "not fetched" message is pinned
+    verbatim -- including the raw `python -m tensor_grep.core.retrieval_dense --fetch` command --
+    by `test_retrieval_dense_fetch.py::test_not_fetched_error_names_the_new_fetch_command`, which
+    documents that message as the module-CLI-only front door). A no-op when the raw hint is absent
+    (e.g. a dim-mismatch or malformed-shape `DenseUnavailableError`, which never mentions fetch).
+    """
+    return str(exc).replace(_DENSE_FETCH_RAW_HINT, _DENSE_FETCH_FRIENDLY_HINT)
+
+
+# #189 (ledger DENSE-WEIGHT SWEEP, agent a8580b6e 2026-07-16): the golden-set sweep measured a
+# real ndcg@10/recall lift (1:5 bm25:dense -> +0.1419 ndcg@10, recall 0.55->0.80, ZERO
+# per-category regression) on the 40 NL vocab-mismatch golden queries -- but that set is 100% NL
+# and cannot see the opposite failure mode: a short/lexical query (the canary `vm-behavior-10`)
+# where BM25 is the stronger leg and boosting dense regresses it. `TG_FIND_DENSE_WEIGHT` is the
+# knob (see `core/reranker.py`'s `rank_chunks(dense_weight=...)`); `_find_dense_weight` below is
+# the guard that keeps the boost scoped to the query shape the sweep actually validated.
+# #191 (THE FLIP): the env-unset default is no longer the inert 1.0 no-op. With the classifier
+# hardened (whitespace gate, below) and the flip-prep NITs closed (nan/inf clamp, 3-token
+# identifier re-sweep), env-unset now applies the SAME adaptive rule a valid explicit override
+# would: a multi-word NL query gets `_FIND_DENSE_WEIGHT_ADAPTIVE_DEFAULT` (5.0, the ledger-swept
+# 1:5 bm25:dense ratio); a single whitespace-free token stays at the protected 1.0. A malformed or
+# non-finite override (a typo, `nan`, `inf`) is now treated exactly like unset -- it resolves to
+# the SAME adaptive default rather than silently opting a typo'd operator OUT of the improved
+# default (thinktank rank-lens must-fix, 2026-07-16). An operator who wants the OLD equal-weight
+# fusion back must set `TG_FIND_DENSE_WEIGHT=1.0` explicitly.
+_FIND_DENSE_WEIGHT_ENV = "TG_FIND_DENSE_WEIGHT"
+_FIND_DENSE_WEIGHT_DEFAULT = 1.0
+# The ledger-validated adaptive weight (#191, DENSE-WEIGHT SWEEP): encodes the swept 1:5
+# bm25:dense ratio -- `rank_chunks` fixes the bm25 leg at 1.0, so `dense_weight=5.0` IS the 1:5
+# ratio (tg_find_review_ledger.md DENSE-WEIGHT SWEEP). This is now the env-UNSET (and
+# env-malformed/non-finite) resolution for a genuinely multi-word query; a single-token query
+# still resolves to `_FIND_DENSE_WEIGHT_DEFAULT` above via the whitespace gate.
+_FIND_DENSE_WEIGHT_ADAPTIVE_DEFAULT = 5.0
+# Whitespace-based NL-vs-literal classifier (dogfood finding, #191): a query with MORE THAN ONE
+# whitespace-separated word is NL/multi-word and gets the adaptive weight; a single whitespace-free
+# token is a literal identifier (a symbol name, a grep-style search) and stays at 1.0. The prior
+# `split_terms(query) > 2` morpheme-count floor was WRONG: `split_terms` splits snake_case/camelCase
+# into MORPHEMES, so a descriptive single-token identifier (`_confine_mcp_path`, `getUserName`,
+# `BackendExecutionError`, `reciprocal_rank_fusion` -- all 3 morphemes) counted as "NL" and leaked
+# to the dense boost. A real-repo dogfood on tensor-grep's own src caught this: 5 of 6 literal
+# identifier queries were misclassified; only `rank_chunks` (2 morphemes) stayed protected. Every
+# literal query in the dogfood was a single whitespace-free token and every NL query had 6+
+# space-separated words -- whitespace is the clean separator the morpheme floor couldn't exploit.
+
+
+def _find_dense_weight(query: str) -> float:
+    """Query-adaptive `dense_weight` for `tg find`'s `rank_chunks` calls ONLY (#189, flipped ON by
+    #191): with `TG_FIND_DENSE_WEIGHT` unset -- or set to something malformed/unparseable/
+    non-finite (see flip-prep NIT 1 below) -- a genuinely multi-word NL query now gets the
+    ledger-validated `_FIND_DENSE_WEIGHT_ADAPTIVE_DEFAULT` (5.0) instead of the old inert 1.0
+    no-op. A single whitespace-free token ALWAYS stays at the protected
+    `_FIND_DENSE_WEIGHT_DEFAULT` (1.0), regardless of the env var's state -- the whitespace gate
+    below applies uniformly to the adaptive default, a malformed/non-finite fallback, AND an
+    explicit override alike.
+
+    When the env var IS set to a valid FINITE float, that EXPLICIT value replaces the adaptive
+    default for a multi-word query -- `TG_FIND_DENSE_WEIGHT=1.0` is the explicit opt-out back to
+    the old equal-weight fusion; any other finite value (e.g. `=3.0`) is honored verbatim. A
+    single whitespace-free token (a bare identifier, a function/class/symbol name, a grep-style
+    literal search -- `tg find`'s own "literal" and "identifier3" golden slices,
+    `benchmarks/datasets/literal_golden.jsonl` + `identifier3_golden.jsonl`) instead routes to 1.0
+    (the un-boosted 1:1 fusion) NO MATTER what the env var says: the sweep's canary case proved
+    BM25 is the stronger leg for a lexical query, so boosting dense would risk regressing it --
+    this is the guard that keeps the knob scoped to where it was actually measured to help.
+
+    Whitespace, NOT morphemes (dogfood finding, #191): the classifier gates on whitespace-separated
+    word count, never `split_terms(query)` morpheme count. `split_terms` splits snake_case/camelCase
+    into morphemes, so a descriptive single-token identifier like `mint_access_token` /
+    `getUserName` / `_confine_mcp_path` splits into 3+ morphemes and the old `> 2` floor
+    misclassified it as NL -- exactly backwards for a literal-identifier lookup where BM25 is the
+    strong leg. A real-repo dogfood on tensor-grep's own src caught the leak (5 of 6 literal
+    identifier queries wrongly boosted, only the 2-morpheme `rank_chunks` protected); the
+    whitespace gate is the dogfood's own recommended fix.
+
+    KNOWN SCOPE (thinktank rank-lens, 2026-07-16): the whitespace gate is purely structural -- a
+    2-word LEXICAL phrase (e.g. `"return None"`, `"TODO fixme"`) is indistinguishable from a
+    2-word NL phrase and ALSO receives the adaptive boost. The 1:5 sweep is 100% NL queries and
+    the literal/identifier3 golden slices are single-token by construction, so this exact shape is
+    UNMEASURED. This is a deliberate non-goal, not an oversight: building a lexical-vs-NL content
+    classifier here would repeat the exact mistake the morpheme classifier made (a content-based
+    heuristic that silently misclassifies real queries) -- see
+    `test_find_dense_weight_default_boosts_two_word_lexical_canary` for the regression-catching
+    canary this scope decision needs. `TG_FIND_DENSE_WEIGHT=1.0` remains the escape hatch for a
+    precise 2-word literal search; `potion-code-16M` is a CODE-domain embedding model, which makes
+    boosting a 2-word code fragment defensible too, not just prose NL.
+
+    Flip-prep NIT 1 (tg_find_review_ledger.md FLIP-PREP): `float("nan")` / `float("inf")` /
+    `float("-inf")` all PARSE successfully -- `ValueError` alone never catches them, and `nan` in
+    particular compares unequal to everything (including itself), so a downstream `!= 1.0` check
+    would treat it as "non-default" too. `math.isfinite` rejects `nan` and both infinities the same
+    way the `except ValueError` branch below rejects outright garbage -- both now fall through to
+    the SAME adaptive-default resolution as an unset env var (#191 must-fix 2: a typo must not
+    silently opt an operator OUT of the improved default), rather than being clamped to the old
+    1.0. Either way, a non-finite value never reaches `rank_chunks(dense_weight=...)`:
+    `weights=[1.0, nan]` would otherwise build a degenerate list for `reciprocal_rank_fusion`'s
+    sort.
+    """
+    raw = os.environ.get(_FIND_DENSE_WEIGHT_ENV)
+    weight = _FIND_DENSE_WEIGHT_ADAPTIVE_DEFAULT
+    if raw:
+        try:
+            explicit = float(raw)
+        except ValueError:
+            explicit = None
+        if explicit is not None and math.isfinite(explicit):
+            weight = explicit
+        # else: malformed or non-finite -- treated exactly like an unset env var (falls through to
+        # the adaptive default above), per #191 must-fix 2.
+
+    # A single whitespace-free token (or an empty/whitespace-only query, whose `split()` -> []) is a
+    # literal identifier -> stay at the protected 1.0, regardless of the env var's state. Only a
+    # genuinely multi-word (space-separated) query is NL and gets the resolved `weight` above.
+    # Whitespace, not `split_terms` morphemes -- see the module comment above `_FIND_DENSE_WEIGHT_ENV`
+    # for the dogfood finding (#191) this fixes.
+    if _find_is_single_token_query(query):
+        return _FIND_DENSE_WEIGHT_DEFAULT
+    return weight
+
+
+def _find_is_single_token_query(query: str) -> bool:
+    """Shared literal/identifier-query predicate for `tg find`'s two query-adaptive knobs --
+    `_find_dense_weight`'s dense_weight (above) AND `_find_combine_mode`'s RRF combine mode
+    (below). A single whitespace-free token (or an empty/whitespace-only query, whose ``split()``
+    -> ``[]``) is a literal identifier lookup; anything with 2+ whitespace-separated words is NL.
+    Whitespace, not `split_terms` morphemes -- see the module comment above
+    `_FIND_DENSE_WEIGHT_ENV` for the #191 dogfood finding this rule fixes. Factored out to a single
+    canonical definition so the two knobs can never silently disagree on what counts as literal.
+    """
+    return len(query.split()) <= 1
+
+
+def _find_combine_mode(query: str) -> Literal["sum", "max"]:
+    """Query-adaptive RRF `combine` mode for `tg find`'s `rank_chunks` calls (accuracy-leg
+    max-fusion regression fix, Opus-gate finding on PR #717): `combine="max"` (`rank_chunks`'s own
+    default, see its docstring) lifts genuinely multi-word/NL queries (ndcg@10 +62.6% on the frozen
+    40-query golden set) but REGRESSES single-token literal/identifier lookups -- measured on
+    `benchmarks/datasets/literal_golden.jsonl` (10 queries, `dense_weight=1.0` as
+    `_find_dense_weight` already protects them at): sum scores a perfect 1.0 ndcg@10 (as it always
+    has); max drops to 0.9631, a real -0.0369 regression. Mechanism: a literal query's true answer
+    is frequently ranked #1 by BOTH the bm25 leg and the dense leg independently -- `"sum"`'s
+    per-leg-agreement bonus is exactly the confirming signal `"max"` discards, letting a
+    single-leg-only competitor tie the true answer's now-undiscounted best-single-term score.
+
+    Routes on the EXACT SAME whitespace predicate `_find_dense_weight` already uses
+    (`_find_is_single_token_query`) so the two adaptive knobs can never disagree on what counts as
+    literal: a single whitespace-free token -> `"sum"` (byte-identical to the pre-max-flip
+    behavior, recovering the regression); a genuinely multi-word query -> `"max"` (keeps the NL
+    win, including composed with the adaptive `dense_weight=5.0`, which reaches the dense-alone
+    ndcg@10 ceiling exactly). This is scoped to `tg find` only -- `rerank_hybrid` (the `tg search
+    --semantic` path) never passes `combine`, so it is unaffected and stays on the plain "max"
+    default.
+    """
+    return "sum" if _find_is_single_token_query(query) else "max"
+
+
+def _find_representative_line(chunk: "Chunk", query_terms: set[str]) -> tuple[int, str]:
+    """Pick ONE line within `chunk` to surface as the synthesized `MatchLine` (D2): the line with
+    the most `split_terms` overlap with the query, ties broken by the FIRST such line (the `>`
+    comparison below never replaces an already-found best on an equal score) -- deterministic
+    regardless of repeated content within the chunk.
+
+    Falls back to the chunk's first line (or an empty string for a pathologically empty chunk)
+    when the query has no terms at all or the chunk somehow has no lines -- `chunk_file` never
+    returns an empty-text chunk in practice, but this stays total rather than raising on it.
+    """
+    from tensor_grep.core.retrieval_lexical import split_terms
+
+    lines = chunk.text.splitlines()
+    if not lines:
+        return chunk.start_line, ""
+
+    best_index = 0
+    best_overlap = -1
+    for index, line_text in enumerate(lines):
+        overlap = len(query_terms & set(split_terms(line_text))) if query_terms else 0
+        if overlap > best_overlap:
+            best_overlap = overlap
+            best_index = index
+
+    return chunk.start_line + best_index, lines[best_index]
@@ -0,0 +1,235 @@
+"""`tg index`: build, inspect and prune the persisted search indexes.
+
+Split out of `cli/main.py` (see `docs/design/2026-08-19-split-floor-escape.md`), which only
+registers `index_app` under `tg index`. Two indexes live behind these commands: the repository
+trigram index (`core/repo_trigram_index.py`) that narrows CPU/StringZilla candidate files, and
+the chunk/BM25 semantic index (`core/semantic_index.py`) that `tg find` and `tg search --rank`
+reuse.
+
+`_self` is `cli/main.py`'s module object, imported from `cli/_main_binding`; every reference to
+a helper that still lives in `main.py` goes through it. Read that module's docstring before
+adding a bare cross-module reference.
+
+Each command reports an index failure (an unreadable file, a torn manifest, a chunker error) on
+stderr with exit 1. Anything else is a bug and is left to propagate.
+"""
+
+import dataclasses
+import json
+from pathlib import Path
+
+import typer
+
+from tensor_grep.cli._main_binding import _self as _self
+
+# `tg find`'s walk cap (main.py's `_DEFAULT_AGENT_REPO_SCAN_LIMIT`): `tg index semantic` must
+# cover the same files a default `tg find` ranks over. A separate literal, not an import, for the
+# same reason main.py gives for its own copy -- it is this module's CLI-option default.
+_DEFAULT_SEMANTIC_INDEX_REPO_FILES = 2000
+
+index_app = typer.Typer(
+    help=(
+        "Build and maintain the repository trigram index that narrows CPU/StringZilla searches, "
+        "and the semantic chunk index `tg find` / `tg search --rank` reuse."
+    ),
+    no_args_is_help=True,
+)
+
+
+@index_app.command("build")
+def index_build(
+    path: str = typer.Argument(".", help="Repository root to index."),
+    full: bool = typer.Option(
+        False, "--full", help="Discard the existing index and re-read every file."
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Emit machine-readable JSON output."),
+) -> None:
+    """Build or incrementally update the repository trigram index for PATH.
+
+    Only files whose size or mtime changed since the last build are re-read. CPU/StringZilla
+    searches under PATH then skip files the index proves cannot contain the pattern's literal;
+    files added or changed after the build are always searched.
+    """
+    from tensor_grep.core.config import SearchConfig
+    from tensor_grep.core.repo_trigram_index import build_repo_trigram_index
+    from tensor_grep.io.directory_scanner import DirectoryScanner
+
+    if not Path(path).is_dir():
+        typer.echo(f"Error: index root is not a directory: {path}", err=True)
+        raise typer.Exit(2)
+    try:
+        candidate_files, _ = _self._collect_candidate_files(
+            DirectoryScanner(SearchConfig()), [path]
+        )
+        report = build_repo_trigram_index(path, candidate_files, full=full)
+    except (OSError, ValueError, RuntimeError) as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(1) from exc
+
+    if json_output:
+        payload = {
+            "version": _self._json_output_version(),
+            "schema_version": _self._json_output_version(),
+            "routing_backend": "RepoIndex",
+            "routing_reason": "index-build",
+            **dataclasses.asdict(report),
+        }
+        typer.echo(json.dumps(payload, indent=2))
+        return
+
+    state = "rebuilt" if report.full_rebuild else "updated" if report.changed else "up to date"
+    typer.echo(f"Index {state} for {report.root}")
+    typer.echo(
+        f"files={report.indexed_files} added={report.added_files} "
+        f"updated={report.updated_files} removed={report.removed_files} "
+        f"reused={report.reused_files} skipped={report.skipped_files} "
+        f"segments={report.segments} elapsed_ms={report.elapsed_ms:.2f}"
+    )
+
+
+@index_app.command("semantic")
+def index_semantic(
+    path: str = typer.Argument(".", help="Repository root to index."),
+    full: bool = typer.Option(
+        False, "--full", help="Discard the existing index and re-chunk every file."
+    ),
+    max_repo_files: int = typer.Option(
+        _DEFAULT_SEMANTIC_INDEX_REPO_FILES,
+        "--max-repo-files",
+        min=1,
+        help="Maximum repo files to index (the same walk `tg find` ranks over).",
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Emit machine-readable JSON output."),
+) -> None:
+    """Build or incrementally update the chunk/BM25 semantic index for PATH.
+
+    Only files whose size or mtime changed since the last build are re-chunked. `tg find` and
+    `tg search --rank` under PATH then reuse the stored chunks of unchanged files, and `tg find`
+    keeps the index current after each complete walk of PATH.
+    """
+    from tensor_grep.cli.repo_map import _iter_repo_files
+    from tensor_grep.core.semantic_index import default_index_dir, update_index
+
+    root = Path(path).expanduser().resolve()
+    if not root.is_dir():
+        typer.echo(f"Error: index root is not a directory: {path}", err=True)
+        raise typer.Exit(2)
+    try:
+        files = [str(file_path) for file_path in _iter_repo_files(root, max_files=max_repo_files)]
+        _index, report = update_index(files, default_index_dir(str(root)), full=full)
+    except (OSError, ValueError, RuntimeError) as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(1) from exc
+    capped = len(files) >= max_repo_files
+
+    if json_output:
+        payload = {
+            "version": _self._json_output_version(),
+            "schema_version": _self._json_output_version(),
+            "routing_backend": "SemanticIndex",
+            "routing_reason": "index-semantic",
+            "root": str(root),
+            "capped": capped,
+            **dataclasses.asdict(report),
+        }
+        typer.echo(json.dumps(payload, indent=2))
+        return
+
+    changed = report.chunked_files > 0 or report.removed_files > 0
+    state = "rebuilt" if report.full_rebuild else "updated" if changed else "up to date"
+    typer.echo(f"Semantic index {state} at {report.index_dir}")
+    typer.echo(
+        f"files={report.indexed_files} chunks={report.chunk_count} "
+        f"chunked={report.chunked_files} reused={report.reused_files} "
+        f"removed={report.removed_files} elapsed_ms={report.elapsed_ms:.2f}"
+    )
+    if capped:
+        typer.echo(
+            f"Walk capped at --max-repo-files={max_repo_files}; raise it to index the whole repo.",
+            err=True,
+        )
+
+
+@index_app.command("status")
+def index_status(
+    path: str = typer.Argument(".", help="Repository root whose index to inspect."),
+    json_output: bool = typer.Option(False, "--json", help="Emit machine-readable JSON output."),
+) -> None:
+    """Show the repository trigram index for PATH, including files changed since its build."""
+    from tensor_grep.core.repo_trigram_index import repo_trigram_index_status
+    from tensor_grep.core.semantic_index import discover_index_dir, semantic_index_status
+
+    try:
+        status = repo_trigram_index_status(path)
+        semantic_dir = discover_index_dir([path])
+        semantic_status = (
+            semantic_index_status(semantic_dir) if semantic_dir is not None else {"exists": False}
+        )
+    except (OSError, ValueError, RuntimeError) as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(1) from exc
+
+    if json_output:
+        payload = {
+            "version": _self._json_output_version(),
+            "schema_version": _self._json_output_version(),
+            "routing_backend": "RepoIndex",
+            "routing_reason": "index-status",
+            **status,
+            "semantic": semantic_status,
+        }
+        typer.echo(json.dumps(payload, indent=2))
+        return
+
+    if not status["exists"]:
+        typer.echo(f"No index for {status['root']}. Run `tg index build {path}`.")
+    else:
+        typer.echo(f"Index for {status['root']} (built {status['built_at']})")
+        typer.echo(
+            f"files={status['indexed_files']} stale={status['stale_files']} "
+            f"tombstones={status['tombstones']} segments={status['segments']} "
+            f"bytes={status['index_bytes']}"
+        )
+    if semantic_status["exists"]:
+        typer.echo(f"Semantic index at {semantic_status['index_dir']}")
+        typer.echo(
+            f"files={semantic_status['indexed_files']} chunks={semantic_status['chunk_count']} "
+            f"stale={semantic_status['stale_files']} compatible={semantic_status['compatible']} "
+            f"bytes={semantic_status['corpus_bytes']}"
+        )
+
+
+@index_app.command("prune")
+def index_prune(
+    path: str = typer.Argument(".", help="Repository root whose index to compact."),
+    json_output: bool = typer.Option(False, "--json", help="Emit machine-readable JSON output."),
+) -> None:
+    """Compact PATH's index and delete indexes whose repository root no longer exists."""
+    from tensor_grep.core.repo_trigram_index import prune_repo_trigram_indexes
+
+    try:
+        result = prune_repo_trigram_indexes(path)
+    except (OSError, ValueError, RuntimeError) as exc:
+        typer.echo(str(exc), err=True)
+        raise typer.Exit(1) from exc
+
+    if json_output:
+        payload = {
+            "version": _self._json_output_version(),
+            "schema_version": _self._json_output_version(),
+            "routing_backend": "RepoIndex",
+            "routing_reason": "index-prune",
+            **result,
+        }
+        typer.echo(json.dumps(payload, indent=2))
+        return
+
+    if result["compacted"]:
+        typer.echo(
+            f"Compacted index for {result['root']} "
+            f"(dropped {result['removed_entries']} deleted files)"
+        )
+    else:
+        typer.echo(f"No index for {result['root']}")
+    for removed_root in result["removed_indexes"]:
+        typer.echo(f"Removed index for missing root {removed_root}")
@@ -178,7 +178,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from tensor_grep.cli import lang_c_cpp_include
+from tensor_grep.cli import lang_c_cpp_include, lang_registry
 
 # ---------------------------------------------------------------------------
 # Duplicated tiny helpers -- see the module docstring: no import from repo_map.py, to avoid an
@@ -411,13 +411,10 @@ def c_imports_and_symbols(path: Path) -> tuple[list[str], list[dict[str, Any]]]:
     if parser is None:
         return [], []
 
-    try:
-        source = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    parsed = lang_registry.parsed_source_and_tree(path, parser)
+    if parsed is None:
         return [], []
-
-    source_bytes = source.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    _source, source_bytes, tree = parsed
 
     def _node_text(node: Any) -> str:
         return _tree_sitter_node_text(source_bytes, node)
@@ -530,13 +527,10 @@ def c_imports_with_lines(path: Path) -> list[dict[str, Any]]:
     if parser is None:
         return []
 
-    try:
-        source = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    parsed = lang_registry.parsed_source_and_tree(path, parser)
+    if parsed is None:
         return []
-
-    source_bytes = source.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    _source, source_bytes, tree = parsed
 
     entries: list[dict[str, Any]] = []
 
@@ -575,13 +569,10 @@ def c_parser_symbol_sources(path: Path, symbol: str) -> list[dict[str, Any]]:
     if parser is None:
         return []
 
-    try:
-        source = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    parsed = lang_registry.parsed_source_and_tree(path, parser)
+    if parsed is None:
         return []
-
-    source_bytes = source.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    _source, source_bytes, tree = parsed
     sources: list[dict[str, Any]] = []
 
     def _node_text(node: Any) -> str:
@@ -771,13 +762,10 @@ def c_references_and_calls(
     if parser is None:
         return [], []
 
-    try:
-        source = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    parsed = lang_registry.parsed_source_and_tree(path, parser)
+    if parsed is None:
         return [], []
-
-    source_bytes = source.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    source, source_bytes, tree = parsed
     # Split strictly on "\n" (tree-sitter's own row semantics), stripping a trailing "\r" so
     # CRLF-terminated files still read cleanly -- see lang_go.go_references_and_calls's identical
     # comment (F26 fix, audit #63) for why `str.splitlines()` is NOT safe here.
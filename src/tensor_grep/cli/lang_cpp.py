@@ -172,7 +172,7 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from tensor_grep.cli import lang_c_cpp_include
+from tensor_grep.cli import lang_c_cpp_include, lang_registry
 
 # ---------------------------------------------------------------------------
 # Duplicated tiny helpers -- see the module docstring: no import from repo_map.py, to avoid an
@@ -553,13 +553,10 @@ def cpp_imports_and_symbols(path: Path) -> tuple[list[str], list[dict[str, Any]]
     if parser is None:
         return [], []
 
-    try:
-        source = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    parsed = lang_registry.parsed_source_and_tree(path, parser)
+    if parsed is None:
         return [], []
-
-    source_bytes = source.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    _source, source_bytes, tree = parsed
 
     def _node_text(node: Any) -> str:
         return _tree_sitter_node_text(source_bytes, node)
@@ -702,13 +699,10 @@ def cpp_imports_with_lines(path: Path) -> list[dict[str, Any]]:
     if parser is None:
         return []
 
-    try:
-        source = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    parsed = lang_registry.parsed_source_and_tree(path, parser)
+    if parsed is None:
         return []
-
-    source_bytes = source.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    _source, source_bytes, tree = parsed
 
     entries: list[dict[str, Any]] = []
 
@@ -746,13 +740,10 @@ def cpp_parser_symbol_sources(path: Path, symbol: str) -> list[dict[str, Any]]:
     if parser is None:
         return []
 
-    try:
-        source = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    parsed = lang_registry.parsed_source_and_tree(path, parser)
+    if parsed is None:
         return []
-
-    source_bytes = source.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    _source, source_bytes, tree = parsed
     sources: list[dict[str, Any]] = []
 
     def _node_text(node: Any) -> str:
@@ -1083,13 +1074,10 @@ def cpp_references_and_calls(
     if parser is None:
         return [], []
 
-    try:
-        source = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    parsed = lang_registry.parsed_source_and_tree(path, parser)
+    if parsed is None:
         return [], []
-
-    source_bytes = source.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    source, source_bytes, tree = parsed
     # Split strictly on "\n" (tree-sitter's own row semantics), stripping a trailing "\r" so
     # CRLF-terminated files still read cleanly -- see lang_c.c_references_and_calls's identical
     # comment (F26 fix, audit #63) for why `str.splitlines()` is NOT safe here.
@@ -40,6 +40,8 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from tensor_grep.cli import lang_registry
+
 # ---------------------------------------------------------------------------
 # Duplicated tiny helpers -- see the module docstring: no import from repo_map.py, to avoid an
 # import cycle (repo_map.py imports THIS module). Keep byte-identical to repo_map.py's twins
@@ -208,13 +210,10 @@ def go_imports_and_symbols(path: Path) -> tuple[list[str], list[dict[str, Any]]]
     if parser is None:
         return [], []
 
-    try:
-        source = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    parsed = lang_registry.parsed_source_and_tree(path, parser)
+    if parsed is None:
         return [], []
-
-    source_bytes = source.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    _source, source_bytes, tree = parsed
 
     def _node_text(node: Any) -> str:
         return _tree_sitter_node_text(source_bytes, node)
@@ -332,13 +331,10 @@ def go_imports_with_lines(path: Path) -> list[dict[str, Any]]:
     if parser is None:
         return []
 
-    try:
-        source = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    parsed = lang_registry.parsed_source_and_tree(path, parser)
+    if parsed is None:
         return []
-
-    source_bytes = source.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    _source, source_bytes, tree = parsed
 
     entries: list[dict[str, Any]] = []
 
@@ -371,13 +367,10 @@ def go_parser_symbol_sources(path: Path, symbol: str) -> list[dict[str, Any]]:
     if parser is None:
         return []
 
-    try:
-        source = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    parsed = lang_registry.parsed_source_and_tree(path, parser)
+    if parsed is None:
         return []
-
-    source_bytes = source.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    _source, source_bytes, tree = parsed
     sources: list[dict[str, Any]] = []
 
     def _node_text(node: Any) -> str:
@@ -647,11 +640,17 @@ def go_file_imports_symbol_from_definition(
     parser = _go_parser()
     if parser is None:
         return False
-    try:
-        source_bytes = source.encode("utf-8")
-        tree = parser.parse(source_bytes)
-    except (UnicodeDecodeError, ValueError):
-        return False
+    # The caller's *source* is normally this file's current text, already parsed by the defs/
+    # refs passes -- reuse that tree; anything else is parsed as given.
+    parsed = lang_registry.parsed_source_and_tree(file_path, parser)
+    if parsed is not None and parsed[0] == source:
+        _source, source_bytes, tree = parsed
+    else:
+        try:
+            source_bytes = source.encode("utf-8")
+            tree = parser.parse(source_bytes)
+        except (UnicodeDecodeError, ValueError):
+            return False
 
     context = _go_repo_context(repo_root)
     for binding in _go_import_bindings(source_bytes, tree):
@@ -756,13 +755,10 @@ def go_references_and_calls(
     if parser is None:
         return [], []
 
-    try:
-        source = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    parsed = lang_registry.parsed_source_and_tree(path, parser)
+    if parsed is None:
         return [], []
-
-    source_bytes = source.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    source, source_bytes, tree = parsed
     # F26 fix (audit #63): tree-sitter's row counting (`node.start_point[0]`) advances only on
     # "\n", but `str.splitlines()` ALSO splits on "\r", "\v"/"\x0b", "\f"/"\x0c", "\x1c"-"\x1e",
     # "\x85", U+2028 and U+2029 -- a single stray form-feed (or any of those other separators)
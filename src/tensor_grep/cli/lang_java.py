@@ -113,6 +113,8 @@ import re
 from pathlib import Path
 from typing import Any
 
+from tensor_grep.cli import lang_registry
+
 # ---------------------------------------------------------------------------
 # Duplicated tiny helpers -- see the module docstring: no import from repo_map.py, to avoid an
 # import cycle. Keep byte-identical to repo_map.py's twins (``_tree_sitter_node_text``) if either
@@ -492,13 +494,10 @@ def java_references_and_calls(
     if parser is None:
         return [], []
 
-    try:
-        source = path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+    parsed = lang_registry.parsed_source_and_tree(path, parser)
+    if parsed is None:
         return [], []
-
-    source_bytes = source.encode("utf-8")
-    tree = parser.parse(source_bytes)
+    source, source_bytes, tree = parsed
     # Split strictly on "\n" (tree-sitter's own row semantics), stripping a trailing "\r" so
     # CRLF-terminated files still read cleanly -- see lang_go.go_references_and_calls's identical
     # comment (F26 fix, audit #63) for why `str.splitlines()` is NOT safe here.
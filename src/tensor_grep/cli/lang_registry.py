@@ -17,11 +17,17 @@ Stage 0 is a PURE PARITY REFACTOR: the registry replaces scattered
 languages. It also underpins the ``resolution_gaps`` honesty floor (see repo_map.py's
 ``_resolution_gaps_for_universe``): a file in the refs/callers scan universe with no
 registered ``LanguageSpec`` becomes a labeled gap instead of a silent, unexplained absence.
+
+It also owns the per-file parse every extractor module shares (``parsed_source_and_tree``): the
+defs, imports-with-lines, symbol-source and refs/calls passes over one Go/Java/PHP/C#/C/C++ file
+reuse a single tree-sitter parse instead of each reading and parsing the file again.
 """
 
 from __future__ import annotations
 
 import re
+import threading
+from collections import OrderedDict
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
@@ -147,10 +153,77 @@ def graph_suffixes() -> frozenset[str]:
     return frozenset(_SPEC_BY_SUFFIX.keys())
 
 
+# ---------------------------------------------------------------------------
+# Shared per-file parse. repo_map.py's ``_parsed_source_and_tree`` already gives the python/JS/
+# TS/Rust extractors one parse per (path, mtime, size); the lang_*.py modules cannot reach it (no
+# import from repo_map.py), so each of their extractors used to read + parse the file itself --
+# four parses of the same file for one defs + imports + sources + refs/callers sweep. This is the
+# registry-side twin every lang_*.py extractor goes through instead.
+# ---------------------------------------------------------------------------
+
+# Mirrors repo_map.py's _PARSE_PRODUCT_CACHE_MAXSIZE / _SYMBOL_LITERAL_SEED_MAX_BYTES: enough
+# entries for a capped caller scan, and oversize files are parsed uncached every call.
+_PARSED_TREE_CACHE_MAXSIZE = 2048
+_PARSED_TREE_MAX_BYTES = 2_000_000
+
+ParsedSource = tuple[str, bytes, Any]
+
+_PARSED_TREES: OrderedDict[tuple[str, int, int], tuple[Any, ParsedSource]] = OrderedDict()
+_PARSED_TREES_LOCK = threading.Lock()
+
+
+def _parse_source(path: Path, parser: Any) -> ParsedSource | None:
+    try:
+        source = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    source_bytes = source.encode("utf-8")
+    return source, source_bytes, parser.parse(source_bytes)
+
+
+def parsed_source_and_tree(path: Path, parser: Any) -> ParsedSource | None:
+    """``(source, source_bytes, tree)`` for *path* parsed by *parser*, once per (mtime, size).
+
+    None when the file cannot be read as UTF-8 (every extractor's existing early return). A
+    cached tree is only served to the same *parser* object that built it, so a test swapping in
+    a different parser never sees another grammar's tree. Callers must not ``tree.edit()``.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return _parse_source(path, parser)
+    if stat.st_size > _PARSED_TREE_MAX_BYTES:
+        return _parse_source(path, parser)
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _PARSED_TREES_LOCK:
+        cached = _PARSED_TREES.get(key)
+        if cached is not None and cached[0] is parser:
+            _PARSED_TREES.move_to_end(key)
+            return cached[1]
+    parsed = _parse_source(path, parser)
+    if parsed is None:
+        return None
+    with _PARSED_TREES_LOCK:
+        _PARSED_TREES[key] = (parser, parsed)
+        _PARSED_TREES.move_to_end(key)
+        while len(_PARSED_TREES) > _PARSED_TREE_CACHE_MAXSIZE:
+            _PARSED_TREES.popitem(last=False)
+    return parsed
+
+
+def clear_parsed_trees() -> None:
+    """Drop every shared parse (repo_map's daemon cache sweep calls this with its own)."""
+    with _PARSED_TREES_LOCK:
+        _PARSED_TREES.clear()
+
+
 __all__ = [
     "LANGUAGE_REGISTRY",
     "LanguageSpec",
+    "ParsedSource",
+    "clear_parsed_trees",
     "graph_suffixes",
+    "parsed_source_and_tree",
     "register_language",
     "spec_for_path",
 ]
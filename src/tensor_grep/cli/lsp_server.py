@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import logging
 import os
 import re
+import tempfile
+import threading
 from collections import OrderedDict
 from collections.abc import Callable
 from pathlib import Path
@@ -46,11 +49,22 @@ from lsprotocol.types import (
 from pygls.lsp.server import LanguageServer
 
 from tensor_grep.cli import repo_map
+from tensor_grep.cli._index_lock import atomic_write_bytes
 from tensor_grep.cli.lsp_external_provider import ExternalLSPProviderManager, LSPTransportError
+from tensor_grep.core.symbol_name_index import (
+    SymbolNameIndex,
+    cached_symbol_name_index,
+    remember_symbol_name_index,
+    symbol_name_index_for_map,
+)
+
+logger = logging.getLogger(__name__)
 
 # audit I3: max entries per LRU cache dict.
 _DOCUMENTS_CACHE_MAX = 512
 _REPO_MAP_CACHE_MAX = 64
+# Ranked workspace/symbol results returned per query; clients re-query as the user types.
+_WORKSPACE_SYMBOL_LIMIT = 500
 
 
 class TensorGrepLSPServer(LanguageServer):  # type: ignore
@@ -61,6 +75,13 @@ class TensorGrepLSPServer(LanguageServer):  # type: ignore
         # access, popitem(last=False) when over limit).
         self.documents_cache: OrderedDict[str, str] = OrderedDict()
         self.repo_map_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # Edits patch a root's cached map on a per-root background thread (see
+        # _queue_repo_map_update) instead of dropping it. The lock guards repo_map_cache and
+        # the pending changes: path -> unsaved buffer text, or None to re-read the file.
+        self.repo_map_lock = threading.Lock()
+        self.pending_repo_map_changes: dict[str, dict[str, str | None]] = {}
+        self.repo_map_refreshers: dict[str, threading.Thread] = {}
+        self.buffer_shadow_dir: tempfile.TemporaryDirectory[str] | None = None
         self.provider_mode = "native"
         self.external_providers = ExternalLSPProviderManager()
         # audit B13: position encoding negotiated with the client, mirrored from
@@ -317,14 +338,6 @@ def _workspace_edit_refused(result: dict[str, Any], workspace_root: Path) -> boo
     return False
 
 
-def _invalidate_repo_map_cache(ls: TensorGrepLSPServer, uri: str) -> None:
-    try:
-        repo_root = _resolve_repo_root(_uri_to_path(uri))
-    except Exception:
-        return
-    ls.repo_map_cache.pop(str(repo_root), None)
-
-
 def _lru_put(od: OrderedDict[str, Any], key: str, value: Any, max_size: int) -> None:
     """Insert/update *key* in the LRU OrderedDict, evicting the oldest entry if needed."""
     od.pop(key, None)
@@ -343,16 +356,209 @@ def _lru_get(od: OrderedDict[str, Any], key: str) -> Any | None:
 
 
 def _get_repo_map(ls: TensorGrepLSPServer, uri: str) -> dict[str, Any]:
-    repo_root = _resolve_repo_root(_uri_to_path(uri))
+    return _repo_map_for_root(ls, _resolve_repo_root(_uri_to_path(uri)))
+
+
+def _repo_map_for_root(ls: TensorGrepLSPServer, repo_root: Path) -> dict[str, Any]:
+    """The root's last consistent map snapshot; only a root with none yet is built here."""
     cache_key = str(repo_root)
-    cached = _lru_get(ls.repo_map_cache, cache_key)
+    with ls.repo_map_lock:
+        cached = _lru_get(ls.repo_map_cache, cache_key)
     if cached is not None:
         return cast(dict[str, Any], cached)
     current = repo_map.build_repo_map(repo_root)
-    _lru_put(ls.repo_map_cache, cache_key, current, _REPO_MAP_CACHE_MAX)
+    with ls.repo_map_lock:
+        _lru_put(ls.repo_map_cache, cache_key, current, _REPO_MAP_CACHE_MAX)
+    # The build read the disk; open buffers with unsaved edits are folded in like any edit.
+    for document_uri, text in list(ls.documents_cache.items()):
+        if not _uri_within_root(document_uri, repo_root):
+            continue
+        if _differs_from_disk(_uri_to_path(document_uri), text):
+            _queue_repo_map_update(ls, document_uri, text)
     return current
 
 
+def _queue_repo_map_update(ls: TensorGrepLSPServer, uri: str, text: str | None) -> None:
+    """Record that ``uri`` changed and make sure its root's refresh thread is running.
+
+    ``text`` is the editor buffer (``None``: read the file from disk). Changes queued while a
+    refresh runs coalesce into its next pass. A root with no cached map has nothing to patch:
+    its first request builds from scratch.
+    """
+    try:
+        path = _uri_to_path(uri)
+        cache_key = str(_resolve_repo_root(path))
+    except (OSError, ValueError):
+        return
+    with ls.repo_map_lock:
+        if cache_key not in ls.repo_map_cache:
+            return
+        ls.pending_repo_map_changes.setdefault(cache_key, {})[str(path)] = text
+        refresher = ls.repo_map_refreshers.get(cache_key)
+        if refresher is not None and refresher.is_alive():
+            return
+        refresher = threading.Thread(
+            target=_refresh_repo_map,
+            args=(ls, cache_key),
+            name=f"tg-lsp-repo-map:{cache_key}",
+            daemon=True,
+        )
+        ls.repo_map_refreshers[cache_key] = refresher
+        refresher.start()
+
+
+def _refresh_repo_map(ls: TensorGrepLSPServer, cache_key: str) -> None:
+    """Refresh-thread body: patch the cached map until no changes are pending for the root.
+
+    Requests keep reading the previous snapshot until the patched one replaces it whole. A
+    change whose update fails drops the root's map, so the next request rebuilds it in full.
+    """
+    while True:
+        with ls.repo_map_lock:
+            changes = ls.pending_repo_map_changes.pop(cache_key, None)
+            previous = ls.repo_map_cache.get(cache_key)
+            if not changes or previous is None:
+                ls.repo_map_refreshers.pop(cache_key, None)
+                return
+        try:
+            updated = _apply_repo_map_changes(ls, previous, changes)
+        except (OSError, ValueError, RuntimeError) as exc:
+            logger.warning("incremental repo-map update failed for %s: %s", cache_key, exc)
+            updated = None
+        with ls.repo_map_lock:
+            if ls.repo_map_cache.get(cache_key) is not previous:
+                # Evicted or rebuilt meanwhile: re-apply to whatever is cached now, if anything.
+                pending = ls.pending_repo_map_changes.get(cache_key, {})
+                ls.pending_repo_map_changes[cache_key] = {**changes, **pending}
+            elif updated is None:
+                ls.repo_map_cache.pop(cache_key, None)
+            else:
+                ls.repo_map_cache[cache_key] = updated
+
+
+def _apply_repo_map_changes(
+    ls: TensorGrepLSPServer, previous: dict[str, Any], changes: dict[str, str | None]
+) -> dict[str, Any]:
+    """``previous`` with each changed file re-parsed: from disk, or from its editor buffer."""
+    if "path" not in previous:
+        raise ValueError("cached repo map does not record its root")
+    root = Path(str(previous["path"]))
+    buffers: dict[Path, str] = {}
+    from_disk: list[str] = []
+    for raw_path, text in changes.items():
+        if text is not None and _differs_from_disk(Path(raw_path), text):
+            buffers[Path(raw_path)] = text
+        else:
+            from_disk.append(raw_path)
+    updated = (
+        repo_map.build_repo_map_incremental(
+            previous, {"added": [], "modified": from_disk, "removed": []}
+        )
+        if from_disk
+        else dict(previous)
+    )
+    mapped = _mapped_paths(updated)
+    changed_files = set(from_disk) | (_mapped_paths(previous) ^ mapped)
+    for path, text in buffers.items():
+        if str(path) not in mapped:
+            continue
+        imports, symbols = _parse_unsaved_buffer(ls, root, path, text)
+        _splice_file_entries(updated, path, imports, symbols)
+        changed_files.add(str(path))
+    previous_index = cached_symbol_name_index(previous)
+    if previous_index is not None:
+        _carry_symbol_name_index(previous_index, updated, changed_files)
+    return updated
+
+
+def _mapped_paths(payload: dict[str, Any]) -> set[str]:
+    return set(payload.get("related_paths", [])) or {
+        *payload.get("files", []),
+        *payload.get("tests", []),
+    }
+
+
+def _carry_symbol_name_index(
+    previous_index: SymbolNameIndex, updated: dict[str, Any], changed_files: set[str]
+) -> None:
+    """Seed ``updated``'s symbol name index from the previous map's, re-indexing only
+    ``changed_files`` instead of every name in the workspace."""
+    remember_symbol_name_index(
+        updated,
+        previous_index.replacing_files(
+            changed_files,
+            [
+                symbol
+                for symbol in updated.get("symbols", [])
+                if str(symbol.get("file", "")) in changed_files
+            ],
+        ),
+    )
+
+
+def _differs_from_disk(path: Path, text: str) -> bool:
+    """Whether buffer ``text`` holds unsaved edits to the file at ``path``.
+
+    A path that cannot be read (an unsaved new file, a deleted one) is in no map, so it is left
+    to the disk walk.
+    """
+    try:
+        on_disk = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return False
+    return text.replace("\r\n", "\n") != on_disk
+
+
+def _parse_unsaved_buffer(
+    ls: TensorGrepLSPServer, root: Path, path: Path, text: str
+) -> tuple[list[str], list[dict[str, Any]]]:
+    """Parse editor text that is not on disk yet, attributed to ``path``.
+
+    The repo-map parsers read files, so the buffer is parsed from a shadow copy at the same
+    repo-relative path under a private temp directory.
+    """
+    if ls.buffer_shadow_dir is None:
+        ls.buffer_shadow_dir = tempfile.TemporaryDirectory(prefix="tg-lsp-buffers-")
+    try:
+        relative = path.relative_to(root)
+    except ValueError:
+        relative = Path(path.name)
+    shadow = Path(ls.buffer_shadow_dir.name) / relative
+    atomic_write_bytes(shadow, text.encode("utf-8"))
+    imports, symbols = repo_map._imports_and_symbols_for_path(shadow)
+    return imports, [{**symbol, "file": str(path)} for symbol in symbols]
+
+
+def _splice_file_entries(
+    payload: dict[str, Any], path: Path, imports: list[str], symbols: list[dict[str, Any]]
+) -> None:
+    """Swap ``path``'s symbols and import entry in ``payload`` for freshly parsed ones, in place."""
+    key = str(path)
+    import_entries = (
+        [
+            {
+                "file": key,
+                "imports": imports,
+                "provenance": repo_map._symbol_navigation_provenance_for_path(key),
+            }
+        ]
+        if imports
+        else []
+    )
+    for field, replacement in (("symbols", symbols), ("imports", import_entries)):
+        spliced: list[dict[str, Any]] = []
+        placed = False
+        for entry in payload.get(field, []):
+            if str(entry.get("file", "")) != key:
+                spliced.append(entry)
+            elif not placed:
+                spliced.extend(replacement)
+                placed = True
+        if not placed:
+            spliced.extend(replacement)
+        payload[field] = spliced
+
+
 def _external_client_for_uri(
     ls: TensorGrepLSPServer,
     uri: str,
@@ -761,23 +967,10 @@ def _workspace_symbols(
     repo_root = _resolve_workspace_root(ls, path_hint)
     if repo_root is None:
         return []
-    current_repo_map = cast(
-        dict[str, Any], _lru_get(ls.repo_map_cache, str(repo_root))
-    ) or repo_map.build_repo_map(repo_root)
-    _lru_put(ls.repo_map_cache, str(repo_root), current_repo_map, _REPO_MAP_CACHE_MAX)
-
-    normalized_query = query.strip().lower()
-    matches: list[dict[str, Any]] = []
-    for current in current_repo_map.get("symbols", []):
-        name = str(current.get("name", ""))
-        if not normalized_query or normalized_query in name.lower():
-            matches.append(dict(current))
-    matches.sort(
-        key=lambda item: (
-            str(item.get("name", "")),
-            str(item.get("file", "")),
-            int(item.get("line", 0)),
-        )
+    current_repo_map = _repo_map_for_root(ls, repo_root)
+
+    matches = symbol_name_index_for_map(current_repo_map).search(
+        query, limit=_WORKSPACE_SYMBOL_LIMIT
     )
     return [
         SymbolInformation(
@@ -1016,7 +1209,7 @@ def did_open(ls: TensorGrepLSPServer, params: DidOpenTextDocumentParams) -> None
         params.text_document.text,
         _DOCUMENTS_CACHE_MAX,
     )
-    _invalidate_repo_map_cache(ls, params.text_document.uri)
+    _queue_repo_map_update(ls, params.text_document.uri, params.text_document.text)
     if ls.provider_mode != "native":
         _external_client_for_uri(ls, params.text_document.uri)
 
@@ -1026,9 +1219,9 @@ def did_close(ls: TensorGrepLSPServer, params: DidCloseTextDocumentParams) -> No
     """Document closed — evict from all caches (audit I3)."""
     uri = params.text_document.uri
     ls.documents_cache.pop(uri, None)
-    # repo_map_cache is keyed by repo root, not URI, so we invalidate via the
-    # normal helper which resolves the root from the URI.
-    _invalidate_repo_map_cache(ls, uri)
+    # repo_map_cache is keyed by repo root, not URI: unsaved edits die with the buffer, so
+    # the closed file's entries go back to what is on disk.
+    _queue_repo_map_update(ls, uri, None)
     if ls.provider_mode != "native":
         client: Any = None
         try:
@@ -1053,7 +1246,7 @@ def did_change(ls: TensorGrepLSPServer, params: DidChangeTextDocumentParams) ->
         new_text = cast(Any, params.content_changes[0]).text
         # audit I3: use LRU-bounded cache.
         _lru_put(ls.documents_cache, params.text_document.uri, new_text, _DOCUMENTS_CACHE_MAX)
-        _invalidate_repo_map_cache(ls, params.text_document.uri)
+        _queue_repo_map_update(ls, params.text_document.uri, new_text)
         if ls.provider_mode != "native":
             client = _external_client_for_uri(ls, params.text_document.uri)
             if client is not None:
@@ -1071,7 +1264,7 @@ def did_save(ls: TensorGrepLSPServer, params: DidSaveTextDocumentParams) -> None
     """Document saved."""
     # audit I3: promote to MRU so a just-saved document isn't first to be evicted.
     _lru_get(ls.documents_cache, params.text_document.uri)
-    _invalidate_repo_map_cache(ls, params.text_document.uri)
+    _queue_repo_map_update(ls, params.text_document.uri, None)
     if ls.provider_mode != "native":
         client = _external_client_for_uri(ls, params.text_document.uri)
         if client is not None:
@@ -1,6 +1,5 @@
 import dataclasses
 import json
-import math
 import os
 import re
 
@@ -21,7 +20,7 @@ from collections.abc import Callable
 from contextlib import nullcontext
 from dataclasses import replace
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, cast
+from typing import TYPE_CHECKING, Any, cast
 from uuid import uuid4
 
 # Rich's legacy Windows renderer can raise EINVAL when long help is piped through
@@ -36,6 +35,8 @@ from typer.core import TyperGroup
 from tensor_grep.cli import ast_scan as _ast_scan
 from tensor_grep.cli import doctor_payload as _doctor_payload
 from tensor_grep.cli import doctor_report as _doctor_report
+from tensor_grep.cli import find_ranking as _find_ranking
+from tensor_grep.cli import index_commands as _index_commands
 from tensor_grep.cli import native_frontdoor as _native_frontdoor
 from tensor_grep.cli import windows_launcher as _windows_launcher
 from tensor_grep.cli._index_lock import atomic_write_bytes_anchored
@@ -114,8 +115,8 @@ else:
 
 if TYPE_CHECKING:
     from tensor_grep.core.config import SearchConfig
+    from tensor_grep.core.repo_trigram_index import RepoIndexNarrowing
     from tensor_grep.core.result import MatchLine, SearchResult
-    from tensor_grep.core.retrieval_chunker import Chunk
     from tensor_grep.io.directory_scanner import DirectoryScanner
 
 # Re-exports from the modules split out of this file on 2026-08-20 (see
@@ -330,6 +331,25 @@ _windows_tensor_grep_python_launcher_scan = (
 _windows_user_path_value = _windows_launcher._windows_user_path_value
 _write_windows_exe_bridge_marker = _windows_launcher._write_windows_exe_bridge_marker
 
+# --- from cli/find_ranking.py ------------------------------------------------
+_DENSE_FETCH_FRIENDLY_HINT = _find_ranking._DENSE_FETCH_FRIENDLY_HINT
+_DENSE_FETCH_RAW_HINT = _find_ranking._DENSE_FETCH_RAW_HINT
+_FIND_DENSE_WEIGHT_ADAPTIVE_DEFAULT = _find_ranking._FIND_DENSE_WEIGHT_ADAPTIVE_DEFAULT
+_FIND_DENSE_WEIGHT_DEFAULT = _find_ranking._FIND_DENSE_WEIGHT_DEFAULT
+_FIND_DENSE_WEIGHT_ENV = _find_ranking._FIND_DENSE_WEIGHT_ENV
+_find_combine_mode = _find_ranking._find_combine_mode
+_find_dense_weight = _find_ranking._find_dense_weight
+_find_is_single_token_query = _find_ranking._find_is_single_token_query
+_find_representative_line = _find_ranking._find_representative_line
+_friendly_dense_unavailable_message = _find_ranking._friendly_dense_unavailable_message
+
+# --- from cli/index_commands.py ----------------------------------------------
+index_app = _index_commands.index_app
+index_build = _index_commands.index_build
+index_prune = _index_commands.index_prune
+index_semantic = _index_commands.index_semantic
+index_status = _index_commands.index_status
+
 # backlog #1 (Fable+thinktank plan, 2026-07-06): kept numerically in sync with
 # repo_map.DEFAULT_AGENT_REPO_MAP_LIMIT (raised 512 -> 2000 for routing accuracy -- a file past
 # the old cap never entered the map, so edit-plan/agent/context-render/defs misrouted on repos
@@ -480,8 +500,15 @@ persisted repeated-query acceleration, and optional GPU routing.
 - `TENSOR_GREP_TRITON_TIMEOUT_SECONDS`: Timeout for Triton-backed NLP probes.
 - `TG_MCP_ALLOW_VALIDATION_COMMANDS`: Set to `1` to let the `tg mcp` server's `tg_rewrite_apply` tool accept and shell-execute `lint_cmd` / `test_cmd`; default off (such requests are rejected with `code="unsupported_option"`).
 - `TENSOR_GREP_LSP_OPERATION_BUDGET_SECONDS`: Total per-command budget for optional external LSP provider requests before native fallback.
+- `TG_THREADS`: Worker threads for the native (non-rg) per-file search loop when `--threads` is not given; default auto (up to 8). Results are always merged in candidate order.
+- `TENSOR_GREP_REPO_INDEX`: Set to `0`/`false`/`no`/`off` to stop CPU/StringZilla searches from consulting the `tg index build` repository trigram index. `TENSOR_GREP_REPO_INDEX_DIR` relocates it; `TENSOR_GREP_REPO_INDEX_MAX_FILE_BYTES` (8 MiB default) leaves larger files unindexed, so they are always searched.
+- `TG_SEMANTIC_INDEX_DIR`: Where `tg index semantic` writes (and `tg find` / `tg search --rank` look for) the chunk index; default `<root>/.tg_semantic_index`.
+- `TG_EMBEDDING_CACHE`: Set to `0`/`false`/`no` to stop `tg find` / `tg search --semantic` from reusing stored chunk embeddings. `TG_EMBEDDING_CACHE_DIR` relocates the store (default `~/.tensor-grep/cache/embeddings`); `TG_EMBEDDING_CACHE_MAX_MB` (256 default) bounds it, evicting least-recently-used embeddings.
+- `TG_DENSE_INDEX`: `exact` (default) scores every chunk on the dense leg; `ivf` scores only the chunks in the nearest k-means cells of corpora with at least 20k chunks (approximate; `hnsw` is accepted and served by `ivf`). `TG_DENSE_IVF_NPROBE` sets how many cells are probed.
+- `TENSOR_GREP_REPO_MAP_JOBS`: Worker processes that parse repo maps of 256+ files for `map` / `orient` / `agent` / `session open` and friends (`tg map --jobs` overrides it); unset or `1` = serial (the default); `0` = one per CPU, up to 8. Results are merged in walk order, so the map is identical either way.
 - `TENSOR_GREP_CPU_LITERAL_INDEX_CACHE_MAX_ENTRIES`, `TENSOR_GREP_STRING_INDEX_CACHE_MAX_ENTRIES`, `TENSOR_GREP_AST_QUERY_CACHE_MAX_ENTRIES`, `TENSOR_GREP_AST_NODE_INDEX_CACHE_MAX_ENTRIES`, `TENSOR_GREP_REPO_CONTEXT_CACHE_MAX_ROOTS`: Bound long-lived in-process search and repo-context caches.
 - `TENSOR_GREP_SESSION_RESPONSE_CACHE_MAX_BYTES`, `TENSOR_GREP_LSP_PROVIDER_CLIENT_CACHE_MAX_ENTRIES`, `TENSOR_GREP_LSP_PROVIDER_OPEN_DOCUMENT_MAX_ENTRIES`: Bound agent-loop response and LSP provider caches.
+- `TG_SESSION_DAEMON_JOURNAL`: How a running `tg session daemon` tracks file changes between requests: `auto` (default; inotify on Linux, else directory-mtime polling), `inotify`, `poll`, or `off` (stat every snapshot file on every request, as before).
 - `TG_SESSION_DAEMON_AUTOSTART`: Default-ON warm-daemon fast path for `defs`/`impact`/`refs`/`callers`/`blast-radius` (probes a running `tg session daemon`; auto-spawns one non-blocking on a miss, so only the first call per root pays the cold-start cost). Set to `0`/`false`/`no`/`off` to opt back out to the always-cold path; always forced off when `CI` or `GITHUB_ACTIONS` is set. Querying N distinct repo roots with this on can leave up to N resident daemons; each self-shuts-down after `TG_SESSION_DAEMON_IDLE_SECONDS` (900s default) of inactivity.""",
     no_args_is_help=True,
     add_completion=True,
@@ -1062,6 +1089,22 @@ def _search_with_cpu_fallback(
 _SEMANTIC_CORPUS_CHUNK_CAP = MAX_CHUNKS
 
 
+def _apply_bm25_rerank(
+    all_results: "SearchResult", pattern: str, search_paths: list[str]
+) -> "SearchResult":
+    """`--rank`'s BM25 reordering, shared with the MCP `tg_search` tool. Chunks of files unchanged
+    since a `tg index semantic` build covering ``search_paths`` are read from that index."""
+    from tensor_grep.core.reranker import rerank_by_bm25
+    from tensor_grep.core.semantic_index import SemanticChunkCache
+
+    return rerank_by_bm25(
+        all_results,
+        pattern,
+        all_results.matched_file_paths,
+        chunk_cache=SemanticChunkCache.discover(search_paths),
+    )
+
+
 def _set_semantic_rank_fallback_reason(all_results: "SearchResult") -> None:
     """Probe dense-leg availability and set ``rank_fallback_reason`` (F16, Fable audit LOW).
 
@@ -1117,6 +1160,7 @@ def _apply_semantic_rerank(all_results: "SearchResult", pattern: str) -> "Search
     ``BackendExecutionError`` (e.g. a corrupt model directory) deliberately propagates, same as
     the dense leg's.
     """
+    from tensor_grep.core.embedding_cache import EmbeddingCache
     from tensor_grep.core.reranker import rerank_hybrid
     from tensor_grep.core.retrieval_bm25 import Bm25Index
     from tensor_grep.core.retrieval_chunker import Chunk, chunk_file
@@ -1195,8 +1239,9 @@ def _apply_semantic_rerank(all_results: "SearchResult", pattern: str) -> "Search
 
     if available:
         try:
-            model = load_dense_model(default_model_dir())
-            dense_index = DenseIndex(chunks, model)
+            model_dir = default_model_dir()
+            model = load_dense_model(model_dir)
+            dense_index = DenseIndex(chunks, model, embedding_cache=EmbeddingCache.open(model_dir))
         except DenseUnavailableError as exc:
             # v1.92.1 dogfood item 3: rewrite the raw module-CLI fetch hint into the friendly
             # `tg install-dense` one-shot -- mirrors `tg find`'s identical treatment below
@@ -1267,199 +1312,6 @@ def _apply_semantic_rerank(all_results: "SearchResult", pattern: str) -> "Search
 # must-fix C2), never a silent exit-0 degrade.
 _FIND_CORPUS_CHUNK_CAP = MAX_CHUNKS
 
-# CEO#7: the raw fetch-command hint baked into retrieval_dense.py's `DenseUnavailableError` ("not
-# fetched" case) predates the one-shot `tg install-dense` command -- see
-# `_friendly_dense_unavailable_message` below.
-_DENSE_FETCH_RAW_HINT = "python -m tensor_grep.core.retrieval_dense --fetch"
-_DENSE_FETCH_FRIENDLY_HINT = "tg install-dense"
-
-
-def _friendly_dense_unavailable_message(exc: BaseException) -> str:
-    """CLI-boundary rewrite of the dense leg's raw fetch-command hint into the one-shot
-    `tg install-dense` command (CEO#7) a real `tg find` user should run instead.
-
-    Deliberately a string substitution at the CALL SITE, not an edit to the library exception
-    message itself (`retrieval_dense.py`'s `DenseUnavailableError` "not fetched" message is pinned
-    verbatim -- including the raw `python -m tensor_grep.core.retrieval_dense --fetch` command --
-    by `test_retrieval_dense_fetch.py::test_not_fetched_error_names_the_new_fetch_command`, which
-    documents that message as the module-CLI-only front door). A no-op when the raw hint is absent
-    (e.g. a dim-mismatch or malformed-shape `DenseUnavailableError`, which never mentions fetch).
-    """
-    return str(exc).replace(_DENSE_FETCH_RAW_HINT, _DENSE_FETCH_FRIENDLY_HINT)
-
-
-# #189 (ledger DENSE-WEIGHT SWEEP, agent a8580b6e 2026-07-16): the golden-set sweep measured a
-# real ndcg@10/recall lift (1:5 bm25:dense -> +0.1419 ndcg@10, recall 0.55->0.80, ZERO
-# per-category regression) on the 40 NL vocab-mismatch golden queries -- but that set is 100% NL
-# and cannot see the opposite failure mode: a short/lexical query (the canary `vm-behavior-10`)
-# where BM25 is the stronger leg and boosting dense regresses it. `TG_FIND_DENSE_WEIGHT` is the
-# knob (see `core/reranker.py`'s `rank_chunks(dense_weight=...)`); `_find_dense_weight` below is
-# the guard that keeps the boost scoped to the query shape the sweep actually validated.
-# #191 (THE FLIP): the env-unset default is no longer the inert 1.0 no-op. With the classifier
-# hardened (whitespace gate, below) and the flip-prep NITs closed (nan/inf clamp, 3-token
-# identifier re-sweep), env-unset now applies the SAME adaptive rule a valid explicit override
-# would: a multi-word NL query gets `_FIND_DENSE_WEIGHT_ADAPTIVE_DEFAULT` (5.0, the ledger-swept
-# 1:5 bm25:dense ratio); a single whitespace-free token stays at the protected 1.0. A malformed or
-# non-finite override (a typo, `nan`, `inf`) is now treated exactly like unset -- it resolves to
-# the SAME adaptive default rather than silently opting a typo'd operator OUT of the improved
-# default (thinktank rank-lens must-fix, 2026-07-16). An operator who wants the OLD equal-weight
-# fusion back must set `TG_FIND_DENSE_WEIGHT=1.0` explicitly.
-_FIND_DENSE_WEIGHT_ENV = "TG_FIND_DENSE_WEIGHT"
-_FIND_DENSE_WEIGHT_DEFAULT = 1.0
-# The ledger-validated adaptive weight (#191, DENSE-WEIGHT SWEEP): encodes the swept 1:5
-# bm25:dense ratio -- `rank_chunks` fixes the bm25 leg at 1.0, so `dense_weight=5.0` IS the 1:5
-# ratio (tg_find_review_ledger.md DENSE-WEIGHT SWEEP). This is now the env-UNSET (and
-# env-malformed/non-finite) resolution for a genuinely multi-word query; a single-token query
-# still resolves to `_FIND_DENSE_WEIGHT_DEFAULT` above via the whitespace gate.
-_FIND_DENSE_WEIGHT_ADAPTIVE_DEFAULT = 5.0
-# Whitespace-based NL-vs-literal classifier (dogfood finding, #191): a query with MORE THAN ONE
-# whitespace-separated word is NL/multi-word and gets the adaptive weight; a single whitespace-free
-# token is a literal identifier (a symbol name, a grep-style search) and stays at 1.0. The prior
-# `split_terms(query) > 2` morpheme-count floor was WRONG: `split_terms` splits snake_case/camelCase
-# into MORPHEMES, so a descriptive single-token identifier (`_confine_mcp_path`, `getUserName`,
-# `BackendExecutionError`, `reciprocal_rank_fusion` -- all 3 morphemes) counted as "NL" and leaked
-# to the dense boost. A real-repo dogfood on tensor-grep's own src caught this: 5 of 6 literal
-# identifier queries were misclassified; only `rank_chunks` (2 morphemes) stayed protected. Every
-# literal query in the dogfood was a single whitespace-free token and every NL query had 6+
-# space-separated words -- whitespace is the clean separator the morpheme floor couldn't exploit.
-
-
-def _find_dense_weight(query: str) -> float:
-    """Query-adaptive `dense_weight` for `tg find`'s `rank_chunks` calls ONLY (#189, flipped ON by
-    #191): with `TG_FIND_DENSE_WEIGHT` unset -- or set to something malformed/unparseable/
-    non-finite (see flip-prep NIT 1 below) -- a genuinely multi-word NL query now gets the
-    ledger-validated `_FIND_DENSE_WEIGHT_ADAPTIVE_DEFAULT` (5.0) instead of the old inert 1.0
-    no-op. A single whitespace-free token ALWAYS stays at the protected
-    `_FIND_DENSE_WEIGHT_DEFAULT` (1.0), regardless of the env var's state -- the whitespace gate
-    below applies uniformly to the adaptive default, a malformed/non-finite fallback, AND an
-    explicit override alike.
-
-    When the env var IS set to a valid FINITE float, that EXPLICIT value replaces the adaptive
-    default for a multi-word query -- `TG_FIND_DENSE_WEIGHT=1.0` is the explicit opt-out back to
-    the old equal-weight fusion; any other finite value (e.g. `=3.0`) is honored verbatim. A
-    single whitespace-free token (a bare identifier, a function/class/symbol name, a grep-style
-    literal search -- `tg find`'s own "literal" and "identifier3" golden slices,
-    `benchmarks/datasets/literal_golden.jsonl` + `identifier3_golden.jsonl`) instead routes to 1.0
-    (the un-boosted 1:1 fusion) NO MATTER what the env var says: the sweep's canary case proved
-    BM25 is the stronger leg for a lexical query, so boosting dense would risk regressing it --
-    this is the guard that keeps the knob scoped to where it was actually measured to help.
-
-    Whitespace, NOT morphemes (dogfood finding, #191): the classifier gates on whitespace-separated
-    word count, never `split_terms(query)` morpheme count. `split_terms` splits snake_case/camelCase
-    into morphemes, so a descriptive single-token identifier like `mint_access_token` /
-    `getUserName` / `_confine_mcp_path` splits into 3+ morphemes and the old `> 2` floor
-    misclassified it as NL -- exactly backwards for a literal-identifier lookup where BM25 is the
-    strong leg. A real-repo dogfood on tensor-grep's own src caught the leak (5 of 6 literal
-    identifier queries wrongly boosted, only the 2-morpheme `rank_chunks` protected); the
-    whitespace gate is the dogfood's own recommended fix.
-
-    KNOWN SCOPE (thinktank rank-lens, 2026-07-16): the whitespace gate is purely structural -- a
-    2-word LEXICAL phrase (e.g. `"return None"`, `"TODO fixme"`) is indistinguishable from a
-    2-word NL phrase and ALSO receives the adaptive boost. The 1:5 sweep is 100% NL queries and
-    the literal/identifier3 golden slices are single-token by construction, so this exact shape is
-    UNMEASURED. This is a deliberate non-goal, not an oversight: building a lexical-vs-NL content
-    classifier here would repeat the exact mistake the morpheme classifier made (a content-based
-    heuristic that silently misclassifies real queries) -- see
-    `test_find_dense_weight_default_boosts_two_word_lexical_canary` for the regression-catching
-    canary this scope decision needs. `TG_FIND_DENSE_WEIGHT=1.0` remains the escape hatch for a
-    precise 2-word literal search; `potion-code-16M` is a CODE-domain embedding model, which makes
-    boosting a 2-word code fragment defensible too, not just prose NL.
-
-    Flip-prep NIT 1 (tg_find_review_ledger.md FLIP-PREP): `float("nan")` / `float("inf")` /
-    `float("-inf")` all PARSE successfully -- `ValueError` alone never catches them, and `nan` in
-    particular compares unequal to everything (including itself), so a downstream `!= 1.0` check
-    would treat it as "non-default" too. `math.isfinite` rejects `nan` and both infinities the same
-    way the `except ValueError` branch below rejects outright garbage -- both now fall through to
-    the SAME adaptive-default resolution as an unset env var (#191 must-fix 2: a typo must not
-    silently opt an operator OUT of the improved default), rather than being clamped to the old
-    1.0. Either way, a non-finite value never reaches `rank_chunks(dense_weight=...)`:
-    `weights=[1.0, nan]` would otherwise build a degenerate list for `reciprocal_rank_fusion`'s
-    sort.
-    """
-    raw = os.environ.get(_FIND_DENSE_WEIGHT_ENV)
-    weight = _FIND_DENSE_WEIGHT_ADAPTIVE_DEFAULT
-    if raw:
-        try:
-            explicit = float(raw)
-        except ValueError:
-            explicit = None
-        if explicit is not None and math.isfinite(explicit):
-            weight = explicit
-        # else: malformed or non-finite -- treated exactly like an unset env var (falls through to
-        # the adaptive default above), per #191 must-fix 2.
-
-    # A single whitespace-free token (or an empty/whitespace-only query, whose `split()` -> []) is a
-    # literal identifier -> stay at the protected 1.0, regardless of the env var's state. Only a
-    # genuinely multi-word (space-separated) query is NL and gets the resolved `weight` above.
-    # Whitespace, not `split_terms` morphemes -- see the module comment above `_FIND_DENSE_WEIGHT_ENV`
-    # for the dogfood finding (#191) this fixes.
-    if _find_is_single_token_query(query):
-        return _FIND_DENSE_WEIGHT_DEFAULT
-    return weight
-
-
-def _find_is_single_token_query(query: str) -> bool:
-    """Shared literal/identifier-query predicate for `tg find`'s two query-adaptive knobs --
-    `_find_dense_weight`'s dense_weight (above) AND `_find_combine_mode`'s RRF combine mode
-    (below). A single whitespace-free token (or an empty/whitespace-only query, whose ``split()``
-    -> ``[]``) is a literal identifier lookup; anything with 2+ whitespace-separated words is NL.
-    Whitespace, not `split_terms` morphemes -- see the module comment above
-    `_FIND_DENSE_WEIGHT_ENV` for the #191 dogfood finding this rule fixes. Factored out to a single
-    canonical definition so the two knobs can never silently disagree on what counts as literal.
-    """
-    return len(query.split()) <= 1
-
-
-def _find_combine_mode(query: str) -> Literal["sum", "max"]:
-    """Query-adaptive RRF `combine` mode for `tg find`'s `rank_chunks` calls (accuracy-leg
-    max-fusion regression fix, Opus-gate finding on PR #717): `combine="max"` (`rank_chunks`'s own
-    default, see its docstring) lifts genuinely multi-word/NL queries (ndcg@10 +62.6% on the frozen
-    40-query golden set) but REGRESSES single-token literal/identifier lookups -- measured on
-    `benchmarks/datasets/literal_golden.jsonl` (10 queries, `dense_weight=1.0` as
-    `_find_dense_weight` already protects them at): sum scores a perfect 1.0 ndcg@10 (as it always
-    has); max drops to 0.9631, a real -0.0369 regression. Mechanism: a literal query's true answer
-    is frequently ranked #1 by BOTH the bm25 leg and the dense leg independently -- `"sum"`'s
-    per-leg-agreement bonus is exactly the confirming signal `"max"` discards, letting a
-    single-leg-only competitor tie the true answer's now-undiscounted best-single-term score.
-
-    Routes on the EXACT SAME whitespace predicate `_find_dense_weight` already uses
-    (`_find_is_single_token_query`) so the two adaptive knobs can never disagree on what counts as
-    literal: a single whitespace-free token -> `"sum"` (byte-identical to the pre-max-flip
-    behavior, recovering the regression); a genuinely multi-word query -> `"max"` (keeps the NL
-    win, including composed with the adaptive `dense_weight=5.0`, which reaches the dense-alone
-    ndcg@10 ceiling exactly). This is scoped to `tg find` only -- `rerank_hybrid` (the `tg search
-    --semantic` path) never passes `combine`, so it is unaffected and stays on the plain "max"
-    default.
-    """
-    return "sum" if _find_is_single_token_query(query) else "max"
-
-
-def _find_representative_line(chunk: "Chunk", query_terms: set[str]) -> tuple[int, str]:
-    """Pick ONE line within `chunk` to surface as the synthesized `MatchLine` (D2): the line with
-    the most `split_terms` overlap with the query, ties broken by the FIRST such line (the `>`
-    comparison below never replaces an already-found best on an equal score) -- deterministic
-    regardless of repeated content within the chunk.
-
-    Falls back to the chunk's first line (or an empty string for a pathologically empty chunk)
-    when the query has no terms at all or the chunk somehow has no lines -- `chunk_file` never
-    returns an empty-text chunk in practice, but this stays total rather than raising on it.
-    """
-    from tensor_grep.core.retrieval_lexical import split_terms
-
-    lines = chunk.text.splitlines()
-    if not lines:
-        return chunk.start_line, ""
-
-    best_index = 0
-    best_overlap = -1
-    for index, line_text in enumerate(lines):
-        overlap = len(query_terms & set(split_terms(line_text))) if query_terms else 0
-        if overlap > best_overlap:
-            best_overlap = overlap
-            best_index = index
-
-    return chunk.start_line + best_index, lines[best_index]
-
 
 def _execute_find(
     query: str,
@@ -1505,6 +1357,7 @@ def _execute_find(
         _UnreadablePathFlag,
     )
     from tensor_grep.cli.repo_map import _estimate_tokens as _repo_map_estimate_tokens
+    from tensor_grep.core.embedding_cache import EmbeddingCache
     from tensor_grep.core.reranker import rank_chunks
     from tensor_grep.core.result import MatchLine, SearchResult
     from tensor_grep.core.retrieval_bm25 import Bm25Index
@@ -1517,6 +1370,8 @@ def _execute_find(
         load_dense_model,
     )
     from tensor_grep.core.retrieval_lexical import split_terms
+    from tensor_grep.core.semantic_index import SemanticChunkCache
+    from tensor_grep.core.semantic_index import default_index_dir as default_semantic_index_dir
 
     root = Path(path).expanduser().resolve()
     if not root.exists():
@@ -1590,6 +1445,11 @@ def _execute_find(
             incomplete_reason_class = "unreadable_path"
         sys.stderr.write(f"tg: {reason}\n")
 
+    # A `tg index semantic` index covering `root` serves unchanged files' chunks from disk; only
+    # files whose size/mtime moved since indexing are re-read and re-chunked below.
+    chunk_cache = SemanticChunkCache.discover([str(root)])
+    chunk_source = chunk_cache.chunk if chunk_cache is not None else chunk_file
+
     # C2: chunk with a per-file RuntimeError guard + a corpus-wide cap, mirroring
     # `_apply_semantic_rerank`'s chunk-building loop (main.py:3886-3927) in SHAPE only -- the
     # ACTION on trip deliberately differs (see the docstring above): note partial coverage and
@@ -1609,7 +1469,7 @@ def _execute_find(
             sys.stderr.write(f"tg: {reason}\n")
             break
         try:
-            file_chunks = chunk_file(str(file_path))
+            file_chunks = chunk_source(str(file_path))
         except RuntimeError as exc:
             # A per-file chunk/parse failure doesn't cleanly map onto the closed vocabulary
             # (it could be a read error, a decode error, or a genuine parser bug) -- leave
@@ -1640,7 +1500,24 @@ def _execute_find(
     if not chunks:
         return result
 
-    bm25_index = Bm25Index(chunks)
+    # Nothing changed since indexing: rank straight off the persisted postings.
+    bm25_index = chunk_cache.stored_index() if chunk_cache is not None else None
+    if bm25_index is None:
+        bm25_index = Bm25Index(chunks)
+        if (
+            not incomplete_reasons
+            and chunk_cache is not None
+            and chunk_cache.changed
+            and chunk_cache.index_dir == default_semantic_index_dir(str(root))
+        ):
+            # Only a complete walk of the index's OWN root may rewrite it: a subdirectory query
+            # or a capped/partial walk would silently drop every file it did not visit.
+            try:
+                chunk_cache.save(bm25_index)
+            except (OSError, RuntimeError) as exc:
+                sys.stderr.write(
+                    f"tg: could not refresh semantic index {chunk_cache.index_dir}: {exc}\n"
+                )
 
     dense_index = None
     available, unavailable_reason = dense_available()
@@ -1649,8 +1526,9 @@ def _execute_find(
         sys.stderr.write(f"tg: {unavailable_reason}\n")
     else:
         try:
-            model = load_dense_model(default_model_dir())
-            dense_index = DenseIndex(chunks, model)
+            model_dir = default_model_dir()
+            model = load_dense_model(model_dir)
+            dense_index = DenseIndex(chunks, model, embedding_cache=EmbeddingCache.open(model_dir))
         except DenseUnavailableError as exc:
             message = _friendly_dense_unavailable_message(exc)
             result.rank_fallback_reason = message
@@ -4122,6 +4000,8 @@ def search_command(
                 all_results.match_counts_by_file.get(file_path, 0) + count
             )
 
+    repo_index_narrowing: RepoIndexNarrowing | None = None
+
     # RipgrepBackend optimization: passing all paths natively
     if backend.__class__.__name__ == "RipgrepBackend":
         rg_backend = cast(RipgrepBackend, backend)
@@ -4178,35 +4058,37 @@ def search_command(
         # (never per match -- that would be too fine-grained to bound a pathological single
         # file) and, on expiry, stop and return whatever was found so far as an explicitly
         # incomplete (never silently empty, never a raw crash) result.
-        from tensor_grep.backends.cpu_backend import (
-            compute_native_walk_deadline,
-            native_walk_deadline_exceeded,
-        )
+        from tensor_grep.backends.cpu_backend import compute_native_walk_deadline
+        from tensor_grep.cli.search_executor import iter_file_outcomes, resolve_search_workers
         from tensor_grep.cli.subprocess_policy import configured_ripgrep_timeout_seconds
+        from tensor_grep.core.repo_trigram_index import narrow_candidate_files
+
+        # A `tg index build` for an enclosing root lets the per-file route skip files that
+        # cannot contain the pattern's required literal. Anything the index does not vouch for
+        # (unindexed, changed since the build, outside its root) stays a candidate, and
+        # `candidate_files_ordered` itself is left untouched for --files-without-match/--stats.
+        repo_index_narrowing = narrow_candidate_files(
+            candidate_files_ordered,
+            pattern,
+            config,
+            backend_name=backend.__class__.__name__,
+            search_paths=paths_to_search,
+        )
+        search_files = (
+            repo_index_narrowing.files
+            if repo_index_narrowing is not None
+            else candidate_files_ordered
+        )
 
-        native_walk_deadline = compute_native_walk_deadline()
-        for current_file in candidate_files_ordered:
-            if native_walk_deadline_exceeded(native_walk_deadline):
-                timeout_seconds = configured_ripgrep_timeout_seconds()
-                all_results.result_incomplete = True
-                all_results.incomplete_reason = (
-                    f"native search exceeded the {timeout_seconds:g}s timeout and was "
-                    "stopped; returning partial results. Scope the search to a smaller "
-                    "path, or raise TG_RG_TIMEOUT_SECONDS."
-                )
-                all_results.incomplete_reason_class = "timeout"
-                sys.stderr.write(
-                    "tg: native search exceeded the "
-                    f"{timeout_seconds:g}s timeout, keeping partial results: "
-                    f"{all_results.incomplete_reason}\n"
-                )
-                break
+        backend_name = backend.__class__.__name__
+
+        def _search_one_file(current_file: str) -> SearchResult:
             span_ctx = (
                 tracer.start_as_current_span("search.file") if tracer is not None else nullcontext()
             )
             with span_ctx as span, nvtx_range("search.file", color="cyan"):
                 if span is not None:
-                    span.set_attribute("backend", backend.__class__.__name__)
+                    span.set_attribute("backend", backend_name)
                     span.set_attribute("path", current_file)
                 try:
                     result = backend.search(current_file, pattern, config=config)
@@ -4215,12 +4097,46 @@ def search_command(
                     # available CPU backend so the search returns correct results instead
                     # of a false no-match or a crash (audit B2/I1).
                     result = _search_with_cpu_fallback(current_file, pattern, config, exc)
-                except Exception as exc:
-                    if _is_invalid_regex_error(exc):
-                        _exit_invalid_regex(exc, json_mode=json)
-                    raise
                 if span is not None:
                     span.set_attribute("matches", result.total_matches)
+            return result
+
+        # Thread-safe backends search several files at once (`--threads`/`TG_THREADS`, auto by
+        # default); outcomes are still consumed strictly in candidate order, so the merge below
+        # -- and therefore the output -- is identical to the sequential walk.
+        search_workers = resolve_search_workers(
+            config.threads, backend_name=backend_name, file_count=len(search_files)
+        )
+        native_walk_deadline = compute_native_walk_deadline()
+        file_outcomes = iter_file_outcomes(
+            search_files,
+            _search_one_file,
+            workers=search_workers,
+            deadline=native_walk_deadline,
+        )
+        for current_file, outcome in file_outcomes:
+            if outcome is None:
+                timeout_seconds = configured_ripgrep_timeout_seconds()
+                all_results.result_incomplete = True
+                all_results.incomplete_reason = (
+                    f"native search exceeded the {timeout_seconds:g}s timeout and was "
+                    "stopped; returning partial results. Scope the search to a smaller "
+                    "path, or raise TG_RG_TIMEOUT_SECONDS."
+                )
+                all_results.incomplete_reason_class = "timeout"
+                sys.stderr.write(
+                    "tg: native search exceeded the "
+                    f"{timeout_seconds:g}s timeout, keeping partial results: "
+                    f"{all_results.incomplete_reason}\n"
+                )
+                break
+            try:
+                result = outcome()
+            except Exception as exc:
+                if _is_invalid_regex_error(exc):
+                    file_outcomes.close()
+                    _exit_invalid_regex(exc, json_mode=json)
+                raise
             all_results.matches.extend(result.matches)
             for matched_path in result.matched_file_paths:
                 _record_matched_file(matched_path)
@@ -4342,9 +4258,7 @@ def search_command(
             # count -- skipping the probe here silently made the JSON envelope dishonest.
             _set_semantic_rank_fallback_reason(all_results)
     elif config.rank_bm25 and all_results.matches:
-        from tensor_grep.core.reranker import rerank_by_bm25
-
-        all_results = rerank_by_bm25(all_results, pattern, all_results.matched_file_paths)
+        all_results = _apply_bm25_rerank(all_results, pattern, paths_to_search)
     matched_file_count = len(matched_files) or all_results.total_files
     elapsed_ms = (time.perf_counter() - search_start) * 1000.0
     runtime_override_active = (
@@ -4413,6 +4327,15 @@ def search_command(
             ),
             err=True,
         )
+        from tensor_grep.io.file_universe import FILE_UNIVERSE
+
+        typer.echo(
+            (
+                f"[stats] walk_cache_hits={FILE_UNIVERSE.hits} "
+                f"walk_cache_misses={FILE_UNIVERSE.misses}"
+            ),
+            err=True,
+        )
         typer.echo(
             (
                 f"[stats] backend={all_results.routing_backend or selected_backend_name} "
@@ -4420,6 +4343,16 @@ def search_command(
             ),
             err=True,
         )
+        if repo_index_narrowing is not None:
+            typer.echo(
+                (
+                    f"[stats] repo_index={repo_index_narrowing.root} "
+                    f"candidate_files={repo_index_narrowing.candidates_before} "
+                    f"searched_files={repo_index_narrowing.candidates_after} "
+                    f"unindexed_files={repo_index_narrowing.unindexed_files}"
+                ),
+                err=True,
+            )
         if runtime_override_active:
             stats_gpu_device_ids = list(all_results.routing_gpu_device_ids)
             stats_gpu_chunk_plan_mb = list(all_results.routing_gpu_chunk_plan_mb)
@@ -4716,6 +4649,15 @@ def map(
         help="Accepted for command-surface parity with codemap; a no-op since map already "
         "defaults to an unbounded --deadline.",
     ),
+    jobs: int | None = typer.Option(
+        None,
+        "--jobs",
+        min=0,
+        help=(
+            "Worker processes for parsing large maps (0 = one per CPU, up to 8; 1 = serial). "
+            "Defaults to TENSOR_GREP_REPO_MAP_JOBS, else 1. Output is identical either way."
+        ),
+    ),
     json_output: bool = typer.Option(False, "--json", help="Emit machine-readable JSON output."),
 ) -> None:
     """Return a deterministic repository map for AI editing workflows."""
@@ -4734,7 +4676,10 @@ def map(
         effective_deadline = None if no_deadline else deadline
         deadline_monotonic = _deadline_monotonic_from_seconds(effective_deadline)
         payload = build_repo_map(
-            path, max_repo_files=effective_max_repo_files, deadline_monotonic=deadline_monotonic
+            path,
+            max_repo_files=effective_max_repo_files,
+            deadline_monotonic=deadline_monotonic,
+            jobs=jobs,
         )
         payload = apply_repo_map_output_limits(payload, max_files=max_files)
     except FileNotFoundError as exc:
@@ -10854,6 +10799,7 @@ app.add_typer(session_app, name="session")
 app.add_typer(review_bundle_app, name="review-bundle")
 app.add_typer(evidence_app, name="evidence")
 app.add_typer(ledger_app, name="ledger")
+app.add_typer(index_app, name="index")
 
 
 @app.command(name="mcp")
@@ -0,0 +1,118 @@
+"""Run the MCP server's blocking tool bodies on a bounded worker pool, off the stdio event loop.
+
+FastMCP calls a synchronous tool function directly on the anyio loop that also reads stdin, so one
+slow repo scan (`tg_search`, `tg_find`, `tg_ast_search`, `tg_scan`, ...) used to stall every other
+request from the client -- `tg_mcp_capabilities` included. `offload_blocking_tools` rewraps each
+registered sync tool as an async one that runs the body on a worker thread:
+
+- every offloaded call shares one pool limiter (`TENSOR_GREP_MCP_WORKERS`, default 8);
+- the heavy scanners also hold a per-tool cap (`_TOOL_CONCURRENCY`), so two scans of one kind
+  cannot crowd out everything else;
+- tools that write the tree or checkpoint/audit state share a single slot (`_SERIAL_TOOLS`),
+  keeping the one-at-a-time ordering the single-threaded loop used to give them;
+- the few cheap introspection tools (`_INLINE_TOOLS`) still answer on the loop, so a saturated
+  pool never delays them.
+
+Cancellation: a client `notifications/cancelled` cancels the request's task, and the await on the
+worker is abandoned at once -- the loop and the client move on. A Python thread cannot be
+interrupted, so the body itself stops where the repo already stops long work: at its deadline.
+For tools that take a `deadline` and were called without one, the dispatcher fills in the
+server-wide budget from `TENSOR_GREP_MCP_TOOL_DEADLINE_SECONDS` (unset: no default deadline), so
+an abandoned scan cannot hold its worker slot indefinitely.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import math
+import os
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+import anyio
+import anyio.to_thread
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
+_MCP_WORKERS_ENV = "TENSOR_GREP_MCP_WORKERS"
+_DEFAULT_MCP_WORKERS = 8
+_MCP_TOOL_DEADLINE_ENV = "TENSOR_GREP_MCP_TOOL_DEADLINE_SECONDS"
+
+_INLINE_TOOLS = frozenset({"tg_mcp_capabilities", "tg_rulesets"})
+_TOOL_CONCURRENCY = {
+    "tg_search": 2,
+    "tg_find": 2,
+    "tg_ast_search": 2,
+    "tg_index_search": 2,
+    "tg_ruleset_scan": 1,
+    "tg_scan": 1,
+    "tg_audit": 1,
+}
+_SERIAL_TOOLS = frozenset({
+    "tg_rewrite_apply",
+    "tg_rewrite",
+    "tg_checkpoint_create",
+    "tg_checkpoint_undo",
+    "tg_checkpoint",
+    "tg_review_bundle_create",
+})
+
+
+def _configured_tool_deadline() -> float | None:
+    raw_value = os.environ.get(_MCP_TOOL_DEADLINE_ENV)
+    if raw_value is None:
+        return None
+    try:
+        value = float(raw_value)
+    except ValueError:
+        return None
+    return value if value > 0 and math.isfinite(value) else None
+
+
+def _offloaded(
+    fn: Callable[..., Any],
+    *,
+    pool: anyio.CapacityLimiter,
+    tool_limiter: anyio.CapacityLimiter | None,
+) -> Callable[..., Awaitable[Any]]:
+    takes_deadline = "deadline" in inspect.signature(fn).parameters
+
+    @functools.wraps(fn)
+    async def run(**kwargs: Any) -> Any:
+        if takes_deadline and kwargs.get("deadline") is None:
+            kwargs["deadline"] = _configured_tool_deadline()
+        call = functools.partial(fn, **kwargs)
+        if tool_limiter is None:
+            return await anyio.to_thread.run_sync(call, abandon_on_cancel=True, limiter=pool)
+        async with tool_limiter:
+            return await anyio.to_thread.run_sync(call, abandon_on_cancel=True, limiter=pool)
+
+    return run
+
+
+def offload_blocking_tools(server: FastMCP, *, workers: int | None = None) -> None:
+    """Rewrap ``server``'s registered sync tools to run on the bounded worker pool.
+
+    Call once, after every tool is registered. Tools already async are left alone, so a second
+    call is a no-op.
+    """
+    from tensor_grep.cli import session_store
+
+    pool = anyio.CapacityLimiter(
+        session_store._configured_positive_int(_MCP_WORKERS_ENV, _DEFAULT_MCP_WORKERS)
+        if workers is None
+        else max(1, int(workers))
+    )
+    serial = anyio.CapacityLimiter(1)
+    for tool in server._tool_manager.list_tools():
+        if tool.is_async or tool.name in _INLINE_TOOLS:
+            continue
+        tool_limiter: anyio.CapacityLimiter | None = None
+        if tool.name in _SERIAL_TOOLS:
+            tool_limiter = serial
+        elif tool.name in _TOOL_CONCURRENCY:
+            tool_limiter = anyio.CapacityLimiter(_TOOL_CONCURRENCY[tool.name])
+        tool.fn = _offloaded(tool.fn, pool=pool, tool_limiter=tool_limiter)
+        tool.is_async = True
@@ -0,0 +1,214 @@
+"""The MCP server's warm repo-map cache: one map per (root, scan cap), reused across tool calls.
+
+Every MCP tool that needs a repo map (`tg_repo_map`, `tg_context_pack`, `tg_edit_plan`,
+`tg_navigate`, `tg_impact`, ...) reaches `build_repo_map` through a repo_map wrapper. Outside the
+`tg_session_*` tools nothing carried over between those calls except the mtime-keyed source
+caches, so an agent calling five tools in a row paid five full walks and parses.
+
+`run_mcp_server` installs this cache as `repo_map_cache`'s warm repo-map source. A cached map is
+checked with the session layer's own staleness sweep (`session_store._stale_changeset`: one stat
+per mapped file plus an added-file walk). It is served as-is when nothing changed and patched with
+`build_repo_map_incremental` when something did. Each store bumps the entry's generation.
+Entries are evicted least-recently-used past an entry cap or a byte budget (JSON size, set by
+`TENSOR_GREP_MCP_REPO_MAP_CACHE_MAX_BYTES`). Partial (deadline-cut) maps are returned but never
+stored.
+
+Like `session_serve_cache.py`, this module reaches `session_store` and `repo_map` through
+deferred, module-qualified imports, so patched names are the ones a miss goes through.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from tensor_grep.cli.repo_map_cache import _install_warm_repo_map_source
+from tensor_grep.cli.session_serve_cache import _json_size_bytes
+
+if TYPE_CHECKING:
+    from tensor_grep.cli.repo_map import _ProfileCollector
+
+_MCP_REPO_MAP_CACHE_MAX_ENTRIES = 16
+_MCP_REPO_MAP_CACHE_MAX_BYTES_ENV = "TENSOR_GREP_MCP_REPO_MAP_CACHE_MAX_BYTES"
+_DEFAULT_MCP_REPO_MAP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class _McpRepoMapCacheEntry:
+    repo_map: dict[str, Any]
+    snapshot: list[dict[str, Any]]
+    generation: int
+    size_bytes: int
+
+
+class _McpRepoMapCache:
+    def __init__(
+        self,
+        max_entries: int = _MCP_REPO_MAP_CACHE_MAX_ENTRIES,
+        max_size_bytes: int | None = None,
+    ) -> None:
+        from tensor_grep.cli import session_store
+
+        self._max_entries = max(1, max_entries)
+        self._max_size_bytes = (
+            session_store._configured_positive_int(
+                _MCP_REPO_MAP_CACHE_MAX_BYTES_ENV, _DEFAULT_MCP_REPO_MAP_CACHE_MAX_BYTES
+            )
+            if max_size_bytes is None
+            else max(1, int(max_size_bytes))
+        )
+        self._entries: OrderedDict[tuple[str, int], _McpRepoMapCacheEntry] = OrderedDict()
+        self._build_locks: dict[tuple[str, int], threading.Lock] = {}
+        self._size_bytes = 0
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._evictions = 0
+        self._oversized_skips = 0
+        self._lock = threading.Lock()
+
+    def __call__(
+        self,
+        build: Callable[..., dict[str, Any]],
+        path: str | Path = ".",
+        *,
+        max_repo_files: int | None = None,
+        deadline_monotonic: float | None = None,
+        _profiling_collector: _ProfileCollector | None = None,
+    ) -> dict[str, Any]:
+        """`build_repo_map(path, ...)`, served from / refreshed into the cache.
+
+        An uncapped build is passed straight through: the staleness walk needs the scan cap to
+        see the same files the map did. ``_profiling_collector`` only sees the phases of a build
+        this call actually runs, so a hit records none.
+        """
+        root = Path(path).expanduser().resolve()
+        if max_repo_files is None or not root.exists():
+            return build(
+                path,
+                max_repo_files=max_repo_files,
+                deadline_monotonic=deadline_monotonic,
+                _profiling_collector=_profiling_collector,
+            )
+        key = (str(root), max(1, int(max_repo_files)))
+        changeset: dict[str, list[str]] | None = None
+        with self._build_lock(key):
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+            if entry is not None:
+                changeset = self._changeset(root, key[1], entry)
+                if changeset is not None and not any(changeset.values()):
+                    with self._lock:
+                        self._hits += 1
+                    return entry.repo_map
+            if entry is None or changeset is None:
+                repo_map = build(
+                    root,
+                    max_repo_files=key[1],
+                    deadline_monotonic=deadline_monotonic,
+                    _profiling_collector=_profiling_collector,
+                )
+                with self._lock:
+                    self._misses += 1
+            else:
+                from tensor_grep.cli import repo_map as repo_map_module
+
+                repo_map = repo_map_module.build_repo_map_incremental(
+                    entry.repo_map,
+                    changeset,
+                    max_repo_files=key[1],
+                    deadline_monotonic=deadline_monotonic,
+                )
+                with self._lock:
+                    self._refreshes += 1
+            if not repo_map.get("partial"):
+                self._store(key, repo_map)
+            return repo_map
+
+    def _build_lock(self, key: tuple[str, int]) -> threading.Lock:
+        with self._lock:
+            return self._build_locks.setdefault(key, threading.Lock())
+
+    def _changeset(
+        self, root: Path, max_repo_files: int, entry: _McpRepoMapCacheEntry
+    ) -> dict[str, list[str]] | None:
+        from tensor_grep.cli import session_store
+
+        return session_store._stale_changeset(
+            {
+                "root": str(root),
+                "snapshot": entry.snapshot,
+                "scan_limit": {"max_repo_files": max_repo_files},
+            },
+            detect_added_files=True,
+        )
+
+    def _store(self, key: tuple[str, int], repo_map: dict[str, Any]) -> None:
+        from tensor_grep.cli import session_store
+
+        size_bytes = _json_size_bytes(repo_map)
+        snapshot = session_store._capture_snapshot(list(repo_map.get("related_paths", [])))
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous.size_bytes
+            if size_bytes > self._max_size_bytes:
+                self._oversized_skips += 1
+                self._build_locks.pop(key, None)
+                return
+            self._generation += 1
+            self._entries[key] = _McpRepoMapCacheEntry(
+                repo_map=repo_map,
+                snapshot=snapshot,
+                generation=self._generation,
+                size_bytes=size_bytes,
+            )
+            self._size_bytes += size_bytes
+            while len(self._entries) > self._max_entries or self._size_bytes > self._max_size_bytes:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= evicted.size_bytes
+                self._build_locks.pop(evicted_key, None)
+                self._evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": True,
+                "hits": self._hits,
+                "misses": self._misses,
+                "refreshes": self._refreshes,
+                "evictions": self._evictions,
+                "oversized_skips": self._oversized_skips,
+                "entries": [
+                    {"root": root, "max_repo_files": max_repo_files, "generation": entry.generation}
+                    for (root, max_repo_files), entry in self._entries.items()
+                ],
+                "size_bytes": self._size_bytes,
+                "max_size_bytes": self._max_size_bytes,
+            }
+
+
+_INSTALLED_CACHE: _McpRepoMapCache | None = None
+
+
+def install_mcp_repo_map_cache() -> _McpRepoMapCache:
+    """Install (once per process) the warm repo-map cache every MCP tool call builds through."""
+    global _INSTALLED_CACHE
+    if _INSTALLED_CACHE is None:
+        _INSTALLED_CACHE = _McpRepoMapCache()
+        _install_warm_repo_map_source(_INSTALLED_CACHE)
+    return _INSTALLED_CACHE
+
+
+def mcp_repo_map_cache_stats() -> dict[str, Any]:
+    """Hit/miss/refresh counts for `tg_mcp_capabilities` and `tg_doctor`."""
+    if _INSTALLED_CACHE is None:
+        return {"enabled": False}
+    return _INSTALLED_CACHE.stats()
@@ -33,6 +33,7 @@ from tensor_grep.backends.cpu_backend import (
 from tensor_grep.backends.ripgrep_backend import RipgrepBackend
 from tensor_grep.cli.main import (
     _LARGE_ROOT_SCAN_FILE_CEILING,
+    _apply_bm25_rerank,
     _apply_semantic_rerank,
     _execute_find,
     _format_unbounded_large_root_scan_error,
@@ -42,12 +43,10 @@ from tensor_grep.cli.main import (
     _should_refuse_unbounded_large_root_scan,
     _should_refuse_unbounded_vendored_root_scan,
 )
-from tensor_grep.cli.main import (
-    _build_doctor_payload as _build_doctor_payload,
-)
-from tensor_grep.cli.main import (
-    _run_ast_scan_payload as _run_ast_scan_payload,
-)
+from tensor_grep.cli.main import _build_doctor_payload as _build_doctor_payload
+from tensor_grep.cli.main import _run_ast_scan_payload as _run_ast_scan_payload
+from tensor_grep.cli.mcp_dispatch import offload_blocking_tools
+from tensor_grep.cli.mcp_repo_map_cache import install_mcp_repo_map_cache, mcp_repo_map_cache_stats
 from tensor_grep.cli.orient_capsule import (
     build_orient_capsule_json as build_orient_capsule_json,
 )
@@ -998,6 +997,7 @@ def _mcp_capabilities_payload() -> dict[str, Any]:
         "embedded_rewrite": {
             "available": _self._embedded_rewrite_available(),
         },
+        "repo_map_cache": mcp_repo_map_cache_stats(),
         "tools": [
             {"name": name, **capability}
             for name, capability in sorted(_MCP_TOOL_CAPABILITIES.items())
@@ -1674,11 +1674,9 @@ def tg_doctor(
             return json.dumps(payload, indent=2)
 
     try:
-        return _self._inject_mcp_contract_fields(
-            json.dumps(
-                _self._build_doctor_payload(path, config=config, with_lsp=with_lsp), indent=2
-            )
-        )
+        doctor = _self._build_doctor_payload(path, config=config, with_lsp=with_lsp)
+        doctor["mcp_repo_map_cache"] = mcp_repo_map_cache_stats()
+        return _self._inject_mcp_contract_fields(json.dumps(doctor, indent=2))
     except Exception as exc:  # propagate as structured error, never a raw exception
         payload = _envelope_base(
             routing_backend="Doctor",
@@ -1718,9 +1716,11 @@ def tg_context_pack(
         return json.dumps(payload, indent=2)
 
     try:
-        return _self._inject_mcp_contract_fields(
-            json.dumps(build_context_pack(query, path, max_tokens=max_tokens), indent=2)
+        # The MCP scan cap every other repo-map tool uses, so the pack shares their warm map.
+        pack = build_context_pack(
+            query, path, max_repo_files=_DEFAULT_MCP_REPO_SCAN_LIMIT, max_tokens=max_tokens
         )
+        return _self._inject_mcp_contract_fields(json.dumps(pack, indent=2))
     except FileNotFoundError:
         payload = _envelope_base(
             routing_backend="RepoMap",
@@ -3030,11 +3030,7 @@ def tg_search(
                 # the leg is unavailable, regardless of match count.
                 _set_semantic_rank_fallback_reason(all_results)
         elif rank and all_results.matches:
-            from tensor_grep.core.reranker import rerank_by_bm25
-
-            all_results = rerank_by_bm25(
-                all_results, search_pattern, all_results.matched_file_paths
-            )
+            all_results = _apply_bm25_rerank(all_results, search_pattern, [path])
 
         empty_scan_capped = bool(scan_limit_payload and scan_limit_payload["possibly_truncated"])
         if all_results.is_empty:
@@ -5328,6 +5324,7 @@ async def _stdio_server_accepting_content_length(
 
 async def _run_mcp_stdio_async() -> None:
     _apply_mcp_server_metadata(mcp)
+    offload_blocking_tools(mcp)
     async with _stdio_server_accepting_content_length() as (read_stream, write_stream):
         await mcp._mcp_server.run(
             read_stream,
@@ -5338,4 +5335,5 @@ async def _run_mcp_stdio_async() -> None:
 
 def run_mcp_server() -> None:
     """Entry point for the MCP server."""
+    install_mcp_repo_map_cache()
     anyio.run(_run_mcp_stdio_async)
@@ -0,0 +1,141 @@
+"""`tg scan`'s regex-engine rules compiled into one literal prefilter over each file.
+
+The regex leg of `_run_ast_scan_payload` used to run every rule's regex over every line of every
+file: rules x lines Python-level `finditer` calls. Most ruleset regexes cannot match without a
+fixed literal -- `sk_`, `api_key` / `API_KEY` / ..., a keyword -- so `RegexRuleMatcher` pulls the
+required literal alternatives out of each rule's parsed regex and joins every rule's literals
+into one longest-first alternation. A file is scanned by that alternation once, each literal hit
+is attributed to the rules that require it, and a rule's own regex then runs only on the lines
+its literals hit. Rules with no usable literal (too short, case-insensitive, or no fixed text at
+all) still run on every line.
+
+The prefilter only skips lines a rule cannot match, so per-rule output is exactly what running
+the rule's `finditer` on every line gives.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+from collections.abc import Sequence
+from re import _constants as _sre_constants  # type: ignore[attr-defined]
+from re import _parser as _sre_parser  # type: ignore[attr-defined]
+from typing import Any
+
+# Same floor as CPUBackend._extract_required_literal: shorter literals hit nearly every line.
+_MIN_PREFILTER_LITERAL_CHARS = 3
+_REPEAT_OPS = tuple(
+    op
+    for op in (
+        _sre_constants.MAX_REPEAT,
+        _sre_constants.MIN_REPEAT,
+        getattr(_sre_constants, "POSSESSIVE_REPEAT", None),
+    )
+    if op is not None
+)
+
+
+def _best_factor(factors: list[frozenset[str]]) -> frozenset[str] | None:
+    """The alternative set whose SHORTEST member is longest -- the most selective prefilter."""
+    return max(factors, key=lambda options: min(map(len, options)), default=None)
+
+
+def _required_factors(items: Any) -> list[frozenset[str]]:
+    """Literal alternative sets, each of which every match of ``items`` must contain one of."""
+    factors: list[frozenset[str]] = []
+    run: list[str] = []
+
+    def _flush() -> None:
+        if run:
+            factors.append(frozenset({"".join(run)}))
+            run.clear()
+
+    for op, av in items:
+        if op is _sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        _flush()
+        if op is _sre_constants.SUBPATTERN:
+            _group, add_flags, _del_flags, sub = av
+            if not add_flags & re.IGNORECASE:
+                factors.extend(_required_factors(sub))
+        elif op in _REPEAT_OPS:
+            minimum, _maximum, sub = av
+            if minimum >= 1:
+                factors.extend(_required_factors(sub))
+        elif op is _sre_constants.BRANCH:
+            options: set[str] = set()
+            for alternative in av[1]:
+                best = _best_factor(_required_factors(alternative))
+                if best is None:
+                    break
+                options.update(best)
+            else:
+                factors.append(frozenset(options))
+        # IN / ANY / AT / ASSERT / GROUPREF / ... pin no fixed text.
+    _flush()
+    return factors
+
+
+def required_literals(pattern: str) -> frozenset[str] | None:
+    """Literals one of which every match of ``pattern`` contains, or ``None`` when none qualify."""
+    try:
+        parsed = _sre_parser.parse(pattern)
+    except (re.error, RecursionError):
+        return None
+    if parsed.state.flags & re.IGNORECASE:
+        return None
+    best = _best_factor(_required_factors(parsed))
+    if best is None or min(map(len, best)) < _MIN_PREFILTER_LITERAL_CHARS:
+        return None
+    return best
+
+
+class RegexRuleMatcher:
+    """A ruleset's regex rules behind one combined literal prefilter."""
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+        self._unfiltered: set[int] = set()
+        rules_by_literal: dict[str, set[int]] = {}
+        for rule_index, pattern in enumerate(patterns):
+            literals = required_literals(pattern)
+            if literals is None:
+                self._unfiltered.add(rule_index)
+                continue
+            for literal in literals:
+                rules_by_literal.setdefault(literal, set()).add(rule_index)
+        # Longest first, so the literal a search reports at a position is the longest one there;
+        # every other literal starting at that position is one of its prefixes.
+        ordered = sorted(rules_by_literal, key=lambda literal: (-len(literal), literal))
+        self._rules_by_hit = {
+            literal: frozenset().union(
+                *(rules_by_literal[other] for other in ordered if literal.startswith(other))
+            )
+            for literal in ordered
+        }
+        self._automaton = (
+            re.compile("|".join(re.escape(literal) for literal in ordered)) if ordered else None
+        )
+
+    def candidate_lines(self, lines: Sequence[str], rule_indexes: Sequence[int]) -> list[list[int]]:
+        """For each of ``rule_indexes``, the 0-based line indexes its regex can match on."""
+        wanted = set(rule_indexes)
+        hit_lines: dict[int, set[int]] = {rule_index: set() for rule_index in wanted}
+        if self._automaton is not None and wanted.difference(self._unfiltered):
+            text = "\n".join(lines)
+            line_starts = [0]
+            for line in lines[:-1]:
+                line_starts.append(line_starts[-1] + len(line) + 1)
+            position = 0
+            while (hit := self._automaton.search(text, position)) is not None:
+                line_index = bisect.bisect_right(line_starts, hit.start()) - 1
+                for rule_index in self._rules_by_hit[hit.group()] & wanted:
+                    hit_lines[rule_index].add(line_index)
+                # Step one character, not past the hit: literals may overlap.
+                position = hit.start() + 1
+        every_line = list(range(len(lines)))
+        return [
+            every_line if rule_index in self._unfiltered else sorted(hit_lines[rule_index])
+            for rule_index in rule_indexes
+        ]
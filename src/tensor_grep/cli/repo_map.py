@@ -28,6 +28,7 @@ from tensor_grep.cli import (
     lang_java,
     lang_php,
     lang_registry,
+    repo_map_pagerank,
 )
 from tensor_grep.cli.incompleteness import budget_remediable
 from tensor_grep.cli.lsp_external_provider import ExternalLSPProviderManager, LSPTransportError
@@ -43,6 +44,7 @@ from tensor_grep.cli.repo_map_cache import (
 from tensor_grep.cli.repo_map_cache import (
     _resolved_path_str as _resolved_path_str,
 )
+from tensor_grep.cli.repo_map_cache import _served_warm
 from tensor_grep.cli.repo_map_lang_java import (
     _java_import_declaration_text as _java_import_declaration_text,
 )
@@ -391,6 +393,15 @@ from tensor_grep.cli.repo_map_output_budget import (
 from tensor_grep.cli.repo_map_output_budget import (
     apply_repo_map_output_limits as apply_repo_map_output_limits,
 )
+from tensor_grep.cli.repo_map_parse import (
+    _parse_changed_context_files as _parse_changed_context_files,
+)
+from tensor_grep.cli.repo_map_parse import (
+    _parse_context_files as _parse_context_files,
+)
+from tensor_grep.cli.repo_map_parse import (
+    _parse_context_files_parallel as _parse_context_files_parallel,
+)
 from tensor_grep.cli.repo_map_regex_fallback import (
     _regex_imports_and_symbols as _regex_imports_and_symbols,
 )
@@ -400,7 +411,22 @@ from tensor_grep.cli.repo_map_regex_fallback import (
 from tensor_grep.cli.repo_map_regex_fallback import (
     _regex_symbol_sources as _regex_symbol_sources,
 )
+from tensor_grep.core.identifier_index import (
+    flush_identifier_indexes,
+    identifier_index_for_path,
+    identifier_tokens,
+    open_identifier_index,
+)
 from tensor_grep.core.retrieval_lexical import score_term_overlap, split_terms
+from tensor_grep.core.symbol_name_index import symbol_name_index_for_map
+from tensor_grep.io.file_universe import (
+    FILE_UNIVERSE,
+    DirectoryRecorder,
+    FileListing,
+    FileUniverseEntry,
+    file_universe_entries,
+)
+from tensor_grep.io.gitignore_rules import GitignoreRules
 
 # Route A (docs/design/2026-08-19-split-floor-escape.md): this module object, for late
 # attribute reads. A BARE call to a monkeypatched name resolves through THIS module's
@@ -458,6 +484,7 @@ def _clear_all_source_caches() -> None:
     _JS_TS_REPO_CONTEXTS.clear()
     _RUST_REPO_CONTEXTS.clear()
     lang_go.clear_go_repo_context_cache()
+    lang_registry.clear_parsed_trees()
 
 
 JSON_OUTPUT_VERSION = 1
@@ -657,6 +684,10 @@ _DEFAULT_REPO_CONTEXT_CACHE_MAX_ROOTS = 32
 # multi-MB bundled/generated files.  Override with env var.
 _MAX_PARSE_BYTES_ENV = "TENSOR_GREP_MAX_PARSE_BYTES"
 _DEFAULT_MAX_PARSE_BYTES = 2_000_000
+# build_repo_map's process-pool parse stage (repo_map_parse.py) needs at least this many
+# context files; workers take _PARALLEL_PARSE_CHUNK_FILES files per task.
+_PARALLEL_PARSE_MIN_FILES = 256
+_PARALLEL_PARSE_CHUNK_FILES = 32
 # Total-resident-bytes budget for the content-addressed AST parse cache (see
 # _cached_ast_parse below).  Bounds DAEMON MEMORY -- independent of _MAX_PARSE_BYTES_ENV
 # above, which only bounds a single file's eligibility to be parsed/cached at all.
@@ -1177,89 +1208,21 @@ def _is_test_file(path: Path) -> bool:
     )
 
 
-def _gitignore_pattern_to_regex(pattern: str) -> str:
-    """Translate a single gitignore glob body to an anchored regex fragment.
-
-    The fragment matches against a repo-relative POSIX path (no leading slash).
-    Handles ``*`` (segment-local), ``**`` (cross-segment), ``?`` and literal
-    characters; anchoring/negation/dir-only handling lives in the caller.
-    """
-
-    regex_parts: list[str] = []
-    index = 0
-    length = len(pattern)
-    while index < length:
-        char = pattern[index]
-        if char == "*":
-            if pattern[index : index + 2] == "**":
-                # ``**`` matches any number of path segments (including none).
-                index += 2
-                if pattern[index : index + 1] == "/":
-                    index += 1
-                    regex_parts.append("(?:.*/)?")
-                else:
-                    regex_parts.append(".*")
-            else:
-                regex_parts.append("[^/]*")
-                index += 1
-        elif char == "?":
-            regex_parts.append("[^/]")
-            index += 1
-        else:
-            regex_parts.append(re.escape(char))
-            index += 1
-    return "".join(regex_parts)
-
-
 class _GitignoreMatcher:
-    """Pragmatic ``.gitignore`` matcher covering the common pattern forms.
-
-    Supports directory-only patterns (trailing ``/``), anchored patterns
-    (leading or embedded ``/``), unanchored basename patterns, ``*``/``**``/``?``
-    globs, and ``!`` negation. Paths are matched relative to ``root`` using
-    POSIX separators. This intentionally mirrors ripgrep's gitignore handling
-    closely enough that context/repo-map walks stop drowning in vendored and
-    cache files; it is not a byte-perfect reimplementation of git's spec.
+    """One directory's ``.gitignore`` answering for absolute walked paths under ``root``.
+
+    Paths are matched relative to ``root`` using POSIX separators; the rules themselves (forms
+    supported, rule precedence, per-directory decision memo) live in the shared
+    `tensor_grep.io.gitignore_rules.GitignoreRules` engine.
     """
 
     def __init__(self, root: Path, lines: list[str]) -> None:
         self._root = root.resolve()
-        self._rules: list[tuple[re.Pattern[str], bool, bool]] = []
-        for raw_line in lines:
-            line = raw_line.rstrip("\n")
-            if not line.strip() or line.lstrip().startswith("#"):
-                continue
-            # A literal leading ``#`` or ``!`` is escaped with a backslash.
-            negated = False
-            if line.startswith("!"):
-                negated = True
-                line = line[1:]
-            elif line.startswith(("\\#", "\\!")):
-                line = line[1:]
-            line = line.rstrip()
-            if not line:
-                continue
-            dir_only = line.endswith("/")
-            body = line[:-1] if dir_only else line
-            anchored = body.startswith("/") or ("/" in body.rstrip("/"))
-            body = body.lstrip("/")
-            if not body:
-                continue
-            fragment = _gitignore_pattern_to_regex(body)
-            if anchored:
-                regex = rf"^{fragment}(?:/.*)?$"
-            else:
-                # Unanchored patterns match at any depth.
-                regex = rf"(?:^|.*/){fragment}(?:/.*)?$"
-            try:
-                compiled = re.compile(regex)
-            except re.error:
-                continue
-            self._rules.append((compiled, negated, dir_only))
+        self._rules = GitignoreRules(lines)
 
     @property
     def has_rules(self) -> bool:
-        return bool(self._rules)
+        return self._rules.has_rules
 
     def check(self, path: Path, *, is_dir: bool) -> bool | None:
         # Tri-state result so nested .gitignore specs can be stacked with correct git
@@ -1270,35 +1233,14 @@ class _GitignoreMatcher:
         # ``path.resolve()`` per entry would add a stat/symlink syscall for every file in the
         # tree — an O(files) regression on large roots (~384k files) and would follow symlinks,
         # which is not how gitignore matches paths.
+        if not self._rules.has_rules:
+            return None
         candidate = path if path.is_absolute() else (self._root / path)
         try:
             relative = candidate.relative_to(self._root)
         except ValueError:
             return None
-        rel_posix = relative.as_posix()
-        if not rel_posix or rel_posix == ".":
-            return None
-        # A dir-only pattern (``dist/``) ignores the directory *and everything
-        # inside it*. Test the path itself plus each ancestor segment-prefix so
-        # files under an ignored directory are recognised even when checked in
-        # isolation (the walk also prunes such directories during traversal).
-        segments = rel_posix.split("/")
-        ancestor_prefixes = ["/".join(segments[: index + 1]) for index in range(len(segments) - 1)]
-        decision: bool | None = None
-        for compiled, negated, dir_only in self._rules:
-            if dir_only:
-                matched = any(compiled.match(prefix) for prefix in ancestor_prefixes)
-                if is_dir:
-                    matched = matched or bool(compiled.match(rel_posix))
-            else:
-                matched = bool(compiled.match(rel_posix))
-                if not matched:
-                    # An unanchored/file pattern still ignores descendants of a
-                    # directory it matched (e.g. ``build`` matching ``build/x``).
-                    matched = any(compiled.match(prefix) for prefix in ancestor_prefixes)
-            if matched:
-                decision = not negated
-        return decision
+        return self._rules.check(relative.as_posix(), is_dir=is_dir)
 
     def is_ignored(self, path: Path, *, is_dir: bool) -> bool:
         return bool(self.check(path, is_dir=is_dir))
@@ -1442,12 +1384,15 @@ def _iter_repo_bucket_files(
     ancestor_stack: tuple[_GitignoreMatcher, ...] = (),
     *,
     unreadable_hit: _UnreadablePathFlag | None = None,
+    recorder: DirectoryRecorder | None = None,
 ) -> Iterator[Path]:
     # Nested-.gitignore support (MED-5 part B): load THIS directory's own matcher and push it onto
     # the ancestor stack, so a nested subdir/.gitignore is honored -- not just the repo root's.
     # _load_gitignore_matcher is lru_cached per directory, so re-walks stay cheap.
     own = _load_gitignore_matcher(str(root))
     stack = (*ancestor_stack, own) if own.has_rules else ancestor_stack
+    if recorder is not None:
+        recorder.record(str(root))
     try:
         entries = list(os.scandir(root))
     except OSError as exc:
@@ -1485,10 +1430,52 @@ def _iter_repo_bucket_files(
     other_dirs = [path for path in dir_paths if _repo_walk_dir_sort_key(path.name)[0] > 1]
 
     for directory in source_dirs:
-        yield from _iter_repo_bucket_files(directory, stack, unreadable_hit=unreadable_hit)
+        yield from _iter_repo_bucket_files(
+            directory, stack, unreadable_hit=unreadable_hit, recorder=recorder
+        )
     yield from file_paths
     for directory in other_dirs:
-        yield from _iter_repo_bucket_files(directory, stack, unreadable_hit=unreadable_hit)
+        yield from _iter_repo_bucket_files(
+            directory, stack, unreadable_hit=unreadable_hit, recorder=recorder
+        )
+
+
+def _repo_walk_root_buckets(
+    root: Path, *, unreadable_hit: _UnreadablePathFlag, recorder: DirectoryRecorder
+) -> list[tuple[tuple[int, str], Iterator[Path]]]:
+    """One lazily-walked file iterator per top-level entry of ``root``, keyed for bucketing."""
+    gitignore = _load_gitignore_matcher(str(root))
+    recorder.record(str(root))
+    try:
+        entries = list(os.scandir(root))
+    except OSError as exc:
+        unreadable_hit.record(exc)
+        return []
+
+    buckets: list[tuple[tuple[int, str], Iterator[Path]]] = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                path = Path(entry.path)
+                if _should_skip_repo_dir(path):
+                    continue
+                if gitignore.is_ignored(path, is_dir=True):
+                    continue
+                buckets.append((
+                    _repo_walk_bucket_sort_key(path, root),
+                    _iter_repo_bucket_files(
+                        path, (gitignore,), unreadable_hit=unreadable_hit, recorder=recorder
+                    ),
+                ))
+            elif entry.is_file(follow_symlinks=False):
+                path = Path(entry.path)
+                if gitignore.is_ignored(path, is_dir=False):
+                    continue
+                buckets.append((_repo_walk_bucket_sort_key(path, root), iter([path])))
+        except OSError as exc:
+            unreadable_hit.record(exc)
+            continue
+    return buckets
 
 
 def _iter_repo_files(
@@ -1509,96 +1496,118 @@ def _iter_repo_files(
 
     ``unreadable_hit`` (task #276 slice 1): same mutable-out-param pattern as ``deadline_hit``,
     for an `os.scandir()` failure (permission denied, since-deleted) instead of a wall-clock
-    bound. Defaults to None -> a complete no-op for every existing call site."""
+    bound. Defaults to None -> a complete no-op for every existing call site.
+
+    A walk that runs to completion is kept in the process-wide file universe
+    (`tensor_grep.io.file_universe`), so the next walk of the same root -- capped or not -- is
+    served from it for the cost of re-statting the walked directories."""
     with _profiling_phase(_profiling_collector, "file_walk"):
         if root.is_file():
             return [root.resolve()]
 
-        files: list[Path] = []
         normalized_root = root.resolve()
-        gitignore = _load_gitignore_matcher(str(normalized_root))
-        if max_files is not None:
-            try:
-                entries = list(os.scandir(normalized_root))
-            except OSError as exc:
-                if unreadable_hit is not None:
-                    unreadable_hit.record(exc)
-                return []
-
-            buckets: list[tuple[tuple[int, str], Iterator[Path]]] = []
-            for entry in entries:
-                try:
-                    if entry.is_dir(follow_symlinks=False):
-                        path = Path(entry.path)
-                        if _should_skip_repo_dir(path):
-                            continue
-                        if gitignore.is_ignored(path, is_dir=True):
-                            continue
-                        buckets.append((
-                            _repo_walk_bucket_sort_key(path, normalized_root),
-                            _iter_repo_bucket_files(
-                                path, (gitignore,), unreadable_hit=unreadable_hit
-                            ),
-                        ))
-                    elif entry.is_file(follow_symlinks=False):
-                        path = Path(entry.path)
-                        if gitignore.is_ignored(path, is_dir=False):
-                            continue
-                        buckets.append((
-                            _repo_walk_bucket_sort_key(path, normalized_root),
-                            iter([path]),
-                        ))
-                except OSError as exc:
-                    if unreadable_hit is not None:
-                        unreadable_hit.record(exc)
-                    continue
+        universe_key = (str(normalized_root), "repo_map")
+        listing = FILE_UNIVERSE.lookup(universe_key) if FILE_UNIVERSE.enabled() else None
+        if listing is not None and max_files is None:
+            return list(listing.files)
+        walk_unreadable = unreadable_hit if unreadable_hit is not None else _UnreadablePathFlag()
+        unreadable_before = walk_unreadable.count
+        recorder = DirectoryRecorder()
+        if listing is not None:
+            buckets = [(key, iter(files)) for key, files in listing.buckets]
+        else:
+            buckets = _repo_walk_root_buckets(
+                normalized_root, unreadable_hit=walk_unreadable, recorder=recorder
+            )
+        bucket_files: list[list[Path]] = [[] for _ in buckets]
 
-            selected: list[Path] = []
-            limit = max(1, max_files)
-            bucket_groups: dict[int, list[tuple[tuple[int, str], Iterator[Path]]]] = {}
-            for key, iterator in buckets:
-                bucket_groups.setdefault(key[0], []).append((key, iterator))
-            walk_deadline_exceeded = False
-            for group in sorted(bucket_groups):
-                active_buckets = sorted(bucket_groups[group], key=lambda item: item[0])
-                while active_buckets and len(selected) < limit:
-                    next_buckets: list[tuple[tuple[int, str], Iterator[Path]]] = []
-                    for key, iterator in active_buckets:
-                        # task #52 loop A: one deadline check per next() = the file-granularity
-                        # this walk otherwise has no time bound at all (only the max_files COUNT
-                        # bound above), so a huge bucket could burn the whole --deadline budget.
-                        if (
-                            deadline_monotonic is not None
-                            and time.monotonic() >= deadline_monotonic
-                        ):
-                            walk_deadline_exceeded = True
-                            break
-                        try:
-                            selected.append(next(iterator))
-                        except StopIteration:
-                            continue
-                        if len(selected) >= limit:
-                            break
-                        next_buckets.append((key, iterator))
-                    if walk_deadline_exceeded:
-                        break
-                    active_buckets = next_buckets
-                if len(selected) >= limit or walk_deadline_exceeded:
-                    break
-            if walk_deadline_exceeded and deadline_hit is not None:
-                deadline_hit.hit = True
-            return selected
+        def _store_listing() -> list[Path]:
+            files = sorted(
+                (path for drained in bucket_files for path in drained),
+                key=lambda path: _repo_walk_path_sort_key(path, normalized_root),
+            )
+            if listing is None and walk_unreadable.count == unreadable_before:
+                FILE_UNIVERSE.store(
+                    universe_key,
+                    FileListing(
+                        files=tuple(files),
+                        directories=tuple(recorder.directories),
+                        buckets=tuple(
+                            (key, tuple(drained))
+                            for (key, _iterator), drained in zip(buckets, bucket_files, strict=True)
+                        ),
+                    ),
+                    recorder,
+                )
+            return files
 
         walk_deadline_exceeded = False
-        for current in _iter_repo_bucket_files(normalized_root, (), unreadable_hit=unreadable_hit):
-            if deadline_monotonic is not None and time.monotonic() >= deadline_monotonic:
-                walk_deadline_exceeded = True
+        if max_files is None:
+            for (_key, iterator), drained in zip(buckets, bucket_files, strict=True):
+                for current in iterator:
+                    if deadline_monotonic is not None and time.monotonic() >= deadline_monotonic:
+                        walk_deadline_exceeded = True
+                        break
+                    drained.append(current)
+                if walk_deadline_exceeded:
+                    break
+            if walk_deadline_exceeded:
+                if deadline_hit is not None:
+                    deadline_hit.hit = True
+                files = [path for drained in bucket_files for path in drained]
+                files.sort(key=lambda path: _repo_walk_path_sort_key(path, normalized_root))
+                return files
+            return _store_listing()
+
+        selected: list[Path] = []
+        limit = max(1, max_files)
+        bucket_groups: dict[int, list[tuple[tuple[int, str], int]]] = {}
+        for index, (key, _iterator) in enumerate(buckets):
+            bucket_groups.setdefault(key[0], []).append((key, index))
+        for group in sorted(bucket_groups):
+            active_buckets = sorted(bucket_groups[group], key=lambda item: item[0])
+            while active_buckets and len(selected) < limit:
+                next_buckets: list[tuple[tuple[int, str], int]] = []
+                for key, index in active_buckets:
+                    # task #52 loop A: one deadline check per next() = the file-granularity
+                    # this walk otherwise has no time bound at all (only the max_files COUNT
+                    # bound above), so a huge bucket could burn the whole --deadline budget.
+                    if deadline_monotonic is not None and time.monotonic() >= deadline_monotonic:
+                        walk_deadline_exceeded = True
+                        break
+                    try:
+                        current = next(buckets[index][1])
+                    except StopIteration:
+                        continue
+                    selected.append(current)
+                    bucket_files[index].append(current)
+                    if len(selected) >= limit:
+                        break
+                    next_buckets.append((key, index))
+                if walk_deadline_exceeded:
+                    break
+                active_buckets = next_buckets
+            if len(selected) >= limit or walk_deadline_exceeded:
                 break
-            files.append(current)
         if walk_deadline_exceeded and deadline_hit is not None:
             deadline_hit.hit = True
-        files.sort(key=lambda path: _repo_walk_path_sort_key(path, normalized_root))
-        return files
+        if len(selected) < limit and not walk_deadline_exceeded:
+            # Every bucket ran dry under the cap: this was a complete walk after all.
+            _store_listing()
+        return selected
+
+
+def _classify_universe_file(path: Path) -> tuple[bool, str | None]:
+    spec = lang_registry.spec_for_path(path)
+    return _is_test_file(path), (spec.language_id if spec is not None else None)
+
+
+def _repo_file_universe(
+    root: Path, *, unreadable_hit: _UnreadablePathFlag | None = None
+) -> list[FileUniverseEntry]:
+    """The repo walk's files as ``(path, size, mtime_ns, is_test, language)`` entries."""
+    files = _self._iter_repo_files(root, unreadable_hit=unreadable_hit)
+    return file_universe_entries(files, _classify_universe_file, unreadable_hit=unreadable_hit)
 
 
 def _safe_resolve(path: Path) -> Path:
@@ -1918,6 +1927,7 @@ def _parsed_source_and_tree_bounded(path_str: str) -> tuple[str, bytes, Any] | N
 
 
 def _file_may_contain_literal_symbol(path: Path, symbol: str) -> bool:
+    """Identifiers answer from the open identifier index, when it has the file; else bytes."""
     normalized_symbol = (symbol or "").strip()
     if not normalized_symbol:
         return True
@@ -1927,13 +1937,21 @@ def _file_may_contain_literal_symbol(path: Path, symbol: str) -> bool:
         return True
     if stat.st_size > _SYMBOL_LITERAL_SEED_MAX_BYTES:
         return True
+    indexed = identifier_index_for_path(str(path), normalized_symbol)
+    if indexed is not None:
+        known = indexed[0].contains(indexed[1], stat.st_size, stat.st_mtime_ns, normalized_symbol)
+        if known is not None:
+            return known
     try:
-        data = _read_source_cached(str(path))
+        data = _self._read_source_cached(str(path))
     except OSError:
         return True
-    if b"\0" in data[:8192]:
-        return False
-    return normalized_symbol.encode("utf-8") in data
+    binary = b"\0" in data[:8192]
+    if indexed is not None:
+        tokens = set() if binary else identifier_tokens(data)
+        indexed[0].record(indexed[1], stat.st_size, stat.st_mtime_ns, tokens)
+        return normalized_symbol.encode("ascii") in tokens
+    return not binary and normalized_symbol.encode("utf-8") in data
 
 
 def _file_may_import_symbol_definition(path: Path, definition_files: list[str]) -> bool:
@@ -1947,7 +1965,7 @@ def _file_may_import_symbol_definition(path: Path, definition_files: list[str])
     if stat.st_size > _SYMBOL_LITERAL_SEED_MAX_BYTES:
         return True
     try:
-        data = _read_source_cached(str(path))
+        data = _self._read_source_cached(str(path))
     except OSError:
         return True
     if b"\0" in data[:8192]:
@@ -3013,11 +3031,7 @@ def _preferred_definition_files(
     deadline_hit: _DeadlineBreakFlag | None = None,
 ) -> list[str]:
     repo_root = _repo_map_root_dir(repo_map)
-    definitions = [
-        dict(current)
-        for current in repo_map.get("symbols", [])
-        if str(current.get("name")) == symbol
-    ]
+    definitions = [dict(current) for current in symbol_name_index_for_map(repo_map).exact(symbol)]
     definition_files = list(dict.fromkeys(str(current["file"]) for current in definitions))
     if len(definition_files) <= 1:
         return definition_files
@@ -3067,9 +3081,8 @@ def _relevant_tests_for_symbol(
         definition_symbol = next(
             (
                 current
-                for current in repo_map.get("symbols", [])
-                if str(current.get("file")) == str(definition_file)
-                and str(current.get("name")) == symbol
+                for current in symbol_name_index_for_map(repo_map).in_file(str(definition_file))
+                if str(current.get("name")) == symbol
             ),
             None,
         )
@@ -4245,14 +4258,23 @@ def _normalized_changeset_paths(
     return normalized
 
 
+@_served_warm
 def build_repo_map(
     path: str | Path = ".",
     *,
     max_repo_files: int | None = None,
     extra_files: list[Path] | None = None,
     deadline_monotonic: float | None = None,
+    jobs: int | None = None,
     _profiling_collector: _ProfileCollector | None = None,
 ) -> dict[str, Any]:
+    """Walk ``path`` and parse its context files into the repo-map payload.
+
+    ``jobs`` sizes the parse stage's process pool (see ``repo_map_parse.py``). Maps under
+    ``_PARALLEL_PARSE_MIN_FILES`` context files always parse serially. Results merge back in
+    walk order, so the payload is identical for every ``jobs`` value; under a deadline both
+    paths keep the files parsed before the first unreached one and ``files_scanned`` counts them.
+    """
     root = Path(path).expanduser().resolve()
     if not root.exists():
         raise FileNotFoundError(f"Path not found: {root}")
@@ -4307,8 +4329,6 @@ def build_repo_map(
         ]
         source_files = non_test_source_files or tests
 
-        imports: list[dict[str, Any]] = []
-        symbols: list[dict[str, Any]] = []
         # moat P0-6: a supplied ABSOLUTE monotonic deadline stops the CPU-bound per-file parse loop
         # early and returns partial results (partial:true + deadline_limit) instead of running
         # unbounded, so a huge repo degrades gracefully instead of the caller's hard timeout
@@ -4318,27 +4338,11 @@ def build_repo_map(
         # LIST is itself a reason this whole result is partial, even if the parse loop that follows
         # never gets to run (or completes trivially over a truncated list without tripping its own
         # check).
-        deadline_hit = repo_walk_deadline_hit.hit
-        files_scanned = 0
-        for current in context_files:
-            if deadline_monotonic is not None and time.monotonic() >= deadline_monotonic:
-                deadline_hit = True
-                break
-            if _profiling_collector is None:
-                current_imports, current_symbols = _self._imports_and_symbols_for_path(current)
-            else:
-                current_imports, current_symbols = _self._imports_and_symbols_for_path(
-                    current,
-                    _profiling_collector=_profiling_collector,
-                )
-            if current_imports:
-                imports.append({
-                    "file": str(current),
-                    "imports": current_imports,
-                    "provenance": _symbol_navigation_provenance_for_path(str(current)),
-                })
-            symbols.extend(current_symbols)
-            files_scanned += 1
+        # The parse loop itself (serial, or pooled for large maps) lives in repo_map_parse.py.
+        imports, symbols, files_scanned, parse_deadline_hit = _self._parse_context_files(
+            context_files, context_root, jobs, deadline_monotonic, _profiling_collector
+        )
+        deadline_hit = repo_walk_deadline_hit.hit or parse_deadline_hit
 
         payload["files"] = source_files
         payload["symbols"] = symbols
@@ -4457,8 +4461,6 @@ def build_repo_map_incremental(
     ]
     capped_file_count = len(all_files)
     current_files_by_path = {str(current): current for current in all_files}
-    parsed_imports_by_file: dict[str, list[str]] = {}
-    parsed_symbols_by_file: dict[str, list[dict[str, Any]]] = {}
 
     # Task #304: PARSING is bounded here, exactly as `build_repo_map` bounds its own loop -- break
     # and keep what we have, never raise, never zero the results.
@@ -4473,20 +4475,19 @@ def build_repo_map_incremental(
     # Unparsed files are NOT dropped from the payload: the assembly loop below falls back to the
     # PREVIOUS map's imports/symbols for any file this loop did not reach, so a deadline yields a
     # staler-but-complete map rather than a map with holes in it.
-    deadline_hit = False
-    files_parsed = 0
+    #
+    # Unchanged-on-disk files among them come back from the persistent parse store unparsed.
     changed_to_parse = sorted(changed_files | (set(current_files_by_path) - previous_paths))
-    for current_path in changed_to_parse:
-        if deadline_monotonic is not None and time.monotonic() >= deadline_monotonic:
-            deadline_hit = True
-            break
-        path_obj = current_files_by_path.get(current_path)
-        if path_obj is None:
-            continue
-        current_imports, current_symbols = _self._imports_and_symbols_for_path(path_obj)
-        parsed_imports_by_file[current_path] = current_imports
-        parsed_symbols_by_file[current_path] = current_symbols
-        files_parsed += 1
+    parsed_by_file, deadline_hit = _self._parse_changed_context_files(
+        [
+            current_files_by_path[current]
+            for current in changed_to_parse
+            if current in current_files_by_path
+        ],
+        context_root,
+        deadline_monotonic,
+    )
+    files_parsed = len(parsed_by_file)
 
     payload = _envelope(root)
     tests = [str(current) for current in all_files if _is_test_file(current)]
@@ -4495,15 +4496,9 @@ def build_repo_map_incremental(
     symbols: list[dict[str, Any]] = []
     for current in all_files:
         current_path = str(current)
-        current_imports = (
-            parsed_imports_by_file[current_path]
-            if current_path in parsed_imports_by_file
-            else previous_imports_by_file.get(current_path, [])
-        )
-        current_symbols = (
-            parsed_symbols_by_file[current_path]
-            if current_path in parsed_symbols_by_file
-            else previous_symbols_by_file.get(current_path, [])
+        current_imports, current_symbols = parsed_by_file.get(current_path) or (
+            previous_imports_by_file.get(current_path, []),
+            previous_symbols_by_file.get(current_path, []),
         )
         if current_imports:
             imports.append({
@@ -5713,6 +5708,10 @@ def _personalized_reverse_import_pagerank(
     the same sort up to 12x per node for nothing. Free, additive speedup, independent of the
     deadline fix above -- proven numerically identical to the pre-hoist shape by
     ``test_pagerank_hoisted_sort_matches_reference_computation``.
+
+    The iteration itself lives in `repo_map_pagerank`: large graphs run it as a CSR sparse
+    mat-vec over int32 file ids (cached across calls on an unchanged graph), small ones keep
+    the dict loop.
     """
     with _profiling_phase(_profiling_collector, "graph_pagerank"):
         if not seed_files:
@@ -5731,33 +5730,19 @@ def _personalized_reverse_import_pagerank(
         if not unique_seeds:
             return {}
 
-        seed_set = set(unique_seeds)
-        seed_weight = 1.0 / len(unique_seeds)
-        personalization = {
-            current: (seed_weight if current in seed_set else 0.0) for current in all_files
-        }
-        ranks = dict(personalization)
-        sorted_outgoing = {
-            current: sorted(reverse_importers.get(current, set())) for current in all_files
-        }
-        for _ in range(iterations):
-            if deadline_monotonic is not None and time.monotonic() >= deadline_monotonic:
-                if deadline_hit is not None:
-                    deadline_hit.hit = True
-                return {}
-            updated = {current: (1.0 - alpha) * personalization[current] for current in all_files}
-            for current in all_files:
-                outgoing = sorted_outgoing[current]
-                if outgoing:
-                    share = alpha * ranks[current] / len(outgoing)
-                    for importer in outgoing:
-                        updated[importer] = updated.get(importer, 0.0) + share
-                    continue
-                spill = alpha * ranks[current] / len(unique_seeds)
-                for seed in unique_seeds:
-                    updated[seed] = updated.get(seed, 0.0) + spill
-            ranks = updated
-        return {current: rank for current, rank in ranks.items() if rank > 0.0}
+        ranks = repo_map_pagerank.personalized_pagerank(
+            unique_seeds,
+            all_files,
+            reverse_importers,
+            alpha=alpha,
+            iterations=iterations,
+            deadline_monotonic=deadline_monotonic,
+        )
+        if ranks is None:
+            if deadline_hit is not None:
+                deadline_hit.hit = True
+            return {}
+        return ranks
 
 
 def _test_import_bonus(
@@ -11303,11 +11288,10 @@ def _provider_languages_for_symbol(
             languages.add(language)
     if languages:
         return sorted(languages)
-    for current in repo_map.get("symbols", []):
-        if str(current.get("name", "")) == symbol:
-            language = _provider_language_for_path(str(current.get("file", "")))
-            if language:
-                languages.add(language)
+    for current in symbol_name_index_for_map(repo_map).exact(symbol):
+        language = _provider_language_for_path(str(current.get("file", "")))
+        if language:
+            languages.add(language)
     if languages:
         return sorted(languages)
     for current in repo_map.get("files", []):
@@ -12070,7 +12054,8 @@ def build_symbol_defs_from_map(
 ) -> dict[str, Any]:
     payload = dict(repo_map)
     payload["files"] = list(repo_map.get("files", []))
-    payload["symbols"] = [dict(current) for current in repo_map.get("symbols", [])]
+    name_index = symbol_name_index_for_map(repo_map)
+    payload["symbols"] = [dict(current) for current in name_index.exact(symbol)]
     payload["imports"] = [dict(current) for current in repo_map.get("imports", [])]
     payload["related_paths"] = list(repo_map.get("related_paths", []))
     native_definitions = [
@@ -12079,7 +12064,6 @@ def build_symbol_defs_from_map(
             "provenance": _symbol_navigation_provenance_for_path(str(current["file"])),
         }
         for current in payload["symbols"]
-        if str(current["name"]) == symbol
     ]
     native_definitions.sort(
         key=lambda item: (
@@ -12112,11 +12096,10 @@ def build_symbol_defs_from_map(
     # L3: Enrich each definition with `class` (enclosing class name or null)
     # and `score` (confidence signal).  These are additive fields — existing
     # keys are not renamed or removed.
-    all_symbols_for_class_lookup = list(repo_map.get("symbols", []))
     for definition in definitions:
         if "class" not in definition:
             definition["class"] = _enclosing_class_for_definition(
-                definition, all_symbols_for_class_lookup
+                definition, name_index.in_file(str(definition.get("file", "")))
             )
         if "score" not in definition:
             definition["score"] = _definition_confidence_score(definition, symbol)
@@ -12157,8 +12140,7 @@ def build_symbol_defs_from_map(
     compact_symbols = [
         current
         for current in payload["symbols"]
-        if str(current.get("name", "")) == symbol
-        and (not definition_file_set or str(current.get("file", "")) in definition_file_set)
+        if not definition_file_set or str(current.get("file", "")) in definition_file_set
     ]
     if not compact_symbols and definitions:
         compact_symbols = [dict(current) for current in definitions]
@@ -12868,6 +12850,7 @@ def build_symbol_refs_from_map(
         _test_scan_counts=context_pack_test_scan_counts,
     )
     repo_root = _repo_map_root_dir(repo_map)
+    open_identifier_index(repo_root)
     refs_universe_files, refs_universe_tests = _repo_map_file_and_test_universe(repo_map)
     bounded_files, refs_ceiling_hit = _cap_caller_scan_files(
         [*refs_universe_files, *refs_universe_tests],
@@ -12875,6 +12858,7 @@ def build_symbol_refs_from_map(
         test_files=refs_universe_tests,
         deadline_monotonic=deadline_monotonic,
     )
+    flush_identifier_indexes()
     bounded_file_set = {str(current) for current in bounded_files}
     # F25 fix (Go alias-resolution confidence): the symbol's own known definition directories,
     # so a package-qualified Go call only earns high-confidence "go-import-resolution" when it
@@ -13826,6 +13810,7 @@ def build_symbol_callers_from_map(
         payload["resolution_gaps"] = []
         return _attach_profiling(payload, _profiling_collector)
     repo_root = _repo_map_root_dir(repo_map)
+    open_identifier_index(repo_root)
     callers_universe_files, callers_universe_tests = _repo_map_file_and_test_universe(repo_map)
     bounded_files, callers_ceiling_hit = _cap_caller_scan_files(
         [*callers_universe_files, *callers_universe_tests],
@@ -13929,6 +13914,7 @@ def build_symbol_callers_from_map(
                 )
                 call_payload.setdefault("ref_kind", "call")
                 calls.append(call_payload)
+    flush_identifier_indexes()
 
     normalized_provider = _normalize_semantic_provider(semantic_provider)
     external_calls: list[dict[str, Any]] = []
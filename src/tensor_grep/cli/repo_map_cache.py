@@ -127,3 +127,36 @@ def _mtime_aware_cache(
         return cast("Callable[..., _CacheR]", wrapper)
 
     return decorator
+
+
+# The warm repo-map source: a long-lived process (today the MCP server, see
+# mcp_repo_map_cache.py) installs one here, and every `build_repo_map` call that names only a
+# root, a scan cap, a deadline and a profiling collector goes through it instead of re-walking
+# and re-parsing the repo. The source receives the undecorated builder, and the collector, for its
+# own misses. Nothing is installed in the CLI or in tests, so there `build_repo_map` builds every
+# time exactly as before.
+_BuildR = TypeVar("_BuildR", bound=Callable[..., dict[str, Any]])
+_WARM_SOURCE_KWARGS = frozenset({"max_repo_files", "deadline_monotonic", "_profiling_collector"})
+_warm_repo_map_source: Callable[..., dict[str, Any]] | None = None
+
+
+def _install_warm_repo_map_source(
+    source: Callable[..., dict[str, Any]] | None,
+) -> Callable[..., dict[str, Any]] | None:
+    """Install ``source`` (None uninstalls) and return the one it replaced."""
+    global _warm_repo_map_source
+    previous, _warm_repo_map_source = _warm_repo_map_source, source
+    return previous
+
+
+def _served_warm(build: _BuildR) -> _BuildR:
+    """Decorator for `build_repo_map`: route plain builds through the installed warm source."""
+
+    @wraps(build)
+    def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        source = _warm_repo_map_source
+        if source is None or len(args) > 1 or not kwargs.keys() <= _WARM_SOURCE_KWARGS:
+            return build(*args, **kwargs)
+        return source(build, args[0] if args else ".", **kwargs)
+
+    return cast("_BuildR", wrapper)
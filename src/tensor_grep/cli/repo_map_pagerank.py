@@ -0,0 +1,249 @@
+"""Personalized PageRank over the reverse-import graph, lifted out of `repo_map`.
+
+`repo_map._personalized_reverse_import_pagerank` (seed selection, deadline readback, profiling)
+calls `personalized_pagerank` here. The score is the same fixed-iteration recurrence either way:
+
+    rank'[i] = (1 - alpha) * p[i] + sum over importers-of-j edges j -> i of alpha * rank[j] / out[j]
+               + (i is a seed) * sum over dangling j of alpha * rank[j] / len(seeds)
+
+Small graphs run it as the original pure-Python dict loop. From `_CSR_MIN_FILES` files up, and
+when NumPy is importable (it is an optional dependency), the graph is laid out once as a CSR
+adjacency -- int32 node ids, one row of importer ids per file -- and each iteration is a
+vectorized sparse mat-vec. The CSR is kept in a small cache validated by equality with the
+``(all_files, reverse_importers)`` it was built from, so a warm session's repeated context
+queries over an unchanged repo map rebuild only the seed vector. The vectorized route stops
+early once an iteration moves no rank by more than `_CONVERGENCE_TOLERANCE` in total (the
+recurrence is an alpha-contraction, so the ranks it skips differ by under 1e-11); its floating
+point sums may differ from the dict loop's in the last bits, never by more than 1e-9.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Below this many files the array setup costs more than the dict loop it replaces.
+_CSR_MIN_FILES = 256
+# L1 change per iteration under which the remaining iterations are skipped.
+_CONVERGENCE_TOLERANCE = 1e-12
+# Graphs kept per process: one per repo map a warm session is answering queries for.
+_CSR_CACHE_MAX_ENTRIES = 4
+
+
+@dataclass(frozen=True)
+class ImportGraphCsr:
+    """The reverse-import graph with files numbered ``0 .. len(files) - 1``.
+
+    ``files`` lists every distinct entry of ``all_files`` in first-seen order, then any importer
+    outside ``all_files`` in the order the dict loop first reaches it, so a rank vector indexed
+    by id iterates in the dict loop's key order. Row ``j`` of ``indptr``/``indices`` holds the
+    sorted importers of file ``j`` (only the first ``internal_count`` ids have rows).
+    """
+
+    files: tuple[str, ...]
+    internal_count: int
+    indptr: np.ndarray
+    indices: np.ndarray
+    # Source id of every edge (``indices`` is the target), for the scatter-add.
+    edge_sources: np.ndarray
+    # ``multiplicity[j] / out[j]`` for a file with importers, else 0.
+    share: np.ndarray
+    # ``multiplicity[j]`` for a file with no importers, else 0.
+    dangling: np.ndarray
+    # A file listed twice in ``all_files`` is propagated twice by the dict loop; the contraction
+    # bound behind the early stop only holds when no file is.
+    unit_multiplicity: bool
+
+    @classmethod
+    def build(
+        cls, numpy: Any, all_files: list[str], reverse_importers: dict[str, set[str]]
+    ) -> ImportGraphCsr:
+        ids: dict[str, int] = {}
+        multiplicity: list[int] = []
+        for current in all_files:
+            file_id = ids.setdefault(current, len(ids))
+            if file_id == len(multiplicity):
+                multiplicity.append(1)
+            else:
+                multiplicity[file_id] += 1
+        internal_count = len(ids)
+        files = list(ids)
+        indptr = [0]
+        indices: list[int] = []
+        for current in files[:internal_count]:
+            for importer in sorted(reverse_importers.get(current, set())):
+                importer_id = ids.get(importer)
+                if importer_id is None:
+                    importer_id = ids[importer] = len(files)
+                    files.append(importer)
+                indices.append(importer_id)
+            indptr.append(len(indices))
+        indptr_array = numpy.asarray(indptr, dtype=numpy.int32)
+        out_degree = numpy.diff(indptr_array).astype(numpy.float64)
+        weights = numpy.zeros(len(files), dtype=numpy.float64)
+        weights[:internal_count] = multiplicity
+        has_importers = numpy.zeros(len(files), dtype=bool)
+        has_importers[:internal_count] = out_degree > 0
+        share = numpy.zeros(len(files), dtype=numpy.float64)
+        share[:internal_count] = numpy.divide(
+            weights[:internal_count],
+            out_degree,
+            out=numpy.zeros(internal_count, dtype=numpy.float64),
+            where=out_degree > 0,
+        )
+        dangling = numpy.where(has_importers, 0.0, weights)
+        return cls(
+            files=tuple(files),
+            internal_count=internal_count,
+            indptr=indptr_array,
+            indices=numpy.asarray(indices, dtype=numpy.int32),
+            edge_sources=numpy.repeat(
+                numpy.arange(internal_count, dtype=numpy.int32), numpy.diff(indptr_array)
+            ),
+            share=share,
+            dangling=dangling,
+            unit_multiplicity=len(all_files) == internal_count,
+        )
+
+
+@dataclass(frozen=True)
+class _CsrCacheEntry:
+    all_files: tuple[str, ...]
+    reverse_importers: dict[str, frozenset[str]]
+    graph: ImportGraphCsr
+
+
+_CSR_CACHE: OrderedDict[int, _CsrCacheEntry] = OrderedDict()
+_CSR_CACHE_LOCK = threading.Lock()
+_CSR_CACHE_NEXT_KEY = 0
+
+
+def import_graph_csr(
+    numpy: Any, all_files: list[str], reverse_importers: dict[str, set[str]]
+) -> ImportGraphCsr:
+    """The CSR for this graph, reused while an identical graph was seen recently."""
+    global _CSR_CACHE_NEXT_KEY
+    files_key = tuple(all_files)
+    with _CSR_CACHE_LOCK:
+        for key, entry in _CSR_CACHE.items():
+            # Tuple and dict-of-set equality run in C: far cheaper than rebuilding the rows.
+            if entry.all_files == files_key and entry.reverse_importers == reverse_importers:
+                _CSR_CACHE.move_to_end(key)
+                return entry.graph
+    graph = ImportGraphCsr.build(numpy, all_files, reverse_importers)
+    frozen = {current: frozenset(importers) for current, importers in reverse_importers.items()}
+    with _CSR_CACHE_LOCK:
+        _CSR_CACHE[_CSR_CACHE_NEXT_KEY] = _CsrCacheEntry(files_key, frozen, graph)
+        _CSR_CACHE_NEXT_KEY += 1
+        while len(_CSR_CACHE) > _CSR_CACHE_MAX_ENTRIES:
+            _CSR_CACHE.popitem(last=False)
+    return graph
+
+
+def clear_import_graph_cache() -> None:
+    with _CSR_CACHE_LOCK:
+        _CSR_CACHE.clear()
+
+
+def _numpy_or_none() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def personalized_pagerank(
+    unique_seeds: list[str],
+    all_files: list[str],
+    reverse_importers: dict[str, set[str]],
+    *,
+    alpha: float,
+    iterations: int,
+    deadline_monotonic: float | None = None,
+) -> dict[str, float] | None:
+    """Positive ranks by file, in the dict loop's key order; None once the deadline passes.
+
+    ``unique_seeds`` are distinct members of ``all_files`` (at least one). The deadline is
+    checked at each iteration boundary, so a run is either complete or abandoned.
+    """
+    numpy = _numpy_or_none() if len(all_files) >= _CSR_MIN_FILES else None
+    if numpy is None:
+        return _dict_pagerank(
+            unique_seeds,
+            all_files,
+            reverse_importers,
+            alpha=alpha,
+            iterations=iterations,
+            deadline_monotonic=deadline_monotonic,
+        )
+    graph = import_graph_csr(numpy, all_files, reverse_importers)
+    node_count = len(graph.files)
+    file_ids = {current: file_id for file_id, current in enumerate(graph.files)}
+    seed_ids = numpy.asarray([file_ids[seed] for seed in unique_seeds], dtype=numpy.int32)
+    personalization = numpy.zeros(node_count, dtype=numpy.float64)
+    personalization[seed_ids] = 1.0 / len(unique_seeds)
+    teleport = (1.0 - alpha) * personalization
+    ranks = personalization
+    for _ in range(iterations):
+        if deadline_monotonic is not None and time.monotonic() >= deadline_monotonic:
+            return None
+        spread = alpha * ranks * graph.share
+        updated = teleport + numpy.bincount(
+            graph.indices, weights=spread[graph.edge_sources], minlength=node_count
+        )
+        updated[seed_ids] += alpha * float(numpy.dot(graph.dangling, ranks)) / len(unique_seeds)
+        converged = (
+            graph.unit_multiplicity
+            and float(numpy.abs(updated - ranks).sum()) <= _CONVERGENCE_TOLERANCE
+        )
+        ranks = updated
+        if converged:
+            break
+    return {
+        graph.files[file_id]: float(ranks[file_id]) for file_id in numpy.flatnonzero(ranks > 0.0)
+    }
+
+
+def _dict_pagerank(
+    unique_seeds: list[str],
+    all_files: list[str],
+    reverse_importers: dict[str, set[str]],
+    *,
+    alpha: float,
+    iterations: int,
+    deadline_monotonic: float | None,
+) -> dict[str, float] | None:
+    seed_set = set(unique_seeds)
+    seed_weight = 1.0 / len(unique_seeds)
+    personalization = {
+        current: (seed_weight if current in seed_set else 0.0) for current in all_files
+    }
+    ranks = dict(personalization)
+    # Hoisted out of the iteration loop: ``reverse_importers`` never changes across iterations,
+    # so re-sorting it per node per iteration was up to 12x the same work.
+    sorted_outgoing = {
+        current: sorted(reverse_importers.get(current, set())) for current in all_files
+    }
+    for _ in range(iterations):
+        if deadline_monotonic is not None and time.monotonic() >= deadline_monotonic:
+            return None
+        updated = {current: (1.0 - alpha) * personalization[current] for current in all_files}
+        for current in all_files:
+            outgoing = sorted_outgoing[current]
+            if outgoing:
+                share = alpha * ranks[current] / len(outgoing)
+                for importer in outgoing:
+                    updated[importer] = updated.get(importer, 0.0) + share
+                continue
+            spill = alpha * ranks[current] / len(unique_seeds)
+            for seed in unique_seeds:
+                updated[seed] = updated.get(seed, 0.0) + spill
+        ranks = updated
+    return {current: rank for current, rank in ranks.items() if rank > 0.0}
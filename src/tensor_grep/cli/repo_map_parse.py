@@ -0,0 +1,282 @@
+"""build_repo_map's per-file parse stage, lifted out of `repo_map`.
+
+Small maps parse serially in-process; large ones fan the per-file symbol/import parse out
+across worker processes, and the results are folded back in context-file order so the payload
+is identical either way. Split out of `repo_map.py` under
+docs/design/2026-08-19-split-floor-escape.md.
+
+`_PARALLEL_PARSE_MIN_FILES` and `_PARALLEL_PARSE_CHUNK_FILES` deliberately stay in `repo_map`:
+the test suite monkeypatches them there, so they are read through `_self` like any patched name.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from tensor_grep.cli.repo_map_parse_store import ParsedFile, ParseStore
+
+# Route A late binding, exactly as in repo_map_output_budget.py: `_self` is
+# `tensor_grep.cli.repo_map`, resolved on each attribute read so patched names are the ones run.
+if TYPE_CHECKING:
+    from tensor_grep.cli import repo_map as _self
+    from tensor_grep.cli.repo_map import _ProfileCollector
+else:
+
+    class _RepoMapProxy:
+        """Late-binding view of `tensor_grep.cli.repo_map`."""
+
+        __slots__ = ()
+
+        def __getattr__(self, name: str) -> Any:
+            module = sys.modules.get("tensor_grep.cli.repo_map")
+            if module is None:
+                module = importlib.import_module("tensor_grep.cli.repo_map")
+            return getattr(module, name)
+
+    _self = _RepoMapProxy()
+
+# The pool is opt-in: the size comes from --jobs / the env var, and without either the parse stays
+# serial. 0 means one per CPU, up to the max below.
+_REPO_MAP_JOBS_ENV = "TENSOR_GREP_REPO_MAP_JOBS"
+_DEFAULT_MAX_REPO_MAP_JOBS = 8
+
+
+def _repo_map_jobs(jobs: int | None = None) -> int:
+    """Return the parse-stage worker count: ``jobs`` if given, else the env override.
+
+    Neither (or an unparseable env value) means ``1``: parsing stays serial and in-process. ``0``
+    means auto -- one per CPU, capped at ``_DEFAULT_MAX_REPO_MAP_JOBS``.
+    """
+    if jobs is None:
+        raw_value = os.environ.get(_REPO_MAP_JOBS_ENV)
+        try:
+            jobs = int(raw_value) if raw_value is not None else 1
+        except ValueError:
+            jobs = 1
+    if jobs <= 0:
+        return max(1, min(os.cpu_count() or 1, _DEFAULT_MAX_REPO_MAP_JOBS))
+    return jobs
+
+
+def _parser_is_unpatched() -> bool:
+    # A patched parser exists only in this process; spawned workers would run the original.
+    parser = _self._imports_and_symbols_for_path
+    return (
+        getattr(parser, "__module__", None) == "tensor_grep.cli.repo_map"
+        and getattr(parser, "__qualname__", None) == "_imports_and_symbols_for_path"
+    )
+
+
+def _pooled_context_parse(
+    context_files: list[Path],
+    context_root: Path,
+    jobs: int | None,
+    deadline_monotonic: float | None,
+    collector: _ProfileCollector | None,
+) -> list[tuple[list[str], list[dict[str, Any]]] | None] | None:
+    """The pool's results for build_repo_map, or ``None`` when the map should parse serially.
+
+    Serial means: one job, fewer than ``_PARALLEL_PARSE_MIN_FILES`` files (spawning and
+    importing workers would cost more than the parsing it saves), a patched parser, an already
+    spent deadline, or a pool that could not run.
+    """
+    parse_jobs = _repo_map_jobs(jobs)
+    if (
+        parse_jobs <= 1
+        or len(context_files) < _self._PARALLEL_PARSE_MIN_FILES
+        or not _parser_is_unpatched()
+        or (deadline_monotonic is not None and time.monotonic() >= deadline_monotonic)
+    ):
+        return None
+    with _self._profiling_phase(collector, "parallel_parse"):
+        return _self._parse_context_files_parallel(
+            context_files, context_root, parse_jobs, deadline_monotonic, collector
+        )
+
+
+def _parse_context_files(
+    context_files: list[Path],
+    context_root: Path,
+    jobs: int | None,
+    deadline_monotonic: float | None,
+    collector: _ProfileCollector | None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], int, bool]:
+    """Parse every context file: ``(imports, symbols, files_scanned, deadline_hit)``.
+
+    Past ``deadline_monotonic`` the parse stops at the first file it did not reach -- the serial
+    loop's next file, or the first one the pool left unparsed -- so a partial result is always a
+    prefix of ``context_files``; what was parsed is kept and ``deadline_hit`` is set.
+    """
+    imports: list[dict[str, Any]] = []
+    symbols: list[dict[str, Any]] = []
+    files_scanned = 0
+    deadline_hit = False
+    store = _open_parse_store(context_root)
+    with _self._profiling_phase(collector, "parse_store_lookup"):
+        stored = store.lookup(context_files) if store is not None else {}
+    to_parse = [current for current in context_files if str(current) not in stored]
+    pooled = _pooled_context_parse(to_parse, context_root, jobs, deadline_monotonic, collector)
+    fresh: list[tuple[Path, ParsedFile]] = []
+    parse_position = 0
+    for current in context_files:
+        cached = stored.get(str(current))
+        if cached is not None:
+            current_imports, current_symbols = cached
+        elif pooled is not None:
+            parsed = pooled[parse_position]
+            parse_position += 1
+            if parsed is None:
+                deadline_hit = True
+                break
+            current_imports, current_symbols = parsed
+            fresh.append((current, parsed))
+        elif deadline_monotonic is not None and time.monotonic() >= deadline_monotonic:
+            deadline_hit = True
+            break
+        else:
+            if collector is None:
+                parsed = _self._imports_and_symbols_for_path(current)
+            else:
+                parsed = _self._imports_and_symbols_for_path(
+                    current,
+                    _profiling_collector=collector,
+                )
+            current_imports, current_symbols = parsed
+            fresh.append((current, parsed))
+        if current_imports:
+            imports.append({
+                "file": str(current),
+                "imports": current_imports,
+                "provenance": _self._symbol_navigation_provenance_for_path(str(current)),
+            })
+        symbols.extend(current_symbols)
+        files_scanned += 1
+    _store_fresh_parses(store, fresh)
+    return imports, symbols, files_scanned, deadline_hit
+
+
+def _open_parse_store(context_root: Path) -> ParseStore | None:
+    # A patched parser's results are the test's own; never serve or persist them.
+    return ParseStore.open(context_root) if _parser_is_unpatched() else None
+
+
+def _store_fresh_parses(store: ParseStore | None, fresh: list[tuple[Path, ParsedFile]]) -> None:
+    if store is not None:
+        store.store(fresh)
+        store.close()
+
+
+def _parse_changed_context_files(
+    paths: list[Path], context_root: Path, deadline_monotonic: float | None
+) -> tuple[dict[str, ParsedFile], bool]:
+    """build_repo_map_incremental's serial parse of its changed files, through the parse store.
+
+    Returns ``(parsed_by_path, deadline_hit)``; files past the deadline are simply absent.
+    """
+    store = _open_parse_store(context_root)
+    parsed_by_path = store.lookup(paths) if store is not None else {}
+    fresh: list[tuple[Path, ParsedFile]] = []
+    deadline_hit = False
+    for current in paths:
+        if str(current) in parsed_by_path:
+            continue
+        if deadline_monotonic is not None and time.monotonic() >= deadline_monotonic:
+            deadline_hit = True
+            break
+        parsed = _self._imports_and_symbols_for_path(current)
+        parsed_by_path[str(current)] = parsed
+        fresh.append((current, parsed))
+    _store_fresh_parses(store, fresh)
+    return parsed_by_path, deadline_hit
+
+
+def _parse_worker_init(context_root: str) -> None:
+    """Process-pool initializer: prime the per-repo language contexts the parser reads."""
+    _self._prime_all_language_repo_contexts(Path(context_root))
+
+
+def _parse_file_chunk(
+    paths: list[str],
+    deadline_wall: float | None,
+    profile: bool,
+) -> tuple[list[tuple[list[str], list[dict[str, Any]]]], list[float]]:
+    """Worker task: parse ``paths`` in order, stopping at ``deadline_wall`` (``time.time()``).
+
+    Returns the results for the PREFIX of ``paths`` that was parsed, plus per-file parse seconds
+    when ``profile`` is set (the parent folds them into its ``file_parse`` phase).
+    """
+    results: list[tuple[list[str], list[dict[str, Any]]]] = []
+    timings: list[float] = []
+    for current in paths:
+        if deadline_wall is not None and time.time() >= deadline_wall:
+            break
+        started = time.perf_counter()
+        results.append(_self._imports_and_symbols_for_path(Path(current)))
+        if profile:
+            timings.append(time.perf_counter() - started)
+    return results, timings
+
+
+def _parse_context_files_parallel(
+    context_files: list[Path],
+    context_root: Path,
+    jobs: int,
+    deadline_monotonic: float | None,
+    collector: _ProfileCollector | None,
+) -> list[tuple[list[str], list[dict[str, Any]]] | None] | None:
+    """Parse ``context_files`` across a ``jobs``-process pool.
+
+    Returns one entry per file, in ``context_files`` order -- ``None`` for a file a worker did
+    not reach before the deadline -- or ``None`` overall when the pool itself could not run (no
+    usable multiprocessing here, a worker died), in which case the caller parses serially.
+
+    The deadline crosses the process boundary as a wall-clock instant: ``time.monotonic()`` has
+    no reference point shared between processes on every platform.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    deadline_wall = (
+        None
+        if deadline_monotonic is None
+        else time.time() + (deadline_monotonic - time.monotonic())
+    )
+    profile = collector is not None and collector.enabled
+    chunk_files = _self._PARALLEL_PARSE_CHUNK_FILES
+    chunks = [
+        context_files[start : start + chunk_files]
+        for start in range(0, len(context_files), chunk_files)
+    ]
+    results: list[tuple[list[str], list[dict[str, Any]]] | None] = [None] * len(context_files)
+    try:
+        # spawn, not fork: the daemon / MCP server call this from worker threads, and forking a
+        # threaded process can deadlock the child on a lock another thread held.
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(chunks)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_parse_worker_init,
+            initargs=(str(context_root),),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _parse_file_chunk, [str(current) for current in chunk], deadline_wall, profile
+                )
+                for chunk in chunks
+            ]
+            offset = 0
+            for chunk, future in zip(chunks, futures, strict=True):
+                parsed, timings = future.result()
+                results[offset : offset + len(parsed)] = parsed
+                offset += len(chunk)
+                if collector is not None:
+                    for elapsed in timings:
+                        collector._record("file_parse", elapsed)
+    except (BrokenProcessPool, OSError):
+        return None
+    return results
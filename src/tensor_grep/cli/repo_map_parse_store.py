@@ -0,0 +1,251 @@
+"""Persistent per-repository store of build_repo_map's per-file parse results.
+
+The mtime-aware caches in `repo_map_cache` die with the process, so every cold `tg map` /
+`orient` / `agent` / `defs` re-parsed every context file. This store keeps each file's
+``(imports, symbols)`` in SQLite (WAL mode), one database per map root under the user cache dir
+(like the identifier and repo trigram indexes, so read-only commands never write into the
+repository), keyed by absolute path and validated by::
+
+    (size, mtime_ns)     unchanged -> reuse
+    size unchanged       but mtime moved (touch, checkout) -> reuse if the content hash matches
+    extractor            a fingerprint of the package version, the tree-sitter and grammar
+                         package versions and the extractor modules' own (size, mtime_ns), so
+                         an upgraded or edited extractor never serves an old parse
+
+The content hash is taken at lookup, before the miss is parsed: a write landing mid-parse then
+leaves a hash that no longer matches the file, never the new content's hash beside the old
+content's parse. A file changed within `_RACY_WINDOW_NS` of the lookup is left out: a same-size
+rewrite inside one timestamp tick would otherwise look unchanged (git's "racy clean" rule).
+
+The store is only created once there is something to write. Any SQLite or filesystem error
+degrades to parsing. ``TENSOR_GREP_PARSE_STORE=0`` turns it off;
+``TENSOR_GREP_PARSE_STORE_DIR`` moves it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+_PARSE_STORE_ENV = "TENSOR_GREP_PARSE_STORE"
+_PARSE_STORE_NAME = "parse-store.sqlite3"
+# The grammars behind the lang_* extractors (pyproject's ``ast`` extra).
+_GRAMMAR_DISTRIBUTIONS = (
+    "tree-sitter-python",
+    "tree-sitter-javascript",
+    "tree-sitter-typescript",
+    "tree-sitter-rust",
+    "tree-sitter-go",
+    "tree-sitter-java",
+    "tree-sitter-php",
+    "tree-sitter-c-sharp",
+    "tree-sitter-c",
+    "tree-sitter-cpp",
+)
+# Bump when the stored row shape changes.
+_PARSE_STORE_SCHEMA = 1
+# Wider than any common filesystem's timestamp granularity (FAT 2s, HFS+/ext3 1s, coarse clocks).
+_RACY_WINDOW_NS = 2_000_000_000
+# Stays under SQLite's default host-parameter limit.
+_LOOKUP_BATCH = 500
+_BUSY_TIMEOUT_MS = 2000
+
+ParsedFile = tuple[list[str], list[dict[str, Any]]]
+
+
+def parse_store_enabled() -> bool:
+    value = os.environ.get(_PARSE_STORE_ENV, "").strip().lower()
+    return value not in {"0", "false", "no", "off"}
+
+
+def get_parse_store_cache_dir() -> Path:
+    override = os.environ.get("TENSOR_GREP_PARSE_STORE_DIR")
+    if override:
+        return Path(override).expanduser().resolve()
+    if os.name == "nt":
+        local_appdata = os.environ.get("LOCALAPPDATA")
+        if local_appdata:
+            return Path(local_appdata) / "tensor-grep" / "parse-store"
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache_home:
+        return Path(xdg_cache_home) / "tensor-grep" / "parse-store"
+    return Path.home() / ".cache" / "tensor-grep" / "parse-store"
+
+
+def parse_store_path(root: Path) -> Path:
+    digest = hashlib.sha256(str(root).encode("utf-8", errors="surrogatepass")).hexdigest()
+    return get_parse_store_cache_dir() / digest / _PARSE_STORE_NAME
+
+
+@lru_cache(maxsize=1)
+def extractor_fingerprint() -> str:
+    """Identity of the code that produced a parse; a stored row from other code is a miss."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    parts = [str(_PARSE_STORE_SCHEMA)]
+    for distribution in ("tensor-grep", "tree-sitter", *_GRAMMAR_DISTRIBUTIONS):
+        try:
+            parts.append(version(distribution))
+        except PackageNotFoundError:
+            parts.append("-")
+    cli_dir = Path(__file__).resolve().parent
+    for module in sorted([*cli_dir.glob("repo_map*.py"), *cli_dir.glob("lang_*.py")]):
+        stat = _stat_or_none(module)
+        parts.append(f"{module.name}:{stat.st_size}:{stat.st_mtime_ns}" if stat else module.name)
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def _content_hash(path: Path) -> bytes | None:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class ParseStore:
+    """One root's store. Use `open`; call `close` when done."""
+
+    def __init__(self, location: Path, connection: sqlite3.Connection | None) -> None:
+        self._location = location
+        self._connection = connection
+        self._extractor = extractor_fingerprint()
+        # Stats and miss hashes taken at lookup, BEFORE the misses are parsed: a change landing
+        # mid-parse then shows up as a newer mtime and a mismatched hash on the next lookup
+        # instead of being stored as current.
+        self._stats: dict[str, os.stat_result] = {}
+        self._hashes: dict[str, bytes | None] = {}
+        self.hits = 0
+
+    @classmethod
+    def open(cls, root: Path) -> ParseStore | None:
+        if not parse_store_enabled():
+            return None
+        location = parse_store_path(root)
+        if not location.is_file():
+            return cls(location, None)
+        connection = cls._connect(location)
+        return cls(location, connection)
+
+    @staticmethod
+    def _connect(location: Path) -> sqlite3.Connection | None:
+        try:
+            connection = sqlite3.connect(location, timeout=_BUSY_TIMEOUT_MS / 1000)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+                "content_hash BLOB, extractor TEXT NOT NULL, imports TEXT NOT NULL, "
+                "symbols TEXT NOT NULL)"
+            )
+        except (sqlite3.Error, OSError):
+            return None
+        return connection
+
+    def lookup(self, paths: Iterable[Path]) -> dict[str, ParsedFile]:
+        """Stored parses still current for ``paths``, keyed by ``str(path)``."""
+        wanted: list[str] = []
+        for path in paths:
+            stat = _stat_or_none(path)
+            if stat is not None:
+                self._stats[str(path)] = stat
+                wanted.append(str(path))
+        found = self._lookup_stored(wanted)
+        for path_str in wanted:
+            if path_str in found or path_str in self._hashes or _is_racy(self._stats[path_str]):
+                continue
+            self._hashes[path_str] = _content_hash(Path(path_str))
+        return found
+
+    def _lookup_stored(self, wanted: list[str]) -> dict[str, ParsedFile]:
+        if self._connection is None or not wanted:
+            return {}
+        found: dict[str, ParsedFile] = {}
+        touched: list[tuple[int, str]] = []
+        for start in range(0, len(wanted), _LOOKUP_BATCH):
+            batch = wanted[start : start + _LOOKUP_BATCH]
+            try:
+                rows = self._connection.execute(
+                    "SELECT path, size, mtime_ns, content_hash, imports, symbols FROM files "
+                    f"WHERE extractor = ? AND path IN ({','.join('?' * len(batch))})",
+                    [self._extractor, *batch],
+                ).fetchall()
+            except sqlite3.Error:
+                return found
+            for path_str, size, mtime_ns, content_hash, imports, symbols in rows:
+                stat = self._stats[path_str]
+                if stat.st_size != size:
+                    continue
+                if stat.st_mtime_ns != mtime_ns:
+                    if _is_racy(stat):
+                        continue
+                    current_hash = _content_hash(Path(path_str))
+                    if current_hash != content_hash:
+                        self._hashes[path_str] = current_hash
+                        continue
+                    touched.append((stat.st_mtime_ns, path_str))
+                found[path_str] = (json.loads(imports), json.loads(symbols))
+        if touched:
+            self._write("UPDATE files SET mtime_ns = ? WHERE path = ?", touched)
+        self.hits += len(found)
+        return found
+
+    def store(self, parsed: Iterable[tuple[Path, ParsedFile]]) -> None:
+        """Record fresh parses of misses `lookup` hashed; racy files were never hashed."""
+        rows: list[tuple[Any, ...]] = []
+        for path, (imports, symbols) in parsed:
+            stat = self._stats.get(str(path))
+            if stat is None or str(path) not in self._hashes:
+                continue
+            rows.append((
+                str(path),
+                stat.st_size,
+                stat.st_mtime_ns,
+                self._hashes[str(path)],
+                self._extractor,
+                json.dumps(imports, separators=(",", ":")),
+                json.dumps(symbols, separators=(",", ":")),
+            ))
+        if not rows:
+            return
+        if self._connection is None:
+            try:
+                self._location.parent.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                return
+            self._connection = self._connect(self._location)
+        self._write("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def _write(self, statement: str, rows: list[tuple[Any, ...]]) -> None:
+        if self._connection is None:
+            return
+        try:
+            with self._connection:
+                self._connection.executemany(statement, rows)
+        except sqlite3.Error:
+            # Another writer holding the lock past the busy timeout: the next build stores them.
+            pass
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def _is_racy(stat: os.stat_result) -> bool:
+    return time.time_ns() - stat.st_mtime_ns < _RACY_WINDOW_NS
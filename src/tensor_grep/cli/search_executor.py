@@ -0,0 +1,118 @@
+"""Bounded, order-preserving per-file executor for `search_command`'s native (non-rg) route.
+
+`search_command` hands every candidate file to `backend.search()` one at a time when Pipeline
+did not route to `RipgrepBackend` (`--rank`, context flags, native `--json`, no `rg` on PATH).
+For backends whose per-file search is thread-safe, this module fans those calls out over a
+small thread pool (file reads, mmap-backed prefilters and the native engines all release the
+GIL) while the caller still consumes results strictly in candidate order, so the merged output
+is identical to the sequential loop.
+
+Deadline semantics match the sequential loop exactly: a file is only searched if the native
+walk deadline has not passed when its search STARTS, and the first file skipped that way ends
+the walk -- results of any later file that a worker happened to finish are discarded, so the
+returned results are always a prefix of the candidate order, never a set with holes in it.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Callable, Generator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, cast
+
+from tensor_grep.backends import cpu_backend as _cpu_backend
+
+if TYPE_CHECKING:
+    from tensor_grep.core.result import SearchResult
+
+# Backends whose `search()` keeps no per-call instance state and guards its shared caches.
+# GPU backends stay sequential: they already batch across devices internally.
+_PARALLEL_SAFE_BACKENDS = frozenset({"CPUBackend", "RustCoreBackend", "StringZillaBackend"})
+_AUTO_MAX_WORKERS = 8
+# Submitted-but-unconsumed files per worker: enough to keep every worker busy behind a slow
+# file at the head of the queue without materialising a future per candidate on huge trees.
+_IN_FLIGHT_PER_WORKER = 4
+_DEADLINE_SKIPPED = object()
+
+FileOutcome = Callable[[], "SearchResult"]
+
+
+def _configured_threads() -> int:
+    raw_value = os.environ.get("TG_THREADS")
+    if raw_value is None:
+        return 0
+    try:
+        value = int(raw_value)
+    except (TypeError, ValueError):
+        return 0
+    return value if value > 0 else 0
+
+
+def resolve_search_workers(requested_threads: int, *, backend_name: str, file_count: int) -> int:
+    """Worker count for the per-file loop: ``--threads``, else ``TG_THREADS``, else auto.
+
+    Always 1 for a backend not known to be thread-safe or for fewer than two files.
+    """
+    if backend_name not in _PARALLEL_SAFE_BACKENDS or file_count < 2:
+        return 1
+    threads = requested_threads if requested_threads > 0 else _configured_threads()
+    if threads <= 0:
+        threads = min(os.cpu_count() or 1, _AUTO_MAX_WORKERS)
+    return max(1, min(threads, file_count))
+
+
+def iter_file_outcomes(
+    files: Sequence[str],
+    search_one: Callable[[str], SearchResult],
+    *,
+    workers: int,
+    deadline: float,
+) -> Generator[tuple[str, FileOutcome | None], None, None]:
+    """Yield ``(file, outcome)`` in candidate order; ``outcome()`` returns or raises its result.
+
+    A ``None`` outcome means the walk deadline expired before that file was searched; it is the
+    last item yielded. With ``workers <= 1`` nothing runs until the caller invokes ``outcome``,
+    which is exactly the old sequential loop. Exceptions are re-raised by ``outcome()`` in
+    candidate order, so the first failing file (e.g. an invalid regex) is reported once, as it
+    would have been sequentially, regardless of which worker finished first.
+    """
+    if workers <= 1:
+        for current_file in files:
+            if _cpu_backend.native_walk_deadline_exceeded(deadline):
+                yield current_file, None
+                return
+            yield current_file, partial(search_one, current_file)
+        return
+
+    def _run(current_file: str) -> object:
+        if _cpu_backend.native_walk_deadline_exceeded(deadline):
+            return _DEADLINE_SKIPPED
+        return search_one(current_file)
+
+    pending: deque[tuple[str, Future[object]]] = deque()
+    remaining = iter(files)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tg-search")
+
+    def _fill() -> None:
+        while len(pending) < workers * _IN_FLIGHT_PER_WORKER:
+            current_file = next(remaining, None)
+            if current_file is None:
+                return
+            pending.append((current_file, executor.submit(_run, current_file)))
+
+    try:
+        _fill()
+        while pending:
+            current_file, future = pending.popleft()
+            if future.exception() is None and future.result() is _DEADLINE_SKIPPED:
+                yield current_file, None
+                return
+            yield current_file, cast(FileOutcome, future.result)
+            _fill()
+    finally:
+        # Early exit (deadline, an exception raised by the caller, or the generator being
+        # closed): never start queued files, but let in-flight ones finish so no worker thread
+        # outlives the search.
+        executor.shutdown(wait=True, cancel_futures=True)
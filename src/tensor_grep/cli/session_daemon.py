@@ -22,28 +22,25 @@ from uuid import uuid4
 
 from tensor_grep.cli._index_lock import IndexLockTimeoutError, index_lock, replace_with_retry
 from tensor_grep.cli.runtime_paths import _expected_tg_version
+from tensor_grep.cli.session_journal import ChangeJournal, start_change_journal, stop_change_journal
+from tensor_grep.cli.session_serve_cache import _SessionServeCache, _SessionServeResponseCache
 from tensor_grep.cli.session_store import (
     _DEFAULT_SESSION_AGENT_REPO_MAP_LIMIT,
     _DEFAULT_SESSION_CONTEXT_RENDER_REPO_MAP_LIMIT,
     _DEFAULT_SESSION_EDIT_PLAN_REPO_MAP_LIMIT,
     _DEFAULT_SESSION_ORIENT_REPO_MAP_LIMIT,
-    _DEFAULT_SESSION_SERVE_RESPONSE_CACHE_MAX_BYTES,
     _DEFAULT_SESSION_SYMBOL_REPO_MAP_LIMIT,
-    _SESSION_SERVE_RESPONSE_CACHE_MAX_BYTES_ENV,
     _SESSION_VERSION,
     WARM_DAEMON_DEFAULT_DEADLINE_SECONDS,
-    _configured_positive_int,
+    SessionStaleError,
     _ensure_session_not_stale,
     _index_path,
-    _json_size_bytes,
     _load_index,
     _resolve_request_session_target,
     _resolve_root,
     _session_health_payload,
     _session_payload_path,
     _sessions_dir,
-    _SessionServeCache,
-    _SessionServeResponseCacheEntry,
     _write_index,
     _write_json_atomic,
     open_session,
@@ -1647,92 +1644,24 @@ def _attach_demand_metrics(status: dict[str, Any], metrics_root: Path) -> dict[s
     return status
 
 
-class _SessionResponseCache:
+class _SessionResponseCache(_SessionServeResponseCache):
+    """The serve response cache behind a lock: the daemon serves requests on many threads."""
+
     def __init__(
         self,
         max_entries: int = _DAEMON_RESPONSE_CACHE_MAX_ENTRIES,
         max_size_bytes: int | None = None,
     ) -> None:
-        self._max_entries = max(1, max_entries)
-        self._max_size_bytes = (
-            _configured_positive_int(
-                _SESSION_SERVE_RESPONSE_CACHE_MAX_BYTES_ENV,
-                _DEFAULT_SESSION_SERVE_RESPONSE_CACHE_MAX_BYTES,
-            )
-            if max_size_bytes is None
-            else max(1, int(max_size_bytes))
-        )
-        self._entries: OrderedDict[tuple[str, ...], _SessionServeResponseCacheEntry] = OrderedDict()
-        self._size_bytes = 0
-        self._hits = 0
-        self._misses = 0
-        self._puts = 0
-        self._oversized_skips = 0
+        super().__init__(max_entries, max_size_bytes)
         self._lock = threading.RLock()
 
     def get(self, key: tuple[str, ...]) -> dict[str, Any] | None:
         with self._lock:
-            entry = self._entries.pop(key, None)
-            if entry is None:
-                self._misses += 1
-                return None
-            self._hits += 1
-            self._entries[key] = entry
-            return copy.deepcopy(entry.payload)
+            return super().get(key)
 
     def put(self, key: tuple[str, ...], response: dict[str, Any]) -> None:
         with self._lock:
-            self._puts += 1
-            size_bytes = _json_size_bytes(response)
-            if size_bytes > self._max_size_bytes:
-                self._oversized_skips += 1
-                return
-            previous = self._entries.pop(key, None)
-            if previous is not None:
-                self._size_bytes -= previous.size_bytes
-            entry = _SessionServeResponseCacheEntry(
-                payload=copy.deepcopy(response),
-                size_bytes=size_bytes,
-            )
-            self._entries[key] = entry
-            self._size_bytes += entry.size_bytes
-            while len(self._entries) > self._max_entries or self._size_bytes > self._max_size_bytes:
-                _, evicted = self._entries.popitem(last=False)
-                self._size_bytes -= evicted.size_bytes
-
-    @property
-    def hits(self) -> int:
-        with self._lock:
-            return self._hits
-
-    @property
-    def misses(self) -> int:
-        with self._lock:
-            return self._misses
-
-    @property
-    def puts(self) -> int:
-        with self._lock:
-            return self._puts
-
-    @property
-    def entry_count(self) -> int:
-        with self._lock:
-            return len(self._entries)
-
-    @property
-    def size_bytes(self) -> int:
-        with self._lock:
-            return self._size_bytes
-
-    @property
-    def max_size_bytes(self) -> int:
-        return self._max_size_bytes
-
-    @property
-    def oversized_skips(self) -> int:
-        with self._lock:
-            return self._oversized_skips
+            super().put(key, response)
 
 
 class _ThreadedSessionDaemon(socketserver.ThreadingMixIn, socketserver.TCPServer):
@@ -1759,6 +1688,9 @@ class _ThreadedSessionDaemon(socketserver.ThreadingMixIn, socketserver.TCPServer
         self._request_lock = threading.Lock()
         self._response_cache_lock = threading.Lock()
         self._implicit_session_lock = threading.Lock()
+        # Started by run_session_daemon_server; staleness checks for `root` consult it through
+        # session_journal.change_journal_for. None = every check is a full stat sweep.
+        self.change_journal: ChangeJournal | None = None
 
     def note_activity(self) -> None:
         # audit I7: bump the idle clock on every authenticated request.
@@ -1911,6 +1843,11 @@ class _SessionDaemonHandler(socketserver.StreamRequestHandler):
                     "uptime_seconds": max(0.0, monotonic() - server.started_at),
                     "request_count": server.request_count,
                     "inflight_requests": server.inflight_requests,
+                    "change_journal": (
+                        server.change_journal.backend
+                        if server.change_journal is not None
+                        else "off"
+                    ),
                 }
             elif command == "health":
                 payload, cache_status = _load_payload_with_status_retry(
@@ -1944,10 +1881,17 @@ class _SessionDaemonHandler(socketserver.StreamRequestHandler):
                         payload=payload,
                     )
                     served_at = monotonic()
-                except Exception:
+                except Exception as exc:
                     refresh_on_stale = bool(request.get("refresh_on_stale", False))
                     if not refresh_on_stale:
                         raise
+                    # A staleness check that also looked for added files already knows the full
+                    # changeset; hand it over rather than sweeping the tree a second time.
+                    known_changeset = (
+                        exc.changeset
+                        if isinstance(exc, SessionStaleError) and exc.added_files_checked
+                        else None
+                    )
                     load_started_at = monotonic()
                     # Task #304: bound the staleness-triggered rebuild with the SAME budget the
                     # warm daemon already applies to `agent`/`orient`/context-render
@@ -1965,6 +1909,7 @@ class _SessionDaemonHandler(socketserver.StreamRequestHandler):
                         request_path,
                         payload_cache=server.payload_cache,
                         deadline_monotonic=(monotonic() + WARM_DAEMON_DEFAULT_DEADLINE_SECONDS),
+                        changeset=known_changeset,
                     )
                     server.payload_cache.record_refresh()
                     payload, cache_status = _load_payload_with_status_retry(
@@ -2102,6 +2047,7 @@ def run_session_daemon_server(path: str = ".") -> None:
                 _DAEMON_TOKEN_FIELD: token,
             },
         )
+        server.change_journal = start_change_journal(root)
         stop_event = threading.Event()
         lifecycle_thread = threading.Thread(
             target=_run_daemon_lifecycle_monitor,
@@ -2113,6 +2059,8 @@ def run_session_daemon_server(path: str = ".") -> None:
             server.serve_forever(poll_interval=0.1)
         finally:
             stop_event.set()
+            if server.change_journal is not None:
+                stop_change_journal(server.change_journal)
             _flush_demand_metrics_if_dirty(server, force=True)
             # Task #143a-a: this daemon must only ever remove ITS OWN daemon.json on shutdown
             # (idle timeout, max-uptime, or a cooperative "stop" command). If a client already
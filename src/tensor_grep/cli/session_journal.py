@@ -0,0 +1,372 @@
+"""Filesystem change journal behind the warm session daemon's staleness checks.
+
+Every session-serving request asks ``session_store._stale_changeset`` whether the cached repo
+map still matches the disk. Without a journal that means one ``os.stat`` per snapshot entry (up
+to ``DEFAULT_AGENT_REPO_MAP_LIMIT`` files) plus, for ``refresh_on_stale`` requests, a full
+``_iter_repo_files`` re-walk to find added files. A journal lets a check that already proved a
+payload fresh at some cursor answer the next one from what changed since:
+
+- :class:`InotifyJournal` (Linux): one watch per walked directory. Events are drained
+  synchronously at :meth:`ChangeJournal.cursor`, so a write that returned before the check is
+  always seen by it. A check then stats only the changed paths, and re-walks only when a new
+  context-file candidate, a ``.gitignore``, or a directory appeared.
+- :class:`DirectoryMtimeJournal` (everywhere else): a stat of every walked directory. An added
+  or removed file bumps its parent's mtime, so an unchanged directory set skips the added-file
+  walk. An in-place write bumps nothing but the file, so snapshot entries are still stat'd.
+
+Fail-safe in both: an inotify queue overflow, a watch that could not be added, or any directory
+created / moved / deleted resets the journal, and the next check is the full sweep it replaced.
+``TG_SESSION_DAEMON_JOURNAL`` picks ``auto`` (default), ``inotify``, ``poll`` or ``off``.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from tensor_grep.cli.repo_map import (
+    _CONTEXT_FILE_SUFFIXES,
+    _load_gitignore_matcher,
+    _should_skip_repo_dir,
+    _UnreadablePathFlag,
+)
+
+logger = logging.getLogger(__name__)
+
+SESSION_JOURNAL_ENV = "TG_SESSION_DAEMON_JOURNAL"
+# More distinct changed paths than this between two clean checks resets the journal: at that
+# point one full sweep is cheaper than carrying the set.
+_MAX_CHANGED_PATHS = 4096
+_MAX_VERIFIED_PAYLOADS = 64
+# Wider than any common filesystem's timestamp granularity (FAT 2s, HFS+/ext3 1s, coarse clocks).
+_RACY_WINDOW_NS = 2_000_000_000
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_DONTFOLLOW = 0x02000000
+_IN_ISDIR = 0x40000000
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+    | _IN_DONTFOLLOW
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+@dataclass(frozen=True)
+class VerifiedAt:
+    """Cursors at which a payload was last proven fresh; ``tree`` is None until a check that
+    also looked for added files came back clean."""
+
+    files: int
+    tree: int | None
+
+
+def _iter_watch_dirs(root: Path, unreadable_hit: _UnreadablePathFlag) -> Iterator[Path]:
+    """Every directory under ``root`` the repo walk could descend into (symlinks not followed).
+
+    A directory that cannot be listed hides a subtree no watch or mtime will cover, so it is
+    recorded in ``unreadable_hit`` and the caller stops trusting itself for the tree.
+    """
+    gitignore = _load_gitignore_matcher(str(root))
+    pending = [root]
+    while pending:
+        current = pending.pop()
+        yield current
+        try:
+            entries = list(os.scandir(current))
+        except OSError as exc:
+            unreadable_hit.record(exc)
+            continue
+        for entry in entries:
+            try:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+            except OSError as exc:
+                unreadable_hit.record(exc)
+                continue
+            path = Path(entry.path)
+            if _should_skip_repo_dir(path) or gitignore.is_ignored(path, is_dir=True):
+                continue
+            pending.append(path)
+
+
+class ChangeJournal:
+    """Knows nothing: every check is a full sweep. The base for the two real journals.
+
+    Queries answer as of the last :meth:`cursor` call, which is where a journal syncs with the
+    disk; callers take the cursor BEFORE they stat anything, so a change racing the check is
+    attributed to the next one rather than lost.
+    """
+
+    backend = "none"
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._lock = threading.Lock()
+        self._verified: OrderedDict[tuple[str, str], VerifiedAt] = OrderedDict()
+
+    def cursor(self) -> int:
+        return 0
+
+    def changed_paths_since(self, cursor: int) -> set[str] | None:
+        """Absolute paths touched since ``cursor``, or None when every path must be checked."""
+        return None
+
+    def tree_changed_since(self, cursor: int) -> bool:
+        """Could a repo walk now find a file it would not have found at ``cursor``?"""
+        return True
+
+    def verified(self, identity: tuple[str, str]) -> VerifiedAt | None:
+        with self._lock:
+            return self._verified.get(identity)
+
+    def mark_verified(self, identity: tuple[str, str], cursor: int, *, tree: bool) -> None:
+        with self._lock:
+            previous = self._verified.pop(identity, None)
+            tree_cursor = cursor if tree else (previous.tree if previous is not None else None)
+            self._verified[identity] = VerifiedAt(files=cursor, tree=tree_cursor)
+            while len(self._verified) > _MAX_VERIFIED_PAYLOADS:
+                self._verified.popitem(last=False)
+
+    def close(self) -> None:
+        return None
+
+
+class DirectoryMtimeJournal(ChangeJournal):
+    backend = "poll"
+
+    def __init__(self, root: Path) -> None:
+        super().__init__(root)
+        self._seq = 0
+        self._racy = False
+        self._dir_mtimes = self._scan()
+
+    def _scan(self) -> dict[str, int]:
+        # Filesystem timestamps are coarser than st_mtime_ns suggests, so a directory modified
+        # within _RACY_WINDOW_NS of the scan could change again without its mtime moving. Such a
+        # scan proves nothing; the next cursor() rescans until the tree has settled. So does a
+        # scan that could not list some directory: its subtree has no mtime here to watch.
+        started_ns = time.time_ns()
+        mtimes: dict[str, int] = {}
+        unreadable = _UnreadablePathFlag()
+        for directory in _iter_watch_dirs(self.root, unreadable):
+            try:
+                mtimes[str(directory)] = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+        self._racy = unreadable.hit or any(
+            mtime_ns >= started_ns - _RACY_WINDOW_NS for mtime_ns in mtimes.values()
+        )
+        return mtimes
+
+    def _unchanged(self) -> bool:
+        for directory, mtime_ns in self._dir_mtimes.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def cursor(self) -> int:
+        with self._lock:
+            if self._racy or not self._unchanged():
+                self._seq += 1
+                self._dir_mtimes = self._scan()
+            return self._seq
+
+    def tree_changed_since(self, cursor: int) -> bool:
+        with self._lock:
+            return self._seq != cursor
+
+
+class InotifyJournal(ChangeJournal):
+    backend = "inotify"
+
+    def __init__(self, root: Path) -> None:
+        super().__init__(root)
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        self._watches: dict[int, str] = {}
+        self._seq = 0
+        self._reset_seq = 0
+        self._tree_seq = 0
+        self._changed: dict[str, int] = {}
+        # A watch that could not be added (fs.inotify.max_user_watches) leaves a blind spot no
+        # later event can reveal; from then on this journal answers like the base class.
+        self._blind = False
+        self._watch_tree(root)
+
+    def _watch_tree(self, top: Path) -> None:
+        unreadable = _UnreadablePathFlag()
+        for directory in _iter_watch_dirs(top, unreadable):
+            self._watch(directory)
+        if unreadable.hit:
+            if not self._blind:
+                logger.warning(
+                    "session change journal could not list %s; staleness checks fall back to "
+                    "full stat sweeps",
+                    unreadable.sample[0],
+                )
+            self._blind = True
+
+    def _watch(self, directory: Path) -> None:
+        wd = self._add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            if not self._blind:
+                logger.warning(
+                    "session change journal could not watch %s (%s); staleness checks fall back "
+                    "to full stat sweeps",
+                    directory,
+                    os.strerror(ctypes.get_errno()),
+                )
+            self._blind = True
+            return
+        self._watches[wd] = str(directory)
+
+    def _reset(self) -> None:
+        self._reset_seq = self._seq
+        self._changed.clear()
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            except OSError:
+                self._blind = True
+                return
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buffer):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                name = buffer[offset : offset + length].rstrip(b"\0")
+                offset += length
+                self._handle(wd, mask, os.fsdecode(name))
+
+    def _handle(self, wd: int, mask: int, name: str) -> None:
+        self._seq += 1
+        if mask & _IN_Q_OVERFLOW:
+            self._reset()
+            return
+        directory = self._watches.get(wd)
+        if mask & _IN_IGNORED:
+            self._watches.pop(wd, None)
+            return
+        if directory is None:
+            return
+        if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+            self._reset()
+            return
+        path = os.path.join(directory, name) if name else directory
+        if mask & _IN_ISDIR:
+            if mask & (_IN_CREATE | _IN_MOVED_TO) and not _should_skip_repo_dir(Path(path)):
+                self._watch_tree(Path(path))
+            if mask & (_IN_CREATE | _IN_MOVED_TO | _IN_MOVED_FROM | _IN_DELETE):
+                self._reset()
+            return
+        if mask & (_IN_CREATE | _IN_MOVED_TO) and (
+            name == ".gitignore" or Path(name).suffix.lower() in _CONTEXT_FILE_SUFFIXES
+        ):
+            self._tree_seq = self._seq
+        self._changed[path] = self._seq
+        if len(self._changed) > _MAX_CHANGED_PATHS:
+            self._reset()
+
+    def cursor(self) -> int:
+        with self._lock:
+            self._drain()
+            return self._seq
+
+    def changed_paths_since(self, cursor: int) -> set[str] | None:
+        with self._lock:
+            if self._blind or self._reset_seq > cursor:
+                return None
+            return {path for path, seq in self._changed.items() if seq > cursor}
+
+    def tree_changed_since(self, cursor: int) -> bool:
+        with self._lock:
+            return self._blind or self._reset_seq > cursor or self._tree_seq > cursor
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fd >= 0:
+                os.close(self._fd)
+                self._fd = -1
+
+
+_JOURNALS: dict[str, ChangeJournal] = {}
+_JOURNALS_LOCK = threading.Lock()
+
+
+def start_change_journal(root: Path) -> ChangeJournal | None:
+    """Build and register the journal ``TG_SESSION_DAEMON_JOURNAL`` asks for (None when off).
+
+    ``auto`` prefers inotify and falls back to directory-mtime polling wherever inotify is
+    missing or refuses to start.
+    """
+    mode = os.environ.get(SESSION_JOURNAL_ENV, "auto").strip().lower() or "auto"
+    if mode in {"0", "off", "false", "no", "none"}:
+        return None
+    journal: ChangeJournal | None = None
+    if mode in {"auto", "inotify"} and sys.platform.startswith("linux"):
+        try:
+            journal = InotifyJournal(root)
+        except (OSError, AttributeError) as exc:
+            logger.info("inotify change journal unavailable for %s: %s", root, exc)
+    if journal is None:
+        journal = DirectoryMtimeJournal(root)
+    with _JOURNALS_LOCK:
+        previous = _JOURNALS.pop(str(root), None)
+        _JOURNALS[str(root)] = journal
+    if previous is not None:
+        previous.close()
+    return journal
+
+
+def stop_change_journal(journal: ChangeJournal) -> None:
+    with _JOURNALS_LOCK:
+        if _JOURNALS.get(str(journal.root)) is journal:
+            del _JOURNALS[str(journal.root)]
+    journal.close()
+
+
+def change_journal_for(root: Path) -> ChangeJournal | None:
+    """The journal watching exactly ``root``, if this process runs one."""
+    with _JOURNALS_LOCK:
+        return _JOURNALS.get(str(root))
@@ -0,0 +1,223 @@
+"""The warm-serve caches: parsed session payloads, and rendered responses keyed by request.
+
+Lifted out of `session_store.py` under docs/design/2026-08-19-split-floor-escape.md. Like
+`checkpoint_blobs.py`, this module reaches `session_store` through a deferred, module-qualified
+import, so the two never form an import-order-dependent cycle and a patched
+`session_store.get_session` is the one a cache miss loads through.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+_SESSION_SERVE_CACHE_MAX_ENTRIES = 32
+_SESSION_SERVE_RESPONSE_CACHE_MAX_ENTRIES = 32
+_SESSION_SERVE_RESPONSE_CACHE_MAX_BYTES_ENV = "TENSOR_GREP_SESSION_RESPONSE_CACHE_MAX_BYTES"
+_DEFAULT_SESSION_SERVE_RESPONSE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+
+@dataclass
+class _SessionServeCacheEntry:
+    payload: dict[str, Any]
+    size_bytes: int
+
+
+@dataclass
+class _SessionServeResponseCacheEntry:
+    payload: dict[str, Any]
+    size_bytes: int
+
+
+def _json_size_bytes(payload: dict[str, Any]) -> int:
+    return len(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+class _SessionServeCache:
+    def __init__(self, max_entries: int = _SESSION_SERVE_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max(1, max_entries)
+        self._entries: OrderedDict[tuple[str, str], _SessionServeCacheEntry] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._lock = threading.RLock()
+
+    def _key(self, session_id: str, path: str) -> tuple[str, str]:
+        from tensor_grep.cli import session_store
+
+        return (str(session_store._session_root_for_payload(session_id, path)), session_id)
+
+    def get(self, session_id: str, path: str) -> dict[str, Any] | None:
+        key = self._key(session_id, path)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries[key] = entry
+            return entry.payload
+
+    def put(self, session_id: str, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+        key = self._key(session_id, path)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous.size_bytes
+
+            entry = _SessionServeCacheEntry(
+                payload=payload,
+                size_bytes=_json_size_bytes(payload),
+            )
+            self._entries[key] = entry
+            self._size_bytes += entry.size_bytes
+
+            while len(self._entries) > self._max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= evicted.size_bytes
+
+            return payload
+
+    def load(self, session_id: str, path: str) -> dict[str, Any]:
+        from tensor_grep.cli import session_store
+
+        cached = self.get(session_id, path)
+        if cached is not None:
+            return cached
+        return self.put(session_id, path, session_store.get_session(session_id, path))
+
+    def load_with_status(self, session_id: str, path: str) -> tuple[dict[str, Any], str]:
+        from tensor_grep.cli import session_store
+
+        cached = self.get(session_id, path)
+        if cached is not None:
+            return cached, "hit"
+        return self.put(session_id, path, session_store.get_session(session_id, path)), "miss"
+
+    def record_refresh(self) -> None:
+        with self._lock:
+            self._refreshes += 1
+
+    @property
+    def session_count(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._size_bytes
+
+    @property
+    def hits(self) -> int:
+        with self._lock:
+            return self._hits
+
+    @property
+    def misses(self) -> int:
+        with self._lock:
+            return self._misses
+
+    @property
+    def refreshes(self) -> int:
+        with self._lock:
+            return self._refreshes
+
+    @property
+    def root_count(self) -> int:
+        with self._lock:
+            return len({root for root, _ in self._entries})
+
+    @property
+    def sessions(self) -> list[dict[str, str]]:
+        with self._lock:
+            return [
+                {"root": root, "session_id": session_id}
+                for root, session_id in self._entries.keys()
+            ]
+
+
+class _SessionServeResponseCache:
+    def __init__(
+        self,
+        max_entries: int = _SESSION_SERVE_RESPONSE_CACHE_MAX_ENTRIES,
+        max_size_bytes: int | None = None,
+    ) -> None:
+        self._max_entries = max(1, max_entries)
+        from tensor_grep.cli import session_store
+
+        self._max_size_bytes = (
+            session_store._configured_positive_int(
+                _SESSION_SERVE_RESPONSE_CACHE_MAX_BYTES_ENV,
+                _DEFAULT_SESSION_SERVE_RESPONSE_CACHE_MAX_BYTES,
+            )
+            if max_size_bytes is None
+            else max(1, int(max_size_bytes))
+        )
+        self._entries: OrderedDict[tuple[str, ...], _SessionServeResponseCacheEntry] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._puts = 0
+        self._oversized_skips = 0
+
+    def get(self, key: tuple[str, ...]) -> dict[str, Any] | None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries[key] = entry
+        return copy.deepcopy(entry.payload)
+
+    def put(self, key: tuple[str, ...], response: dict[str, Any]) -> None:
+        self._puts += 1
+        size_bytes = _json_size_bytes(response)
+        if size_bytes > self._max_size_bytes:
+            self._oversized_skips += 1
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size_bytes -= previous.size_bytes
+        entry = _SessionServeResponseCacheEntry(
+            payload=copy.deepcopy(response),
+            size_bytes=size_bytes,
+        )
+        self._entries[key] = entry
+        self._size_bytes += entry.size_bytes
+        while len(self._entries) > self._max_entries or self._size_bytes > self._max_size_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size_bytes -= evicted.size_bytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def puts(self) -> int:
+        return self._puts
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    @property
+    def max_size_bytes(self) -> int:
+        return self._max_size_bytes
+
+    @property
+    def oversized_skips(self) -> int:
+        return self._oversized_skips
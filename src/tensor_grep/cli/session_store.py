@@ -1,12 +1,9 @@
 from __future__ import annotations
 
-import copy
 import json
 import logging
 import os
 import sys
-import threading
-from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -38,6 +35,16 @@ from tensor_grep.cli.repo_map import (
     build_symbol_impact_from_map,
     build_symbol_refs_from_map,
 )
+from tensor_grep.cli.session_journal import change_journal_for
+from tensor_grep.cli.session_serve_cache import (
+    _DEFAULT_SESSION_SERVE_RESPONSE_CACHE_MAX_BYTES as _DEFAULT_SESSION_SERVE_RESPONSE_CACHE_MAX_BYTES,
+)
+from tensor_grep.cli.session_serve_cache import (
+    _SessionServeCache as _SessionServeCache,
+)
+from tensor_grep.cli.session_serve_cache import (
+    _SessionServeResponseCache as _SessionServeResponseCache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,10 +59,6 @@ _SESSION_VERSION = 1
 _TG_DIRNAME = ".tensor-grep"
 _SESSIONS_SUBDIR = "sessions"
 _INDEX_FILE = "index.json"
-_SESSION_SERVE_CACHE_MAX_ENTRIES = 32
-_SESSION_SERVE_RESPONSE_CACHE_MAX_ENTRIES = 32
-_SESSION_SERVE_RESPONSE_CACHE_MAX_BYTES_ENV = "TENSOR_GREP_SESSION_RESPONSE_CACHE_MAX_BYTES"
-_DEFAULT_SESSION_SERVE_RESPONSE_CACHE_MAX_BYTES = 8 * 1024 * 1024
 _DEFAULT_SESSION_EDIT_PLAN_REPO_MAP_LIMIT = DEFAULT_AGENT_REPO_MAP_LIMIT
 _DEFAULT_SESSION_CONTEXT_RENDER_REPO_MAP_LIMIT = DEFAULT_AGENT_REPO_MAP_LIMIT
 _DEFAULT_SESSION_BLAST_RADIUS_PLAN_REPO_MAP_LIMIT = DEFAULT_AGENT_REPO_MAP_LIMIT
@@ -129,19 +132,22 @@ class SessionRefreshResult:
 
 
 class SessionStaleError(RuntimeError):
-    pass
-
-
-@dataclass
-class _SessionServeCacheEntry:
-    payload: dict[str, Any]
-    size_bytes: int
+    """A cached session no longer matches the disk.
 
+    ``changeset`` is what the check found; ``added_files_checked`` says whether it looked for
+    added files, i.e. whether it is complete enough to hand to ``refresh_session``.
+    """
 
-@dataclass
-class _SessionServeResponseCacheEntry:
-    payload: dict[str, Any]
-    size_bytes: int
+    def __init__(
+        self,
+        message: str,
+        *,
+        changeset: dict[str, list[str]] | None = None,
+        added_files_checked: bool = False,
+    ) -> None:
+        super().__init__(message)
+        self.changeset = changeset
+        self.added_files_checked = added_files_checked
 
 
 def _configured_positive_int(env_var: str, default: int) -> int:
@@ -168,188 +174,6 @@ def _nearby_lookup_enabled() -> bool:
     return raw_value.strip().lower() in {"1", "true", "yes", "on"}
 
 
-def _json_size_bytes(payload: dict[str, Any]) -> int:
-    return len(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
-
-
-class _SessionServeCache:
-    def __init__(self, max_entries: int = _SESSION_SERVE_CACHE_MAX_ENTRIES) -> None:
-        self._max_entries = max(1, max_entries)
-        self._entries: OrderedDict[tuple[str, str], _SessionServeCacheEntry] = OrderedDict()
-        self._size_bytes = 0
-        self._hits = 0
-        self._misses = 0
-        self._refreshes = 0
-        self._lock = threading.RLock()
-
-    def _key(self, session_id: str, path: str) -> tuple[str, str]:
-        return (str(_session_root_for_payload(session_id, path)), session_id)
-
-    def get(self, session_id: str, path: str) -> dict[str, Any] | None:
-        key = self._key(session_id, path)
-        with self._lock:
-            entry = self._entries.pop(key, None)
-            if entry is None:
-                self._misses += 1
-                return None
-            self._hits += 1
-            self._entries[key] = entry
-            return entry.payload
-
-    def put(self, session_id: str, path: str, payload: dict[str, Any]) -> dict[str, Any]:
-        key = self._key(session_id, path)
-        with self._lock:
-            previous = self._entries.pop(key, None)
-            if previous is not None:
-                self._size_bytes -= previous.size_bytes
-
-            entry = _SessionServeCacheEntry(
-                payload=payload,
-                size_bytes=_json_size_bytes(payload),
-            )
-            self._entries[key] = entry
-            self._size_bytes += entry.size_bytes
-
-            while len(self._entries) > self._max_entries:
-                _, evicted = self._entries.popitem(last=False)
-                self._size_bytes -= evicted.size_bytes
-
-            return payload
-
-    def load(self, session_id: str, path: str) -> dict[str, Any]:
-        cached = self.get(session_id, path)
-        if cached is not None:
-            return cached
-        return self.put(session_id, path, get_session(session_id, path))
-
-    def load_with_status(self, session_id: str, path: str) -> tuple[dict[str, Any], str]:
-        cached = self.get(session_id, path)
-        if cached is not None:
-            return cached, "hit"
-        return self.put(session_id, path, get_session(session_id, path)), "miss"
-
-    def record_refresh(self) -> None:
-        with self._lock:
-            self._refreshes += 1
-
-    @property
-    def session_count(self) -> int:
-        with self._lock:
-            return len(self._entries)
-
-    @property
-    def size_bytes(self) -> int:
-        with self._lock:
-            return self._size_bytes
-
-    @property
-    def hits(self) -> int:
-        with self._lock:
-            return self._hits
-
-    @property
-    def misses(self) -> int:
-        with self._lock:
-            return self._misses
-
-    @property
-    def refreshes(self) -> int:
-        with self._lock:
-            return self._refreshes
-
-    @property
-    def root_count(self) -> int:
-        with self._lock:
-            return len({root for root, _ in self._entries})
-
-    @property
-    def sessions(self) -> list[dict[str, str]]:
-        with self._lock:
-            return [
-                {"root": root, "session_id": session_id}
-                for root, session_id in self._entries.keys()
-            ]
-
-
-class _SessionServeResponseCache:
-    def __init__(
-        self,
-        max_entries: int = _SESSION_SERVE_RESPONSE_CACHE_MAX_ENTRIES,
-        max_size_bytes: int | None = None,
-    ) -> None:
-        self._max_entries = max(1, max_entries)
-        self._max_size_bytes = (
-            _configured_positive_int(
-                _SESSION_SERVE_RESPONSE_CACHE_MAX_BYTES_ENV,
-                _DEFAULT_SESSION_SERVE_RESPONSE_CACHE_MAX_BYTES,
-            )
-            if max_size_bytes is None
-            else max(1, int(max_size_bytes))
-        )
-        self._entries: OrderedDict[tuple[str, ...], _SessionServeResponseCacheEntry] = OrderedDict()
-        self._size_bytes = 0
-        self._hits = 0
-        self._misses = 0
-        self._puts = 0
-        self._oversized_skips = 0
-
-    def get(self, key: tuple[str, ...]) -> dict[str, Any] | None:
-        entry = self._entries.pop(key, None)
-        if entry is None:
-            self._misses += 1
-            return None
-        self._hits += 1
-        self._entries[key] = entry
-        return copy.deepcopy(entry.payload)
-
-    def put(self, key: tuple[str, ...], response: dict[str, Any]) -> None:
-        self._puts += 1
-        size_bytes = _json_size_bytes(response)
-        if size_bytes > self._max_size_bytes:
-            self._oversized_skips += 1
-            return
-        previous = self._entries.pop(key, None)
-        if previous is not None:
-            self._size_bytes -= previous.size_bytes
-        entry = _SessionServeResponseCacheEntry(
-            payload=copy.deepcopy(response),
-            size_bytes=size_bytes,
-        )
-        self._entries[key] = entry
-        self._size_bytes += entry.size_bytes
-        while len(self._entries) > self._max_entries or self._size_bytes > self._max_size_bytes:
-            _, evicted = self._entries.popitem(last=False)
-            self._size_bytes -= evicted.size_bytes
-
-    @property
-    def hits(self) -> int:
-        return self._hits
-
-    @property
-    def misses(self) -> int:
-        return self._misses
-
-    @property
-    def puts(self) -> int:
-        return self._puts
-
-    @property
-    def entry_count(self) -> int:
-        return len(self._entries)
-
-    @property
-    def size_bytes(self) -> int:
-        return self._size_bytes
-
-    @property
-    def max_size_bytes(self) -> int:
-        return self._max_size_bytes
-
-    @property
-    def oversized_skips(self) -> int:
-        return self._oversized_skips
-
-
 def _resolve_root(path: Path) -> Path:
     resolved = path.expanduser().resolve()
     return resolved if resolved.is_dir() else resolved.parent
@@ -550,9 +374,28 @@ def _stale_changeset(
     root = _resolve_root(Path(str(payload.get("root", payload.get("path", ".")))))
     snapshot_by_path = {_snapshot_path_key(entry["path"]): entry for entry in snapshot}
 
+    # A warm daemon's change journal (session_journal.py) narrows both halves below to what
+    # changed since this payload was last proven fresh. The cursor is taken before any stat, so
+    # a write racing this check is re-examined by the next one rather than lost.
+    journal = change_journal_for(root)
+    identity = _snapshot_identity(payload)
+    verified = journal.verified(identity) if journal is not None and identity is not None else None
+    journal_cursor = journal.cursor() if journal is not None else 0
+    dirty_paths = (
+        journal.changed_paths_since(verified.files)
+        if journal is not None and verified is not None
+        else None
+    )
+    walk_for_added_files = detect_added_files and (
+        journal is None
+        or verified is None
+        or verified.tree is None
+        or journal.tree_changed_since(verified.tree)
+    )
+
     added: list[str] = []
     current_paths: dict[str, Path] = {}
-    if detect_added_files:
+    if walk_for_added_files:
         context_root = root if root.is_dir() else root.parent
         # M3 (Fable completeness review): bound the added-file probe walk to the session's
         # own recorded scan cap (or the shared default) instead of an unbounded full
@@ -580,7 +423,14 @@ def _stale_changeset(
     # resolve. Held back from `removed` until the loop ends, because one root probe decides the
     # whole batch (see the classification block after the loop).
     path_unresolved: list[str] = []
-    for current_path, snapshot_entry in snapshot_by_path.items():
+    entries_to_check = (
+        snapshot_by_path.items()
+        if dirty_paths is None
+        else [
+            (path, snapshot_by_path[path]) for path in sorted(dirty_paths & snapshot_by_path.keys())
+        ]
+    )
+    for current_path, snapshot_entry in entries_to_check:
         try:
             stat = os.stat(current_paths.get(current_path) or current_path)
         except (FileNotFoundError, NotADirectoryError) as exc:
@@ -682,17 +532,33 @@ def _stale_changeset(
             ", ".join(indeterminate[:3]),
         )
 
-    return {
+    changeset = {
         "added": added,
         "modified": sorted(dict.fromkeys(modified)),
         "removed": removed,
     }
+    if journal is not None and identity is not None and not indeterminate:
+        if not _changeset_has_entries(changeset):
+            journal.mark_verified(identity, journal_cursor, tree=detect_added_files)
+    return changeset
+
+
+def _snapshot_identity(payload: dict[str, Any]) -> tuple[str, str] | None:
+    """Which snapshot a payload carries: every open/refresh writes a new timestamp."""
+    session_id = str(payload.get("session_id", ""))
+    if not session_id:
+        return None
+    return (session_id, str(payload.get("refreshed_at", payload.get("created_at", ""))))
 
 
 def _ensure_session_not_stale(payload: dict[str, Any], *, detect_added_files: bool = False) -> None:
     changeset = _stale_changeset(payload, detect_added_files=detect_added_files)
     if _changeset_has_entries(changeset):
-        raise SessionStaleError(_changeset_message(cast(dict[str, list[str]], changeset)))
+        raise SessionStaleError(
+            _changeset_message(cast(dict[str, list[str]], changeset)),
+            changeset=changeset,
+            added_files_checked=detect_added_files,
+        )
 
 
 def _resolve_request_session_target(
@@ -823,7 +689,13 @@ def refresh_session(
     max_repo_files: int | None = None,
     payload_cache: _SessionServeCache | None = None,
     deadline_monotonic: float | None = None,
+    changeset: dict[str, list[str]] | None = None,
 ) -> SessionRefreshResult:
+    """Rebuild a session's repo map and snapshot, incrementally when a changeset is known.
+
+    ``changeset`` lets a caller that just detected staleness (with added-file detection on) pass
+    what it found instead of this function re-deriving it with another stat sweep and walk.
+    """
     # Fix A / Guard 3: this is the single choke point every refresh path funnels through -- the
     # explicit `tg session refresh` CLI/MCP command, and the daemon's refresh_on_stale recovery
     # (session_daemon._handle: except Exception -> refresh_session(...) when
@@ -836,7 +708,8 @@ def refresh_session(
     root = _resolve_root(Path(path))
     existing = get_session(session_id, path)
     effective_max_repo_files = _effective_session_max_repo_files(max_repo_files, existing)
-    changeset = _stale_changeset(existing, detect_added_files=True)
+    if changeset is None:
+        changeset = _stale_changeset(existing, detect_added_files=True)
     refresh_type = "full"
     refresh_fallback_reason: str | None = None
     if changeset is not None:
@@ -1003,10 +876,15 @@ def _load_session_payload(
     payload = get_session(session_id, path)
     try:
         _ensure_session_not_stale(payload, detect_added_files=refresh_on_stale)
-    except SessionStaleError:
+    except SessionStaleError as exc:
         if not refresh_on_stale:
             raise
-        refresh_session(session_id, path, payload_cache=payload_cache)
+        refresh_session(
+            session_id,
+            path,
+            payload_cache=payload_cache,
+            changeset=exc.changeset if exc.added_files_checked else None,
+        )
         payload = get_session(session_id, path)
         _ensure_session_not_stale(payload, detect_added_files=True)
     return payload
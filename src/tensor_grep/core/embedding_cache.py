@@ -0,0 +1,364 @@
+"""Persistent dense-embedding store for :class:`~tensor_grep.core.retrieval_dense.DenseIndex`.
+
+``DenseIndex`` used to re-encode every chunk on every ``tg find`` / ``tg search --semantic``
+run, even though almost all of a repo's chunks are byte-identical between runs. This store keys
+each embedding by ``(model revision, BLAKE2b-128 of the chunk text)`` so only new or changed
+chunks reach the encoder.
+
+Layout under the store dir (``TG_EMBEDDING_CACHE_DIR``, else ``~/.tensor-grep/cache/embeddings``),
+one subdirectory per model revision:
+
+- ``embeddings_meta.json`` -- ``{version, revision, dim, count, generation, hits, misses, keys,
+  vectors, used}``; the last three name the current array files.
+- ``keys-<hex>.npy``    -- ``count`` x ``S16`` text digests, sorted, so a batch lookup is one
+  ``searchsorted``.
+- ``vectors-<hex>.npy`` -- ``count`` x ``dim`` ``float32`` raw (un-normalized) embeddings, row
+  ``i`` belonging to ``keys[i]``. Stored at full precision so a cached vector is bit-identical to a
+  fresh encode and rankings never depend on cache state.
+- ``used-<hex>.npy``    -- ``count`` x ``int64`` generation of the run that last used each row.
+
+Every array is opened with ``numpy.load(mmap_mode="r")``: loading the store costs a JSON read,
+and only the rows a run actually hits are paged in. Writes go to fresh uniquely-named files
+followed by an atomic meta swap under the index lock, so a reader never pairs keys from one write
+with vectors from another. When the store would exceed ``TG_EMBEDDING_CACHE_MAX_MB`` (default
+256) the least-recently-used rows are evicted at write time. ``TG_EMBEDDING_CACHE=0`` disables
+the store entirely.
+
+Cumulative hit/miss counts are kept in the meta for ``tg doctor`` (:func:`embedding_cache_status`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_STORE_VERSION = 1
+_META_NAME = "embeddings_meta.json"
+_ARRAY_NAMES = ("keys", "vectors", "used")
+_KEY_BYTES = 16
+_DEFAULT_MAX_MB = 256
+
+
+def embedding_cache_enabled() -> bool:
+    return os.environ.get("TG_EMBEDDING_CACHE", "1").strip().lower() not in {
+        "0",
+        "false",
+        "no",
+        "off",
+    }
+
+
+def default_cache_root() -> Path:
+    """``TG_EMBEDDING_CACHE_DIR`` if set, else ``~/.tensor-grep/cache/embeddings``."""
+    env = os.environ.get("TG_EMBEDDING_CACHE_DIR")
+    if env:
+        return Path(env)
+    return Path.home() / ".tensor-grep" / "cache" / "embeddings"
+
+
+def _max_bytes() -> int:
+    raw_value = os.environ.get("TG_EMBEDDING_CACHE_MAX_MB")
+    try:
+        value = float(raw_value) if raw_value is not None else float(_DEFAULT_MAX_MB)
+    except ValueError:
+        value = float(_DEFAULT_MAX_MB)
+    return max(0, int(value * 1024 * 1024))
+
+
+def model_revision(model_dir: Path) -> str | None:
+    """A cheap identity for the model files in ``model_dir``: every file's name, size and mtime,
+    plus the bytes of its (small) ``config.json``. ``None`` when the directory is unreadable."""
+    digest = hashlib.sha256()
+    try:
+        entries = sorted(entry for entry in model_dir.iterdir() if entry.is_file())
+        for entry in entries:
+            stat_result = entry.stat()
+            digest.update(
+                f"{entry.name}\0{stat_result.st_size}\0{stat_result.st_mtime_ns}\n".encode()
+            )
+        config = model_dir / "config.json"
+        if config.is_file():
+            digest.update(config.read_bytes())
+    except OSError:
+        return None
+    if not entries:
+        return None
+    return digest.hexdigest()
+
+
+def text_key(text: str) -> bytes:
+    return hashlib.blake2b(
+        text.encode("utf-8", errors="surrogatepass"), digest_size=_KEY_BYTES
+    ).digest()
+
+
+def _read_meta(directory: Path) -> dict[str, Any] | None:
+    try:
+        meta = json.loads((directory / _META_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return meta if isinstance(meta, dict) else None
+
+
+def _npy_bytes(array: np.ndarray) -> bytes:
+    import numpy as np
+
+    buffer = io.BytesIO()
+    np.save(buffer, array, allow_pickle=False)
+    return buffer.getvalue()
+
+
+class EmbeddingCache:
+    """One model revision's embedding store; see the module docstring for the layout.
+
+    :meth:`embed` answers a batch from the store and encodes only the misses; :meth:`flush`
+    persists the new rows and the refreshed LRU stamps. Neither is thread-safe -- a
+    ``DenseIndex`` build owns its cache for the duration of the build.
+    """
+
+    def __init__(self, directory: Path, revision: str) -> None:
+        import numpy as np
+
+        self.directory = directory
+        self.revision = revision
+        self.hits = 0
+        self.misses = 0
+        self._np = np
+        # The generation on disk when this store was opened, even if its arrays were unusable;
+        # a write only lands if nobody else has written since.
+        self._generation = 0
+        self._keys: np.ndarray = np.zeros(0, dtype=f"S{_KEY_BYTES}")
+        self._vectors: np.ndarray | None = None
+        self._used: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._meta: dict[str, Any] = {}
+        self._touched: set[int] = set()
+        self._new: dict[bytes, np.ndarray] = {}
+        self._load()
+
+    @classmethod
+    def open(cls, model_dir: Path) -> EmbeddingCache | None:
+        """The store for the model at ``model_dir``; ``None`` when disabled, when numpy is not
+        importable, or when the model directory cannot be identified (e.g. not fetched)."""
+        if not embedding_cache_enabled():
+            return None
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            return None
+        revision = model_revision(Path(model_dir))
+        if revision is None:
+            return None
+        return cls(default_cache_root() / revision[:16], revision)
+
+    def _load(self) -> None:
+        np = self._np
+        meta = _read_meta(self.directory)
+        if (
+            meta is None
+            or meta.get("version") != _STORE_VERSION
+            or meta.get("revision") != self.revision
+        ):
+            return
+        self._generation = int(meta.get("generation", 0))
+        try:
+            arrays = [
+                np.load(
+                    self.directory / Path(str(meta[name])).name, mmap_mode="r", allow_pickle=False
+                )
+                for name in _ARRAY_NAMES
+            ]
+        except (OSError, ValueError, KeyError):
+            return
+        keys, vectors, used = arrays
+        count = meta.get("count")
+        if (
+            keys.shape != (count,)
+            or keys.dtype != np.dtype(f"S{_KEY_BYTES}")
+            or vectors.ndim != 2
+            or vectors.shape[0] != count
+            or vectors.dtype != np.float32
+            or used.shape != (count,)
+        ):
+            return
+        self._keys, self._vectors, self._used = keys, vectors, used
+        self._meta = meta
+
+    def __len__(self) -> int:
+        return int(self._keys.shape[0])
+
+    def embed(self, texts: list[str], encode: Callable[[list[str]], np.ndarray]) -> np.ndarray:
+        """Embeddings for ``texts``, row for row: stored rows where present, ``encode`` (called at
+        most once, on the distinct missing texts) for the rest."""
+        np = self._np
+        keys = [text_key(text) for text in texts]
+        rows = self._lookup(keys)
+        missing: dict[bytes, str] = {}
+        for key, text, row in zip(keys, texts, rows, strict=True):
+            if row < 0 and key not in self._new:
+                missing.setdefault(key, text)
+        if missing:
+            encoded = encode(list(missing.values()))
+            if self._vectors is not None and encoded.shape[1] != self._vectors.shape[1]:
+                # A different embedding width under the same revision: the stored rows can never
+                # be served alongside these, so start the store over.
+                self._keys = np.zeros(0, dtype=f"S{_KEY_BYTES}")
+                self._vectors = None
+                self._used = np.zeros(0, dtype=np.int64)
+                self._touched.clear()
+                return self.embed(texts, encode)
+            for key, vector in zip(missing, encoded, strict=True):
+                self._new[key] = vector
+        hit_count = int((rows >= 0).sum())
+        self.hits += hit_count
+        self.misses += len(texts) - hit_count
+        self._touched.update(int(row) for row in rows[rows >= 0])
+
+        dim = self._vectors.shape[1] if self._vectors is not None else None
+        if dim is None:
+            dim = next(iter(self._new.values())).shape[0] if self._new else 0
+        matrix = np.empty((len(texts), dim), dtype=np.float32)
+        stored = rows >= 0
+        if stored.any():
+            assert self._vectors is not None
+            matrix[stored] = self._vectors[rows[stored]]
+        for position in np.flatnonzero(~stored):
+            matrix[position] = self._new[keys[position]]
+        return matrix
+
+    def _lookup(self, keys: list[bytes]) -> np.ndarray:
+        np = self._np
+        if not keys or not len(self):
+            return np.full(len(keys), -1, dtype=np.int64)
+        wanted = np.array(keys, dtype=f"S{_KEY_BYTES}")
+        positions = np.searchsorted(self._keys, wanted)
+        clipped = np.minimum(positions, len(self) - 1)
+        found = self._keys[clipped] == wanted
+        return np.where(found, clipped, -1).astype(np.int64)
+
+    def flush(self) -> None:
+        """Persist this run's new rows and LRU stamps (best effort: a failure is reported to
+        stderr and the run continues with the embeddings it already has)."""
+        if not self._new and not self._touched and not self.hits:
+            return
+        try:
+            self._write()
+        except (OSError, RuntimeError, ValueError) as exc:
+            sys.stderr.write(f"tg: could not update embedding cache {self.directory}: {exc}\n")
+
+    def _write(self) -> None:
+        from tensor_grep.cli._index_lock import atomic_write_bytes, index_lock
+
+        np = self._np
+        generation = self._generation + 1
+        meta = dict(self._meta)
+        names = {name: meta.get(name) for name in _ARRAY_NAMES}
+        used = np.array(self._used, dtype=np.int64)
+        if self._touched:
+            used[np.fromiter(self._touched, dtype=np.int64)] = generation
+        payloads: dict[str, Any] = {"used": used}
+        keys = self._keys
+        if self._new or self._vectors is None:
+            dim = (
+                self._vectors.shape[1]
+                if self._vectors is not None
+                else next(iter(self._new.values())).shape[0]
+            )
+            new_keys = np.array(list(self._new), dtype=f"S{_KEY_BYTES}")
+            keys = np.concatenate([keys, new_keys])
+            vectors = np.concatenate([
+                np.asarray(self._vectors if self._vectors is not None else np.zeros((0, dim))),
+                np.array(list(self._new.values()), dtype=np.float32).reshape(-1, dim),
+            ]).astype(np.float32, copy=False)
+            used = np.concatenate([used, np.full(len(new_keys), generation, dtype=np.int64)])
+            row_bytes = _KEY_BYTES + 8 + 4 * dim
+            capacity = _max_bytes() // row_bytes
+            if len(keys) > capacity:
+                # Least-recently-used rows go first; among equals, the oldest rows.
+                keep = np.sort(np.argsort(-used, kind="stable")[:capacity])
+                keys, vectors, used = keys[keep], vectors[keep], used[keep]
+            order = np.argsort(keys, kind="stable")
+            keys, vectors, used = keys[order], vectors[order], used[order]
+            payloads = {"keys": keys, "vectors": vectors, "used": used}
+        token = uuid4().hex
+        for name in payloads:
+            names[name] = f"{name}-{token}.npy"
+        meta.update(
+            version=_STORE_VERSION,
+            revision=self.revision,
+            dim=int(payloads["vectors"].shape[1]) if "vectors" in payloads else meta.get("dim"),
+            count=len(keys),
+            generation=generation,
+            hits=int(meta.get("hits", 0)) + self.hits,
+            misses=int(meta.get("misses", 0)) + self.misses,
+            **names,
+        )
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with index_lock(self.directory / _META_NAME):
+            current = _read_meta(self.directory)
+            if current is not None and current.get("generation", 0) != self._generation:
+                # Another run wrote first; keep its store rather than clobbering it.
+                return
+            for name, array in payloads.items():
+                atomic_write_bytes(self.directory / str(names[name]), _npy_bytes(array))
+            atomic_write_bytes(self.directory / _META_NAME, json.dumps(meta).encode("utf-8"))
+            _remove_orphans(self.directory, {str(value) for value in names.values()})
+        self._meta = meta
+        self._generation = generation
+        self._new.clear()
+        self._touched.clear()
+        self.hits = self.misses = 0
+
+
+def _remove_orphans(directory: Path, live: set[str]) -> None:
+    for name in _ARRAY_NAMES:
+        for path in directory.glob(f"{name}-*.npy"):
+            if path.name not in live:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+
+def embedding_cache_status(model_dir: Path) -> dict[str, Any]:
+    """``tg doctor``'s view of the store for the model at ``model_dir``."""
+    revision = model_revision(Path(model_dir))
+    directory = (
+        default_cache_root() / revision[:16] if revision is not None else default_cache_root()
+    )
+    status: dict[str, Any] = {
+        "enabled": embedding_cache_enabled(),
+        "dir": str(directory),
+        "exists": False,
+        "max_bytes": _max_bytes(),
+    }
+    meta = _read_meta(directory) if revision is not None else None
+    if meta is None or meta.get("revision") != revision:
+        return status
+    hits = int(meta.get("hits", 0))
+    misses = int(meta.get("misses", 0))
+    size = 0
+    for name in _ARRAY_NAMES:
+        try:
+            size += (directory / Path(str(meta.get(name))).name).stat().st_size
+        except OSError:
+            pass
+    status.update(
+        exists=True,
+        entries=meta.get("count", 0),
+        dim=meta.get("dim"),
+        bytes=size,
+        hits=hits,
+        misses=misses,
+        hit_rate=round(hits / (hits + misses), 4) if hits + misses else None,
+    )
+    return status
@@ -0,0 +1,272 @@
+"""Per-repository identifier-token inverted index for the caller / reference candidate probes.
+
+``tg callers`` / ``refs`` / ``blast-radius`` decide which files can mention a symbol by reading
+each candidate's bytes and testing ``symbol in data``. For a central symbol that is a byte scan of
+the whole caller-scan universe on every invocation, paid again by every new process. This index
+remembers, per file, which identifier tokens it contains, so the same question becomes a posting
+list membership test once the file has been seen.
+
+Tokens are the maximal ``[A-Za-z0-9_]`` runs of the RAW bytes, so a file's token set contains
+every identifier any tree-sitter grammar could find in it (a non-ASCII identifier still yields
+its ASCII runs). Only plain ASCII identifiers are answered from the index; a dotted or non-ASCII
+symbol keeps the byte scan. Token membership is narrower than substring containment on purpose:
+``target`` no longer matches a file that only mentions ``target_other``.
+
+On-disk layout, one file per root under the user cache dir::
+
+    identifiers-v1.json   {"format_version", "root", "files": [[relative_path, size, mtime_ns]
+                          | null, ...], "postings": {token: base64(varint deltas of file ids)}}
+
+A file's position in ``files`` is its id; ``null`` is a tombstone left by a changed file until the
+next save compacts them away. Binary files are recorded with no tokens.
+
+The index is filled lazily: a probe that finds a file missing or stale (size / mtime changed)
+tokenizes the bytes it already read and records them. A file modified within `_RACY_WINDOW_NS` is
+answered from its bytes but not recorded, since a same-size rewrite inside one timestamp tick
+would otherwise go unnoticed (git's "racy clean" rule). `flush_identifier_indexes` publishes every
+dirty index atomically; it also runs at interpreter exit.
+
+``TENSOR_GREP_IDENTIFIER_INDEX=0`` turns the index off; ``TENSOR_GREP_IDENTIFIER_INDEX_DIR``
+moves it.
+"""
+
+from __future__ import annotations
+
+import atexit
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from tensor_grep.core.line_trigram_index import decode_varint_deltas, encode_varint_deltas
+
+IDENTIFIER_INDEX_FORMAT_VERSION = 1
+_INDEX_NAME = f"identifiers-v{IDENTIFIER_INDEX_FORMAT_VERSION}.json"
+_TOKEN_RE = re.compile(rb"[A-Za-z0-9_]+")
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+# Wider than any common filesystem's timestamp granularity (FAT 2s, HFS+/ext3 1s, coarse clocks).
+_RACY_WINDOW_NS = 2_000_000_000
+# Roots kept open in one process; an evicted dirty index is flushed first.
+_MAX_OPEN_INDEXES = 8
+
+
+def is_identifier_index_enabled() -> bool:
+    return os.environ.get("TENSOR_GREP_IDENTIFIER_INDEX", "1").strip().lower() not in {
+        "0",
+        "false",
+        "no",
+        "off",
+    }
+
+
+def get_identifier_index_cache_dir() -> Path:
+    override = os.environ.get("TENSOR_GREP_IDENTIFIER_INDEX_DIR")
+    if override:
+        return Path(override).expanduser().resolve()
+    if os.name == "nt":
+        local_appdata = os.environ.get("LOCALAPPDATA")
+        if local_appdata:
+            return Path(local_appdata) / "tensor-grep" / "identifier-index"
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache_home:
+        return Path(xdg_cache_home) / "tensor-grep" / "identifier-index"
+    return Path.home() / ".cache" / "tensor-grep" / "identifier-index"
+
+
+def identifier_index_path(root: Path) -> Path:
+    digest = hashlib.sha256(str(root).encode("utf-8", errors="surrogatepass")).hexdigest()
+    return get_identifier_index_cache_dir() / digest / _INDEX_NAME
+
+
+def is_indexable_identifier(symbol: str) -> bool:
+    return _IDENTIFIER_RE.fullmatch(symbol) is not None
+
+
+def identifier_tokens(data: bytes) -> set[bytes]:
+    """Distinct ``[A-Za-z0-9_]`` runs of one file's raw bytes."""
+    return set(_TOKEN_RE.findall(data))
+
+
+class IdentifierIndex:
+    """One root's token -> file-id postings plus the ``(size, mtime_ns)`` each file had."""
+
+    def __init__(self, root: str, location: Path) -> None:
+        self.root = root
+        self._prefix = root if root.endswith(os.sep) else root + os.sep
+        self._location = location
+        self._lock = threading.Lock()
+        self._files: list[list[Any] | None] = []
+        self._ids: dict[str, int] = {}
+        self._encoded: dict[str, str] = {}
+        self._postings: dict[str, set[int]] = {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, root: str) -> IdentifierIndex:
+        """The persisted index for ``root``; an empty one when it is missing, foreign or damaged."""
+        location = identifier_index_path(Path(root).resolve())
+        index = cls(root, location)
+        try:
+            payload = json.loads(location.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return index
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format_version") != IDENTIFIER_INDEX_FORMAT_VERSION
+            or payload.get("root") != str(Path(root).resolve())
+            or not isinstance(payload.get("files"), list)
+            or not isinstance(payload.get("postings"), dict)
+        ):
+            return index
+        index._files = list(payload["files"])
+        index._ids = {
+            entry[0]: file_id for file_id, entry in enumerate(index._files) if entry is not None
+        }
+        index._encoded = dict(payload["postings"])
+        return index
+
+    def relative_key(self, path_str: str) -> str | None:
+        if not path_str.startswith(self._prefix):
+            return None
+        relative = path_str[len(self._prefix) :]
+        return relative.replace(os.sep, "/") if os.sep != "/" else relative
+
+    def _posting(self, token: str) -> set[int]:
+        posting = self._postings.get(token)
+        if posting is None:
+            encoded = self._encoded.pop(token, None)
+            raw = base64.b64decode(encoded) if encoded else b""
+            posting = set(decode_varint_deltas(raw, 0, len(raw)))
+            self._postings[token] = posting
+        return posting
+
+    def contains(self, relative: str, size: int, mtime_ns: int, token: str) -> bool | None:
+        """Whether the file holds ``token``; ``None`` when the index cannot vouch for the file."""
+        with self._lock:
+            file_id = self._ids.get(relative)
+            if file_id is None:
+                return None
+            entry = self._files[file_id]
+            if entry is None or entry[1] != size or entry[2] != mtime_ns:
+                return None
+            return file_id in self._posting(token)
+
+    def record(self, relative: str, size: int, mtime_ns: int, tokens: set[bytes]) -> None:
+        if time.time_ns() - mtime_ns < _RACY_WINDOW_NS:
+            return
+        with self._lock:
+            previous = self._ids.get(relative)
+            if previous is not None:
+                self._files[previous] = None
+            file_id = len(self._files)
+            self._files.append([relative, size, mtime_ns])
+            self._ids[relative] = file_id
+            for token in tokens:
+                self._posting(token.decode("ascii")).add(file_id)
+            self._dirty = True
+
+    def save(self) -> None:
+        """Publish the index atomically, dropping tombstoned ids."""
+        from tensor_grep.cli._index_lock import atomic_write_bytes
+
+        with self._lock:
+            if not self._dirty:
+                return
+            for token in list(self._encoded):
+                self._posting(token)
+            remap: dict[int, int] = {}
+            files: list[list[Any]] = []
+            for old_id, entry in enumerate(self._files):
+                if entry is not None:
+                    remap[old_id] = len(files)
+                    files.append(entry)
+            postings: dict[str, set[int]] = {}
+            for token, posting in self._postings.items():
+                live = {remap[file_id] for file_id in posting if file_id in remap}
+                if live:
+                    postings[token] = live
+            payload = {
+                "format_version": IDENTIFIER_INDEX_FORMAT_VERSION,
+                "root": str(Path(self.root).resolve()),
+                "files": files,
+                "postings": {
+                    token: base64.b64encode(encode_varint_deltas(sorted(posting))).decode("ascii")
+                    for token, posting in postings.items()
+                },
+            }
+            self._files = list(files)
+            self._ids = {entry[0]: file_id for file_id, entry in enumerate(files)}
+            self._postings = postings
+            self._dirty = False
+        try:
+            self._location.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_bytes(
+                self._location, json.dumps(payload, separators=(",", ":")).encode("utf-8")
+            )
+        except OSError:
+            # The cache dir is best-effort: the probes stay correct without a persisted index.
+            pass
+
+
+_OPEN_INDEXES: OrderedDict[str, IdentifierIndex] = OrderedDict()
+_OPEN_INDEXES_LOCK = threading.Lock()
+
+
+def open_identifier_index(root: str | Path) -> IdentifierIndex | None:
+    """Load (once per process) the index for ``root`` so probes under it can use it."""
+    if not is_identifier_index_enabled():
+        return None
+    key = os.path.abspath(root)
+    evicted: IdentifierIndex | None = None
+    with _OPEN_INDEXES_LOCK:
+        index = _OPEN_INDEXES.get(key)
+        if index is not None:
+            _OPEN_INDEXES.move_to_end(key)
+            return index
+    index = IdentifierIndex.load(key)
+    with _OPEN_INDEXES_LOCK:
+        index = _OPEN_INDEXES.setdefault(key, index)
+        if len(_OPEN_INDEXES) > _MAX_OPEN_INDEXES:
+            _evicted_key, evicted = _OPEN_INDEXES.popitem(last=False)
+    if evicted is not None:
+        evicted.save()
+    return index
+
+
+def identifier_index_for_path(path_str: str, symbol: str) -> tuple[IdentifierIndex, str] | None:
+    """The open index whose root holds ``path_str`` (the deepest one) and the file's key in it.
+
+    ``None`` as well when ``symbol`` is not a plain identifier the index can answer for.
+    """
+    if not is_indexable_identifier(symbol):
+        return None
+    best: tuple[IdentifierIndex, str] | None = None
+    with _OPEN_INDEXES_LOCK:
+        indexes = list(_OPEN_INDEXES.values())
+    for index in indexes:
+        relative = index.relative_key(path_str)
+        if relative is not None and (best is None or len(index.root) > len(best[0].root)):
+            best = (index, relative)
+    return best
+
+
+def flush_identifier_indexes() -> None:
+    with _OPEN_INDEXES_LOCK:
+        indexes = list(_OPEN_INDEXES.values())
+    for index in indexes:
+        index.save()
+
+
+def close_identifier_indexes() -> None:
+    flush_identifier_indexes()
+    with _OPEN_INDEXES_LOCK:
+        _OPEN_INDEXES.clear()
+
+
+atexit.register(flush_identifier_indexes)
@@ -0,0 +1,374 @@
+"""Versioned binary on-disk format for the per-file line-trigram prefilter caches.
+
+Shared by ``CPUBackend`` (literal prefilter for the pure-Python regex path) and
+``StringZillaBackend`` (fixed-string index). Both used to persist the WHOLE decoded ``lines``
+list plus a ``{trigram: [line, ...]}`` dict as pretty-printed JSON, so a warm hit paid a full
+``json.loads`` and rebuilt every posting list as Python ints -- often more than a fresh ``rg``
+run, and several times the size of the file being indexed.
+
+Layout (all integers little-endian)::
+
+    header        _HEADER: magic, layout version, (mtime_ns, size) of the indexed file,
+                  line count, trigram count, and the byte offset of each section below
+    line offsets  (line_count + 1) x uint64 -- byte offset of each line start in the ORIGINAL
+                  file, plus the end-of-data sentinel. Lines are never copied into the index;
+                  a candidate line is sliced (and decoded) from the source file on demand.
+    trigram table trigram_count x _ENTRY, sorted by key: the trigram's UTF-8 bytes zero-padded
+                  to 12 bytes, then the posting list's offset/length/count in the postings blob
+    postings      per trigram: ascending line indexes, first value raw and the rest as deltas,
+                  each LEB128-varint encoded
+
+The file is read through ``mmap``: opening it parses only the fixed-size header, a lookup
+bisects the trigram table and decodes just that trigram's posting bytes, so a warm prefilter
+query costs roughly the size of the posting lists it touches. Line boundaries are exactly the
+ones :func:`tensor_grep.core.result.split_source_lines` produces (split on a bare ``\\n``, one
+trailing empty segment dropped), so a lazily decoded line is byte-identical to the eager one.
+
+An index is only as good as the ``(mtime_ns, size)`` stamp in its header, so a source file
+modified within `_RACY_WINDOW_NS` is neither persisted nor served from disk: a same-size rewrite
+inside one timestamp tick would otherwise keep its old postings (git's "racy clean" rule).
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import time
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import overload
+from uuid import uuid4
+
+LINE_TRIGRAM_INDEX_MAGIC = b"TGLT"
+# Layout version of the binary container itself. Callers that change what the indexed lines
+# MEAN (e.g. the task #262 CRLF fix) version their cache PATH instead; see
+# CPUBackend._get_prefilter_cache_path.
+LINE_TRIGRAM_INDEX_LAYOUT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHqQQQQQQ")
+_ENTRY = struct.Struct("<12sQII")
+_OFFSET = struct.Struct("<Q")
+_KEY_WIDTH = 12
+# Wider than any common filesystem's timestamp granularity (FAT 2s, HFS+/ext3 1s, coarse clocks).
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def is_racy_signature(file_signature: tuple[int, int]) -> bool:
+    """Whether a file stamped ``(mtime_ns, size)`` changed too recently for the stamp to vouch
+    for its contents."""
+    return time.time_ns() - file_signature[0] < _RACY_WINDOW_NS
+
+
+def _trigram_key(trigram: str) -> bytes | None:
+    encoded = trigram.encode("utf-8", errors="surrogatepass")
+    if len(encoded) > _KEY_WIDTH:
+        return None
+    return encoded.ljust(_KEY_WIDTH, b"\x00")
+
+
+def encode_varint_deltas(values: Iterable[int]) -> bytes:
+    """LEB128-encode an ascending sequence of non-negative ints as first-value-then-deltas."""
+    out = bytearray()
+    previous = 0
+    for value in values:
+        delta = value - previous
+        previous = value
+        while delta >= 0x80:
+            out.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return bytes(out)
+
+
+def decode_varint_deltas(buffer: bytes | mmap.mmap | memoryview, start: int, end: int) -> list[int]:
+    """Inverse of :func:`encode_varint_deltas` over ``buffer[start:end]``."""
+    values: list[int] = []
+    previous = 0
+    current = 0
+    shift = 0
+    for byte in buffer[start:end]:
+        current |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        previous += current
+        values.append(previous)
+        current = 0
+        shift = 0
+    return values
+
+
+def line_start_offsets(data: bytes) -> list[int]:
+    """Byte offset of every line start in ``data`` plus a trailing ``len(data)`` sentinel.
+
+    Mirrors ``split_source_lines``: lines end at a bare ``\\n`` only, and the empty segment a
+    final ``\\n`` would produce is not a line. Empty input therefore has zero lines (``[0]``).
+    """
+    offsets = [0]
+    position = data.find(b"\n")
+    while position != -1:
+        offsets.append(position + 1)
+        position = data.find(b"\n", position + 1)
+    if offsets[-1] == len(data):
+        offsets.pop()
+    offsets.append(len(data))
+    return offsets
+
+
+def encode_line_trigram_index(
+    *,
+    file_signature: tuple[int, int],
+    line_offsets: Sequence[int],
+    trigram_index: Mapping[str, Sequence[int]],
+) -> bytes:
+    """Serialize one file's trigram index into the binary layout described in the module doc."""
+    entries: list[tuple[bytes, bytes, int]] = []
+    for trigram, line_numbers in trigram_index.items():
+        key = _trigram_key(trigram)
+        if key is None:
+            # A trigram wider than the key slot cannot occur for real text (3 code points are
+            # at most 12 UTF-8 bytes); skip rather than write an unreachable entry.
+            continue
+        entries.append((key, encode_varint_deltas(line_numbers), len(line_numbers)))
+    entries.sort(key=lambda entry: entry[0])
+
+    line_count = max(len(line_offsets) - 1, 0)
+    offsets_pos = _HEADER.size
+    table_pos = offsets_pos + len(line_offsets) * _OFFSET.size
+    postings_pos = table_pos + len(entries) * _ENTRY.size
+    mtime_ns, size = file_signature
+
+    out = bytearray(
+        _HEADER.pack(
+            LINE_TRIGRAM_INDEX_MAGIC,
+            LINE_TRIGRAM_INDEX_LAYOUT_VERSION,
+            0,
+            mtime_ns,
+            size,
+            line_count,
+            len(entries),
+            offsets_pos,
+            table_pos,
+            postings_pos,
+        )
+    )
+    for offset in line_offsets:
+        out += _OFFSET.pack(offset)
+    posting_offset = 0
+    for key, posting, count in entries:
+        out += _ENTRY.pack(key, posting_offset, len(posting), count)
+        posting_offset += len(posting)
+    for _key, posting, _count in entries:
+        out += posting
+    return bytes(out)
+
+
+def write_line_trigram_index(
+    path: Path,
+    *,
+    file_signature: tuple[int, int],
+    line_offsets: Sequence[int],
+    trigram_index: Mapping[str, Sequence[int]],
+) -> None:
+    """Publish an index file atomically (sibling temp + replace).
+
+    Never rewritten in place: another process may have the old file ``mmap``-ed, and truncating
+    a mapped file under it faults that reader instead of giving it a clean cache miss. No
+    ``fsync`` either -- this is a disposable cache, and a torn file after a crash fails the
+    header/size validation in :meth:`MappedLineTrigramIndex.open` and is simply rebuilt.
+    """
+    from tensor_grep.cli._index_lock import replace_with_retry
+
+    payload = encode_line_trigram_index(
+        file_signature=file_signature,
+        line_offsets=line_offsets,
+        trigram_index=trigram_index,
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        replace_with_retry(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class MappedSourceLines(Sequence[str]):
+    """Lazy ``Sequence[str]`` over the indexed source file, sliced by the stored line offsets.
+
+    The source file is mapped on first access, so a query whose trigrams have no candidates
+    never opens it at all.
+    """
+
+    def __init__(self, source_path: str, index: MappedLineTrigramIndex) -> None:
+        self._source_path = source_path
+        self._index = index
+        self._data: mmap.mmap | bytes | None = None
+
+    def _source(self) -> mmap.mmap | bytes:
+        if self._data is None:
+            with open(self._source_path, "rb") as handle:
+                try:
+                    self._data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Zero-length files cannot be mapped.
+                    self._data = b""
+        return self._data
+
+    def __len__(self) -> int:
+        return self._index.line_count
+
+    @overload
+    def __getitem__(self, item: int) -> str: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> list[str]: ...
+
+    def __getitem__(self, item: int | slice) -> str | list[str]:
+        if isinstance(item, slice):
+            return [self[position] for position in range(*item.indices(len(self)))]
+        position = item + len(self) if item < 0 else item
+        if not 0 <= position < len(self):
+            raise IndexError(item)
+        start, end = self._index.line_span(position)
+        raw = self._source()[start:end]
+        if raw.endswith(b"\n"):
+            raw = raw[:-1]
+        return raw.decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = None
+
+
+class MappedLineTrigramIndex(Mapping[str, list[int]]):
+    """Read-only, ``mmap``-backed view of one persisted line-trigram index.
+
+    Behaves as a ``Mapping[str, list[int]]`` (trigram -> ascending 0-based line indexes) so it
+    drops into the same lookup code as the freshly built in-memory dict. Use :meth:`open`; it
+    returns ``None`` for a missing, foreign, truncated, or stale file so callers treat every
+    such case as an ordinary cache miss.
+    """
+
+    def __init__(
+        self,
+        data: mmap.mmap,
+        *,
+        source_path: str,
+        line_count: int,
+        trigram_count: int,
+        offsets_pos: int,
+        table_pos: int,
+        postings_pos: int,
+    ) -> None:
+        self._data = data
+        self.line_count = line_count
+        self.trigram_count = trigram_count
+        self._offsets_pos = offsets_pos
+        self._table_pos = table_pos
+        self._postings_pos = postings_pos
+        self.lines = MappedSourceLines(source_path, self)
+
+    @classmethod
+    def open(
+        cls, index_path: Path, *, source_path: str, file_signature: tuple[int, int]
+    ) -> MappedLineTrigramIndex | None:
+        if is_racy_signature(file_signature):
+            return None
+        try:
+            with open(index_path, "rb") as handle:
+                data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            header = _HEADER.unpack_from(data, 0)
+        except struct.error:
+            data.close()
+            return None
+        magic, version, _reserved, mtime_ns, size = header[:5]
+        line_count, trigram_count, offsets_pos, table_pos, postings_pos = header[5:]
+        if (
+            magic != LINE_TRIGRAM_INDEX_MAGIC
+            or version != LINE_TRIGRAM_INDEX_LAYOUT_VERSION
+            or (mtime_ns, size) != tuple(file_signature)
+            or offsets_pos + (line_count + 1) * _OFFSET.size > table_pos
+            or table_pos + trigram_count * _ENTRY.size != postings_pos
+            or postings_pos > len(data)
+        ):
+            data.close()
+            return None
+        if trigram_count:
+            # Postings are laid out in table order, so the last entry ends the file; a short
+            # read here is a torn write, not a smaller index.
+            _key, last_offset, last_length, _count = _ENTRY.unpack_from(
+                data, table_pos + (trigram_count - 1) * _ENTRY.size
+            )
+            if postings_pos + last_offset + last_length != len(data):
+                data.close()
+                return None
+        return cls(
+            data,
+            source_path=source_path,
+            line_count=line_count,
+            trigram_count=trigram_count,
+            offsets_pos=offsets_pos,
+            table_pos=table_pos,
+            postings_pos=postings_pos,
+        )
+
+    def line_span(self, line_index: int) -> tuple[int, int]:
+        base = self._offsets_pos + line_index * _OFFSET.size
+        (start,) = _OFFSET.unpack_from(self._data, base)
+        (end,) = _OFFSET.unpack_from(self._data, base + _OFFSET.size)
+        return start, end
+
+    def _key_at(self, position: int) -> bytes:
+        base = self._table_pos + position * _ENTRY.size
+        return self._data[base : base + _KEY_WIDTH]
+
+    def _find(self, key: bytes) -> int:
+        low, high = 0, self.trigram_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.trigram_count and self._key_at(low) == key:
+            return low
+        return -1
+
+    def _postings_at(self, position: int) -> list[int]:
+        _key, offset, length, _count = _ENTRY.unpack_from(
+            self._data, self._table_pos + position * _ENTRY.size
+        )
+        start = self._postings_pos + offset
+        return decode_varint_deltas(self._data, start, start + length)
+
+    def __getitem__(self, trigram: str) -> list[int]:
+        key = _trigram_key(trigram)
+        position = -1 if key is None else self._find(key)
+        if position < 0:
+            raise KeyError(trigram)
+        return self._postings_at(position)
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self.trigram_count):
+            # Every key is exactly three code points; the NUL padding decodes past them.
+            yield self._key_at(position).decode("utf-8", errors="surrogatepass")[:3]
+
+    def __len__(self) -> int:
+        return self.trigram_count
+
+    def close(self) -> None:
+        self.lines.close()
+        if not self._data.closed:
+            self._data.close()
+
+    def __enter__(self) -> MappedLineTrigramIndex:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
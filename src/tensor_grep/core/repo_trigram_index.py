@@ -0,0 +1,760 @@
+"""Repository-wide, file-level trigram index for narrowing the CPU/StringZilla candidate list.
+
+The per-file prefilters in :mod:`tensor_grep.core.line_trigram_index` only help once a file has
+been opened; a query over a large tree still walks, stats, and opens every candidate. This index
+answers the question one level up -- "which files can possibly contain this literal?" -- from a
+single persisted structure per repository root, built by ``tg index build``.
+
+On-disk layout, one directory per indexed root under the user cache dir::
+
+    manifest-v1.json   {"format_version", "root", "built_at", "segments": [name, ...],
+                        "files": [[relative_path, size, mtime_ns] | null, ...]}
+                       A file's position in ``files`` is its id; ``null`` is a tombstone left
+                       by a changed or deleted file until the next compaction.
+    seg-<hex>.tgr      immutable segment: _SEGMENT_HEADER, then trigram_count x _SEGMENT_ENTRY
+                       sorted by key (3 raw trigram bytes), then per trigram the ascending file
+                       ids as LEB128 varint deltas (the same encoding as the line index)
+
+Trigrams are taken over the RAW bytes with ASCII case folded (``bytes.lower``), so one index
+serves both case-sensitive and case-insensitive queries for ASCII literals. An incremental
+``build`` re-reads only files whose ``(size, mtime_ns)`` changed, appends them to a new segment,
+and tombstones their old ids; segments are merged once there are too many of them or tombstones
+outnumber live files. Queries never trust the index for a file it does not vouch for: a file that
+is missing from the manifest, or whose size/mtime no longer match, always stays a candidate. A
+file modified within `_RACY_WINDOW_NS` of the build is left unindexed, and one modified that
+recently before a query is searched regardless: a same-size rewrite inside one timestamp tick
+would otherwise keep its old trigrams (git's "racy clean" rule).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+import time
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from tensor_grep.core.config import SearchConfig
+from tensor_grep.core.line_trigram_index import decode_varint_deltas, encode_varint_deltas
+
+REPO_TRIGRAM_INDEX_FORMAT_VERSION = 1
+_MANIFEST_NAME = f"manifest-v{REPO_TRIGRAM_INDEX_FORMAT_VERSION}.json"
+_SEGMENT_MAGIC = b"TGRS"
+_SEGMENT_SUFFIX = ".tgr"
+_SEGMENT_HEADER = struct.Struct("<4sHHQQ")
+_SEGMENT_ENTRY = struct.Struct("<3sxQI")
+# Merge segments once an incremental build would leave more than this many behind; each one
+# costs a bisect per query trigram.
+_MAX_SEGMENTS = 8
+_DEFAULT_MAX_FILE_BYTES = 8 * 1024 * 1024
+_INDEXED_BACKENDS = frozenset({"CPUBackend", "StringZillaBackend"})
+_UTF8_ENCODINGS = frozenset({"auto", "utf-8", "utf8"})
+# Wider than any common filesystem's timestamp granularity (FAT 2s, HFS+/ext3 1s, coarse clocks).
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def is_repo_index_enabled() -> bool:
+    return os.environ.get("TENSOR_GREP_REPO_INDEX", "1").strip().lower() not in {
+        "0",
+        "false",
+        "no",
+        "off",
+    }
+
+
+def get_repo_index_cache_dir() -> Path:
+    override = os.environ.get("TENSOR_GREP_REPO_INDEX_DIR")
+    if override:
+        return Path(override).expanduser().resolve()
+    if os.name == "nt":
+        local_appdata = os.environ.get("LOCALAPPDATA")
+        if local_appdata:
+            return Path(local_appdata) / "tensor-grep" / "repo-trigram-index"
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache_home:
+        return Path(xdg_cache_home) / "tensor-grep" / "repo-trigram-index"
+    return Path.home() / ".cache" / "tensor-grep" / "repo-trigram-index"
+
+
+def _max_file_bytes() -> int:
+    raw = os.environ.get("TENSOR_GREP_REPO_INDEX_MAX_FILE_BYTES", "").strip()
+    try:
+        value = int(raw)
+    except ValueError:
+        return _DEFAULT_MAX_FILE_BYTES
+    return value if value > 0 else _DEFAULT_MAX_FILE_BYTES
+
+
+def repo_index_dir(root: Path) -> Path:
+    digest = hashlib.sha256(str(root).encode("utf-8", errors="surrogatepass")).hexdigest()
+    return get_repo_index_cache_dir() / digest
+
+
+def _is_racy(stat_result: os.stat_result) -> bool:
+    return time.time_ns() - stat_result.st_mtime_ns < _RACY_WINDOW_NS
+
+
+def file_trigrams(data: bytes) -> set[bytes]:
+    """Distinct ASCII-case-folded byte trigrams of one file's contents."""
+    folded = data.lower()
+    return {folded[start : start + 3] for start in range(len(folded) - 2)}
+
+
+def _relative_key(absolute_path: str, root_prefix: str) -> str | None:
+    if not absolute_path.startswith(root_prefix):
+        return None
+    relative = absolute_path[len(root_prefix) :]
+    return relative.replace(os.sep, "/") if os.sep != "/" else relative
+
+
+def _root_prefix(root: str) -> str:
+    return root if root.endswith(os.sep) else root + os.sep
+
+
+class _Segment:
+    """``mmap``-backed view of one immutable segment file (see the module docstring)."""
+
+    def __init__(self, data: mmap.mmap, trigram_count: int, postings_pos: int) -> None:
+        self._data = data
+        self.trigram_count = trigram_count
+        self._postings_pos = postings_pos
+
+    @classmethod
+    def open(cls, path: Path) -> _Segment | None:
+        try:
+            with open(path, "rb") as handle:
+                data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            magic, version, _reserved, trigram_count, postings_pos = _SEGMENT_HEADER.unpack_from(
+                data, 0
+            )
+        except struct.error:
+            data.close()
+            return None
+        if (
+            magic != _SEGMENT_MAGIC
+            or version != REPO_TRIGRAM_INDEX_FORMAT_VERSION
+            or _SEGMENT_HEADER.size + trigram_count * _SEGMENT_ENTRY.size != postings_pos
+            or postings_pos > len(data)
+        ):
+            data.close()
+            return None
+        if trigram_count:
+            _key, last_offset, last_length = _SEGMENT_ENTRY.unpack_from(
+                data, _SEGMENT_HEADER.size + (trigram_count - 1) * _SEGMENT_ENTRY.size
+            )
+            if postings_pos + last_offset + last_length != len(data):
+                data.close()
+                return None
+        return cls(data, trigram_count, postings_pos)
+
+    def _entry(self, position: int) -> tuple[bytes, int, int]:
+        key, offset, length = _SEGMENT_ENTRY.unpack_from(
+            self._data, _SEGMENT_HEADER.size + position * _SEGMENT_ENTRY.size
+        )
+        return key, offset, length
+
+    def _postings(self, offset: int, length: int) -> list[int]:
+        start = self._postings_pos + offset
+        return decode_varint_deltas(self._data, start, start + length)
+
+    def get(self, trigram: bytes) -> list[int] | None:
+        low, high = 0, self.trigram_count
+        while low < high:
+            middle = (low + high) // 2
+            base = _SEGMENT_HEADER.size + middle * _SEGMENT_ENTRY.size
+            if self._data[base : base + 3] < trigram:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self.trigram_count:
+            return None
+        key, offset, length = self._entry(low)
+        if key != trigram:
+            return None
+        return self._postings(offset, length)
+
+    def items(self) -> Iterator[tuple[bytes, list[int]]]:
+        for position in range(self.trigram_count):
+            key, offset, length = self._entry(position)
+            yield key, self._postings(offset, length)
+
+    def close(self) -> None:
+        self._data.close()
+
+
+def _write_segment(path: Path, postings: Mapping[bytes, Sequence[int]]) -> None:
+    """Publish one segment atomically (sibling temp + replace), mirroring the line index."""
+    from tensor_grep.cli._index_lock import replace_with_retry
+
+    keys = sorted(key for key, file_ids in postings.items() if file_ids)
+    encoded = [encode_varint_deltas(postings[key]) for key in keys]
+    postings_pos = _SEGMENT_HEADER.size + len(keys) * _SEGMENT_ENTRY.size
+    out = bytearray(
+        _SEGMENT_HEADER.pack(
+            _SEGMENT_MAGIC, REPO_TRIGRAM_INDEX_FORMAT_VERSION, 0, len(keys), postings_pos
+        )
+    )
+    offset = 0
+    for key, posting in zip(keys, encoded, strict=True):
+        out += _SEGMENT_ENTRY.pack(key, offset, len(posting))
+        offset += len(posting)
+    for posting in encoded:
+        out += posting
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        tmp_path.write_bytes(bytes(out))
+        replace_with_retry(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_manifest(directory: Path, root: Path) -> dict[str, Any] | None:
+    try:
+        payload = json.loads((directory / _MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("format_version") != REPO_TRIGRAM_INDEX_FORMAT_VERSION
+        or payload.get("root") != str(root)
+        or not isinstance(payload.get("files"), list)
+        or not isinstance(payload.get("segments"), list)
+    ):
+        return None
+    return payload
+
+
+def _write_manifest(directory: Path, manifest: Mapping[str, Any]) -> None:
+    from tensor_grep.cli._index_lock import atomic_write_bytes
+
+    atomic_write_bytes(
+        directory / _MANIFEST_NAME,
+        json.dumps(manifest, separators=(",", ":")).encode("utf-8"),
+    )
+
+
+def _remove_orphans(directory: Path, segments: Iterable[str]) -> None:
+    """Delete segment files the current manifest no longer references.
+
+    A reader that loaded the previous manifest may still have one mapped; on POSIX unlinking it
+    is harmless, and on Windows the delete fails and is retried by the next build or prune.
+    """
+    keep = set(segments)
+    for path in directory.glob(f"seg-*{_SEGMENT_SUFFIX}"):
+        if path.name not in keep:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _open_segments(directory: Path, names: Sequence[str]) -> list[_Segment] | None:
+    segments: list[_Segment] = []
+    for name in names:
+        segment = _Segment.open(directory / str(name))
+        if segment is None:
+            for opened in segments:
+                opened.close()
+            return None
+        segments.append(segment)
+    return segments
+
+
+def _compact(
+    directory: Path, entries: list[list[Any] | None], segments: Sequence[str]
+) -> tuple[list[list[Any] | None], list[str]] | None:
+    """Merge every segment into one, dropping tombstones and renumbering live file ids.
+
+    Ids are renumbered in their original order and segments hold ascending, disjoint id ranges,
+    so concatenating each trigram's remapped postings segment by segment stays sorted.
+    """
+    remap: dict[int, int] = {}
+    compacted: list[list[Any] | None] = []
+    for old_id, entry in enumerate(entries):
+        if entry is not None:
+            remap[old_id] = len(compacted)
+            compacted.append(entry)
+    opened = _open_segments(directory, segments)
+    if opened is None:
+        return None
+    merged: dict[bytes, array[int]] = {}
+    try:
+        for segment in opened:
+            for key, file_ids in segment.items():
+                live = [remap[file_id] for file_id in file_ids if file_id in remap]
+                if live:
+                    merged.setdefault(key, array("I")).extend(live)
+    finally:
+        for segment in opened:
+            segment.close()
+    if not merged:
+        return compacted, []
+    name = f"seg-{uuid4().hex}{_SEGMENT_SUFFIX}"
+    _write_segment(directory / name, merged)
+    return compacted, [name]
+
+
+@dataclass(frozen=True)
+class RepoIndexBuildReport:
+    root: str
+    index_dir: str
+    indexed_files: int
+    reused_files: int
+    added_files: int
+    updated_files: int
+    removed_files: int
+    skipped_files: int
+    segments: int
+    changed: bool
+    full_rebuild: bool
+    elapsed_ms: float
+
+
+def build_repo_trigram_index(
+    root: str | Path, files: Iterable[str], *, full: bool = False
+) -> RepoIndexBuildReport:
+    """Create or incrementally update the index for ``root`` from the walked ``files``.
+
+    ``files`` is the complete candidate universe under ``root`` (what a search would walk);
+    an indexed file that is absent from it is treated as deleted. Files larger than
+    ``TENSOR_GREP_REPO_INDEX_MAX_FILE_BYTES`` (8 MiB by default), and files modified within
+    `_RACY_WINDOW_NS`, are left unindexed and so are always searched.
+    """
+    from tensor_grep.cli._index_lock import index_lock
+
+    started = time.perf_counter()
+    root_path = Path(root).resolve()
+    directory = repo_index_dir(root_path)
+    root_prefix = _root_prefix(str(root_path))
+    max_file_bytes = _max_file_bytes()
+
+    with index_lock(directory / _MANIFEST_NAME):
+        manifest = None if full else _read_manifest(directory, root_path)
+        if manifest is not None:
+            opened = _open_segments(directory, manifest["segments"])
+            if opened is None:
+                # A referenced segment is gone or torn: the surviving ids cannot be trusted.
+                manifest = None
+            else:
+                for segment in opened:
+                    segment.close()
+        full_rebuild = manifest is None
+        entries: list[list[Any] | None] = list(manifest["files"]) if manifest else []
+        segments: list[str] = [str(name) for name in manifest["segments"]] if manifest else []
+        by_path = {entry[0]: file_id for file_id, entry in enumerate(entries) if entry is not None}
+
+        postings: dict[bytes, array[int]] = {}
+        seen: set[str] = set()
+        reused = added = updated = skipped = removed = tombstoned = 0
+        for file_path in files:
+            relative = _relative_key(os.path.abspath(file_path), root_prefix)
+            if relative is None or relative in seen:
+                continue
+            seen.add(relative)
+            absolute = root_prefix + relative
+            try:
+                # Stat BEFORE reading: a write racing the read leaves a newer mtime on disk than
+                # the one recorded, so the file reads as stale (always searched), never as indexed
+                # with content it no longer has.
+                stat_result = os.stat(absolute)
+            except OSError:
+                continue
+            previous = by_path.get(relative)
+            if previous is not None:
+                entry = entries[previous]
+                if entry is not None and (entry[1], entry[2]) == (
+                    stat_result.st_size,
+                    stat_result.st_mtime_ns,
+                ):
+                    reused += 1
+                    continue
+                entries[previous] = None
+                tombstoned += 1
+            if stat_result.st_size > max_file_bytes or _is_racy(stat_result):
+                skipped += 1
+                continue
+            try:
+                data = Path(absolute).read_bytes()
+            except OSError:
+                skipped += 1
+                continue
+            file_id = len(entries)
+            entries.append([relative, stat_result.st_size, stat_result.st_mtime_ns])
+            if previous is None:
+                added += 1
+            else:
+                updated += 1
+            for trigram in file_trigrams(data):
+                postings.setdefault(trigram, array("I")).append(file_id)
+
+        for relative, file_id in by_path.items():
+            if relative not in seen and entries[file_id] is not None:
+                entries[file_id] = None
+                removed += 1
+                tombstoned += 1
+
+        changed = full_rebuild or tombstoned > 0 or added > 0
+        if changed:
+            if postings:
+                name = f"seg-{uuid4().hex}{_SEGMENT_SUFFIX}"
+                _write_segment(directory / name, postings)
+                segments.append(name)
+            live_count = sum(1 for entry in entries if entry is not None)
+            if len(segments) > _MAX_SEGMENTS or len(entries) - live_count > live_count:
+                compacted = _compact(directory, entries, segments)
+                if compacted is not None:
+                    entries, segments = compacted
+            _write_manifest(
+                directory,
+                {
+                    "format_version": REPO_TRIGRAM_INDEX_FORMAT_VERSION,
+                    "root": str(root_path),
+                    "built_at": datetime.now(UTC).isoformat(),
+                    "segments": segments,
+                    "files": entries,
+                },
+            )
+            _remove_orphans(directory, segments)
+
+    return RepoIndexBuildReport(
+        root=str(root_path),
+        index_dir=str(directory),
+        indexed_files=sum(1 for entry in entries if entry is not None),
+        reused_files=reused,
+        added_files=added,
+        updated_files=updated,
+        removed_files=removed,
+        skipped_files=skipped,
+        segments=len(segments),
+        changed=changed,
+        full_rebuild=full_rebuild,
+        elapsed_ms=(time.perf_counter() - started) * 1000.0,
+    )
+
+
+class RepoTrigramIndex:
+    """Read-only view of one root's manifest plus its mapped segments. Use :meth:`load`."""
+
+    def __init__(
+        self, root: Path, directory: Path, manifest: Mapping[str, Any], segments: list[_Segment]
+    ) -> None:
+        self.root = root
+        self.directory = directory
+        self.built_at = str(manifest.get("built_at") or "")
+        self.entries: list[list[Any] | None] = list(manifest["files"])
+        self.segment_names = [str(name) for name in manifest["segments"]]
+        self._segments = segments
+        self._by_path: dict[str, int] | None = None
+
+    @classmethod
+    def load(cls, root: str | Path) -> RepoTrigramIndex | None:
+        """The index for ``root``, or ``None`` when it is missing, foreign, or damaged."""
+        root_path = Path(root).resolve()
+        directory = repo_index_dir(root_path)
+        manifest = _read_manifest(directory, root_path)
+        if manifest is None:
+            return None
+        segments = _open_segments(directory, manifest["segments"])
+        if segments is None:
+            return None
+        return cls(root_path, directory, manifest, segments)
+
+    @classmethod
+    def discover(cls, path: str | Path) -> tuple[RepoTrigramIndex, str] | None:
+        """Nearest index covering ``path`` plus the absolute prefix its files are spelled under.
+
+        Walks ``path``'s unresolved ancestors so a search through a symlinked directory still
+        finds the index built for the resolved root, and candidate paths (which are spelled the
+        way the walk produced them) can be matched by prefix against the returned spelling.
+        """
+        start = Path(os.path.abspath(path))
+        if not start.is_dir():
+            start = start.parent
+        for ancestor in (start, *start.parents):
+            try:
+                resolved = ancestor.resolve()
+            except OSError:
+                continue
+            if not (repo_index_dir(resolved) / _MANIFEST_NAME).is_file():
+                continue
+            index = cls.load(resolved)
+            if index is not None:
+                return index, str(ancestor)
+        return None
+
+    @property
+    def live_file_count(self) -> int:
+        return sum(1 for entry in self.entries if entry is not None)
+
+    def file_id(self, relative_path: str) -> int | None:
+        if self._by_path is None:
+            self._by_path = {
+                entry[0]: file_id for file_id, entry in enumerate(self.entries) if entry is not None
+            }
+        return self._by_path.get(relative_path)
+
+    def candidate_file_ids(self, literal: bytes) -> set[int]:
+        """Ids of live indexed files whose contents contain every trigram of ``literal``."""
+        folded = literal.lower()
+        trigrams = {folded[start : start + 3] for start in range(len(folded) - 2)}
+        matched: set[int] = set()
+        for segment in self._segments:
+            postings: list[list[int]] = []
+            for trigram in trigrams:
+                file_ids = segment.get(trigram)
+                if not file_ids:
+                    postings = []
+                    break
+                postings.append(file_ids)
+            if not postings:
+                continue
+            postings.sort(key=len)
+            narrowed = set(postings[0])
+            for file_ids in postings[1:]:
+                narrowed.intersection_update(file_ids)
+                if not narrowed:
+                    break
+            matched |= narrowed
+        return {file_id for file_id in matched if self.entries[file_id] is not None}
+
+    def close(self) -> None:
+        for segment in self._segments:
+            segment.close()
+        self._segments = []
+
+    def __enter__(self) -> RepoTrigramIndex:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def repo_index_literal(pattern: str, config: SearchConfig) -> bytes | None:
+    """The ASCII literal every match must contain, or ``None`` when the index cannot help.
+
+    Narrowing is a file-level filter, so it is only sound for modes that print nothing for a
+    file without a match: inverted, files-without-match, passthru and ``--count
+    --include-zero`` output all mention such files. Non-UTF-8 decoding, preprocessors and
+    archive search change the bytes being matched; non-ASCII literals are skipped because the
+    Python path may decode a file as latin-1 and ``bytes.lower`` folds ASCII only.
+    """
+    if (
+        config.invert_match
+        or config.files_without_match
+        or config.passthru
+        or config.include_zero
+        or config.ltl
+        or config.ast
+        or config.pre
+        or config.search_zip
+        or (not config.no_encoding and config.encoding.strip().lower() not in _UTF8_ENCODINGS)
+    ):
+        return None
+    if config.fixed_strings:
+        literal: str | None = pattern if "\n" not in pattern else None
+    else:
+        from tensor_grep.backends.cpu_backend import CPUBackend
+
+        literal = CPUBackend._extract_required_literal(pattern)
+    if literal is None or len(literal) < 3 or not literal.isascii():
+        return None
+    return literal.encode("ascii")
+
+
+@dataclass(frozen=True)
+class RepoIndexNarrowing:
+    root: str
+    files: list[str] = field(repr=False)
+    candidates_before: int
+    unindexed_files: int
+
+    @property
+    def candidates_after(self) -> int:
+        return len(self.files)
+
+
+def narrow_candidate_files(
+    files: Sequence[str],
+    pattern: str,
+    config: SearchConfig,
+    *,
+    backend_name: str,
+    search_paths: Sequence[str],
+) -> RepoIndexNarrowing | None:
+    """Drop candidates the repository index proves cannot match, preserving walk order.
+
+    Returns ``None`` (search every candidate) when the index is disabled, absent, or not
+    applicable to this backend/pattern. Files outside the indexed root, never indexed, or
+    changed since the last ``tg index build`` are always kept.
+    """
+    if backend_name not in _INDEXED_BACKENDS or not files or not is_repo_index_enabled():
+        return None
+    literal = repo_index_literal(pattern, config)
+    if literal is None:
+        return None
+    discovered = RepoTrigramIndex.discover(search_paths[0] if search_paths else ".")
+    if discovered is None:
+        return None
+    index, spelled_root = discovered
+    with index:
+        matched = index.candidate_file_ids(literal)
+        root_prefix = _root_prefix(spelled_root)
+        kept: list[str] = []
+        unindexed = 0
+        for file_path in files:
+            relative = _relative_key(os.path.abspath(file_path), root_prefix)
+            file_id = index.file_id(relative) if relative is not None else None
+            if file_id is None:
+                unindexed += 1
+                kept.append(file_path)
+                continue
+            if file_id in matched:
+                kept.append(file_path)
+                continue
+            entry = index.entries[file_id]
+            try:
+                stat_result = os.stat(file_path)
+            except OSError:
+                # Let the backend report the unreadable file exactly as it would have.
+                kept.append(file_path)
+                continue
+            if (
+                entry is None
+                or (entry[1], entry[2]) != (stat_result.st_size, stat_result.st_mtime_ns)
+                or _is_racy(stat_result)
+            ):
+                unindexed += 1
+                kept.append(file_path)
+        return RepoIndexNarrowing(
+            root=str(index.root),
+            files=kept,
+            candidates_before=len(files),
+            unindexed_files=unindexed,
+        )
+
+
+def repo_trigram_index_status(root: str | Path) -> dict[str, Any]:
+    """Summary of ``root``'s index; ``stale_files`` stats every indexed file."""
+    root_path = Path(root).resolve()
+    directory = repo_index_dir(root_path)
+    status: dict[str, Any] = {
+        "root": str(root_path),
+        "index_dir": str(directory),
+        "exists": False,
+        "format_version": REPO_TRIGRAM_INDEX_FORMAT_VERSION,
+    }
+    index = RepoTrigramIndex.load(root_path)
+    if index is None:
+        return status
+    with index:
+        root_prefix = _root_prefix(str(root_path))
+        stale = 0
+        for entry in index.entries:
+            if entry is None:
+                continue
+            try:
+                stat_result = os.stat(root_prefix + entry[0])
+            except OSError:
+                stale += 1
+                continue
+            if (entry[1], entry[2]) != (stat_result.st_size, stat_result.st_mtime_ns):
+                stale += 1
+        index_bytes = 0
+        for path in (directory / _MANIFEST_NAME, *(directory / n for n in index.segment_names)):
+            try:
+                index_bytes += path.stat().st_size
+            except OSError:
+                pass
+        live = index.live_file_count
+        status.update(
+            exists=True,
+            built_at=index.built_at,
+            indexed_files=live,
+            stale_files=stale,
+            tombstones=len(index.entries) - live,
+            segments=len(index.segment_names),
+            index_bytes=index_bytes,
+        )
+    return status
+
+
+def prune_repo_trigram_indexes(root: str | Path) -> dict[str, Any]:
+    """Compact ``root``'s index and delete indexes whose root directory no longer exists.
+
+    Compaction drops entries for deleted files and every tombstone, merges all segments into
+    one, and removes unreferenced segment/temp files. Changed files are left for ``build``.
+    """
+    from tensor_grep.cli._index_lock import index_lock
+
+    root_path = Path(root).resolve()
+    directory = repo_index_dir(root_path)
+    removed_entries = 0
+    compacted = False
+    # Only lock (which creates the index directory) when there is an index to compact.
+    lock: AbstractContextManager[None] = (
+        index_lock(directory / _MANIFEST_NAME) if directory.is_dir() else nullcontext()
+    )
+    with lock:
+        manifest = _read_manifest(directory, root_path)
+        if manifest is not None:
+            entries: list[list[Any] | None] = list(manifest["files"])
+            root_prefix = _root_prefix(str(root_path))
+            for file_id, entry in enumerate(entries):
+                if entry is not None and not os.path.exists(root_prefix + entry[0]):
+                    entries[file_id] = None
+                    removed_entries += 1
+            result = _compact(directory, entries, manifest["segments"])
+            if result is not None:
+                compacted = True
+                entries, segments = result
+                _write_manifest(
+                    directory,
+                    {
+                        "format_version": REPO_TRIGRAM_INDEX_FORMAT_VERSION,
+                        "root": str(root_path),
+                        "built_at": manifest.get("built_at"),
+                        "segments": segments,
+                        "files": entries,
+                    },
+                )
+                _remove_orphans(directory, segments)
+                for tmp_path in directory.glob(".seg-*.tmp"):
+                    tmp_path.unlink(missing_ok=True)
+
+    removed_indexes: list[str] = []
+    cache_dir = get_repo_index_cache_dir()
+    if cache_dir.is_dir():
+        for candidate in sorted(cache_dir.iterdir()):
+            if not candidate.is_dir():
+                continue
+            try:
+                payload = json.loads((candidate / _MANIFEST_NAME).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            indexed_root = payload.get("root") if isinstance(payload, dict) else None
+            if isinstance(indexed_root, str) and not Path(indexed_root).is_dir():
+                shutil.rmtree(candidate, ignore_errors=True)
+                removed_indexes.append(indexed_root)
+
+    return {
+        "root": str(root_path),
+        "index_dir": str(directory),
+        "compacted": compacted,
+        "removed_entries": removed_entries,
+        "removed_indexes": removed_indexes,
+    }
@@ -15,7 +15,7 @@ import os
 import sys
 import threading
 from collections import defaultdict
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from tensor_grep.core.result import SearchResult
 from tensor_grep.core.retrieval_bm25 import Bm25Index
@@ -25,6 +25,9 @@ from tensor_grep.core.retrieval_fusion import DEFAULT_K, reciprocal_rank_fusion
 from tensor_grep.core.retrieval_late import LateReranker, LateRerankUnavailableError
 from tensor_grep.core.retrieval_lexical import split_terms
 
+if TYPE_CHECKING:
+    from tensor_grep.core.semantic_index import SemanticChunkCache
+
 # PR-S2 (channelized RRF, sverklo steal-list #2): a third, opt-in fusion leg that ranks chunks by
 # filename-token overlap with the query -- a precision signal (a query mentioning "invoice" should
 # surface invoice_parser.py's chunks first). DEFAULT-OFF (gated by `_RRF_CHANNELS_ENV`) so this is
@@ -50,7 +53,7 @@ def _rrf_channels_enabled() -> bool:
 _RERANK_POOL_K_ENV: str = "TG_RERANK_POOL_K"
 _RERANK_BUDGET_MS_ENV: str = "TG_RERANK_BUDGET_MS"
 _DEFAULT_RERANK_POOL_K: int = 50
-_MAX_RERANK_POOL_K: int = 100
+_MAX_RERANK_POOL_K: int = 200
 _DEFAULT_RERANK_BUDGET_MS: int = 2000
 
 # #128d (backlog cluster-1 P0-CORRECTNESS, MED-1): retrieval_chunker.MAX_CHUNKS bounds a single
@@ -119,6 +122,7 @@ def _chunk_corpus_with_total_cap(
     *,
     chunk_size: int,
     overlap: int,
+    chunk_cache: SemanticChunkCache | None = None,
 ) -> tuple[list[Chunk], str | None]:
     """Chunk every file in ``file_paths`` in order, STOPPING before the accumulated chunk count
     would exceed :func:`_rank_corpus_chunk_cap` -- the chokepoint fix for #128d (MED-1): plain
@@ -140,13 +144,19 @@ def _chunk_corpus_with_total_cap(
     docstring). Files left unchunked past the trip point simply have no scored chunk, so their
     matches sink to the end via the existing zero-score path -- identical to how an unmatched file
     behaves today.
+
+    With a ``chunk_cache`` (a persisted ``tg index semantic`` index), files unchanged since
+    indexing take their chunks from it instead of being re-read; the cap applies identically.
     """
     cap = _rank_corpus_chunk_cap()
     chunks: list[Chunk] = []
     fallback_reason: str | None = None
     chunked_file_count = 0
     for path in file_paths:
-        chunks.extend(chunk_file(path, chunk_size=chunk_size, overlap=overlap))
+        if chunk_cache is not None:
+            chunks.extend(chunk_cache.chunk(path))
+        else:
+            chunks.extend(chunk_file(path, chunk_size=chunk_size, overlap=overlap))
         chunked_file_count += 1
         if len(chunks) > cap:
             fallback_reason = (
@@ -167,11 +177,14 @@ def rerank_by_bm25(
     chunk_size: int = 30,
     overlap: int = 5,
     index: Bm25Index | None = None,
+    chunk_cache: SemanticChunkCache | None = None,
 ) -> SearchResult:
     """Return a copy of ``result`` with matches re-sorted by best BM25 chunk score (desc).
 
     When ``index`` is not supplied, the corpus built from ``file_paths`` is bounded by
     :func:`_chunk_corpus_with_total_cap` (#128d) -- see its docstring for the chokepoint fix.
+    ``chunk_cache`` is only consulted then; it must have been loaded with the same
+    ``chunk_size``/``overlap`` or it is ignored.
     Passing a prebuilt ``index`` (e.g. a caller's own deliberately-capped corpus, as the
     ``--semantic`` degrade path does) bypasses this bound entirely, same as before.
     """
@@ -180,8 +193,12 @@ def rerank_by_bm25(
 
     corpus_cap_reason: str | None = None
     if index is None:
+        if chunk_cache is not None and (
+            chunk_cache.chunk_size != chunk_size or chunk_cache.overlap != overlap
+        ):
+            chunk_cache = None
         chunks, corpus_cap_reason = _chunk_corpus_with_total_cap(
-            file_paths, chunk_size=chunk_size, overlap=overlap
+            file_paths, chunk_size=chunk_size, overlap=overlap, chunk_cache=chunk_cache
         )
         index = Bm25Index(chunks)
 
@@ -384,7 +401,7 @@ def rerank_hybrid(
 
     ``late_reranker`` (optional, T5, design doc "The seam"): a 4th, ORDER-ONLY stage layered on
     top of the fused ranking above -- it MaxSim-reranks the head of ``fused_order`` (size
-    ``TG_RERANK_POOL_K``, default 50, hard-capped at 100) and leaves the tail untouched in its RRF
+    ``TG_RERANK_POOL_K``, default 50, hard-capped at 200) and leaves the tail untouched in its RRF
     order. Same matches, same membership, same JSON shape -- only a permutation of the head.
     ``late_reranker=None`` (the default) skips this stage entirely: a byte-identical no-op,
     mirroring ``dense_index=None`` and the ``TG_RRF_CHANNELS`` pattern above. The caller
@@ -410,7 +427,7 @@ def rerank_hybrid(
             file_paths, chunk_size=chunk_size, overlap=overlap
         )
         bm25_index = Bm25Index(chunks)
-    chunks = bm25_index.chunks
+    chunks = list(bm25_index.chunks)
 
     fused_order, late_rank_fallback_reason = rank_chunks(
         query,
@@ -3,46 +3,132 @@
 This is a real relevance scorer (IDF + term-frequency saturation + length normalization), unlike
 ``retrieval_lexical.score_term_overlap`` which is a bare set-membership count. It reuses
 ``retrieval_lexical.split_terms`` as the tokenizer so the BM25 leg tokenizes identically to the
-existing lexical path (camelCase / underscore / hyphen aware, lowercased). Pure Python, no new deps.
+existing lexical path (camelCase / underscore / hyphen aware, lowercased). Pure Python, no new deps;
+when ``numpy`` is importable (the ``semantic`` extra) large corpora score through it instead.
+
+The index is inverted: each term maps to its postings (doc ids and term frequencies), and every
+document's length normalization is precomputed once. A query therefore only touches documents
+that contain at least one query term, and only partially orders them for ``top_k``. Scores are
+accumulated per document in query-term order with exactly the per-term expression of the
+original doc-at-a-time loop, so rankings -- scores and tie-breaks -- are bit-identical to it.
 """
 
 from __future__ import annotations
 
+import heapq
 import math
 from collections import Counter
+from collections.abc import Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
 
 from tensor_grep.core.retrieval_chunker import Chunk
 from tensor_grep.core.retrieval_lexical import split_terms
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # Okapi BM25 defaults; k1 controls term-frequency saturation, b the length normalization.
 DEFAULT_K1: float = 1.5
 DEFAULT_B: float = 0.75
+# Below this many chunks the per-query array setup costs more than the Python loop it replaces.
+_NUMPY_MIN_DOCS = 2048
+
+
+def _ranking_key(item: tuple[int, float]) -> tuple[float, int]:
+    return (-item[1], item[0])
 
 
 class Bm25Index:
-    """An in-memory BM25 index over a list of :class:`Chunk` documents."""
+    """A BM25 index over a list of :class:`Chunk` documents.
+
+    Built in memory from chunks, or (:meth:`from_postings`) over postings and chunks that some
+    other store -- the persisted semantic index -- materializes lazily, term by term.
+    """
 
     def __init__(
         self, chunks: list[Chunk], *, k1: float = DEFAULT_K1, b: float = DEFAULT_B
     ) -> None:
-        self.chunks = list(chunks)
+        # term -> (ascending doc ids, matching term frequencies)
+        postings: dict[str, tuple[list[int], list[int]]] = {}
+        doc_len: list[int] = []
+        for doc_id, chunk in enumerate(chunks):
+            terms = split_terms(chunk.text)
+            doc_len.append(len(terms))
+            for term, freq in Counter(terms).items():
+                term_postings = postings.get(term)
+                if term_postings is None:
+                    term_postings = postings[term] = ([], [])
+                term_postings[0].append(doc_id)
+                term_postings[1].append(freq)
+        self._setup(list(chunks), postings, doc_len, sum(doc_len), k1=k1, b=b)
+
+    @classmethod
+    def from_postings(
+        cls,
+        chunks: Sequence[Chunk],
+        postings: Mapping[str, tuple[Sequence[int], Sequence[int]]],
+        doc_len: Sequence[int],
+        total_doc_len: int,
+        *,
+        k1: float = DEFAULT_K1,
+        b: float = DEFAULT_B,
+    ) -> Bm25Index:
+        """An index over prebuilt postings; scores are bit-identical to building from chunks.
+
+        ``postings`` is only ever asked for the query's own terms and ``chunks`` only indexed by
+        the caller, so both may decode on demand.
+        """
+        index = cls.__new__(cls)
+        index._setup(chunks, postings, doc_len, total_doc_len, k1=k1, b=b)
+        return index
+
+    def _setup(
+        self,
+        chunks: Sequence[Chunk],
+        postings: Mapping[str, tuple[Sequence[int], Sequence[int]]],
+        doc_len: Sequence[int],
+        total_doc_len: int,
+        *,
+        k1: float,
+        b: float,
+    ) -> None:
+        self.chunks = chunks
         self.k1 = k1
         self.b = b
+        self._postings = postings
+        self._doc_len = doc_len
+        n = len(chunks)
+        self._avgdl: float = (total_doc_len / n) if n else 0.0
+        # The `k1 * (1 - b + b * |d| / avgdl)` half of every denominator, once per document,
+        # computed on the first query.
+        self._norm: list[float] | None = None
+        self._np: Any = None
+        self._norm_array: np.ndarray | None = None
+        self._posting_arrays: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        if n >= _NUMPY_MIN_DOCS and self._avgdl:
+            try:
+                import numpy
+            except ImportError:
+                pass
+            else:
+                self._np = numpy
+                lengths = numpy.asarray(doc_len, dtype=numpy.float64)
+                # Same operations in the same order as the scalar list below, elementwise.
+                self._norm_array = self.k1 * (1.0 - self.b + self.b * lengths / self._avgdl)
 
-        doc_terms = [split_terms(chunk.text) for chunk in self.chunks]
-        self._tf: list[Counter[str]] = [Counter(terms) for terms in doc_terms]
-        self._doc_len: list[int] = [len(terms) for terms in doc_terms]
-        n = len(self.chunks)
-        self._avgdl: float = (sum(self._doc_len) / n) if n else 0.0
+    def iter_postings(self) -> Iterator[tuple[str, Sequence[int], Sequence[int]]]:
+        """Every ``(term, doc_ids, term_frequencies)``, for persisting the index."""
+        for term, (doc_ids, freqs) in self._postings.items():
+            yield term, doc_ids, freqs
+
+    @property
+    def doc_lengths(self) -> Sequence[int]:
+        return self._doc_len
 
-        df: Counter[str] = Counter()
-        for terms in doc_terms:
-            for term in set(terms):
-                df[term] += 1
+    def _idf(self, df: int) -> float:
         # BM25 IDF with +1 smoothing so weights stay non-negative even for very common terms.
-        self._idf: dict[str, float] = {
-            term: math.log(1.0 + (n - freq + 0.5) / (freq + 0.5)) for term, freq in df.items()
-        }
+        n = len(self.chunks)
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
 
     def query(self, query: str, *, top_k: int = 10) -> list[tuple[int, float]]:
         """Rank chunks against ``query``; returns ``(chunk_index, score)`` sorted by score desc.
@@ -59,20 +145,66 @@ class Bm25Index:
         # Dedupe query terms: split_terms can repeat a token (camelCase "cacheCache" ->
         # ["cache", "cache"]), which would double-count its BM25 contribution. IDF build uses
         # set(terms), so scoring must sum once per unique query term (standard Okapi BM25).
-        unique_terms = list(dict.fromkeys(q_terms))
+        unique_terms = [term for term in dict.fromkeys(q_terms) if term in self._postings]
+        if not unique_terms:
+            return []
+        if self._norm_array is not None:
+            return self._query_numpy(unique_terms, top_k)
+
+        k1_plus_1 = self.k1 + 1.0
+        norm = self._norm
+        if norm is None:
+            norm = self._norm = [
+                self.k1 * (1.0 - self.b + self.b * length / self._avgdl) for length in self._doc_len
+            ]
         scored: dict[int, float] = {}
-        for i, tf in enumerate(self._tf):
-            doc_len = self._doc_len[i]
-            score = 0.0
-            for term in unique_terms:
-                freq = tf.get(term, 0)
-                if freq == 0:
-                    continue
-                idf = self._idf.get(term, 0.0)
-                denom = freq + self.k1 * (1.0 - self.b + self.b * doc_len / self._avgdl)
-                score += idf * (freq * (self.k1 + 1.0)) / denom
-            if score > 0.0:
-                scored[i] = score
-
-        ranked = sorted(scored.items(), key=lambda item: (-item[1], item[0]))
-        return ranked[:top_k]
+        for term in unique_terms:
+            doc_ids, freqs = self._postings[term]
+            idf = self._idf(len(doc_ids))
+            for doc_id, freq in zip(doc_ids, freqs, strict=True):
+                scored[doc_id] = scored.get(doc_id, 0.0) + idf * (freq * k1_plus_1) / (
+                    freq + norm[doc_id]
+                )
+
+        items = [item for item in scored.items() if item[1] > 0.0]
+        if 0 < top_k < len(items):
+            return heapq.nsmallest(top_k, items, key=_ranking_key)
+        return sorted(items, key=_ranking_key)[:top_k]
+
+    def _term_arrays(self, term: str) -> tuple[np.ndarray, np.ndarray]:
+        arrays = self._posting_arrays.get(term)
+        if arrays is None:
+            doc_ids, freqs = self._postings[term]
+            arrays = (
+                self._np.asarray(doc_ids, dtype=self._np.int64),
+                self._np.asarray(freqs, dtype=self._np.float64),
+            )
+            self._posting_arrays[term] = arrays
+        return arrays
+
+    def _query_numpy(self, unique_terms: list[str], top_k: int) -> list[tuple[int, float]]:
+        np = self._np
+        norm = self._norm_array
+        assert norm is not None
+        k1_plus_1 = self.k1 + 1.0
+        scores = np.zeros(len(self.chunks), dtype=np.float64)
+        for term in unique_terms:
+            doc_ids, freqs = self._term_arrays(term)
+            # Same operation order as the scalar path; a term's doc ids are unique, so the
+            # fancy-indexed `+=` adds exactly once per document.
+            idf = self._idf(len(doc_ids))
+            scores[doc_ids] += idf * (freqs * k1_plus_1) / (freqs + norm[doc_ids])
+
+        candidates = np.flatnonzero(scores > 0.0)
+        candidate_scores = scores[candidates]
+        if 0 < top_k < len(candidates):
+            # Keep everything tied with the k-th best score so the index tie-break below still
+            # sees every contender for the last slots.
+            kth_best = np.partition(candidate_scores, len(candidates) - top_k)[
+                len(candidates) - top_k
+            ]
+            keep = candidate_scores >= kth_best
+            candidates = candidates[keep]
+            candidate_scores = candidate_scores[keep]
+        order = np.lexsort((candidates, -candidate_scores))[:top_k]
+        return [(int(candidates[i]), float(candidate_scores[i])) for i in order]
@@ -46,8 +46,23 @@ from tensor_grep.core.retrieval_chunker import Chunk
 if TYPE_CHECKING:
     import numpy as np
 
+    from tensor_grep.core.embedding_cache import EmbeddingCache
+
 _DEFAULT_MODEL_SUBDIR = ("models", "potion-code-16M")
 
+# `TG_DENSE_INDEX` selects how `DenseIndex.query` searches the corpus matrix: `exact` (default,
+# every chunk scored) or `ivf` (an inverted-file coarse quantizer: only the chunks in the few
+# k-means cells nearest the query are scored). `hnsw` is accepted and served by the IVF path --
+# see `current_dense_index_mode`.
+DENSE_INDEX_ENV_VAR = "TG_DENSE_INDEX"
+DENSE_INDEX_MODES = ("exact", "ivf", "hnsw")
+# Below this many chunks an exact scan is already sub-millisecond; IVF only adds build time.
+_IVF_MIN_CHUNKS = 20_000
+_IVF_KMEANS_ITERATIONS = 8
+_IVF_SAMPLE_PER_LIST = 32
+_IVF_ASSIGN_BLOCK = 8192
+_hnsw_fallback_noted = False
+
 
 class DenseUnavailableError(RuntimeError):
     """The dense leg cannot run for a RECOVERABLE reason.
@@ -165,26 +180,155 @@ def _l2_normalize(matrix: np.ndarray) -> np.ndarray:
     return matrix / norms
 
 
+def current_dense_index_mode() -> str:
+    """The dense search mode ``DenseIndex.query`` uses right now, per ``TG_DENSE_INDEX``.
+
+    Unknown values mean ``exact``. ``hnsw`` resolves to ``ivf``: building a navigable graph in
+    pure Python/NumPy costs minutes on the corpora where an ANN index pays off at all, so the
+    coarse quantizer is the only approximate structure shipped; a one-line stderr note says so.
+    """
+    global _hnsw_fallback_noted
+    mode = os.environ.get(DENSE_INDEX_ENV_VAR, "exact").strip().lower()
+    if mode == "hnsw":
+        if not _hnsw_fallback_noted:
+            _hnsw_fallback_noted = True
+            print(
+                "tg: TG_DENSE_INDEX=hnsw is served by the ivf coarse quantizer (no graph index "
+                "is built)",
+                file=sys.stderr,
+            )
+        return "ivf"
+    return mode if mode in DENSE_INDEX_MODES else "exact"
+
+
+def _top_k(scores: np.ndarray, ids: np.ndarray, top_k: int) -> list[tuple[int, float]]:
+    """``(id, score)`` pairs by score desc, ties by ascending id -- the order
+    ``sorted(..., key=lambda item: (-item[1], item[0]))[:top_k]`` produces, without sorting
+    every score: ``argpartition`` finds the k-th best and only rows at or above it are sorted
+    (rows tied with it all survive, so the id tie-break still sees every contender)."""
+    import numpy as np
+
+    if 0 < top_k < len(scores):
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        keep = scores >= scores[best].min()
+        scores = scores[keep]
+        ids = ids[keep]
+    order = np.lexsort((ids, -scores))
+    return [(int(ids[i]), float(scores[i])) for i in order][:top_k]
+
+
+class _IvfIndex:
+    """Inverted-file coarse quantizer over L2-normalized rows (spherical k-means cells).
+
+    A query scores the ``n_lists`` centroids, keeps the ``nprobe`` nearest cells, and hands back
+    only those cells' row ids for exact scoring. Build is deterministic (fixed seed) so the same
+    corpus always yields the same cells.
+    """
+
+    def __init__(self, matrix: np.ndarray, *, n_lists: int, seed: int = 0) -> None:
+        import numpy as np
+
+        rows = matrix.shape[0]
+        rng = np.random.default_rng(seed)
+        sample_size = min(rows, n_lists * _IVF_SAMPLE_PER_LIST)
+        sample = matrix[np.sort(rng.choice(rows, size=sample_size, replace=False))]
+        centroids = sample[rng.choice(sample_size, size=n_lists, replace=False)].copy()
+        for _ in range(_IVF_KMEANS_ITERATIONS):
+            assignment = self._assign(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            filled = np.bincount(assignment, minlength=n_lists) > 0
+            # An emptied cell keeps its previous centroid rather than collapsing to zero.
+            centroids[filled] = _l2_normalize(sums[filled])
+        self.centroids = centroids
+        assignment = self._assign(matrix, centroids)
+        self._order = np.argsort(assignment, kind="stable")
+        self._offsets = np.searchsorted(assignment[self._order], np.arange(n_lists + 1))
+
+    @staticmethod
+    def _assign(rows: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        import numpy as np
+
+        assignment = np.empty(rows.shape[0], dtype=np.int64)
+        for start in range(0, rows.shape[0], _IVF_ASSIGN_BLOCK):
+            block = rows[start : start + _IVF_ASSIGN_BLOCK]
+            assignment[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+        return assignment
+
+    @property
+    def n_lists(self) -> int:
+        return int(self.centroids.shape[0])
+
+    def candidates(self, query_vec: np.ndarray, nprobe: int) -> np.ndarray:
+        import numpy as np
+
+        nprobe = max(1, min(nprobe, self.n_lists))
+        cell_scores = self.centroids @ query_vec
+        probed = np.argpartition(-cell_scores, nprobe - 1)[:nprobe]
+        ids = np.concatenate([
+            self._order[self._offsets[cell] : self._offsets[cell + 1]] for cell in probed
+        ])
+        ids.sort()
+        return ids
+
+
+def _ivf_nprobe(n_lists: int) -> int:
+    raw_value = os.environ.get("TG_DENSE_IVF_NPROBE")
+    if raw_value is not None:
+        try:
+            value = int(raw_value)
+        except ValueError:
+            value = 0
+        if value > 0:
+            return value
+    return max(8, n_lists // 16)
+
+
 class DenseIndex:
     """In-memory dense (cosine) index over a chunk corpus.
 
     Vectors are L2-normalized so a plain dot product IS cosine similarity. Chunk text is fed to
     the model RAW -- static embeddings tokenize internally, so this deliberately does NOT reuse
     ``retrieval_lexical.split_terms`` (that tokenizer stays the BM25 leg's alone).
+
+    With an ``embedding_cache`` (:class:`~tensor_grep.core.embedding_cache.EmbeddingCache`),
+    only chunks whose text is not already stored for this model are encoded, and the new
+    embeddings are persisted for the next run.
     """
 
-    def __init__(self, chunks: list[Chunk], model: Any) -> None:
+    def __init__(
+        self, chunks: list[Chunk], model: Any, *, embedding_cache: EmbeddingCache | None = None
+    ) -> None:
         import numpy as np
 
         self.chunks = list(chunks)
         self.model = model
+        self._ivf: _IvfIndex | None = None
         if not self.chunks:
             self._matrix: np.ndarray = np.zeros((0, 0), dtype=np.float32)
             return
 
-        vectors = _encode_matrix(model, [c.text for c in self.chunks])
+        texts = [c.text for c in self.chunks]
+        if embedding_cache is None:
+            vectors = _encode_matrix(model, texts)
+        else:
+            vectors = embedding_cache.embed(texts, lambda batch: _encode_matrix(model, batch))
+            embedding_cache.flush()
         self._matrix = _l2_normalize(vectors)
 
+    @property
+    def mode(self) -> str:
+        """``exact`` or ``ivf`` -- what :meth:`query` actually does for this corpus size."""
+        if len(self.chunks) >= _IVF_MIN_CHUNKS and current_dense_index_mode() == "ivf":
+            return "ivf"
+        return "exact"
+
+    def _ivf_index(self) -> _IvfIndex:
+        if self._ivf is None:
+            n_lists = max(1, min(len(self.chunks), round(len(self.chunks) ** 0.5)))
+            self._ivf = _IvfIndex(self._matrix, n_lists=n_lists)
+        return self._ivf
+
     @property
     def dim(self) -> int:
         return int(self._matrix.shape[1]) if self._matrix.size else 0
@@ -197,7 +341,13 @@ class DenseIndex:
         ``ValueError`` -- if the query embedding's dimensionality does not match the index's: a
         defensive shape check so a broken/inconsistent model degrades visibly (BM25-only) instead
         of crashing deep inside a numpy matrix multiply.
+
+        Under ``TG_DENSE_INDEX=ivf`` (on corpora of at least ``_IVF_MIN_CHUNKS`` chunks) only the
+        chunks in the ``TG_DENSE_IVF_NPROBE`` nearest k-means cells are scored, so a relevant chunk
+        in an unprobed cell can be missed; the exact default scores every chunk.
         """
+        import numpy as np
+
         if not self.chunks or self._matrix.size == 0:
             return []
 
@@ -209,9 +359,12 @@ class DenseIndex:
                 "(dim mismatch)"
             )
         query_vec = _l2_normalize(query_matrix)[0]
+        if self.mode == "ivf":
+            ivf = self._ivf_index()
+            ids = ivf.candidates(query_vec, _ivf_nprobe(ivf.n_lists))
+            return _top_k(self._matrix[ids] @ query_vec, ids, top_k)
         scores = self._matrix @ query_vec
-        ranked = sorted(enumerate(scores.tolist()), key=lambda item: (-item[1], item[0]))
-        return ranked[:top_k]
+        return _top_k(scores, np.arange(len(scores)), top_k)
 
 
 # ---------------------------------------------------------------------------------------------
@@ -59,8 +59,10 @@ import os
 import shutil
 import sys
 import tempfile
+import threading
 import time
 import urllib.request
+from collections import OrderedDict
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
@@ -71,6 +73,12 @@ from tensor_grep.backends.base import BackendExecutionError
 if TYPE_CHECKING:
     import numpy as np
 
+# Upper bound on padded doc-token values per MaxSim matmul block (16M float32 = 64 MiB), so one
+# very long chunk in a pool cannot pad every other chunk in it out to its length.
+_MAXSIM_BLOCK_ELEMENTS = 16 * 1024 * 1024
+# Per-process budget for cached document token matrices (see TokenEmbeddingCache).
+_TOKEN_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 
 def maxsim_scores(query_matrix: np.ndarray, doc_matrices: Sequence[np.ndarray]) -> list[float]:
     """MaxSim(query, doc) for each doc in ``doc_matrices``, returned in the same order.
@@ -81,16 +89,43 @@ def maxsim_scores(query_matrix: np.ndarray, doc_matrices: Sequence[np.ndarray])
 
     A doc with zero tokens (an empty ``(0, D)`` matrix) scores 0.0 -- there is nothing to compare
     against, and numpy's ``.max(axis=1)`` would otherwise raise on a zero-size reduction.
+
+    Batched: docs are zero-padded into ``(N, Tmax, D)`` blocks (at most
+    ``_MAXSIM_BLOCK_ELEMENTS`` padded values each) and scored with one matmul per block; padded
+    token rows are masked to ``-inf`` before the max, so they can never win it.
     """
     import numpy as np
 
-    scores: list[float] = []
-    for doc_matrix in doc_matrices:
-        if query_matrix.size == 0 or doc_matrix.size == 0:
-            scores.append(0.0)
-            continue
-        similarity = query_matrix @ doc_matrix.T  # (Tq, Td)
-        scores.append(float(np.max(similarity, axis=1).sum()))
+    scores = [0.0] * len(doc_matrices)
+    if query_matrix.size == 0:
+        return scores
+    live = [position for position, doc in enumerate(doc_matrices) if doc.size]
+    query_t = np.ascontiguousarray(query_matrix.T)
+    dim = query_matrix.shape[1]
+    start = 0
+    while start < len(live):
+        # Grow the block while its padded size stays under the cap (always at least one doc).
+        longest = doc_matrices[live[start]].shape[0]
+        stop = start + 1
+        while stop < len(live):
+            longest_next = max(longest, doc_matrices[live[stop]].shape[0])
+            if (stop - start + 1) * longest_next * dim > _MAXSIM_BLOCK_ELEMENTS:
+                break
+            longest = longest_next
+            stop += 1
+        block = live[start:stop]
+        lengths = np.array([doc_matrices[position].shape[0] for position in block])
+        padded = np.zeros(
+            (len(block), longest, dim), dtype=np.result_type(query_matrix, np.float32)
+        )
+        for row, position in enumerate(block):
+            padded[row, : lengths[row]] = doc_matrices[position]
+        similarity = padded @ query_t  # (N, Tmax, Tq)
+        similarity[np.arange(longest)[None, :] >= lengths[:, None]] = -np.inf
+        block_scores = similarity.max(axis=1).sum(axis=1)
+        for row, position in enumerate(block):
+            scores[position] = float(block_scores[row])
+        start = stop
     return scores
 
 
@@ -108,6 +143,75 @@ def rank_by_maxsim(scores: Sequence[float], indices: Sequence[int]) -> list[int]
     return [idx for idx, _ in sorted(paired, key=lambda pair: (-pair[1], pair[0]))]
 
 
+class TokenEmbeddingCache:
+    """Bounded LRU of document token matrices keyed by a BLAKE2b digest of the chunk text.
+
+    Shared by every :class:`LateReranker` built for one model in this process, so a long-lived
+    server (MCP, session daemon) encodes an unchanged chunk once rather than on every query that
+    pools it. Thread-safe: ``rerank_hybrid`` runs the rerank on a worker thread.
+    """
+
+    def __init__(self, max_bytes: int = _TOKEN_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        return hashlib.blake2b(
+            text.encode("utf-8", errors="surrogatepass"), digest_size=16
+        ).digest()
+
+    def get(self, key: bytes) -> np.ndarray | None:
+        with self._lock:
+            matrix = self._entries.get(key)
+            if matrix is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return matrix
+
+    def put(self, key: bytes, matrix: np.ndarray) -> None:
+        if matrix.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = matrix
+            self._bytes += matrix.nbytes
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+
+_TOKEN_CACHES: dict[str, TokenEmbeddingCache] = {}
+_TOKEN_CACHES_LOCK = threading.Lock()
+
+
+def _token_cache_for(model_dir: str | Path) -> TokenEmbeddingCache:
+    """The process-wide document token cache for the model files currently at ``model_dir``."""
+    path = Path(model_dir).resolve()
+    stamps = []
+    for name in _REQUIRED_MODEL_FILES:
+        try:
+            stat_result = (path / name).stat()
+        except OSError:
+            stamps.append(f"{name}:missing")
+            continue
+        stamps.append(f"{name}:{stat_result.st_size}:{stat_result.st_mtime_ns}")
+    cache_key = f"{path}|{'|'.join(stamps)}"
+    with _TOKEN_CACHES_LOCK:
+        cache = _TOKEN_CACHES.get(cache_key)
+        if cache is None:
+            cache = _TOKEN_CACHES[cache_key] = TokenEmbeddingCache()
+        return cache
+
+
 class LateReranker:
     """Order-only MaxSim reranker over an already-pooled candidate set.
 
@@ -123,15 +227,32 @@ class LateReranker:
     contract, so existing callers (and their order-only tests) are unaffected. See
     :func:`load_late_reranker` for the real ONNX wiring that supplies role-correct encoders
     (``[Q] `` vs ``[D] `` prefix + per-role max length) via :func:`build_late_encoder`.
+
+    ``token_cache`` (optional): a :class:`TokenEmbeddingCache` consulted before ``encode`` for
+    every candidate chunk. It must only ever be shared between rerankers whose ``encode`` is the
+    same model and role -- :func:`load_late_reranker` keys it by the model files.
     """
 
     def __init__(
         self,
         encode: Callable[[str], np.ndarray],
         encode_query: Callable[[str], np.ndarray] | None = None,
+        *,
+        token_cache: TokenEmbeddingCache | None = None,
     ) -> None:
         self._encode = encode
         self._encode_query = encode_query
+        self._token_cache = token_cache
+
+    def _encode_document(self, text: str) -> np.ndarray:
+        if self._token_cache is None:
+            return self._encode(text)
+        key = TokenEmbeddingCache.key(text)
+        matrix = self._token_cache.get(key)
+        if matrix is None:
+            matrix = self._encode(text)
+            self._token_cache.put(key, matrix)
+        return matrix
 
     def rerank(self, query: str, chunks: list[str], indices: list[int]) -> list[int]:
         """Return ``indices`` permuted by MaxSim(query, chunk) descending; ties break by
@@ -150,7 +271,7 @@ class LateReranker:
         if not indices:
             return []
         query_matrix = (self._encode_query or self._encode)(query)
-        doc_matrices = [self._encode(chunk) for chunk in chunks]
+        doc_matrices = [self._encode_document(chunk) for chunk in chunks]
         scores = maxsim_scores(query_matrix, doc_matrices)
         return rank_by_maxsim(scores, indices)
 
@@ -368,6 +489,7 @@ def load_late_reranker(model_dir: str | Path | None = None) -> LateReranker:
     return LateReranker(
         build_late_encoder(model, is_query=False),
         encode_query=build_late_encoder(model, is_query=True),
+        token_cache=_token_cache_for(resolved_dir),
     )
 
 
@@ -2,38 +2,108 @@
 
 Layout under the index dir (default ``<root>/.tg_semantic_index/``, overridable via
 ``TG_SEMANTIC_INDEX_DIR``):
-- ``bm25_chunks.json`` -- the chunk corpus ``[{file_path, start_line, end_line, text}, ...]``
-- ``bm25_meta.json``   -- ``{fingerprint, file_count, chunk_count, version, files}``
-
-Staleness mirrors (does not duplicate) the Rust index.rs mtime semantics: a fingerprint over the
-indexed files' paths + mtimes is stored at build time and re-checked at load; a mismatch warns and
-returns ``None`` so the caller falls back to the unranked path rather than serving stale results.
-
-NOTE: this persisted-index acceleration is NOT yet wired into the CLI. The live ``tg search --rank``
-path ranks in-memory via :mod:`tensor_grep.core.reranker`; there is intentionally no ``tg index``
-command yet. These helpers are the building blocks for a future indexed-acceleration command — the
-stderr messages therefore describe the in-memory fallback rather than instructing a command that
-does not exist.
+- ``bm25_meta.json``     -- ``{fingerprint, file_count, chunk_count, version, chunker_mode,
+  chunk_size, overlap, corpus, files: {abs_path: [size, mtime_ns, chunk_count, chunk_path]}}``
+- ``corpus-<hex>.tgsi``  -- the columnar corpus named by ``meta["corpus"]`` (all integers
+  little-endian)::
+
+      header           _CORPUS_HEADER: magic, format version, chunk/term/file counts, the summed
+                       document length, and the byte offset of each section below
+      file ids         chunk_count x uint32 -- index into ``files`` (chunks are grouped by file)
+      start/end lines  chunk_count x uint32 each
+      doc lengths      chunk_count x uint32 -- BM25 token count per chunk
+      text offsets     (chunk_count + 1) x uint64 into the text blob
+      text blob        each chunk's UTF-8 text, zlib-compressed on its own
+      term offsets     (term_count + 1) x uint64 into the term bytes
+      term bytes       the UTF-8 terms, sorted bytewise, back to back
+      posting offsets  (term_count + 1) x uint64 into the postings blob
+      id lengths       term_count x uint32 -- byte length of each term's doc-id run
+      postings         per term: ascending doc ids (LEB128 first-value-then-deltas, shared with
+                       the line-trigram index), then its term frequencies as plain LEB128 varints
+                       (written and read as the deltas of their running total, so the same two
+                       helpers cover both runs)
+
+The corpus is opened through ``mmap``: loading it parses only the header, the fixed-width columns
+are zero-copy ``memoryview`` casts, a query term is found by bisecting the term table and only its
+posting bytes are decoded, and a chunk's text is decompressed the first time it is indexed. So
+answering one query costs the posting lists it touches rather than a full ``json.loads`` of every
+chunk plus a from-scratch :class:`Bm25Index` build. Each rebuild writes a fresh ``corpus-<hex>``
+file and then atomically swaps the meta, so a reader never sees a torn meta/corpus pair.
+
+Built by ``tg index semantic``. Staleness is tracked PER FILE: a file's chunks are reused only
+while its size and mtime match the stamp recorded when it was chunked (a file written within
+`_RACY_WINDOW_NS` of being chunked or looked up is always re-chunked), so a rebuild
+(:func:`update_index`) re-chunks just the files that changed, and :class:`SemanticChunkCache`
+lets ``tg find`` and ``tg search --rank`` take unchanged files' chunks from disk instead of
+re-reading and re-chunking them. ``tg find`` writes its refreshed corpus back after a complete
+walk of the index's own root, so repeated queries keep the index fresh for free, and when nothing
+changed it ranks straight off the stored postings.
+
+:func:`load_or_warn` keeps the original all-or-nothing contract: the whole-corpus fingerprint over
+the indexed paths + mtimes is re-checked at load, and a mismatch warns and returns ``None`` so the
+caller falls back to the in-memory path rather than serving stale results.
 """
 
 from __future__ import annotations
 
+import dataclasses
 import hashlib
+import itertools
 import json
+import mmap
 import os
+import struct
 import sys
+import time
+import zlib
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Literal, overload
+from uuid import uuid4
 
+from tensor_grep.core.line_trigram_index import decode_varint_deltas, encode_varint_deltas
 from tensor_grep.core.retrieval_bm25 import Bm25Index
 from tensor_grep.core.retrieval_chunker import Chunk, chunk_file, current_chunker_mode
 
-# v2 (was 1): folds the active chunker mode (fixed-window vs cAST structural, TG_CHUNKER) into the
-# schema so a structural-chunked index can never silently fuse with -- or be silently reused by --
-# a stale fixed-window index (or vice versa). See ``load_or_warn``'s version+mode check below and
-# ``retrieval_chunker.current_chunker_mode``'s docstring for the bug class this closes.
-INDEX_VERSION: int = 2
-_CHUNKS_NAME = "bm25_chunks.json"
+# v4 (was 3): the chunk corpus moved from ``bm25_chunks.json`` into the mmap-able columnar
+# ``corpus-<hex>.tgsi`` file named by the meta. v3 added per-file ``[size, mtime_ns,
+# chunk_count]`` stamps plus the chunk_size/overlap the corpus was cut with, so a rebuild can
+# splice unchanged files' chunks back in. v2 folded the active chunker mode (fixed-window vs cAST
+# structural, TG_CHUNKER) into the schema so a structural-chunked index can never silently fuse
+# with -- or be silently reused by -- a stale fixed-window index (or vice versa). See
+# ``load_or_warn``'s version+mode check below and ``retrieval_chunker.current_chunker_mode``'s
+# docstring for the bug class this closes.
+INDEX_VERSION: int = 4
+_LEGACY_CHUNKS_NAME = "bm25_chunks.json"
 _META_NAME = "bm25_meta.json"
+_INDEX_DIR_NAME = ".tg_semantic_index"
+_CORPUS_SUFFIX = ".tgsi"
+_CORPUS_MAGIC = b"TGSI"
+_CORPUS_FORMAT_VERSION = 1
+_SECTIONS = (
+    "file_ids",
+    "start_lines",
+    "end_lines",
+    "doc_lens",
+    "text_offsets",
+    "text",
+    "term_offsets",
+    "term_bytes",
+    "posting_offsets",
+    "id_lengths",
+    "postings",
+)
+# magic, format version, reserved, chunk/term/file counts, summed doc length, each section's
+# start offset, then the end-of-file offset.
+_CORPUS_HEADER = struct.Struct("<4sHHIIIQ" + "Q" * (len(_SECTIONS) + 1))
+_TEXT_COMPRESSION_LEVEL = 1
+# Wider than any common filesystem's timestamp granularity (FAT 2s, HFS+/ext3 1s, coarse clocks).
+_RACY_WINDOW_NS = 2_000_000_000
+# Recorded for a file chunked within that window of its last write. No stat matches it, so the
+# file is re-chunked next time rather than trusted past a same-size rewrite in the same tick.
+_UNTRUSTED_MTIME_NS = -1
 
 
 def default_index_dir(root: str | None = None) -> Path:
@@ -42,7 +112,22 @@ def default_index_dir(root: str | None = None) -> Path:
     if env:
         return Path(env)
     base = Path(root) if root else Path.cwd()
-    return base / ".tg_semantic_index"
+    return base / _INDEX_DIR_NAME
+
+
+def discover_index_dir(paths: Sequence[str]) -> Path | None:
+    """The index dir covering ``paths[0]``: ``TG_SEMANTIC_INDEX_DIR``, else the nearest
+    ``.tg_semantic_index`` in it or an ancestor directory. ``None`` when there is no built index."""
+    env = os.environ.get("TG_SEMANTIC_INDEX_DIR")
+    if env:
+        return Path(env) if (Path(env) / _META_NAME).is_file() else None
+    start = Path(paths[0] if paths else ".").resolve()
+    if not start.is_dir():
+        start = start.parent
+    for directory in (start, *start.parents):
+        if (directory / _INDEX_DIR_NAME / _META_NAME).is_file():
+            return directory / _INDEX_DIR_NAME
+    return None
 
 
 def compute_fingerprint(file_paths: list[str]) -> str:
@@ -57,47 +142,593 @@ def compute_fingerprint(file_paths: list[str]) -> str:
     return digest.hexdigest()
 
 
-def build_and_save(
+def _is_racy(stat_result: os.stat_result) -> bool:
+    return time.time_ns() - stat_result.st_mtime_ns < _RACY_WINDOW_NS
+
+
+def _column_bytes(typecode: str, values: Sequence[int]) -> bytes:
+    column = array(typecode, values)
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column.tobytes()
+
+
+def _column(data: mmap.mmap, start: int, end: int, typecode: Literal["I", "Q"]) -> Sequence[int]:
+    view = memoryview(data)[start:end]
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    column = array(typecode, view.tobytes())
+    column.byteswap()
+    return column
+
+
+class _MappedCorpus:
+    """``mmap``-backed view of one ``corpus-<hex>.tgsi`` file (see the module docstring)."""
+
+    def __init__(self, data: mmap.mmap, counts: Sequence[int], sections: Sequence[int]) -> None:
+        self._data = data
+        self.chunk_count, self.term_count, self.file_count, self.total_doc_len = counts
+        self._sections = dict(zip(_SECTIONS, sections, strict=False))
+        self._end = sections[-1]
+        n = self.chunk_count
+        self.file_ids = self._u32("file_ids", n)
+        self.start_lines = self._u32("start_lines", n)
+        self.end_lines = self._u32("end_lines", n)
+        self.doc_lens = self._u32("doc_lens", n)
+        self.id_lengths = self._u32("id_lengths", self.term_count)
+        self.text_offsets = self._u64("text_offsets", n + 1)
+        self.term_offsets = self._u64("term_offsets", self.term_count + 1)
+        self.posting_offsets = self._u64("posting_offsets", self.term_count + 1)
+
+    def _u32(self, section: str, count: int) -> Sequence[int]:
+        start = self._sections[section]
+        return _column(self._data, start, start + 4 * count, "I")
+
+    def _u64(self, section: str, count: int) -> Sequence[int]:
+        start = self._sections[section]
+        return _column(self._data, start, start + 8 * count, "Q")
+
+    @classmethod
+    def open(cls, path: Path) -> _MappedCorpus | None:
+        try:
+            with open(path, "rb") as handle:
+                data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        corpus = cls._validated(data)
+        if corpus is None:
+            data.close()
+        return corpus
+
+    @classmethod
+    def _validated(cls, data: mmap.mmap) -> _MappedCorpus | None:
+        try:
+            magic, version, _reserved, *fields = _CORPUS_HEADER.unpack_from(data, 0)
+        except struct.error:
+            return None
+        counts, sections = fields[:4], fields[4:]
+        chunk_count, term_count = counts[0], counts[1]
+        fixed_widths = {
+            "file_ids": 4 * chunk_count,
+            "start_lines": 4 * chunk_count,
+            "end_lines": 4 * chunk_count,
+            "doc_lens": 4 * chunk_count,
+            "text_offsets": 8 * (chunk_count + 1),
+            "term_offsets": 8 * (term_count + 1),
+            "posting_offsets": 8 * (term_count + 1),
+            "id_lengths": 4 * term_count,
+        }
+        if (
+            magic != _CORPUS_MAGIC
+            or version != _CORPUS_FORMAT_VERSION
+            or sections[0] != _CORPUS_HEADER.size
+            or sections[-1] != len(data)
+            or any(later < earlier for earlier, later in itertools.pairwise(sections))
+            or any(
+                sections[position + 1] - sections[position] != fixed_widths[name]
+                for position, name in enumerate(_SECTIONS)
+                if name in fixed_widths
+            )
+        ):
+            return None
+        corpus = cls(data, counts, sections)
+        # The variable-width blobs must end exactly where their offset columns say they do.
+        if (
+            corpus.text_offsets[chunk_count] != corpus._span("text")
+            or corpus.term_offsets[term_count] != corpus._span("term_bytes")
+            or corpus.posting_offsets[term_count] != corpus._span("postings")
+        ):
+            return None
+        return corpus
+
+    def _span(self, section: str) -> int:
+        position = _SECTIONS.index(section)
+        following = _SECTIONS[position + 1] if position + 1 < len(_SECTIONS) else None
+        end = self._sections[following] if following is not None else self._end
+        return end - self._sections[section]
+
+    def text(self, chunk_id: int) -> str:
+        base = self._sections["text"]
+        start, end = self.text_offsets[chunk_id], self.text_offsets[chunk_id + 1]
+        return zlib.decompress(self._data[base + start : base + end]).decode(
+            "utf-8", errors="surrogatepass"
+        )
+
+    def term(self, position: int) -> bytes:
+        base = self._sections["term_bytes"]
+        return self._data[
+            base + self.term_offsets[position] : base + self.term_offsets[position + 1]
+        ]
+
+    def find_term(self, term: bytes) -> int | None:
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            if self.term(middle) < term:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.term_count and self.term(low) == term:
+            return low
+        return None
+
+    def postings(self, position: int) -> tuple[list[int], list[int]]:
+        base = self._sections["postings"]
+        start = base + self.posting_offsets[position]
+        end = base + self.posting_offsets[position + 1]
+        split = start + self.id_lengths[position]
+        totals = decode_varint_deltas(self._data, split, end)
+        return (
+            decode_varint_deltas(self._data, start, split),
+            [total - previous for previous, total in itertools.pairwise([0, *totals])],
+        )
+
+
+class _MappedChunks(Sequence[Chunk]):
+    """Lazily decoded ``Chunk`` objects for the corpus range ``[start, stop)``."""
+
+    def __init__(self, corpus: _MappedCorpus, paths: Sequence[str], start: int, stop: int) -> None:
+        self._corpus = corpus
+        self._paths = paths
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> Chunk: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Chunk]: ...
+
+    def __getitem__(self, index: int | slice) -> Chunk | list[Chunk]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        chunk_id = self._start + index
+        corpus = self._corpus
+        return Chunk(
+            file_path=self._paths[corpus.file_ids[chunk_id]],
+            start_line=corpus.start_lines[chunk_id],
+            end_line=corpus.end_lines[chunk_id],
+            text=corpus.text(chunk_id),
+        )
+
+
+class _MappedPostings(Mapping[str, tuple[list[int], list[int]]]):
+    """The corpus term dictionary as the ``term -> (doc_ids, freqs)`` mapping Bm25Index reads."""
+
+    def __init__(self, corpus: _MappedCorpus) -> None:
+        self._corpus = corpus
+        self._decoded: dict[str, tuple[list[int], list[int]] | None] = {}
+
+    def _lookup(self, term: str) -> tuple[list[int], list[int]] | None:
+        if term not in self._decoded:
+            position = self._corpus.find_term(term.encode("utf-8", errors="surrogatepass"))
+            self._decoded[term] = None if position is None else self._corpus.postings(position)
+        return self._decoded[term]
+
+    def __contains__(self, term: object) -> bool:
+        return isinstance(term, str) and self._lookup(term) is not None
+
+    def __getitem__(self, term: str) -> tuple[list[int], list[int]]:
+        postings = self._lookup(term)
+        if postings is None:
+            raise KeyError(term)
+        return postings
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self._corpus.term_count):
+            yield self._corpus.term(position).decode("utf-8", errors="surrogatepass")
+
+    def __len__(self) -> int:
+        return self._corpus.term_count
+
+
+def _mapped_bm25_index(corpus: _MappedCorpus, paths: Sequence[str]) -> Bm25Index:
+    return Bm25Index.from_postings(
+        _MappedChunks(corpus, paths, 0, corpus.chunk_count),
+        _MappedPostings(corpus),
+        corpus.doc_lens,
+        corpus.total_doc_len,
+    )
+
+
+def _encode_corpus(chunks: Sequence[Chunk], file_ids: Sequence[int], index: Bm25Index) -> bytes:
+    texts = [
+        zlib.compress(chunk.text.encode("utf-8", errors="surrogatepass"), _TEXT_COMPRESSION_LEVEL)
+        for chunk in chunks
+    ]
+    text_offsets = [0]
+    for text in texts:
+        text_offsets.append(text_offsets[-1] + len(text))
+
+    terms = sorted(
+        (term.encode("utf-8", errors="surrogatepass"), doc_ids, freqs)
+        for term, doc_ids, freqs in index.iter_postings()
+    )
+    term_offsets = [0]
+    posting_offsets = [0]
+    id_lengths: list[int] = []
+    postings: list[bytes] = []
+    for term, doc_ids, freqs in terms:
+        term_offsets.append(term_offsets[-1] + len(term))
+        encoded_ids = encode_varint_deltas(doc_ids)
+        encoded_freqs = encode_varint_deltas(itertools.accumulate(freqs))
+        id_lengths.append(len(encoded_ids))
+        postings.append(encoded_ids + encoded_freqs)
+        posting_offsets.append(posting_offsets[-1] + len(encoded_ids) + len(encoded_freqs))
+
+    sections = [
+        _column_bytes("I", file_ids),
+        _column_bytes("I", [chunk.start_line for chunk in chunks]),
+        _column_bytes("I", [chunk.end_line for chunk in chunks]),
+        _column_bytes("I", index.doc_lengths),
+        _column_bytes("Q", text_offsets),
+        b"".join(texts),
+        _column_bytes("Q", term_offsets),
+        b"".join(term for term, _doc_ids, _freqs in terms),
+        _column_bytes("Q", posting_offsets),
+        _column_bytes("I", id_lengths),
+        b"".join(postings),
+    ]
+    offsets = [_CORPUS_HEADER.size]
+    for section in sections:
+        offsets.append(offsets[-1] + len(section))
+    header = _CORPUS_HEADER.pack(
+        _CORPUS_MAGIC,
+        _CORPUS_FORMAT_VERSION,
+        0,
+        len(chunks),
+        len(terms),
+        (max(file_ids) + 1) if file_ids else 0,
+        sum(index.doc_lengths),
+        *offsets,
+    )
+    return header + b"".join(sections)
+
+
+def _remove_orphans(index_dir: Path, corpus_name: str) -> None:
+    """Delete corpus files (and a pre-v4 JSON corpus) the current meta no longer references.
+
+    A reader that loaded the previous meta may still have one mapped; on POSIX unlinking it is
+    harmless, and on Windows the delete fails and is retried by the next save.
+    """
+    for path in (*index_dir.glob(f"corpus-*{_CORPUS_SUFFIX}"), index_dir / _LEGACY_CHUNKS_NAME):
+        if path.name != corpus_name:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+@dataclass(frozen=True)
+class _FileEntry:
+    size: int
+    mtime_ns: int
+    chunks: Sequence[Chunk]
+
+
+@dataclass(frozen=True)
+class SemanticIndexBuildReport:
+    index_dir: str
+    indexed_files: int
+    chunk_count: int
+    reused_files: int
+    chunked_files: int
+    removed_files: int
+    full_rebuild: bool
+    elapsed_ms: float
+
+
+def _read_meta(index_dir: Path) -> dict[str, Any] | None:
+    try:
+        meta = json.loads((index_dir / _META_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return meta if isinstance(meta, dict) else None
+
+
+def _open_corpus(
+    index_dir: Path, meta: dict[str, Any]
+) -> tuple[_MappedCorpus, list[str], dict[str, _FileEntry]] | None:
+    """Map the corpus ``meta`` names and split it into per-file entries; ``None`` if unusable."""
+    files = meta.get("files")
+    corpus_name = meta.get("corpus")
+    if not isinstance(files, dict) or not isinstance(corpus_name, str):
+        return None
+    corpus = _MappedCorpus.open(index_dir / Path(corpus_name).name)
+    if corpus is None or corpus.chunk_count != meta.get("chunk_count"):
+        return None
+    paths: list[str] = []
+    entries: dict[str, _FileEntry] = {}
+    offset = 0
+    try:
+        for key, (size, mtime_ns, chunk_count, chunk_path) in files.items():
+            paths.append(chunk_path)
+            entries[key] = _FileEntry(
+                size, mtime_ns, _MappedChunks(corpus, paths, offset, offset + chunk_count)
+            )
+            offset += chunk_count
+    except (TypeError, ValueError):
+        return None
+    if offset != corpus.chunk_count or len(paths) < corpus.file_count:
+        return None
+    return corpus, paths, entries
+
+
+class SemanticChunkCache:
+    """Per-file chunk lists from a persisted index, reused while a file's size and mtime hold.
+
+    :meth:`chunk` is a drop-in for :func:`chunk_file`: it returns the stored chunks for an
+    unchanged file and re-chunks anything else. Every file passed through it is remembered, so
+    :meth:`save` can persist exactly the corpus the caller just ranked.
+    """
+
+    def __init__(
+        self,
+        index_dir: Path,
+        entries: dict[str, _FileEntry] | None = None,
+        *,
+        chunk_size: int = 30,
+        overlap: int = 5,
+        corpus: tuple[_MappedCorpus, list[str]] | None = None,
+    ) -> None:
+        self.index_dir = index_dir
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.reused_files = 0
+        self.chunked_files = 0
+        self._entries: dict[str, _FileEntry] = entries or {}
+        self._seen: dict[str, _FileEntry] = {}
+        self._corpus = corpus
+        self._respelled = False
+
+    @classmethod
+    def load(
+        cls, index_dir: Path, *, chunk_size: int = 30, overlap: int = 5
+    ) -> SemanticChunkCache | None:
+        """The cache persisted at ``index_dir``, or ``None`` if it is missing, was built with a
+        different schema / chunker mode / chunk geometry, or is torn. Silent: a caller without a
+        usable cache simply chunks everything, exactly as it would with no index at all."""
+        meta = _read_meta(index_dir)
+        if (
+            meta is None
+            or meta.get("version") != INDEX_VERSION
+            or meta.get("chunker_mode") != current_chunker_mode()
+            or meta.get("chunk_size") != chunk_size
+            or meta.get("overlap") != overlap
+        ):
+            return None
+        opened = _open_corpus(index_dir, meta)
+        if opened is None:
+            return None
+        corpus, paths, entries = opened
+        return cls(
+            index_dir, entries, chunk_size=chunk_size, overlap=overlap, corpus=(corpus, paths)
+        )
+
+    @classmethod
+    def discover(cls, paths: Sequence[str]) -> SemanticChunkCache | None:
+        """:meth:`load` the index :func:`discover_index_dir` finds for ``paths``, if any."""
+        index_dir = discover_index_dir(paths)
+        return cls.load(index_dir) if index_dir is not None else None
+
+    @property
+    def changed(self) -> bool:
+        """Whether :meth:`save` would write anything different from what is on disk."""
+        return self.chunked_files > 0 or self._seen.keys() != self._entries.keys()
+
+    @property
+    def removed_files(self) -> int:
+        return len(self._entries.keys() - self._seen.keys())
+
+    def chunk(self, path: str) -> list[Chunk]:
+        """``chunk_file(path)``, served from the cache when ``path`` is unchanged since indexing.
+
+        Raises whatever :func:`chunk_file` raises for a file that has to be re-chunked.
+        """
+        key = os.path.abspath(path)
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return chunk_file(path, chunk_size=self.chunk_size, overlap=self.overlap)
+        entry = self._entries.get(key)
+        racy = _is_racy(stat_result)
+        if (
+            entry is not None
+            and not racy
+            and entry.size == stat_result.st_size
+            and entry.mtime_ns == stat_result.st_mtime_ns
+        ):
+            self.reused_files += 1
+            chunks = list(entry.chunks)
+            if chunks and chunks[0].file_path != path:
+                # Callers match chunks back to results by path spelling ("src/a.py" vs the
+                # absolute path the index was built from), so hand back the caller's spelling.
+                chunks = [dataclasses.replace(chunk, file_path=path) for chunk in chunks]
+                self._respelled = True
+        else:
+            # Stamped from the stat taken BEFORE reading: a write racing the read leaves a newer
+            # mtime on disk, so the next lookup re-chunks instead of trusting a torn read.
+            chunks = chunk_file(path, chunk_size=self.chunk_size, overlap=self.overlap)
+            self.chunked_files += 1
+            mtime_ns = _UNTRUSTED_MTIME_NS if racy else stat_result.st_mtime_ns
+            entry = _FileEntry(stat_result.st_size, mtime_ns, chunks)
+        self._seen[key] = entry
+        return chunks
+
+    def stored_index(self) -> Bm25Index | None:
+        """The persisted BM25 index, when it covers exactly the files seen so far, unchanged and
+        in the same order and path spelling -- i.e. exactly what ``Bm25Index`` over the chunks
+        :meth:`chunk` returned would build."""
+        if (
+            self._corpus is None
+            or self.chunked_files
+            or self._respelled
+            or list(self._seen) != list(self._entries)
+        ):
+            return None
+        corpus, paths = self._corpus
+        return _mapped_bm25_index(corpus, paths)
+
+    def save(self, index: Bm25Index | None = None) -> None:
+        """Atomically persist every file seen by :meth:`chunk`, in the order it was seen.
+
+        ``index`` may pass in a :class:`Bm25Index` the caller already built over exactly those
+        chunks, in that order, so it is not rebuilt here.
+        """
+        from tensor_grep.cli._index_lock import atomic_write_bytes, index_lock
+
+        chunks: list[Chunk] = []
+        file_ids: list[int] = []
+        files: dict[str, list[Any]] = {}
+        for file_id, (path, entry) in enumerate(self._seen.items()):
+            file_chunks = list(entry.chunks)
+            chunks.extend(file_chunks)
+            file_ids.extend([file_id] * len(file_chunks))
+            chunk_path = file_chunks[0].file_path if file_chunks else path
+            files[path] = [entry.size, entry.mtime_ns, len(file_chunks), chunk_path]
+        if index is None:
+            index = Bm25Index(chunks)
+        corpus_name = f"corpus-{uuid4().hex}{_CORPUS_SUFFIX}"
+        meta = {
+            "fingerprint": compute_fingerprint(list(self._seen)),
+            "file_count": len(self._seen),
+            "chunk_count": len(chunks),
+            "version": INDEX_VERSION,
+            "chunker_mode": current_chunker_mode(),
+            "chunk_size": self.chunk_size,
+            "overlap": self.overlap,
+            "corpus": corpus_name,
+            "files": files,
+        }
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        with index_lock(self.index_dir / _META_NAME):
+            atomic_write_bytes(
+                self.index_dir / corpus_name, _encode_corpus(chunks, file_ids, index)
+            )
+            atomic_write_bytes(self.index_dir / _META_NAME, json.dumps(meta).encode("utf-8"))
+            _remove_orphans(self.index_dir, corpus_name)
+
+
+def update_index(
     file_paths: list[str],
     index_dir: Path,
     *,
     chunk_size: int = 30,
     overlap: int = 5,
-) -> Bm25Index:
-    """Chunk all files, build a :class:`Bm25Index`, and persist it (+ fingerprint) to ``index_dir``."""
+    full: bool = False,
+) -> tuple[Bm25Index, SemanticIndexBuildReport]:
+    """Bring the index at ``index_dir`` up to date with ``file_paths``, re-chunking only files
+    whose size or mtime changed (every file when ``full`` or no compatible index exists)."""
+    started = time.perf_counter()
+    cache = (
+        None if full else SemanticChunkCache.load(index_dir, chunk_size=chunk_size, overlap=overlap)
+    )
+    full_rebuild = cache is None
+    if cache is None:
+        cache = SemanticChunkCache(index_dir, chunk_size=chunk_size, overlap=overlap)
     chunks: list[Chunk] = []
     for path in file_paths:
-        chunks.extend(chunk_file(path, chunk_size=chunk_size, overlap=overlap))
-    index = Bm25Index(chunks)
-
-    index_dir.mkdir(parents=True, exist_ok=True)
-    chunk_records = [
-        {
-            "file_path": c.file_path,
-            "start_line": c.start_line,
-            "end_line": c.end_line,
-            "text": c.text,
-        }
-        for c in chunks
-    ]
-    (index_dir / _CHUNKS_NAME).write_text(json.dumps(chunk_records), encoding="utf-8")
-    meta = {
-        "fingerprint": compute_fingerprint(file_paths),
-        "file_count": len(file_paths),
-        "chunk_count": len(chunks),
-        "version": INDEX_VERSION,
-        "chunker_mode": current_chunker_mode(),
-        "files": sorted(file_paths),
-    }
-    (index_dir / _META_NAME).write_text(json.dumps(meta), encoding="utf-8")
+        chunks.extend(cache.chunk(path))
+    index = cache.stored_index()
+    if index is None:
+        index = Bm25Index(chunks)
+        cache.save(index)
+    report = SemanticIndexBuildReport(
+        index_dir=str(index_dir),
+        indexed_files=len(file_paths),
+        chunk_count=len(chunks),
+        reused_files=cache.reused_files,
+        chunked_files=cache.chunked_files,
+        removed_files=cache.removed_files,
+        full_rebuild=full_rebuild,
+        elapsed_ms=(time.perf_counter() - started) * 1000.0,
+    )
+    return index, report
+
+
+def build_and_save(
+    file_paths: list[str],
+    index_dir: Path,
+    *,
+    chunk_size: int = 30,
+    overlap: int = 5,
+) -> Bm25Index:
+    """Chunk all files, build a :class:`Bm25Index`, and persist it (+ stamps) to ``index_dir``.
+
+    Files unchanged since a previous build of the same index are not re-chunked.
+    """
+    index, _report = update_index(file_paths, index_dir, chunk_size=chunk_size, overlap=overlap)
     return index
 
 
+def semantic_index_status(index_dir: Path) -> dict[str, Any]:
+    """Summary of the index at ``index_dir``; ``stale_files`` stats every indexed file."""
+    status: dict[str, Any] = {"index_dir": str(index_dir), "exists": False}
+    meta = _read_meta(index_dir)
+    if meta is None or not isinstance(meta.get("files"), dict):
+        return status
+    stale = 0
+    for path, (size, mtime_ns, *_rest) in meta["files"].items():
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            stale += 1
+            continue
+        if (stat_result.st_size, stat_result.st_mtime_ns) != (size, mtime_ns):
+            stale += 1
+    try:
+        corpus_bytes = (index_dir / Path(str(meta.get("corpus"))).name).stat().st_size
+    except OSError:
+        corpus_bytes = 0
+    status.update(
+        exists=True,
+        version=meta.get("version"),
+        compatible=meta.get("version") == INDEX_VERSION
+        and meta.get("chunker_mode") == current_chunker_mode(),
+        chunker_mode=meta.get("chunker_mode"),
+        indexed_files=len(meta["files"]),
+        chunk_count=meta.get("chunk_count"),
+        stale_files=stale,
+        corpus_bytes=corpus_bytes,
+    )
+    return status
+
+
 def load_or_warn(index_dir: Path) -> Bm25Index | None:
-    """Load the persisted index, or warn to stderr and return ``None`` if missing or stale."""
-    chunks_path = index_dir / _CHUNKS_NAME
+    """Load the persisted index, or warn to stderr and return ``None`` if missing or stale.
+
+    The returned index answers queries straight off the mapped corpus; chunks are decoded only
+    when indexed.
+    """
     meta_path = index_dir / _META_NAME
-    if not chunks_path.is_file() or not meta_path.is_file():
+    if not meta_path.is_file():
         print(
             f"tg: no persisted semantic index at {index_dir}; falling back to in-memory ranking.",
             file=sys.stderr,
@@ -135,14 +766,13 @@ def load_or_warn(index_dir: Path) -> Bm25Index | None:
         )
         return None
 
-    chunk_records = json.loads(chunks_path.read_text(encoding="utf-8"))
-    chunks = [
-        Chunk(
-            file_path=r["file_path"],
-            start_line=r["start_line"],
-            end_line=r["end_line"],
-            text=r["text"],
+    opened = _open_corpus(index_dir, meta)
+    if opened is None:
+        print(
+            f"tg: semantic index at {index_dir} is unreadable (missing or corrupt corpus); "
+            "falling back to in-memory ranking.",
+            file=sys.stderr,
         )
-        for r in chunk_records
-    ]
-    return Bm25Index(chunks)
+        return None
+    corpus, paths, _entries = opened
+    return _mapped_bm25_index(corpus, paths)
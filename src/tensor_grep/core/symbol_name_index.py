@@ -0,0 +1,337 @@
+"""Name index over a repo map's symbol records, for exact and ranked fuzzy symbol lookup.
+
+``workspace/symbol``, ``tg defs`` and the symbol tools used to scan every record in
+``repo_map["symbols"]`` per request. The index groups the records by exact name and by file up
+front. It builds the ranked-search structures on the first fuzzy query, so a one-shot
+``tg defs`` never pays for them:
+
+- the distinct lower-cased names, sorted, so a prefix query is a bisection;
+- the camelCase/underscore words of every name and its initials, sorted the same way, so
+  ``crInv`` and ``ci`` find ``create_invoice`` without a scan;
+- a trigram -> names map, so a substring query only looks at the names holding every trigram
+  of the query (one- and two-character queries scan the distinct names instead).
+
+Ranking is exact, prefix, initials, word-hump, word-boundary substring, then any substring.
+Only the top ``limit`` records come back.
+
+The index is cached against the identity of the map's ``symbols`` list
+(:func:`symbol_name_index_for_map`). Repo maps are replaced, never edited in place, so a live
+map keeps its index. :meth:`SymbolNameIndex.replacing_files` derives the next map's index from
+the previous one by touching only the changed files' names.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+_WORD_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+|[^\W\d_]+")
+_INDEX_CACHE_MAX = 8
+# Appended to a prefix to bound a bisection: sorts after every character a name can hold.
+_PREFIX_END = "\U0010ffff"
+
+
+def _name_words(name: str) -> list[tuple[int, str]]:
+    """``(offset, lower-cased word)`` for each camelCase/underscore/digit word of ``name``."""
+    return [(match.start(), match.group().lower()) for match in _WORD_RE.finditer(name)]
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[start : start + 3] for start in range(len(text) - 2)}
+
+
+def _hump_skips(query_words: list[str], words: list[str]) -> int | None:
+    """Name words skipped when each query word prefixes a later name word, in order; else None."""
+    skipped = 0
+    position = 0
+    for query_word in query_words:
+        while position < len(words) and not words[position].startswith(query_word):
+            position += 1
+            skipped += 1
+        if position == len(words):
+            return None
+        position += 1
+    return skipped
+
+
+def _match_rank(query: str, query_words: list[str], name: str) -> tuple[int, int] | None:
+    """Sort key for ``name`` against lower-cased ``query`` (smaller is better); None: no match."""
+    lowered = name.lower()
+    if lowered == query:
+        return (0, 0)
+    if lowered.startswith(query):
+        return (1, 0)
+    words = _name_words(name)
+    if "".join(word[0] for _, word in words).startswith(query):
+        return (2, 0)
+    if len(query_words) > 1 or query_words == [query]:
+        skipped = _hump_skips(query_words, [word for _, word in words])
+        if skipped is not None:
+            return (3, skipped)
+    position = lowered.find(query)
+    if position < 0:
+        return None
+    if any(offset == position for offset, _ in words):
+        return (4, position)
+    return (5, position)
+
+
+class SymbolNameIndex:
+    """Exact, per-file and ranked lookup over one repo map's symbol records.
+
+    Records are shared with the map, never copied; callers that mutate a result copy it first.
+    """
+
+    def __init__(self, symbols: Iterable[dict[str, Any]] = ()) -> None:
+        self._by_name: dict[str, list[dict[str, Any]]] = {}
+        self._by_file: dict[str, list[dict[str, Any]]] = {}
+        for symbol in symbols:
+            self._by_name.setdefault(str(symbol.get("name", "")), []).append(symbol)
+            self._by_file.setdefault(str(symbol.get("file", "")), []).append(symbol)
+        self._search: _SearchTables | None = None
+        self._search_lock = threading.Lock()
+
+    def exact(self, name: str) -> list[dict[str, Any]]:
+        """Every record named exactly ``name`` (case-sensitive), in map order."""
+        return list(self._by_name.get(name, ()))
+
+    def in_file(self, file: str) -> list[dict[str, Any]]:
+        """Every record in ``file``, in map order."""
+        return list(self._by_file.get(file, ()))
+
+    def search(self, query: str, *, limit: int) -> list[dict[str, Any]]:
+        """Up to ``limit`` records whose names match ``query``, best match first.
+
+        An empty query lists names alphabetically. Ties break on name, then file and line.
+        """
+        tables = self._search_tables()
+        normalized = query.strip().lower()
+        if not normalized:
+            ranked = [(0, 0, name) for name in tables.names[: max(0, limit)]]
+        else:
+            query_words = [word for _, word in _name_words(query.strip())] or [normalized]
+            scored = []
+            for lowered in tables.candidates(normalized, query_words[0]):
+                best = min(
+                    (
+                        rank
+                        for name in tables.spellings[lowered]
+                        if (rank := _match_rank(normalized, query_words, name)) is not None
+                    ),
+                    default=None,
+                )
+                if best is not None:
+                    scored.append((best[0], best[1], lowered))
+            ranked = heapq.nsmallest(
+                limit, scored, key=lambda item: (*item[:2], len(item[2]), item)
+            )
+        results: list[dict[str, Any]] = []
+        for _, _, lowered in ranked:
+            records = [
+                symbol
+                for name in sorted(tables.spellings[lowered])
+                for symbol in self._by_name[name]
+            ]
+            records.sort(
+                key=lambda symbol: (
+                    str(symbol.get("name", "")),
+                    str(symbol.get("file", "")),
+                    int(symbol.get("line", 0) or 0),
+                )
+            )
+            results.extend(records[: limit - len(results)])
+            if len(results) >= limit:
+                break
+        return results
+
+    def replacing_files(
+        self, files: Iterable[str], symbols: Iterable[dict[str, Any]]
+    ) -> SymbolNameIndex:
+        """A new index with ``files``' records swapped for ``symbols``; this one is unchanged.
+
+        ``symbols`` must be exactly the new records of ``files``. Only the names those files
+        held or now hold are touched; search tables already built carry over the same way.
+        """
+        replaced = set(files)
+        updated = SymbolNameIndex()
+        updated._by_file = dict(self._by_file)
+        updated._by_name = dict(self._by_name)
+        touched: set[str] = set()
+        for file in replaced:
+            for symbol in updated._by_file.pop(file, ()):
+                touched.add(str(symbol.get("name", "")))
+        for name in touched:
+            kept = [
+                symbol
+                for symbol in updated._by_name[name]
+                if str(symbol.get("file", "")) not in replaced
+            ]
+            if kept:
+                updated._by_name[name] = kept
+            else:
+                del updated._by_name[name]
+        for symbol in symbols:
+            name = str(symbol.get("name", ""))
+            if name not in touched and name in updated._by_name:
+                updated._by_name[name] = list(updated._by_name[name])
+            touched.add(name)
+            updated._by_name.setdefault(name, []).append(symbol)
+            updated._by_file.setdefault(str(symbol.get("file", "")), []).append(symbol)
+        if self._search is not None:
+            updated._search = self._search.with_names_changed(touched, updated._by_name)
+        return updated
+
+    def _search_tables(self) -> _SearchTables:
+        with self._search_lock:
+            if self._search is None:
+                self._search = _SearchTables.build(self._by_name)
+            return self._search
+
+
+class _SearchTables:
+    """The sorted/trigram structures behind :meth:`SymbolNameIndex.search`, keyed by lower name."""
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.spellings: dict[str, set[str]] = {}
+        self.words: list[tuple[str, str]] = []
+        self.initials: list[tuple[str, str]] = []
+        self.trigrams: dict[str, set[str]] = {}
+
+    @classmethod
+    def build(cls, by_name: dict[str, list[dict[str, Any]]]) -> _SearchTables:
+        tables = cls()
+        for name in by_name:
+            tables.spellings.setdefault(name.lower(), set()).add(name)
+        tables.names = sorted(tables.spellings)
+        for lowered, spellings in tables.spellings.items():
+            for word, initials in _search_keys(spellings):
+                tables.words.append((word, lowered))
+                tables.initials.append((initials, lowered))
+            for trigram in _trigrams(lowered):
+                tables.trigrams.setdefault(trigram, set()).add(lowered)
+        tables.words = sorted(set(tables.words))
+        tables.initials = sorted(set(tables.initials))
+        return tables
+
+    def candidates(self, query: str, first_word: str) -> set[str]:
+        found = set(self.names[_prefix_span(self.names, query)])
+        found.update(lowered for _, lowered in self.words[_pair_span(self.words, first_word)])
+        found.update(lowered for _, lowered in self.initials[_pair_span(self.initials, query)])
+        if len(query) >= 3:
+            postings = sorted(
+                (self.trigrams.get(trigram, set()) for trigram in _trigrams(query)), key=len
+            )
+            found.update(set.intersection(*postings) if postings else set())
+        else:
+            # Too short for a trigram: scan the distinct names, not every record.
+            found.update(lowered for lowered in self.names if query in lowered)
+        return found
+
+    def with_names_changed(
+        self, names: set[str], by_name: dict[str, list[dict[str, Any]]]
+    ) -> _SearchTables:
+        tables = _SearchTables()
+        tables.names = list(self.names)
+        tables.spellings = dict(self.spellings)
+        tables.trigrams = dict(self.trigrams)
+        words = set(self.words)
+        initials = set(self.initials)
+        for lowered in {name.lower() for name in names}:
+            before = self.spellings.get(lowered, set())
+            after = {name for name in before | names if name.lower() == lowered and name in by_name}
+            if after == before:
+                continue
+            for word, initial in _search_keys(before):
+                words.discard((word, lowered))
+                initials.discard((initial, lowered))
+            for word, initial in _search_keys(after):
+                words.add((word, lowered))
+                initials.add((initial, lowered))
+            if after:
+                tables.spellings[lowered] = after
+            else:
+                del tables.spellings[lowered]
+            if bool(before) != bool(after):
+                position = bisect.bisect_left(tables.names, lowered)
+                if after:
+                    tables.names.insert(position, lowered)
+                else:
+                    del tables.names[position]
+                for trigram in _trigrams(lowered):
+                    holders = set(tables.trigrams.get(trigram, set()))
+                    if after:
+                        holders.add(lowered)
+                    else:
+                        holders.discard(lowered)
+                    if holders:
+                        tables.trigrams[trigram] = holders
+                    else:
+                        tables.trigrams.pop(trigram, None)
+        tables.words = sorted(words)
+        tables.initials = sorted(initials)
+        return tables
+
+
+def _search_keys(spellings: Iterable[str]) -> set[tuple[str, str]]:
+    """``(word, initials)`` pairs for the word and initials tables of one lower-cased name."""
+    keys: set[tuple[str, str]] = set()
+    for name in spellings:
+        words = [word for _, word in _name_words(name)]
+        initials = "".join(word[0] for word in words)
+        keys.update((word, initials) for word in words)
+    return keys
+
+
+def _prefix_span(names: list[str], prefix: str) -> slice:
+    return slice(bisect.bisect_left(names, prefix), bisect.bisect_left(names, prefix + _PREFIX_END))
+
+
+def _pair_span(pairs: list[tuple[str, str]], prefix: str) -> slice:
+    return slice(
+        bisect.bisect_left(pairs, (prefix,)), bisect.bisect_left(pairs, (prefix + _PREFIX_END,))
+    )
+
+
+_INDEX_CACHE: OrderedDict[int, tuple[list[dict[str, Any]], int, SymbolNameIndex]] = OrderedDict()
+_INDEX_CACHE_LOCK = threading.Lock()
+
+
+def cached_symbol_name_index(repo_map: dict[str, Any]) -> SymbolNameIndex | None:
+    """The index already built for ``repo_map``'s symbol list, if any (never builds one)."""
+    symbols = repo_map.get("symbols")
+    if not isinstance(symbols, list):
+        return None
+    with _INDEX_CACHE_LOCK:
+        cached = _INDEX_CACHE.get(id(symbols))
+        if cached is None or cached[0] is not symbols or cached[1] != len(symbols):
+            return None
+        _INDEX_CACHE.move_to_end(id(symbols))
+        return cached[2]
+
+
+def remember_symbol_name_index(repo_map: dict[str, Any], index: SymbolNameIndex) -> None:
+    """Cache ``index`` as the one for ``repo_map``'s current symbol list."""
+    symbols = repo_map.get("symbols")
+    if not isinstance(symbols, list):
+        return
+    with _INDEX_CACHE_LOCK:
+        _INDEX_CACHE[id(symbols)] = (symbols, len(symbols), index)
+        _INDEX_CACHE.move_to_end(id(symbols))
+        while len(_INDEX_CACHE) > _INDEX_CACHE_MAX:
+            _INDEX_CACHE.popitem(last=False)
+
+
+def symbol_name_index_for_map(repo_map: dict[str, Any]) -> SymbolNameIndex:
+    """The name index for ``repo_map``, built on first use and cached with the map."""
+    cached = cached_symbol_name_index(repo_map)
+    if cached is not None:
+        return cached
+    index = SymbolNameIndex(repo_map.get("symbols") or ())
+    remember_symbol_name_index(repo_map, index)
+    return index
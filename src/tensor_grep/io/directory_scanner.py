@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from tensor_grep.core.config import SearchConfig
+from tensor_grep.io.file_universe import FILE_UNIVERSE, DirectoryRecorder, FileListing
+from tensor_grep.io.gitignore_rules import GitignoreRules
 
 # perf (+10% campaign #6 / F2.4): the 5 broad-scan-guard constants below (plus the private
 # `_GENERATED_DIR_NAMES` skip-list they're partly derived from) are now DEFINED in
@@ -40,6 +42,8 @@ from tensor_grep.io.scan_limits import (
 if TYPE_CHECKING:
     from pathspec.gitignore import GitIgnoreSpec
 
+    _IgnoreSpec = GitIgnoreSpec | GitignoreRules
+
 _GENERATED_RELATIVE_DIRS = {
     ".claude/context",
 }
@@ -116,7 +120,7 @@ class DirectoryScanner:
         self.unreadable_path_count = 0
         self.unreadable_path_sample: list[str] = []
 
-    def _load_ignore_spec(self, base_path: Path) -> "GitIgnoreSpec | None":
+    def _load_ignore_spec(self, base_path: Path) -> "_IgnoreSpec | None":
         if self.config.no_ignore or self.config.no_ignore_vcs or self.config.no_ignore_files:
             return None
 
@@ -140,14 +144,20 @@ class DirectoryScanner:
                 raw = raw[:last_newline]
 
         patterns = raw.decode("utf-8", errors="replace").splitlines()
+        # Plain ignore lists (literal names, `*.ext`, anchored literals, no `!`) are answered by
+        # the shared compiled engine -- hash lookups plus a per-directory decision memo instead
+        # of pathspec's per-pattern regex loop. Anything richer keeps pathspec's exact semantics.
+        rules = GitignoreRules(patterns)
+        if rules.plain_ignores_only:
+            return rules
         return pathspec.GitIgnoreSpec.from_lines(patterns)
 
     @staticmethod
     def _ancestor_spec_stack(
         base_path: Path,
         root_path: Path,
-        dir_specs: "dict[Path, GitIgnoreSpec | None]",
-    ) -> "list[tuple[Path, GitIgnoreSpec]]":
+        dir_specs: "dict[Path, _IgnoreSpec | None]",
+    ) -> "list[tuple[Path, _IgnoreSpec]]":
         # Collect the loaded .gitignore specs from base_path down to root_path (shallow-first).
         # os.walk is top-down, so every ancestor of root_path was visited (and its spec loaded)
         # before root_path is processed.
@@ -165,7 +175,7 @@ class DirectoryScanner:
         self,
         path: Path,
         is_dir: bool,
-        spec_stack: "list[tuple[Path, GitIgnoreSpec]]",
+        spec_stack: "list[tuple[Path, _IgnoreSpec]]",
     ) -> bool:
         # Apply the ancestor .gitignore specs shallowest-first; the DEEPEST spec with an opinion
         # wins (git precedence: a nested .gitignore overrides a parent's). pathspec's tri-state
@@ -179,11 +189,12 @@ class DirectoryScanner:
                 continue
             if not rel or rel == ".":
                 continue
-            if is_dir:
-                rel = f"{rel}/"
-            result = spec.check_file(rel)
-            if result.include is not None:
-                decision = result.include
+            if isinstance(spec, GitignoreRules):
+                include = spec.check(rel, is_dir=is_dir)
+            else:
+                include = spec.check_file(f"{rel}/" if is_dir else rel).include
+            if include is not None:
+                decision = include
         return bool(decision)
 
     def _should_descend_dir(self, base_path: Path, root: Path, directory: str) -> bool:
@@ -243,18 +254,46 @@ class DirectoryScanner:
         # Python scan path (the only path — the native RustDirectoryScanner fast path was never
         # exported by rust_core; see HAS_RUST_SCANNER above).
         max_depth = self.config.max_depth
+
+        def _relative_posix(path: Path) -> str:
+            return path.relative_to(base_path).as_posix()
+
+        # A completed walk is kept in the process-wide file universe, keyed by every knob that
+        # shapes it; the glob/type filters are applied on replay, so the implicit-glob probe
+        # (filters stripped) and the search it guards share one listing.
+        universe_key = (
+            "directory_scanner",
+            os.path.abspath(path_str),
+            path_str,
+            self.config.hidden,
+            self.config.no_ignore,
+            self.config.no_ignore_vcs,
+            self.config.no_ignore_files,
+            max_depth,
+            self.max_scan_entries,
+            self.gitignore_max_bytes,
+        )
+        listing = FILE_UNIVERSE.lookup(universe_key) if FILE_UNIVERSE.enabled() else None
+        if listing is not None:
+            for file_path in listing.files:
+                if self._should_include_file(file_path, Path(_relative_posix(file_path))):
+                    yield str(file_path)
+            return
+        recorder = DirectoryRecorder()
+        walked: list[Path] = []
+        unreadable_before = self.unreadable_path_count
+
         base_depth = len(base_path.parts)
         # Nested-.gitignore support: cache each directory's own spec as os.walk descends, then test
         # paths against the full ancestor chain so a nested subdir/.gitignore is honored, not just
         # the root one. base_path's spec is loaded up front; each deeper dir loads lazily on entry.
-        dir_specs: dict[Path, GitIgnoreSpec | None] = {base_path: self._load_ignore_spec(base_path)}
-
-        def _relative_posix(path: Path) -> str:
-            return path.relative_to(base_path).as_posix()
+        dir_specs: dict[Path, _IgnoreSpec | None] = {base_path: self._load_ignore_spec(base_path)}
 
         entries_visited = 0
+        walk_completed = True
 
         for root, dirs, files in os.walk(base_path, onerror=self._on_walk_error):
+            recorder.record(root)
             # Traversal budget (Q14): count this root plus every dir/file entry it exposes
             # BEFORE any filtering, since those are the entries the walk had to stat via
             # readdir. Once the budget is exceeded, stop descending and surface truncation
@@ -264,6 +303,7 @@ class DirectoryScanner:
                 self.scan_truncated = True
                 self.scan_truncation_cause = "max-scan-entries"
                 dirs.clear()
+                walk_completed = False
                 break
 
             current_depth = len(Path(root).parts) - base_depth
@@ -279,6 +319,9 @@ class DirectoryScanner:
             root_path = Path(root)
             if root_path not in dir_specs:
                 dir_specs[root_path] = self._load_ignore_spec(root_path)
+            if dir_specs[root_path] is not None:
+                # An in-place .gitignore edit leaves the directory mtime alone.
+                recorder.record(str(root_path / ".gitignore"))
             spec_stack = self._ancestor_spec_stack(base_path, root_path, dir_specs)
 
             dirs[:] = [
@@ -328,9 +371,21 @@ class DirectoryScanner:
                 relative_path = Path(_relative_posix(file_path))
                 if spec_stack and self._path_ignored_by_stack(file_path, False, spec_stack):
                     continue
+                walked.append(file_path)
                 if self._should_include_file(file_path, relative_path):
                     yield str(file_path)
 
+        if (
+            walk_completed
+            and self.unreadable_path_count == unreadable_before
+            and not self.gitignore_truncated
+        ):
+            FILE_UNIVERSE.store(
+                universe_key,
+                FileListing(files=tuple(walked), directories=tuple(recorder.directories)),
+                recorder,
+            )
+
     def _should_include_file(self, file_path: Path, relative_path: Path | None = None) -> bool:
         # Check explicit globs
         if self.config.glob:
@@ -0,0 +1,167 @@
+"""Process-wide cache of walked file listings, revalidated by directory mtimes.
+
+`DirectoryScanner.walk` and repo_map's `_iter_repo_files` each re-walked the tree on every call:
+an `os.scandir` per directory plus per-entry ignore, hidden, skip-list and sort work. A long-lived
+host (MCP server, session daemon, LSP) and any command that walks the same root twice -- the
+implicit-glob probe ahead of `tg search`, the repeated `_iter_repo_files` calls behind
+`tg agent` / `tg context` -- paid that in full each time.
+
+A walker now records every directory it scans (`DirectoryRecorder`) and, when the walk ran to
+completion, stores the result as a `FileListing` under a key naming the root and every knob that
+shapes the walk. A later walk with the same key re-stats only the recorded directories: adding,
+removing or renaming an entry bumps its directory's mtime, so unchanged mtimes mean the same file
+set. A pruned (ignored or skipped) subtree is never scanned and needs no check.
+
+Racy timestamps: a directory changed within `_RACY_WINDOW_NS` of being scanned could change
+again without its mtime moving on a coarse-timestamp filesystem, so a walk that saw such a
+directory is never stored (git's "racy clean" rule, applied to directories). Freshly created
+trees therefore always walk live.
+
+A listing holds paths only. `file_universe_entries` stats ``size`` / ``mtime_ns`` when asked,
+because a content edit does not touch the directory mtime and so cannot be cached this way.
+
+`TENSOR_GREP_FILE_UNIVERSE_CACHE=0` turns the cache off.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple, Protocol
+
+_FILE_UNIVERSE_CACHE_ENV = "TENSOR_GREP_FILE_UNIVERSE_CACHE"
+_FILE_UNIVERSE_MAX_LISTINGS = 32
+# Wider than any common filesystem's timestamp granularity (FAT 2s, HFS+/ext3 1s, coarse clocks).
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class FileUniverseEntry(NamedTuple):
+    path: Path
+    size: int
+    mtime_ns: int
+    is_test: bool
+    language: str | None
+
+
+class DirectoryRecorder:
+    """The directories one walk scanned, with the mtime each had when the scan began."""
+
+    __slots__ = ("directories", "racy")
+
+    def __init__(self) -> None:
+        self.directories: list[tuple[str, int]] = []
+        self.racy = False
+
+    def record(self, directory: str) -> None:
+        # Stat BEFORE the caller scans: a change landing mid-scan then shows up as a newer mtime.
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            self.racy = True
+            return
+        if time.time_ns() - mtime_ns < _RACY_WINDOW_NS:
+            self.racy = True
+        self.directories.append((directory, mtime_ns))
+
+
+@dataclass
+class FileListing:
+    """One completed walk: its files in the walker's order plus the proof it is still current.
+
+    ``buckets`` optionally keeps the files grouped the way a bounded walk round-robins them
+    (repo_map's top-level buckets), so a ``max_files`` view can be cut from the same listing.
+    """
+
+    files: tuple[Path, ...]
+    directories: tuple[tuple[str, int], ...]
+    buckets: tuple[tuple[tuple[int, str], tuple[Path, ...]], ...] = ()
+
+    def is_current(self) -> bool:
+        for directory, mtime_ns in self.directories:
+            try:
+                if os.stat(directory).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+
+class UnreadableSink(Protocol):
+    def record(self, exc: OSError) -> None: ...
+
+
+def file_universe_entries(
+    files: Iterable[Path],
+    classify: Callable[[Path], tuple[bool, str | None]],
+    *,
+    unreadable_hit: UnreadableSink | None = None,
+) -> list[FileUniverseEntry]:
+    """``(path, size, mtime_ns, is_test, language)`` per file; ``classify`` gives the last two.
+
+    Files that vanished since they were listed are left out and reported to ``unreadable_hit``.
+    """
+    entries: list[FileUniverseEntry] = []
+    for path in files:
+        try:
+            stat = path.stat()
+        except OSError as exc:
+            if unreadable_hit is not None:
+                unreadable_hit.record(exc)
+            continue
+        is_test, language = classify(path)
+        entries.append(FileUniverseEntry(path, stat.st_size, stat.st_mtime_ns, is_test, language))
+    return entries
+
+
+class FileUniverse:
+    """LRU store of `FileListing`s with hit / miss counters for ``--stats``."""
+
+    def __init__(self, max_listings: int = _FILE_UNIVERSE_MAX_LISTINGS) -> None:
+        self._max_listings = max(1, max_listings)
+        self._listings: OrderedDict[Hashable, FileListing] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def enabled() -> bool:
+        value = os.environ.get(_FILE_UNIVERSE_CACHE_ENV, "").strip().lower()
+        return value not in {"0", "false", "no", "off"}
+
+    def lookup(self, key: Hashable) -> FileListing | None:
+        with self._lock:
+            listing = self._listings.get(key)
+        if listing is not None and listing.is_current():
+            with self._lock:
+                self.hits += 1
+                if key in self._listings:
+                    self._listings.move_to_end(key)
+            return listing
+        with self._lock:
+            self.misses += 1
+            if listing is not None and self._listings.get(key) is listing:
+                del self._listings[key]
+        return None
+
+    def store(self, key: Hashable, listing: FileListing, recorder: DirectoryRecorder) -> None:
+        if recorder.racy:
+            return
+        with self._lock:
+            self._listings[key] = listing
+            self._listings.move_to_end(key)
+            while len(self._listings) > self._max_listings:
+                self._listings.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._listings.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+FILE_UNIVERSE = FileUniverse()
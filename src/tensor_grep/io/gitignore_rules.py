@@ -0,0 +1,244 @@
+"""One ``.gitignore`` file's rules compiled for the repo walkers' per-entry ignore checks.
+
+The walkers used to test every walked path against every rule in file order: one ``re.match`` per
+rule per path plus one per rule per ancestor prefix, so on a generated monorepo ``.gitignore``
+with thousands of lines the ignore check dominated walk time. Almost every real rule is one of
+three shapes, each of which is a hash lookup instead of a regex:
+
+- an unanchored literal name (``node_modules/``, ``.DS_Store``): a path segment equals it;
+- an unanchored ``*SUFFIX`` (``*.pyc``, ``*.egg-info/``): a path segment ends with it;
+- an anchored literal (``/build``, ``rust_core/target/``): a segment-prefix of the path equals it.
+
+`GitignoreRules` files those rules into dicts keyed by name / suffix / anchored path holding the
+LAST rule index with that key, and keeps everything else (``**``, ``?``, mid-pattern ``*``, ...)
+as a residual regex list scanned newest-first. The last matching rule still decides, so answers
+are exactly the rule-by-rule loop's. A directory's answer is also every descendant's starting
+point, so per-directory decisions are memoized: a walk resolves each directory once and each
+file with one leaf lookup.
+
+A single combined alternation of every rule was measured ~5x SLOWER than the rule loop on a
+4000-rule file: Python's ``re`` tries the alternatives one after another at each position.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+
+# Bounds the per-directory decision memo; a walk re-fills it in order, so clearing is cheap.
+_MAX_CACHED_DIRS = 65_536
+_NO_MATCH = -1
+_GLOB_CHARS = frozenset("*?[\\")
+
+
+def gitignore_pattern_to_regex(pattern: str) -> str:
+    """Translate a single gitignore glob body to an anchored regex fragment.
+
+    The fragment matches against a repo-relative POSIX path (no leading slash).
+    Handles ``*`` (segment-local), ``**`` (cross-segment), ``?`` and literal
+    characters; anchoring/negation/dir-only handling lives in the caller.
+    """
+
+    regex_parts: list[str] = []
+    index = 0
+    length = len(pattern)
+    while index < length:
+        char = pattern[index]
+        if char == "*":
+            if pattern[index : index + 2] == "**":
+                # ``**`` matches any number of path segments (including none).
+                index += 2
+                if pattern[index : index + 1] == "/":
+                    index += 1
+                    regex_parts.append("(?:.*/)?")
+                else:
+                    regex_parts.append(".*")
+            else:
+                regex_parts.append("[^/]*")
+                index += 1
+        elif char == "?":
+            regex_parts.append("[^/]")
+            index += 1
+        else:
+            regex_parts.append(re.escape(char))
+            index += 1
+    return "".join(regex_parts)
+
+
+def _is_literal(text: str) -> bool:
+    return bool(text) and _GLOB_CHARS.isdisjoint(text) and "//" not in text
+
+
+def _record(table: dict[str, int], key: str, rule_index: int) -> None:
+    # Rules are added in file order, so the newest index for a key is always the largest.
+    table[key] = rule_index
+
+
+class GitignoreRules:
+    """The rules of one ``.gitignore``, answering for paths relative to its directory.
+
+    Supports directory-only patterns (trailing ``/``), anchored patterns (leading or embedded
+    ``/``), unanchored basename patterns, ``*``/``**``/``?`` globs, and ``!`` negation. It mirrors
+    ripgrep's gitignore handling closely enough for context/repo-map walks; it is not a
+    byte-perfect reimplementation of git's spec.
+    """
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        self._rules: list[tuple[re.Pattern[str], bool, bool]] = []
+        self._trimmed_whitespace = False
+        # ``*_any`` answers for a directory segment / path, ``*_file`` for a file leaf, which
+        # dir-only rules never match.
+        self._names_any: dict[str, int] = {}
+        self._names_file: dict[str, int] = {}
+        self._suffixes_any: dict[str, int] = {}
+        self._suffixes_file: dict[str, int] = {}
+        self._anchored_any: dict[str, int] = {}
+        self._anchored_file: dict[str, int] = {}
+        self._residual: list[int] = []
+        for raw_line in lines:
+            line = raw_line.rstrip("\n")
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            # A literal leading ``#`` or ``!`` is escaped with a backslash.
+            negated = False
+            if line.startswith("!"):
+                negated = True
+                line = line[1:]
+            elif line.startswith(("\\#", "\\!")):
+                line = line[1:]
+            if line != line.rstrip():
+                self._trimmed_whitespace = True
+                line = line.rstrip()
+            if not line:
+                continue
+            dir_only = line.endswith("/")
+            body = line[:-1] if dir_only else line
+            anchored = body.startswith("/") or ("/" in body.rstrip("/"))
+            body = body.lstrip("/")
+            if not body:
+                continue
+            fragment = gitignore_pattern_to_regex(body)
+            if anchored:
+                regex = rf"^{fragment}(?:/.*)?$"
+            else:
+                # Unanchored patterns match at any depth.
+                regex = rf"(?:^|.*/){fragment}(?:/.*)?$"
+            try:
+                compiled = re.compile(regex)
+            except re.error:
+                continue
+            rule_index = len(self._rules)
+            self._rules.append((compiled, negated, dir_only))
+            if anchored and _is_literal(body):
+                tables = (self._anchored_any, self._anchored_file)
+                key = body
+            elif not anchored and _is_literal(body):
+                tables = (self._names_any, self._names_file)
+                key = body
+            elif not anchored and body.startswith("*") and _is_literal(body[1:] or "x"):
+                tables = (self._suffixes_any, self._suffixes_file)
+                key = body[1:]
+            else:
+                self._residual.append(rule_index)
+                continue
+            _record(tables[0], key, rule_index)
+            if not dir_only:
+                _record(tables[1], key, rule_index)
+        self._suffix_lengths = sorted({len(suffix) for suffix in self._suffixes_any})
+        self._dir_decisions: dict[str, int] = {}
+
+    @property
+    def has_rules(self) -> bool:
+        return bool(self._rules)
+
+    @property
+    def plain_ignores_only(self) -> bool:
+        """No negation, no glob beyond a leading ``*`` and no trailing whitespace in any rule.
+
+        For such files every rule form reads the same in every gitignore implementation, so a
+        caller holding another matcher (pathspec) may answer with these rules instead.
+        """
+        return (
+            not self._residual
+            and not self._trimmed_whitespace
+            and not any(negated for _compiled, negated, _dir_only in self._rules)
+        )
+
+    def check(self, rel_posix: str, *, is_dir: bool) -> bool | None:
+        """True = ignored, False = re-included by a ``!`` rule, None = no rule matched.
+
+        ``rel_posix`` is relative to this file's directory, with no leading slash.
+        """
+        if not self._rules or not rel_posix or rel_posix == ".":
+            return None
+        if "\n" in rel_posix:
+            # ``.`` in the rule regexes stops at a newline; segment lookups would not.
+            return self._check_rule_by_rule(rel_posix, is_dir=is_dir)
+        if is_dir:
+            best = self._dir_decision(rel_posix)
+        else:
+            parent, _, _leaf = rel_posix.rpartition("/")
+            best = max(
+                self._dir_decision(parent) if parent else _NO_MATCH,
+                self._leaf_decision(rel_posix, is_dir=False),
+            )
+        return None if best == _NO_MATCH else not self._rules[best][1]
+
+    def _dir_decision(self, rel_dir: str) -> int:
+        """Newest rule matching the directory ``rel_dir`` or any of its ancestors."""
+        cached = self._dir_decisions.get(rel_dir)
+        if cached is not None:
+            return cached
+        parent, _, _leaf = rel_dir.rpartition("/")
+        best = max(
+            self._dir_decision(parent) if parent else _NO_MATCH,
+            self._leaf_decision(rel_dir, is_dir=True),
+        )
+        if len(self._dir_decisions) >= _MAX_CACHED_DIRS:
+            self._dir_decisions.clear()
+        self._dir_decisions[rel_dir] = best
+        return best
+
+    def _leaf_decision(self, rel_posix: str, *, is_dir: bool) -> int:
+        """Newest rule matching ``rel_posix`` through its last segment (ancestors excluded)."""
+        names = self._names_any if is_dir else self._names_file
+        suffixes = self._suffixes_any if is_dir else self._suffixes_file
+        anchored = self._anchored_any if is_dir else self._anchored_file
+        leaf = rel_posix.rpartition("/")[2]
+        best = max(names.get(leaf, _NO_MATCH), anchored.get(rel_posix, _NO_MATCH))
+        if suffixes:
+            leaf_length = len(leaf)
+            for suffix_length in self._suffix_lengths:
+                if suffix_length > leaf_length:
+                    break
+                best = max(best, suffixes.get(leaf[leaf_length - suffix_length :], _NO_MATCH))
+        for rule_index in reversed(self._residual):
+            if rule_index <= best:
+                break
+            compiled, _negated, dir_only = self._rules[rule_index]
+            if (is_dir or not dir_only) and compiled.match(rel_posix):
+                best = rule_index
+        return best
+
+    def _check_rule_by_rule(self, rel_posix: str, *, is_dir: bool) -> bool | None:
+        # A dir-only pattern (``dist/``) ignores the directory *and everything
+        # inside it*. Test the path itself plus each ancestor segment-prefix so
+        # files under an ignored directory are recognised even when checked in
+        # isolation (the walk also prunes such directories during traversal).
+        segments = rel_posix.split("/")
+        ancestor_prefixes = ["/".join(segments[: index + 1]) for index in range(len(segments) - 1)]
+        decision: bool | None = None
+        for compiled, negated, dir_only in self._rules:
+            if dir_only:
+                matched = any(compiled.match(prefix) for prefix in ancestor_prefixes)
+                if is_dir:
+                    matched = matched or bool(compiled.match(rel_posix))
+            else:
+                matched = bool(compiled.match(rel_posix))
+                if not matched:
+                    # An unanchored/file pattern still ignores descendants of a
+                    # directory it matched (e.g. ``build`` matching ``build/x``).
+                    matched = any(compiled.match(prefix) for prefix in ancestor_prefixes)
+            if matched:
+                decision = not negated
+        return decision
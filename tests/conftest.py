@@ -1,6 +1,8 @@
+import io
 import os
 import shutil
 import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -83,6 +85,55 @@ def rg_path():
     return path
 
 
+class _CannedRgJsonProcess:
+    """The `rg --json` child a `RipgrepJsonStream` reads, replaying canned output.
+
+    Writes ``stderr`` to the stream's sink, yields ``stdout`` line by line, then exits with
+    ``returncode`` -- or, with ``hang``, keeps running until killed, like an rg past its timeout.
+    """
+
+    def __init__(self, stdout: str, stderr: str, sink, returncode: int, hang: bool) -> None:
+        sink.write(stderr.encode("utf-8"))
+        self._killed = threading.Event()
+        self.returncode = None if hang else returncode
+        self.stdout = self._replay(stdout.encode("utf-8"), hang)
+
+    def _replay(self, data: bytes, hang: bool):
+        yield from io.BytesIO(data)
+        if hang:
+            self._killed.wait()
+
+    def poll(self):
+        return self.returncode
+
+    def kill(self) -> None:
+        if self.returncode is None:
+            self.returncode = -9
+        self._killed.set()
+
+    def wait(self) -> int:
+        if self.returncode is None:
+            self._killed.wait()
+        return self.returncode
+
+
+@pytest.fixture
+def canned_rg_json():
+    """Builds stand-ins for `ripgrep_backend.popen_rg_json`, for tests without a real rg.
+
+    ``canned_rg_json(returncode, stdout, stderr, hang=...)`` is a ``side_effect`` (or
+    ``monkeypatch.setattr`` replacement) that spawns one `_CannedRgJsonProcess` per call.
+    """
+
+    def _canned(returncode: int = 0, stdout: str = "", stderr: str = "", *, hang: bool = False):
+        def _popen(cmd, sink):
+            return _CannedRgJsonProcess(stdout, stderr, sink, returncode, hang)
+
+        return _popen
+
+    return _canned
+
+
 @pytest.fixture(autouse=True)
 def cleanup_external_lsp_providers():
     yield
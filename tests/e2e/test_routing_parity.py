@@ -80,6 +80,7 @@ PUBLIC_TOP_LEVEL_COMMANDS = {
     "review-bundle",
     "evidence",
     "ledger",
+    "index",
     "devices",
     "context",
     "lsp",
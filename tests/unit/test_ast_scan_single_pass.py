@@ -0,0 +1,154 @@
+"""`tg scan` walks and parses each candidate file once, however many rules the ruleset holds."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip("tree_sitter")
+pytest.importorskip("tree_sitter_python")
+
+from tensor_grep.backends.ast_backend import AstBackend
+from tensor_grep.cli.ast_scan import _run_ast_scan_payload
+from tensor_grep.core.config import SearchConfig
+
+_RULES = [
+    {"id": "no-functions", "language": "python", "pattern": "function_definition"},
+    {
+        "id": "classes-or-calls",
+        "language": "python",
+        "pattern": "class_definition",
+        "patterns": ["class_definition", "(call) @call"],
+    },
+    {"id": "functions-again", "language": "python", "pattern": "function_definition"},
+    {"id": "no-lambdas", "language": "python", "pattern": "(lambda) @fn"},
+]
+
+
+class _CountingAstBackend(AstBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.search_calls = 0
+        self.search_patterns_calls = 0
+        self.index_builds = 0
+
+    def search(self, file_path: str, pattern: str, config: Any = None) -> Any:
+        self.search_calls += 1
+        return super().search(file_path, pattern, config)
+
+    def search_patterns(self, file_path: str, patterns: list[str], config: Any = None) -> Any:
+        self.search_patterns_calls += 1
+        return super().search_patterns(file_path, patterns, config)
+
+    def _build_node_type_index(self, root_node: Any) -> Any:
+        self.index_builds += 1
+        return super()._build_node_type_index(root_node)
+
+
+class _PerPatternOnlyBackend:
+    """The pre-single-pass shape: a backend that only answers one (file, pattern) at a time."""
+
+    def __init__(self) -> None:
+        self._backend = AstBackend()
+
+    def search(self, file_path: str, pattern: str, config: Any = None) -> Any:
+        return self._backend.search(file_path, pattern, config)
+
+
+@pytest.fixture(autouse=True)
+def _hermetic_ast_caches(monkeypatch: pytest.MonkeyPatch) -> Any:
+    monkeypatch.setenv("TENSOR_GREP_AST_CACHE", "0")
+    AstBackend._clear_shared_caches()
+    yield
+    AstBackend._clear_shared_caches()
+
+
+def _project(tmp_path: Path) -> dict[str, object]:
+    (tmp_path / "billing.py").write_text(
+        "class Invoice:\n"
+        "    def total(self):\n"
+        "        return sum(line() for line in self.lines)\n\n\n"
+        "def create_invoice():\n"
+        "    return Invoice()\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "jobs.py").write_text(
+        "def run():\n    key = lambda job: job.id\n    print(run, key)\n", encoding="utf-8"
+    )
+    (tmp_path / "README.md").write_text("# notes\n", encoding="utf-8")
+    return {"root_dir": tmp_path, "config_path": tmp_path / "sgconfig.yml", "language": "python"}
+
+
+def _scan(
+    monkeypatch: pytest.MonkeyPatch,
+    project_cfg: dict[str, object],
+    backend: object,
+    rules: list[dict[str, Any]],
+) -> dict[str, object]:
+    class _Pipeline:
+        def __init__(self, force_cpu: bool = False, config: SearchConfig | None = None) -> None:
+            pass
+
+        def get_backend(self) -> object:
+            return backend
+
+    monkeypatch.setattr("tensor_grep.core.pipeline.Pipeline", _Pipeline)
+    return _run_ast_scan_payload(
+        project_cfg, [dict(rule) for rule in rules], routing_reason="test", scan_paths=None
+    )
+
+
+def test_each_file_is_parsed_once_for_the_whole_ruleset(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    project_cfg = _project(tmp_path)
+    backend = _CountingAstBackend()
+
+    payload = _scan(monkeypatch, project_cfg, backend, _RULES)
+
+    candidate_files = 3  # billing.py, jobs.py and README.md -- every rule used to visit each
+    assert backend.search_patterns_calls == candidate_files
+    assert backend.search_calls == 0
+    assert backend.index_builds == candidate_files
+    assert payload["matched_rules"] == 4
+
+
+def test_single_pass_findings_match_scanning_each_rule_on_its_own(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    project_cfg = _project(tmp_path)
+
+    combined = _scan(monkeypatch, project_cfg, AstBackend(), _RULES)
+    one_rule_at_a_time = [
+        finding
+        for rule in _RULES
+        for finding in _scan(monkeypatch, project_cfg, _PerPatternOnlyBackend(), [rule])["findings"]
+    ]
+
+    assert combined["findings"] == one_rule_at_a_time
+    assert combined["total_matches"] == sum(finding["matches"] for finding in one_rule_at_a_time)
+    by_rule = {finding["rule_id"]: finding["matches"] for finding in one_rule_at_a_time}
+    assert by_rule == {
+        "no-functions": 3,
+        "classes-or-calls": 5,
+        "functions-again": 3,
+        "no-lambdas": 1,
+    }
+
+
+def test_search_patterns_answers_each_pattern_like_search(tmp_path: Path) -> None:
+    source = tmp_path / "mod.py"
+    source.write_text("def f():\n    return g(1), g(2)\n\nclass C:\n    pass\n", encoding="utf-8")
+    config = SearchConfig(ast=True, lang="python")
+    patterns = ["call", "function_definition", "(call) @c", "while_statement", "call"]
+
+    batched = AstBackend().search_patterns(str(source), patterns, config)
+    AstBackend._clear_shared_caches()
+    singles = {pattern: AstBackend().search(str(source), pattern, config) for pattern in patterns}
+
+    assert list(batched) == ["call", "function_definition", "(call) @c", "while_statement"]
+    for pattern, result in batched.items():
+        assert result.matches == singles[pattern].matches
+        assert result.total_matches == singles[pattern].total_matches
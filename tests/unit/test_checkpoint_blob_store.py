@@ -0,0 +1,115 @@
+"""Checkpoint snapshots backed by the content-addressed blob store (``checkpoint_blobs``)."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from tensor_grep.cli import checkpoint_blobs, checkpoint_store
+
+
+def _project(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    (root / "pkg").mkdir(parents=True)
+    for name in ("a", "b", "c"):
+        (root / "pkg" / f"{name}.py").write_text(f"{name} = 1\n", encoding="utf-8")
+    # Old enough that the next create may trust the manifest digest instead of re-reading.
+    old = time.time() - 60.0
+    for path in (root / "pkg").iterdir():
+        os.utime(path, (old, old))
+    return root
+
+
+def _blobs(root: Path) -> list[Path]:
+    store = checkpoint_blobs._blob_store_dir(root)
+    return sorted(path for path in store.rglob("*") if path.is_file()) if store.exists() else []
+
+
+def test_unchanged_files_share_one_blob_across_checkpoints(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    first = checkpoint_store.create_checkpoint(str(root))
+    (root / "pkg" / "b.py").write_text("b = 2\n", encoding="utf-8")
+    second = checkpoint_store.create_checkpoint(str(root))
+
+    assert len(_blobs(root)) == 4
+    first_snapshot = checkpoint_store._snapshot_path(root, first.checkpoint_id)
+    second_snapshot = checkpoint_store._snapshot_path(root, second.checkpoint_id)
+    assert os.path.samefile(first_snapshot / "pkg" / "a.py", second_snapshot / "pkg" / "a.py")
+    assert not os.path.samefile(first_snapshot / "pkg" / "b.py", second_snapshot / "pkg" / "b.py")
+    assert (first_snapshot / "pkg" / "b.py").read_text(encoding="utf-8") == "b = 1\n"
+
+    manifest = checkpoint_store.load_checkpoint_metadata(second.checkpoint_id, str(root))[
+        "manifest"
+    ]
+    assert set(manifest["files"]) == {"pkg/a.py", "pkg/b.py", "pkg/c.py"}
+
+
+def test_unchanged_files_are_not_reread_on_the_next_create(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = _project(tmp_path)
+    checkpoint_store.create_checkpoint(str(root))
+    (root / "pkg" / "c.py").write_text("c = 3\n", encoding="utf-8")
+
+    hashed: list[str] = []
+    real_digest = checkpoint_blobs._file_digest
+
+    def _recording(path: Path) -> str:
+        hashed.append(Path(path).name)
+        return real_digest(path)
+
+    monkeypatch.setattr(checkpoint_blobs, "_file_digest", _recording)
+    checkpoint_store.create_checkpoint(str(root))
+
+    assert "a.py" not in hashed and "b.py" not in hashed
+    assert "c.py" in hashed
+
+
+def test_undo_rewrites_only_files_whose_content_differs(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    created = checkpoint_store.create_checkpoint(str(root))
+    (root / "pkg" / "a.py").write_text("a = 'edited'\n", encoding="utf-8")
+    untouched = root / "pkg" / "b.py"
+    inode_before = untouched.stat().st_ino
+
+    result = checkpoint_store.undo_checkpoint(created.checkpoint_id, str(root))
+
+    assert result.restored_files == 1
+    assert (root / "pkg" / "a.py").read_text(encoding="utf-8") == "a = 1\n"
+    assert untouched.stat().st_ino == inode_before
+    assert untouched.stat().st_nlink == 1, "a working-tree file must never share a blob inode"
+
+
+def test_retention_gc_drops_blobs_no_snapshot_links_to(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("TG_CHECKPOINT_MAX", "1")
+    root = _project(tmp_path)
+    checkpoint_store.create_checkpoint(str(root))
+    (root / "pkg" / "a.py").write_text("a = 2\n", encoding="utf-8")
+    latest = checkpoint_store.create_checkpoint(str(root))
+
+    assert [record.checkpoint_id for record in checkpoint_store.list_checkpoints(str(root))] == [
+        latest.checkpoint_id
+    ]
+    assert len(_blobs(root)) == 3
+    assert all(blob.stat().st_nlink == 2 for blob in _blobs(root))
+
+
+def test_legacy_checkpoint_without_manifest_restores_every_entry(tmp_path: Path) -> None:
+    root = _project(tmp_path)
+    created = checkpoint_store.create_checkpoint(str(root))
+    metadata_path = checkpoint_store._metadata_path(root, created.checkpoint_id)
+    metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+    del metadata["manifest"]
+    metadata_path.write_text(json.dumps(metadata), encoding="utf-8")
+    (root / "pkg" / "a.py").write_text("a = 'edited'\n", encoding="utf-8")
+
+    result = checkpoint_store.undo_checkpoint(created.checkpoint_id, str(root))
+
+    assert result.restored_files == 3
+    assert (root / "pkg" / "a.py").read_text(encoding="utf-8") == "a = 1\n"
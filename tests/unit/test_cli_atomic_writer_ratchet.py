@@ -772,17 +772,30 @@ _SANCTIONED_SITES: dict[tuple[str, str, str], str] = {
         "in THIS SAME function to stage an embedded manifest for signature re-verification -- a "
         "self-contained temp artifact, never published outside the function's own scope."
     ),
-    ("checkpoint_store.py", "create_checkpoint", "shutil.copy2"): (
+    ("checkpoint_blobs.py", "_snapshot_file", "shutil.copy2"): (
         "Snapshot copy explicitly passes `follow_symlinks=False` (audit HIGH -- symlink "
         "disclosure): a symlinked entry is stored AS a link, never resolved and copied through, "
-        "so this call carries the same destination-identity guarantee os.replace does. Was "
-        'previously listed under a `("checkpoint_store.py", "*", ...)` wildcard key that the '
-        "matcher (keyed on the exact (module, outer_function, operation) triple) never actually "
-        "matched -- the module was simply outside the old 3-file scan scope, so the wildcard was "
-        "dead. Fixed to real per-function entries now that the census walks this file."
+        "so this call carries the same destination-identity guarantee os.replace does. Moved "
+        "here from `checkpoint_store.py::create_checkpoint` with the blob store, which now only "
+        "copies a non-regular entry or falls back from a failed hardlink; the destination is "
+        "always a fresh path inside the just-created `snapshot/` directory."
+    ),
+    ("checkpoint_blobs.py", "_store_blob", "shutil.copy2"): (
+        "Copies an lstat-verified regular file (`follow_symlinks=False`) into a fresh "
+        "uuid4-named temp path inside the internally-derived blob store -- never a caller-"
+        "selected destination. Not routed through `atomic_write_bytes`: that helper needs the "
+        "whole payload in memory, and a checkpointed file may be up to "
+        "TG_CHECKPOINT_MAX_FILE_BYTES (same size-capped-streaming reason as `lsp_provider_"
+        "setup.py::_download` below)."
+    ),
+    ("checkpoint_blobs.py", "_store_blob", "os.replace"): (
+        "Publishes that temp file under its content-addressed name in the same store: a "
+        "non-dereferencing rename of bytes this function just wrote, to a name derived from "
+        "their own sha256, so a concurrent writer of the same blob can only replace it with "
+        "identical content."
     ),
     ("checkpoint_store.py", "undo_checkpoint", "shutil.copy2"): (
-        "Same `follow_symlinks=False` guarantee as the `create_checkpoint` entry above, at both "
+        "Same `follow_symlinks=False` guarantee as the `_snapshot_file` entry above, at both "
         "the stage-to-temp copy and the commit-phase copy-into-working-tree in this function "
         "(two call sites sharing this one function-level fingerprint, same pattern as the "
         "`_repair_windows_python_subprocess_launcher` entry above)."
@@ -1539,6 +1552,8 @@ _EXPECTED_HELPER_BACKED = {
         "_download_rust_analyzer",
         "tensor_grep.cli._index_lock.atomic_write_bytes_anchored",
     ),
+    # The LSP server's shadow copy of an unsaved editor buffer, parsed for the repo map.
+    ("lsp_server.py", "_parse_unsaved_buffer", "tensor_grep.cli._index_lock.atomic_write_bytes"),
     (
         "native_frontdoor.py",
         "_write_native_frontdoor_metadata",
@@ -1569,7 +1584,9 @@ _EXPECTED_SANCTIONED = {
     # --- Newly discovered once the census walked the full _CLI_SRC directory ---
     ("agent_capsule.py", "_agent_gpu_evidence", "Path.write_text"),
     ("audit_manifest.py", "verify_review_bundle", "Path.write_text"),
-    ("checkpoint_store.py", "create_checkpoint", "shutil.copy2"),
+    ("checkpoint_blobs.py", "_snapshot_file", "shutil.copy2"),
+    ("checkpoint_blobs.py", "_store_blob", "shutil.copy2"),
+    ("checkpoint_blobs.py", "_store_blob", "os.replace"),
     ("checkpoint_store.py", "undo_checkpoint", "shutil.copy2"),
     ("lsp_provider_setup.py", "_ensure_node_runtime", "os.replace"),
     ("lsp_provider_setup.py", "_safe_extract_tar", "archive.extractall"),
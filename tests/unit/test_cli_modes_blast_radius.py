@@ -313,7 +313,7 @@ def test_cli_broad_claude_ripgrep_backend_adds_guard_excludes(monkeypatch):
     assert "!**/context/**" in seen["glob"]
 
 
-def test_cli_rg_aggregate_json_timeout_emits_incomplete_envelope_exit2(monkeypatch):
+def test_cli_rg_aggregate_json_timeout_emits_incomplete_envelope_exit2(monkeypatch, canned_rg_json):
     """Fable review of #400, finding H2: when `tg search PATTERN --json` routes to the
     ripgrep AGGREGATE backend and the rg subprocess times out, the old code let
     ``subprocess.TimeoutExpired`` fall into RipgrepBackend.search()'s broad `except
@@ -325,8 +325,6 @@ def test_cli_rg_aggregate_json_timeout_emits_incomplete_envelope_exit2(monkeypat
     ``result_incomplete: true`` and exit 2 -- the same signal already used for the native
     walk-deadline timeout (#400) and rg's own soft exit-2 partial failure.
     """
-    import subprocess as _subprocess
-
     from tensor_grep.backends.ripgrep_backend import RipgrepBackend as RealRipgrepBackend
 
     global _FAKE_WALK
@@ -335,10 +333,11 @@ def test_cli_rg_aggregate_json_timeout_emits_incomplete_envelope_exit2(monkeypat
     real_backend = RealRipgrepBackend()
     monkeypatch.setattr(RealRipgrepBackend, "_get_binary_name", lambda self: "rg")
 
-    def _raise_timeout(*_args, **_kwargs):
-        raise _subprocess.TimeoutExpired(cmd=["rg"], timeout=5, output="")
-
-    monkeypatch.setattr("tensor_grep.backends.ripgrep_backend.run_subprocess", _raise_timeout)
+    # A hung rg, killed by the aggregate search's own timeout.
+    monkeypatch.setattr(
+        "tensor_grep.backends.ripgrep_backend.popen_rg_json", canned_rg_json(hang=True)
+    )
+    monkeypatch.setenv("TG_RG_TIMEOUT_SECONDS", "0.05")
 
     class _RipgrepPipeline:
         def __init__(self, force_cpu=False, config=None):
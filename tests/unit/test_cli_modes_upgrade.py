@@ -194,6 +194,7 @@ def test_cli_stats_should_respect_count_only_ripgrep_results(monkeypatch):
 
     assert result.exit_code == 0
     assert "[stats] scanned_files=2 matched_files=1 total_matches=3" in result.output
+    assert "[stats] walk_cache_hits=" in result.output
 
 
 def test_files_with_matches_should_use_count_only_ripgrep_file_paths(monkeypatch):
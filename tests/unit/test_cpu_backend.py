@@ -1,3 +1,4 @@
+import os
 import subprocess
 import sys
 import time
@@ -381,6 +382,8 @@ class TestCPUBackend:
 
         log_file = tmp_path / "sys.log"
         log_file.write_bytes(b"alpha needle one\r\nbeta line two\r\n")
+        # Settled: a file written within the racy window is never persisted.
+        os.utime(log_file, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
 
         cache_path = backend._get_prefilter_cache_path(str(log_file), False)
         # The version lives in the cache PATH itself, not just the payload -- an older tg
@@ -391,7 +394,7 @@ class TestCPUBackend:
         # drops the `-v{VERSION}` suffix (reopening exactly that corruption) is caught here
         # -- the payload-only assertion below cannot catch a filename regression, since it
         # reads whatever `cache_path` computes to, not a fixed expected name.
-        assert cache_path.name.endswith(f"-v{_CPU_LITERAL_INDEX_CACHE_FORMAT_VERSION}.json")
+        assert cache_path.name.endswith(f"-v{_CPU_LITERAL_INDEX_CACHE_FORMAT_VERSION}.tgi")
         cache_path.parent.mkdir(parents=True, exist_ok=True)
         stale_payload = {
             # No "format_version" key at all -- the exact pre-#262 on-disk shape.
@@ -406,9 +409,15 @@ class TestCPUBackend:
         assert result.routing_reason == "cpu_python_regex_prefilter"  # fresh, not "_cache"
         assert result.matches[0].text == "alpha needle one\r"
 
-        rewritten = json.loads(cache_path.read_text(encoding="utf-8"))
-        assert rewritten["format_version"] == _CPU_LITERAL_INDEX_CACHE_FORMAT_VERSION
-        assert rewritten["lines"] == ["alpha needle one\r", "beta line two\r"]
+        from tensor_grep.core.line_trigram_index import MappedLineTrigramIndex
+
+        with MappedLineTrigramIndex.open(
+            cache_path,
+            source_path=str(log_file),
+            file_signature=backend._build_file_signature(str(log_file)),
+        ) as rewritten:
+            assert list(rewritten.lines) == ["alpha needle one\r", "beta line two\r"]
+            assert rewritten["alp"] == [0]
 
     def test_literal_index_cache_obeys_entry_cap(self, tmp_path, monkeypatch):
         monkeypatch.setenv("TENSOR_GREP_CPU_REGEX_INDEX", "0")
@@ -961,6 +970,7 @@ class TestCPUBackend:
 
         log = tmp_path / "persistent_prefilter.log"
         log.write_text("INFO ok\nERROR x timeout\nWARN no\n", encoding="utf-8")
+        os.utime(log, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
 
         rust_mod = types.ModuleType("tensor_grep.rust_core")
 
@@ -991,6 +1001,32 @@ class TestCPUBackend:
         assert second.total_matches == 1
         assert second.routing_reason == "cpu_python_regex_prefilter_cache"
 
+    def test_should_not_persist_literal_prefilter_for_a_recently_written_file(
+        self, tmp_path, monkeypatch
+    ):
+        cache_dir = tmp_path / "cpu-prefilter-cache"
+        monkeypatch.setenv("TENSOR_GREP_CPU_REGEX_INDEX_DIR", str(cache_dir))
+        monkeypatch.setenv("TENSOR_GREP_CPU_REGEX_INDEX", "1")
+        CPUBackend._clear_shared_caches()
+
+        log = tmp_path / "fresh_prefilter.log"
+        log.write_text("INFO ok\nERROR x timeout\nWARN no\n", encoding="utf-8")
+
+        rust_mod = types.ModuleType("tensor_grep.rust_core")
+
+        class FailingRustBackend:
+            def search(self, **_kwargs):
+                raise ImportError("simulated rust_core absent")
+
+        rust_mod.RustBackend = FailingRustBackend
+
+        with patch.dict("sys.modules", {"tensor_grep.rust_core": rust_mod}):
+            result = CPUBackend().search(str(log), r"ERROR.*timeout", config=SearchConfig())
+
+        # Its stamp cannot tell this content from a same-size rewrite within the same tick.
+        assert result.routing_reason == "cpu_python_regex_prefilter"
+        assert not cache_dir.exists() or not list(cache_dir.rglob("*.tgi"))
+
     def test_should_invalidate_persistent_literal_prefilter_cache_when_file_changes(
         self, tmp_path, monkeypatch
     ):
@@ -0,0 +1,130 @@
+"""Tests for the persistent dense-embedding store behind `DenseIndex`."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from tensor_grep.core.embedding_cache import EmbeddingCache, embedding_cache_status
+from tensor_grep.core.retrieval_chunker import Chunk
+from tensor_grep.core.retrieval_dense import DenseIndex
+
+
+class _CountingModel:
+    """Deterministic per-text embeddings that record every text it is asked to encode."""
+
+    def __init__(self, dim: int = 4) -> None:
+        self.dim = dim
+        self.encoded: list[str] = []
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        self.encoded.extend(texts)
+        rows = []
+        for text in texts:
+            rng = np.random.default_rng(sum(text.encode("utf-8")) + len(text))
+            rows.append(rng.standard_normal(self.dim))
+        return np.asarray(rows, dtype=np.float32)
+
+
+@pytest.fixture
+def model_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("TG_EMBEDDING_CACHE_DIR", str(tmp_path / "store"))
+    monkeypatch.delenv("TG_EMBEDDING_CACHE", raising=False)
+    monkeypatch.delenv("TG_EMBEDDING_CACHE_MAX_MB", raising=False)
+    directory = tmp_path / "model"
+    directory.mkdir()
+    (directory / "config.json").write_text('{"hidden_dim": 4}', encoding="utf-8")
+    (directory / "model.safetensors").write_bytes(b"weights")
+    return directory
+
+
+def _chunks(*texts: str) -> list[Chunk]:
+    return [
+        Chunk(file_path=f"f{index}.py", start_line=1, end_line=1, text=text)
+        for index, text in enumerate(texts)
+    ]
+
+
+def test_only_new_chunks_are_encoded_and_rankings_match(model_dir: Path) -> None:
+    chunks = _chunks("def alpha(): pass", "def beta(): pass", "def gamma(): pass")
+    model = _CountingModel()
+    uncached = DenseIndex(chunks, _CountingModel())
+
+    first = DenseIndex(chunks, model, embedding_cache=EmbeddingCache.open(model_dir))
+    assert model.encoded == [chunk.text for chunk in chunks]
+
+    model.encoded.clear()
+    changed = [*chunks[:2], Chunk(file_path="f2.py", start_line=1, end_line=1, text="new text")]
+    cache = EmbeddingCache.open(model_dir)
+    assert cache is not None and len(cache) == 3
+    second = DenseIndex(changed, model, embedding_cache=cache)
+    assert model.encoded == ["new text"]
+
+    # Stored rows are bit-identical to a fresh encode, so rankings never depend on the cache.
+    assert first.query("alpha") == uncached.query("alpha")
+    np.testing.assert_array_equal(second._matrix[:2], uncached._matrix[:2])
+
+
+def test_status_reports_the_cumulative_hit_rate(model_dir: Path) -> None:
+    chunks = _chunks("one", "two")
+    DenseIndex(chunks, _CountingModel(), embedding_cache=EmbeddingCache.open(model_dir))
+    DenseIndex(chunks, _CountingModel(), embedding_cache=EmbeddingCache.open(model_dir))
+
+    status = embedding_cache_status(model_dir)
+    assert status["exists"] is True
+    assert (status["entries"], status["hits"], status["misses"]) == (2, 2, 2)
+    assert status["hit_rate"] == 0.5
+    assert status["bytes"] > 0
+
+
+def test_eviction_keeps_the_most_recently_used_rows(
+    model_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Each row costs 16 (key) + 8 (stamp) + 4 * 4 (vector) = 40 bytes: room for three rows.
+    monkeypatch.setenv("TG_EMBEDDING_CACHE_MAX_MB", str(120 / (1024 * 1024)))
+    model = _CountingModel()
+    DenseIndex(_chunks("a", "b"), model, embedding_cache=EmbeddingCache.open(model_dir))
+    DenseIndex(_chunks("b", "c"), model, embedding_cache=EmbeddingCache.open(model_dir))
+    DenseIndex(_chunks("d"), model, embedding_cache=EmbeddingCache.open(model_dir))
+
+    model.encoded.clear()
+    cache = EmbeddingCache.open(model_dir)
+    assert cache is not None and len(cache) == 3
+    DenseIndex(_chunks("a", "b", "c", "d"), model, embedding_cache=cache)
+    assert model.encoded == ["a"]
+
+
+def test_a_different_model_revision_never_reuses_embeddings(model_dir: Path) -> None:
+    model = _CountingModel()
+    DenseIndex(_chunks("shared"), model, embedding_cache=EmbeddingCache.open(model_dir))
+    (model_dir / "config.json").write_text('{"hidden_dim": 8}', encoding="utf-8")
+
+    model.encoded.clear()
+    DenseIndex(_chunks("shared"), model, embedding_cache=EmbeddingCache.open(model_dir))
+    assert model.encoded == ["shared"]
+
+
+def test_corrupt_or_disabled_store_falls_back_to_encoding(
+    model_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    model = _CountingModel()
+    DenseIndex(_chunks("x", "y"), model, embedding_cache=EmbeddingCache.open(model_dir))
+    cache = EmbeddingCache.open(model_dir)
+    assert cache is not None
+    meta = json.loads((cache.directory / "embeddings_meta.json").read_text(encoding="utf-8"))
+    (cache.directory / meta["vectors"]).write_bytes(b"not an npy file")
+
+    model.encoded.clear()
+    DenseIndex(_chunks("x", "y"), model, embedding_cache=EmbeddingCache.open(model_dir))
+    assert model.encoded == ["x", "y"]
+    model.encoded.clear()
+    DenseIndex(_chunks("x", "y"), model, embedding_cache=EmbeddingCache.open(model_dir))
+    assert model.encoded == []
+
+    for disabled in ("0", "false", "no", "off", " OFF "):
+        monkeypatch.setenv("TG_EMBEDDING_CACHE", disabled)
+        assert EmbeddingCache.open(model_dir) is None
+    assert EmbeddingCache.open(model_dir.parent / "not-fetched") is None
@@ -0,0 +1,159 @@
+"""Walk listings are reused while every walked directory keeps its mtime."""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from tensor_grep.cli import repo_map
+from tensor_grep.core.config import SearchConfig
+from tensor_grep.io.directory_scanner import DirectoryScanner
+from tensor_grep.io.file_universe import FILE_UNIVERSE, file_universe_entries
+
+
+@pytest.fixture(autouse=True)
+def _fresh_universe(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("TENSOR_GREP_FILE_UNIVERSE_CACHE", raising=False)
+    FILE_UNIVERSE.clear()
+    repo_map._load_gitignore_matcher.cache_clear()
+
+
+def _age(root: Path) -> None:
+    # Listings are only kept once their directories are past the racy-timestamp window.
+    past = time.time() - 60
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, (past, past))
+
+
+def _tree(root: Path) -> Path:
+    for rel in (
+        "src/app.py",
+        "src/pkg/core.py",
+        "src/pkg/util.rs",
+        "tests/test_app.py",
+        "docs/guide.md",
+        "build/out.py",
+        "README.md",
+        "setup.py",
+        ".hidden/secret.py",
+    ):
+        target = root / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("x = 1\n", encoding="utf-8")
+    (root / ".gitignore").write_text("build/\n", encoding="utf-8")
+    _age(root)
+    return root
+
+
+def _live(monkeypatch: pytest.MonkeyPatch, walk: Callable[[], object]) -> object:
+    monkeypatch.setenv("TENSOR_GREP_FILE_UNIVERSE_CACHE", "0")
+    try:
+        return walk()
+    finally:
+        monkeypatch.delenv("TENSOR_GREP_FILE_UNIVERSE_CACHE")
+
+
+def test_repo_walk_is_served_from_the_universe_in_every_view(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = _tree(tmp_path)
+
+    first = repo_map._iter_repo_files(root)
+    assert (FILE_UNIVERSE.hits, FILE_UNIVERSE.misses) == (0, 1)
+    assert repo_map._iter_repo_files(root) == first
+    for cap in (1, 2, 3, 5, 50):
+        cached = repo_map._iter_repo_files(root, max_files=cap)
+        live = partial(repo_map._iter_repo_files, root, max_files=cap)
+        assert cached == _live(monkeypatch, live)
+    assert FILE_UNIVERSE.hits == 6
+    assert "out.py" not in {path.name for path in first}
+
+
+def test_a_capped_walk_that_runs_dry_fills_the_universe(tmp_path: Path) -> None:
+    root = _tree(tmp_path)
+
+    assert len(repo_map._iter_repo_files(root, max_files=3)) == 3
+    assert FILE_UNIVERSE.hits == 0
+    complete = repo_map._iter_repo_files(root, max_files=1000)
+    assert repo_map._iter_repo_files(root) == sorted(
+        complete, key=lambda path: repo_map._repo_walk_path_sort_key(path, root)
+    )
+    assert FILE_UNIVERSE.hits == 1
+
+
+def test_a_changed_directory_invalidates_and_a_fresh_one_is_never_kept(tmp_path: Path) -> None:
+    root = _tree(tmp_path)
+    repo_map._iter_repo_files(root)
+
+    (root / "src" / "pkg" / "added.py").write_text("y = 2\n", encoding="utf-8")
+    walked = {path.name for path in repo_map._iter_repo_files(root)}
+    assert "added.py" in walked
+    # src/pkg was modified just now: that walk is racy and must not be stored.
+    repo_map._iter_repo_files(root)
+    assert (FILE_UNIVERSE.hits, FILE_UNIVERSE.misses) == (0, 3)
+
+
+def test_directory_scanner_replays_one_listing_through_each_configs_filters(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = _tree(tmp_path)
+    probe = SearchConfig()
+    narrowed = dataclasses.replace(probe, glob=["*.py"])
+
+    probed = list(DirectoryScanner(probe).walk(str(root)))
+    searched = list(DirectoryScanner(narrowed).walk(str(root)))
+
+    assert (FILE_UNIVERSE.hits, FILE_UNIVERSE.misses) == (1, 1)
+    assert probed == _live(monkeypatch, lambda: list(DirectoryScanner(probe).walk(str(root))))
+    assert searched == _live(monkeypatch, lambda: list(DirectoryScanner(narrowed).walk(str(root))))
+    assert all(path.endswith(".py") for path in searched)
+    hidden = dataclasses.replace(probe, hidden=True)
+    assert any(".hidden" in path for path in DirectoryScanner(hidden).walk(str(root)))
+    assert FILE_UNIVERSE.misses == 2
+
+
+def test_an_in_place_gitignore_edit_invalidates_the_scanner_listing(tmp_path: Path) -> None:
+    root = _tree(tmp_path)
+    list(DirectoryScanner(SearchConfig()).walk(str(root)))
+    directory_mtime = root.stat().st_mtime_ns
+
+    (root / ".gitignore").write_text("build/\ndocs/\n", encoding="utf-8")
+    os.utime(root, ns=(directory_mtime, directory_mtime))
+    walked = {Path(path).name for path in DirectoryScanner(SearchConfig()).walk(str(root))}
+
+    assert FILE_UNIVERSE.hits == 0
+    assert "guide.md" not in walked
+
+
+def test_repo_file_universe_entries_carry_size_test_flag_and_language(tmp_path: Path) -> None:
+    root = _tree(tmp_path)
+
+    entries = {entry.path.name: entry for entry in repo_map._repo_file_universe(root)}
+
+    assert entries["test_app.py"].is_test
+    assert not entries["core.py"].is_test
+    assert entries["core.py"].language == "python"
+    assert entries["util.rs"].language == "rust"
+    assert entries["guide.md"].language is None
+    assert entries["app.py"].size == len("x = 1\n")
+    assert entries["app.py"].mtime_ns == (root / "src" / "app.py").stat().st_mtime_ns
+
+
+def test_files_that_vanish_before_the_stat_are_reported(tmp_path: Path) -> None:
+    root = _tree(tmp_path)
+    listed = [root / "setup.py", root / "gone.py"]
+    unreadable = repo_map._UnreadablePathFlag()
+
+    entries = file_universe_entries(
+        listed, repo_map._classify_universe_file, unreadable_hit=unreadable
+    )
+
+    assert [entry.path.name for entry in entries] == ["setup.py"]
+    assert unreadable.count == 1
+    assert unreadable.sample == [str(root / "gone.py")]
@@ -0,0 +1,141 @@
+"""The compiled `.gitignore` engine answers exactly like the rule-by-rule loop it replaced."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pathspec
+
+from tensor_grep.core.config import SearchConfig
+from tensor_grep.io.directory_scanner import DirectoryScanner
+from tensor_grep.io.gitignore_rules import GitignoreRules
+
+_SEGMENTS = [
+    "a",
+    "b",
+    "build",
+    "x.log",
+    ".log",
+    "node_modules",
+    "src",
+    "foo.py",
+    "c d",
+    "b.egg-info",
+]
+_PATTERNS = [
+    "a",
+    "b/",
+    "build",
+    "*.log",
+    "*.py",
+    "/build",
+    "a/b",
+    "a/b/",
+    "src/",
+    "*",
+    "*/",
+    "!a",
+    "!*.log",
+    "**/b",
+    "a/*.py",
+    "b?",
+    "/a",
+    "x.log",
+    "*.egg-info/",
+    "!build/",
+    "/src/a",
+    "node_modules/",
+    " a",
+    "a ",
+    "#c",
+    "\\#x",
+    "\\!a",
+    "!/a/b",
+]
+
+
+def _random_cases(seed: int) -> list[tuple[list[str], list[tuple[str, bool]]]]:
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(1500):
+        lines = [rng.choice(_PATTERNS) for _ in range(rng.randint(0, 6))]
+        paths = [
+            (
+                "/".join(rng.choice(_SEGMENTS) for _ in range(rng.randint(1, 4))),
+                rng.random() < 0.4,
+            )
+            for _ in range(20)
+        ]
+        cases.append((lines, paths))
+    return cases
+
+
+def test_compiled_lookups_agree_with_the_rule_by_rule_loop() -> None:
+    for lines, paths in _random_cases(seed=19):
+        rules = GitignoreRules(lines)
+        for rel_posix, is_dir in paths:
+            assert rules.check(rel_posix, is_dir=is_dir) == rules._check_rule_by_rule(
+                rel_posix, is_dir=is_dir
+            ), (lines, rel_posix, is_dir)
+
+
+def test_plain_ignore_lists_agree_with_pathspec() -> None:
+    compared = 0
+    for lines, paths in _random_cases(seed=20):
+        rules = GitignoreRules(lines)
+        if not rules.plain_ignores_only:
+            continue
+        spec = pathspec.GitIgnoreSpec.from_lines(lines)
+        for rel_posix, is_dir in paths:
+            expected = spec.check_file(f"{rel_posix}/" if is_dir else rel_posix).include
+            assert bool(rules.check(rel_posix, is_dir=is_dir)) == bool(expected), (
+                lines,
+                rel_posix,
+                is_dir,
+            )
+            compared += 1
+    assert compared > 1000
+
+
+def test_rule_forms_are_filed_into_lookups_or_the_residual() -> None:
+    rules = GitignoreRules(["node_modules/", "*.pyc", "/dist", "rust_core/target/", "a/**/b"])
+
+    assert not rules.plain_ignores_only
+    assert rules._names_any == {"node_modules": 0}
+    assert rules._names_file == {}
+    assert rules._suffixes_file == {".pyc": 1}
+    assert rules._anchored_any == {"dist": 2, "rust_core/target": 3}
+    assert rules._residual == [4]
+    assert GitignoreRules(["node_modules/", "*.pyc", "/dist"]).plain_ignores_only
+    assert not GitignoreRules(["*.log", "!keep.log"]).plain_ignores_only
+
+
+def test_directory_decisions_are_memoized_per_directory() -> None:
+    rules = GitignoreRules(["*.log", "vendor/", "!vendor/keep/"])
+
+    assert rules.check("src/pkg/a.log", is_dir=False) is True
+    assert rules.check("src/pkg/a.py", is_dir=False) is None
+    assert rules.check("vendor/keep", is_dir=True) is False
+    assert rules.check("vendor/keep/x.py", is_dir=False) is False
+    assert set(rules._dir_decisions) == {"src", "src/pkg", "vendor", "vendor/keep"}
+    # A newline-bearing path falls back to the exact loop: the rule regexes' `.` stops at a
+    # newline, so the unanchored `vendor/` cannot reach past `p\nq/` here.
+    assert rules.check("p\nq/vendor/x.py", is_dir=False) is None
+
+
+def test_directory_scanner_uses_the_engine_for_plain_ignore_files(tmp_path: Path) -> None:
+    (tmp_path / ".gitignore").write_text("build/\n*.tmp\n/dist\n", encoding="utf-8")
+    nested = tmp_path / "pkg"
+    nested.mkdir()
+    (nested / ".gitignore").write_text("*.log\n!keep.log\n", encoding="utf-8")
+    for rel in ("main.py", "a.tmp", "build/out.py", "dist/w.py", "pkg/x.log", "pkg/keep.log"):
+        target = tmp_path / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("x\n", encoding="utf-8")
+    scanner = DirectoryScanner(SearchConfig())
+
+    assert isinstance(scanner._load_ignore_spec(tmp_path), GitignoreRules)
+    assert isinstance(scanner._load_ignore_spec(nested), pathspec.GitIgnoreSpec)
+    walked = {Path(path).relative_to(tmp_path).as_posix() for path in scanner.walk(str(tmp_path))}
+    assert walked == {"main.py", "pkg/keep.log"}
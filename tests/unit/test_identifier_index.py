@@ -0,0 +1,141 @@
+"""Caller / reference probes answer from the persisted identifier index once a file is seen."""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from tensor_grep.cli import repo_map
+from tensor_grep.core.identifier_index import (
+    IdentifierIndex,
+    close_identifier_indexes,
+    identifier_index_path,
+    identifier_tokens,
+    open_identifier_index,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_index(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("TENSOR_GREP_IDENTIFIER_INDEX_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("TENSOR_GREP_IDENTIFIER_INDEX", raising=False)
+    close_identifier_indexes()
+    yield
+    close_identifier_indexes()
+
+
+def _write_aged(path: Path, text: str, *, age_seconds: int = 60) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    past = time.time() - age_seconds
+    os.utime(path, (past, past))
+    return path
+
+
+def _repo(root: Path) -> Path:
+    _write_aged(root / "repo" / "a.py", "def target():\n    return 1\n")
+    _write_aged(root / "repo" / "b.py", "from a import target\n\nprint(target())\n")
+    _write_aged(root / "repo" / "c.py", "target_other = 'x'\n")
+    (root / "repo" / "blob.bin").write_bytes(b"target\0\0\0")
+    return root / "repo"
+
+
+def _counting_reads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    reads: list[str] = []
+    original = repo_map._read_source_cached
+
+    def _spy(path_str: str) -> bytes:
+        reads.append(Path(path_str).name)
+        return original(path_str)
+
+    monkeypatch.setattr(repo_map, "_read_source_cached", _spy)
+    return reads
+
+
+def _size_and_mtime(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _probe(repo: Path, symbol: str) -> dict[str, bool]:
+    return {
+        name: repo_map._file_may_contain_literal_symbol(repo / name, symbol)
+        for name in ("a.py", "b.py", "c.py")
+    }
+
+
+def test_identifier_tokens_are_the_ascii_word_runs_of_the_raw_bytes() -> None:
+    tokens = identifier_tokens("x.target_other(y1, 'caféName')\n".encode())
+
+    assert tokens == {b"x", b"target_other", b"y1", b"caf", b"Name"}
+
+
+def test_a_persisted_index_answers_without_rereading_unchanged_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo = _repo(tmp_path)
+    open_identifier_index(repo)
+    first = _probe(repo, "target")
+    close_identifier_indexes()
+    assert identifier_index_path(repo.resolve()).is_file()
+
+    reads = _counting_reads(monkeypatch)
+    open_identifier_index(repo)
+
+    assert _probe(repo, "target") == first == {"a.py": True, "b.py": True, "c.py": False}
+    assert _probe(repo, "target_other") == {"a.py": False, "b.py": False, "c.py": True}
+    assert not repo_map._file_may_contain_literal_symbol(repo / "blob.bin", "target")
+    assert reads == ["blob.bin"]
+
+
+def test_changed_files_are_retokenized_and_racy_ones_are_not_recorded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo = _repo(tmp_path)
+    index = open_identifier_index(repo)
+    assert index is not None
+    _probe(repo, "target")
+
+    _write_aged(repo / "c.py", "print(target)\n", age_seconds=30)
+    (repo / "a.py").write_text("def renamed():\n    return 2\n", encoding="utf-8")
+    reads = _counting_reads(monkeypatch)
+
+    assert _probe(repo, "target") == {"a.py": False, "b.py": True, "c.py": True}
+    assert reads == ["a.py", "c.py"]
+    assert index.contains("c.py", *_size_and_mtime(repo / "c.py"), "target") is True
+    assert index.contains("a.py", *_size_and_mtime(repo / "a.py"), "renamed") is None
+
+
+def test_symbols_the_index_cannot_answer_keep_the_byte_scan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo = _repo(tmp_path)
+    open_identifier_index(repo)
+    _probe(repo, "target")
+    reads = _counting_reads(monkeypatch)
+
+    assert repo_map._file_may_contain_literal_symbol(repo / "b.py", "target()")
+    assert reads == ["b.py"]
+    assert not repo_map._file_may_contain_literal_symbol(repo / "c.py", "target")
+    monkeypatch.setenv("TENSOR_GREP_IDENTIFIER_INDEX", "0")
+    close_identifier_indexes()
+    assert open_identifier_index(repo) is None
+    # Without the index the probe is the old substring test again.
+    assert repo_map._file_may_contain_literal_symbol(repo / "c.py", "target")
+
+
+def test_callers_open_and_persist_the_index_for_the_map_root(tmp_path: Path) -> None:
+    repo = _repo(tmp_path)
+
+    payload = repo_map.build_symbol_callers(
+        "target", repo, max_repo_files=None, deadline_seconds=None
+    )
+
+    assert {Path(str(call["file"])).name for call in payload["callers"]} == {"b.py"}
+    stored = IdentifierIndex.load(str(repo.resolve()))
+    assert stored.contains("b.py", *_size_and_mtime(repo / "b.py"), "target") is True
+    assert stored.contains("c.py", *_size_and_mtime(repo / "c.py"), "target") is False
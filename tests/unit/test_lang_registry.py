@@ -426,3 +426,48 @@ def test_blast_radius_downgrades_graph_trust_summary_when_gaps_present(tmp_path:
     assert "resolution_gaps" in payload
     if payload["resolution_gaps"]:
         assert payload["graph_trust_summary"].get("resolution_gaps_present") is True
+
+
+class _CountingParser:
+    def __init__(self, parser: object) -> None:
+        self._parser = parser
+        self.parses = 0
+
+    def parse(self, source_bytes: bytes) -> object:
+        self.parses += 1
+        return self._parser.parse(source_bytes)  # type: ignore[attr-defined]
+
+
+def test_go_extractors_share_one_parse_per_file_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    go_parser = lang_go._go_parser()
+    if go_parser is None:
+        pytest.skip("tree_sitter_go not installed")
+    counting = _CountingParser(go_parser)
+    monkeypatch.setattr(lang_go, "_go_parser", lambda: counting)
+    lang_registry.clear_parsed_trees()
+    path = tmp_path / "main.go"
+    path.write_text(
+        'package main\n\nimport "fmt"\n\nfunc Target() {}\n\nfunc main() {\n'
+        '\tfmt.Println("x")\n\tTarget()\n}\n',
+        encoding="utf-8",
+    )
+
+    _imports, symbols = lang_go.go_imports_and_symbols(path)
+    lines = lang_go.go_imports_with_lines(path)
+    sources = lang_go.go_parser_symbol_sources(path, "Target")
+    _refs, calls = lang_go.go_references_and_calls(path, "Target", tmp_path)
+
+    assert counting.parses == 1
+    assert {symbol["name"] for symbol in symbols} >= {"Target", "main"}
+    assert [entry["module"] for entry in lines] == ["fmt"]
+    assert sources and calls
+
+    path.write_text("package main\n\nfunc Target() {}\n\nfunc Other() {}\n", encoding="utf-8")
+    _imports, symbols = lang_go.go_imports_and_symbols(path)
+    assert counting.parses == 2
+    assert "Other" in {symbol["name"] for symbol in symbols}
+    lang_registry.clear_parsed_trees()
+    lang_go.go_imports_with_lines(path)
+    assert counting.parses == 3
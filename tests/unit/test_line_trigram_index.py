@@ -0,0 +1,139 @@
+import os
+
+from tensor_grep.core.line_trigram_index import (
+    MappedLineTrigramIndex,
+    decode_varint_deltas,
+    encode_varint_deltas,
+    line_start_offsets,
+    write_line_trigram_index,
+)
+from tensor_grep.core.result import split_source_lines
+
+
+def _build_index(lines: list[str]) -> dict[str, list[int]]:
+    index: dict[str, set[int]] = {}
+    for line_idx, line in enumerate(lines):
+        for start in range(max(len(line) - 2, 0)):
+            index.setdefault(line[start : start + 3], set()).add(line_idx)
+    return {trigram: sorted(values) for trigram, values in index.items()}
+
+
+def _signature(path) -> tuple[int, int]:
+    stat_result = path.stat()
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _write(tmp_path, raw: bytes):
+    source = tmp_path / "source.txt"
+    source.write_bytes(raw)
+    # Settled: an index is never trusted for a file written within the racy window.
+    os.utime(source, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+    lines = split_source_lines(raw.decode("utf-8", errors="replace"))
+    index_path = tmp_path / "source.tgi"
+    write_line_trigram_index(
+        index_path,
+        file_signature=_signature(source),
+        line_offsets=line_start_offsets(raw),
+        trigram_index=_build_index(lines),
+    )
+    return source, index_path, lines
+
+
+def test_varint_deltas_round_trip_across_byte_boundaries():
+    values = [0, 1, 127, 128, 300, 16_383, 16_384, 2**40]
+    encoded = encode_varint_deltas(values)
+    assert decode_varint_deltas(encoded, 0, len(encoded)) == values
+
+
+def test_line_start_offsets_mirror_split_source_lines():
+    for raw in (b"", b"a", b"a\n", b"a\nb", b"a\r\nb\r\n", b"\n\n", b"x\ry\r"):
+        offsets = line_start_offsets(raw)
+        lines = split_source_lines(raw.decode("utf-8"))
+        assert len(offsets) - 1 == len(lines)
+        for position, line in enumerate(lines):
+            segment = raw[offsets[position] : offsets[position + 1]]
+            assert segment.removesuffix(b"\n").decode("utf-8") == line
+
+
+def test_mapped_index_answers_lookups_and_decodes_only_source_lines(tmp_path):
+    raw = "alpha needle\r\nbeta\nneedle été \xff\n".encode() + b"\xfe bad\n"
+    source, index_path, lines = _write(tmp_path, raw)
+    expected = _build_index(lines)
+
+    index = MappedLineTrigramIndex.open(
+        index_path, source_path=str(source), file_signature=_signature(source)
+    )
+    assert index is not None
+    with index:
+        assert dict(index.items()) == expected
+        assert index["nee"] == [0, 2]
+        assert index.get("zzz") is None
+        assert list(index.lines) == lines
+        assert index.lines[-1] == "� bad"
+    # The index never stores a copy of the text it indexes.
+    assert b"needle" not in index_path.read_bytes()
+
+
+def test_mapped_index_rejects_stale_truncated_and_foreign_files(tmp_path):
+    source, index_path, _lines = _write(tmp_path, b"alpha needle\nbeta needle\n")
+    mtime_ns, size = _signature(source)
+
+    assert (
+        MappedLineTrigramIndex.open(
+            index_path, source_path=str(source), file_signature=(mtime_ns + 1, size)
+        )
+        is None
+    )
+
+    payload = index_path.read_bytes()
+    index_path.write_bytes(payload[:-1])
+    assert (
+        MappedLineTrigramIndex.open(
+            index_path, source_path=str(source), file_signature=(mtime_ns, size)
+        )
+        is None
+    )
+
+    index_path.write_text('{"format_version": 2}', encoding="utf-8")
+    assert (
+        MappedLineTrigramIndex.open(
+            index_path, source_path=str(source), file_signature=(mtime_ns, size)
+        )
+        is None
+    )
+    assert (
+        MappedLineTrigramIndex.open(
+            tmp_path / "missing.tgi", source_path=str(source), file_signature=(mtime_ns, size)
+        )
+        is None
+    )
+
+
+def test_mapped_index_over_empty_source(tmp_path):
+    source, index_path, lines = _write(tmp_path, b"")
+    assert lines == []
+    with MappedLineTrigramIndex.open(
+        index_path, source_path=str(source), file_signature=_signature(source)
+    ) as index:
+        assert len(index) == 0
+        assert len(index.lines) == 0
+
+
+def test_mapped_index_is_not_trusted_for_a_recently_written_source(tmp_path):
+    source, index_path, _lines = _write(tmp_path, b"alpha needle\n")
+    source.write_bytes(b"gamma needle\n")
+    mtime_ns = source.stat().st_mtime_ns
+    write_line_trigram_index(
+        index_path,
+        file_signature=(mtime_ns, 13),
+        line_offsets=line_start_offsets(b"gamma needle\n"),
+        trigram_index=_build_index(["gamma needle"]),
+    )
+
+    # The stamp matches, but a same-size rewrite in this tick would match it too.
+    assert (
+        MappedLineTrigramIndex.open(
+            index_path, source_path=str(source), file_signature=(mtime_ns, 13)
+        )
+        is None
+    )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -10,7 +12,9 @@ pytest.importorskip("pygls.lsp.server")
 from lsprotocol.types import (
     ClientCapabilities,
     DefinitionParams,
+    DidChangeTextDocumentParams,
     DidOpenTextDocumentParams,
+    DidSaveTextDocumentParams,
     DocumentSymbolParams,
     GeneralClientCapabilities,
     InitializeParams,
@@ -21,16 +25,21 @@ from lsprotocol.types import (
     ReferenceContext,
     ReferenceParams,
     RenameParams,
+    TextDocumentContentChangeWholeDocument,
     TextDocumentIdentifier,
     TextDocumentItem,
+    VersionedTextDocumentIdentifier,
     WorkspaceSymbolParams,
 )
 
 import tensor_grep.cli.lsp_server as lsp_module
+import tensor_grep.core.symbol_name_index as symbol_name_index
 from tensor_grep.cli.lsp_server import (
     TensorGrepLSPServer,
     definition,
+    did_change,
     did_open,
+    did_save,
     document_symbol,
     initialize,
     prepare_rename,
@@ -56,6 +65,26 @@ def _open_document(server: TensorGrepLSPServer, path: Path, language_id: str) ->
     return uri
 
 
+def _change_document(server: TensorGrepLSPServer, uri: str, text: str) -> None:
+    did_change(
+        server,
+        DidChangeTextDocumentParams(
+            text_document=VersionedTextDocumentIdentifier(uri=uri, version=2),
+            content_changes=[TextDocumentContentChangeWholeDocument(text=text)],
+        ),
+    )
+
+
+def _await_repo_map_refresh(server: TensorGrepLSPServer) -> None:
+    for refresher in list(server.repo_map_refreshers.values()):
+        refresher.join(timeout=30)
+        assert not refresher.is_alive()
+
+
+def _workspace_symbol_names(server: TensorGrepLSPServer, query: str) -> set[str]:
+    return {symbol.name for symbol in workspace_symbol(server, WorkspaceSymbolParams(query=query))}
+
+
 def _drive_initialize(server: TensorGrepLSPServer, params: InitializeParams) -> InitializeResult:
     """Pump pygls' generator-based ``lsp_initialize`` protocol method the same way
     ``pygls.protocol.json_rpc.JsonRPCProtocol._run_generator`` does over real
@@ -795,3 +824,95 @@ def test_lsp_initialize_to_prepare_rename_end_to_end_utf8(tmp_path: Path) -> Non
     assert prepared.placeholder == "create_invoice"
     assert prepared.range.start.character == 4
     assert prepared.range.end.character == 4 + len("create_invoice")
+
+
+def _counted_full_builds(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    builds: list[Path] = []
+    real_build = lsp_module.repo_map.build_repo_map
+
+    def _counting(path: Any, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        builds.append(Path(path))
+        return real_build(path, *args, **kwargs)
+
+    monkeypatch.setattr(lsp_module.repo_map, "build_repo_map", _counting)
+    return builds
+
+
+def _invoice_repo(tmp_path: Path) -> tuple[Path, Path]:
+    (tmp_path / "pyproject.toml").write_text(
+        "[project]\nname='demo'\nversion='0.1.0'\n", encoding="utf-8"
+    )
+    module_path = tmp_path / "module.py"
+    module_path.write_text("def create_invoice() -> int:\n    return 1\n", encoding="utf-8")
+    (tmp_path / "extra.py").write_text("def close_invoice() -> None:\n    return None\n", "utf-8")
+    return tmp_path, module_path
+
+
+def test_lsp_edits_patch_the_repo_map_instead_of_rebuilding_it(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _, module_path = _invoice_repo(tmp_path)
+    builds = _counted_full_builds(monkeypatch)
+    server = TensorGrepLSPServer("test", "v1")
+    uri = _open_document(server, module_path, "python")
+    assert _workspace_symbol_names(server, "invoice") == {"create_invoice", "close_invoice"}
+
+    # An unsaved buffer is parsed as typed...
+    _change_document(server, uri, "def void_invoice() -> int:\n    return 0\n")
+    _await_repo_map_refresh(server)
+    assert _workspace_symbol_names(server, "invoice") == {"void_invoice", "close_invoice"}
+
+    # ...and a save re-reads just that file from disk.
+    module_path.write_text("def refund_invoice() -> int:\n    return 2\n", encoding="utf-8")
+    did_save(server, DidSaveTextDocumentParams(text_document=TextDocumentIdentifier(uri=uri)))
+    _await_repo_map_refresh(server)
+    assert _workspace_symbol_names(server, "invoice") == {"refund_invoice", "close_invoice"}
+    assert builds == [tmp_path.resolve()]
+
+
+def test_lsp_requests_read_the_last_snapshot_while_a_refresh_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _, module_path = _invoice_repo(tmp_path)
+    server = TensorGrepLSPServer("test", "v1")
+    uri = _open_document(server, module_path, "python")
+    assert "create_invoice" in _workspace_symbol_names(server, "invoice")
+
+    release = threading.Event()
+    real_incremental = lsp_module.repo_map.build_repo_map_incremental
+
+    def _blocked(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        assert release.wait(timeout=30)
+        return real_incremental(*args, **kwargs)
+
+    monkeypatch.setattr(lsp_module.repo_map, "build_repo_map_incremental", _blocked)
+    module_path.write_text("def refund_invoice() -> int:\n    return 2\n", encoding="utf-8")
+    did_save(server, DidSaveTextDocumentParams(text_document=TextDocumentIdentifier(uri=uri)))
+
+    assert "create_invoice" in _workspace_symbol_names(server, "invoice")
+    release.set()
+    _await_repo_map_refresh(server)
+    assert "refund_invoice" in _workspace_symbol_names(server, "invoice")
+
+
+def test_lsp_workspace_symbols_are_ranked_and_reindexed_per_edit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _, module_path = _invoice_repo(tmp_path)
+    table_builds: list[int] = []
+    real_build = symbol_name_index._SearchTables.build
+
+    def _counting(by_name: dict[str, list[dict[str, Any]]]) -> Any:
+        table_builds.append(len(by_name))
+        return real_build(by_name)
+
+    monkeypatch.setattr(symbol_name_index._SearchTables, "build", staticmethod(_counting))
+    server = TensorGrepLSPServer("test", "v1")
+    uri = _open_document(server, module_path, "python")
+    ranked = workspace_symbol(server, WorkspaceSymbolParams(query="closeInv"))
+    assert [symbol.name for symbol in ranked] == ["close_invoice"]
+
+    _change_document(server, uri, "def void_invoice() -> int:\n    return 0\n")
+    _await_repo_map_refresh(server)
+    assert _workspace_symbol_names(server, "vi") == {"void_invoice"}
+    assert len(table_builds) == 1
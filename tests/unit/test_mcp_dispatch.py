@@ -0,0 +1,118 @@
+"""MCP tool bodies run on a bounded worker pool, so one slow call never stalls the stdio loop."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Sequence
+from typing import Any
+
+import anyio
+import pytest
+
+pytest.importorskip("mcp.server.fastmcp")
+
+from mcp.server.fastmcp import FastMCP
+
+from tensor_grep.cli.mcp_dispatch import offload_blocking_tools
+
+
+def _server() -> tuple[FastMCP, threading.Event, list[int]]:
+    server = FastMCP("dispatch-test")
+    release = threading.Event()
+    scans_in_flight = [0, 0]  # [current, peak]
+    lock = threading.Lock()
+
+    @server.tool()
+    def tg_search(pattern: str) -> str:
+        assert release.wait(timeout=30)
+        return pattern
+
+    @server.tool()
+    def tg_mcp_capabilities() -> str:
+        return "capabilities"
+
+    @server.tool()
+    def tg_repo_map(path: str = ".") -> str:
+        return path
+
+    @server.tool()
+    def tg_scan(path: str = ".") -> str:
+        with lock:
+            scans_in_flight[0] += 1
+            scans_in_flight[1] = max(scans_in_flight[1], scans_in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            scans_in_flight[0] -= 1
+        return path
+
+    @server.tool()
+    def tg_navigate(action: str, deadline: float | None = None) -> str:
+        return f"{action}:{deadline}"
+
+    offload_blocking_tools(server, workers=4)
+    return server, release, scans_in_flight
+
+
+def _text(result: tuple[Sequence[Any], object]) -> str:
+    content, _ = result
+    return str(content[0].text)
+
+
+def test_a_blocked_scan_does_not_stall_other_tool_calls() -> None:
+    server, release, _ = _server()
+    answers: list[str] = []
+
+    async def scenario() -> None:
+        async with anyio.create_task_group() as group:
+            group.start_soon(server.call_tool, "tg_search", {"pattern": "slow"})
+            await anyio.sleep(0.05)
+            with anyio.fail_after(5):
+                answers.append(_text(await server.call_tool("tg_mcp_capabilities", {})))
+                answers.append(_text(await server.call_tool("tg_repo_map", {"path": "src"})))
+            release.set()
+
+    anyio.run(scenario)
+    assert answers == ["capabilities", "src"]
+
+
+def test_per_tool_caps_bound_concurrent_scans() -> None:
+    server, _, scans_in_flight = _server()
+
+    async def scenario() -> None:
+        async with anyio.create_task_group() as group:
+            for index in range(3):
+                group.start_soon(server.call_tool, "tg_scan", {"path": str(index)})
+
+    anyio.run(scenario)
+    assert scans_in_flight[1] == 1
+
+
+def test_a_cancelled_call_releases_the_caller_immediately() -> None:
+    server, release, _ = _server()
+    elapsed: list[float] = []
+
+    async def scenario() -> None:
+        started = time.monotonic()
+        with anyio.move_on_after(0.2):
+            await server.call_tool("tg_search", {"pattern": "abandoned"})
+        elapsed.append(time.monotonic() - started)
+        release.set()
+
+    anyio.run(scenario)
+    assert elapsed[0] < 5
+
+
+def test_the_server_budget_fills_in_a_missing_deadline(monkeypatch: pytest.MonkeyPatch) -> None:
+    server, _, _ = _server()
+    monkeypatch.setenv("TENSOR_GREP_MCP_TOOL_DEADLINE_SECONDS", "12.5")
+
+    async def scenario() -> list[str]:
+        return [
+            _text(await server.call_tool("tg_navigate", {"action": "defs"})),
+            _text(await server.call_tool("tg_navigate", {"action": "refs", "deadline": 3})),
+        ]
+
+    assert anyio.run(scenario) == ["defs:12.5", "refs:3.0"]
+    monkeypatch.delenv("TENSOR_GREP_MCP_TOOL_DEADLINE_SECONDS")
+    assert anyio.run(scenario)[0] == "defs:None"
@@ -0,0 +1,177 @@
+"""The MCP server's warm repo-map cache: one walk+parse per root, shared by every tool call."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tensor_grep.cli import mcp_repo_map_cache, mcp_server, repo_map
+from tensor_grep.cli.mcp_repo_map_cache import _McpRepoMapCache
+from tensor_grep.cli.repo_map_cache import _install_warm_repo_map_source
+from tensor_grep.cli.session_serve_cache import _json_size_bytes
+
+
+@pytest.fixture
+def warm_cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[_McpRepoMapCache]:
+    cache = _McpRepoMapCache()
+    monkeypatch.setattr(mcp_repo_map_cache, "_INSTALLED_CACHE", cache)
+    previous = _install_warm_repo_map_source(cache)
+    try:
+        yield cache
+    finally:
+        _install_warm_repo_map_source(previous)
+
+
+class _ParseCounter:
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.paths: list[str] = []
+        original = repo_map._imports_and_symbols_for_path
+
+        def _counting(path: Path) -> Any:
+            self.paths.append(Path(path).name)
+            return original(path)
+
+        monkeypatch.setattr(repo_map, "_imports_and_symbols_for_path", _counting)
+
+
+def _project(tmp_path: Path) -> Path:
+    project = tmp_path / "project"
+    (project / "src").mkdir(parents=True)
+    (project / "src" / "payments.py").write_text(
+        "def create_invoice(total):\n    return total + 1\n", encoding="utf-8"
+    )
+    (project / "src" / "service.py").write_text(
+        "from src.payments import create_invoice\n\n"
+        "def build_invoice(total):\n"
+        "    return create_invoice(total)\n",
+        encoding="utf-8",
+    )
+    return project
+
+
+def _symbol_names(payload: dict[str, Any]) -> set[str]:
+    return {str(symbol["name"]) for symbol in payload["symbols"]}
+
+
+def test_tool_calls_on_one_root_share_a_single_parse(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, warm_cache: _McpRepoMapCache
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    project = _project(tmp_path)
+    parses = _ParseCounter(monkeypatch)
+
+    first = json.loads(mcp_server.tg_repo_map(str(project)))
+    defs = json.loads(mcp_server.tg_symbol_defs("create_invoice", str(project)))
+    again = json.loads(mcp_server.tg_repo_map(str(project)))
+
+    assert sorted(parses.paths) == ["payments.py", "service.py"]
+    assert first == again
+    assert [Path(row["file"]).name for row in defs["definitions"]] == ["payments.py"]
+    stats = warm_cache.stats()
+    assert (stats["misses"], stats["hits"], stats["refreshes"]) == (1, 2, 0)
+
+
+def test_context_pack_and_impact_calls_hit_the_warm_map(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, warm_cache: _McpRepoMapCache
+) -> None:
+    # Both tools build with a profiling collector, which the warm source must let through.
+    monkeypatch.chdir(tmp_path)
+    project = _project(tmp_path)
+    parses = _ParseCounter(monkeypatch)
+
+    packs = [json.loads(mcp_server.tg_context_pack("invoice", str(project))) for _ in range(2)]
+    assert (warm_cache.stats()["misses"], warm_cache.stats()["hits"]) == (1, 1)
+    impacts = [
+        json.loads(mcp_server.tg_impact("impact", "create_invoice", str(project))) for _ in range(2)
+    ]
+
+    assert sorted(parses.paths) == ["payments.py", "service.py"]
+    assert packs[0] == packs[1]
+    assert impacts[0] == impacts[1]
+    assert "error" not in packs[0] and "error" not in impacts[0]
+    stats = warm_cache.stats()
+    assert (stats["misses"], stats["hits"], stats["refreshes"]) == (1, 3, 0)
+
+
+def test_an_edited_file_is_reparsed_alone_and_bumps_the_generation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, warm_cache: _McpRepoMapCache
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    project = _project(tmp_path)
+    mcp_server.tg_repo_map(str(project))
+    generation = warm_cache.stats()["entries"][0]["generation"]
+    parses = _ParseCounter(monkeypatch)
+
+    edited = project / "src" / "payments.py"
+    edited.write_text("def refund_invoice(total):\n    return -total\n", encoding="utf-8")
+    stat = edited.stat()
+    os.utime(edited, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    payload = json.loads(mcp_server.tg_repo_map(str(project)))
+
+    assert parses.paths == ["payments.py"]
+    assert _symbol_names(payload) == {"refund_invoice", "build_invoice"}
+    stats = warm_cache.stats()
+    assert stats["refreshes"] == 1
+    assert stats["entries"][0]["generation"] > generation
+
+
+def test_the_byte_budget_evicts_the_least_recently_used_root(tmp_path: Path) -> None:
+    roots = []
+    for name in ("a", "b", "c"):
+        root = tmp_path / name
+        root.mkdir()
+        (root / "mod.py").write_text(f"def {name}_fn():\n    return 1\n", encoding="utf-8")
+        roots.append(root)
+    one_map = _json_size_bytes(repo_map.build_repo_map(roots[0], max_repo_files=10))
+    cache = _McpRepoMapCache(max_size_bytes=one_map * 2 + one_map // 2)
+    build = repo_map.build_repo_map.__wrapped__  # type: ignore[attr-defined]
+
+    cache(build, roots[0], max_repo_files=10)
+    cache(build, roots[1], max_repo_files=10)
+    cache(build, roots[0], max_repo_files=10)
+    cache(build, roots[2], max_repo_files=10)
+
+    stats = cache.stats()
+    assert [Path(entry["root"]).name for entry in stats["entries"]] == ["a", "c"]
+    assert stats["evictions"] == 1
+    assert stats["size_bytes"] <= stats["max_size_bytes"]
+
+
+def test_capabilities_and_doctor_report_the_cache_counters(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, warm_cache: _McpRepoMapCache
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    project = _project(tmp_path)
+    mcp_server.tg_repo_map(str(project))
+    mcp_server.tg_repo_map(str(project))
+    monkeypatch.setattr(mcp_server, "_build_doctor_payload", lambda *args, **kwargs: {})
+
+    capabilities = json.loads(mcp_server.tg_mcp_capabilities())["repo_map_cache"]
+    doctor = json.loads(mcp_server.tg_doctor(str(project)))["mcp_repo_map_cache"]
+
+    assert capabilities["enabled"] is True
+    assert (capabilities["hits"], capabilities["misses"]) == (1, 1)
+    assert doctor == capabilities
+
+
+def test_without_an_installed_cache_every_build_walks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(mcp_repo_map_cache, "_INSTALLED_CACHE", None)
+    project = _project(tmp_path)
+    parses = _ParseCounter(monkeypatch)
+    previous = _install_warm_repo_map_source(None)
+    try:
+        mcp_server.tg_repo_map(str(project))
+        mcp_server.tg_repo_map(str(project))
+    finally:
+        _install_warm_repo_map_source(previous)
+
+    assert len(parses.paths) == 4
+    assert json.loads(mcp_server.tg_mcp_capabilities())["repo_map_cache"] == {"enabled": False}
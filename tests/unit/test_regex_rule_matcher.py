@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+from tensor_grep.cli.ast_scan import _run_ast_scan_payload
+from tensor_grep.cli.regex_rule_matcher import RegexRuleMatcher, required_literals
+from tensor_grep.cli.rule_packs import _RULE_PACKS
+
+_PROVIDER_TOKEN = r"\bsk_(?:live|test)_[A-Za-z0-9_=-]{8,}\b"
+_NAMED_API_KEY = (
+    r"\b[A-Za-z_][A-Za-z0-9_]*"
+    r"(?:api_key|API_KEY|access_token|ACCESS_TOKEN)\s*=\s*"
+    r"['\"][^'\"\s]{8,}['\"]"
+)
+
+_PATTERNS = [
+    _PROVIDER_TOKEN,
+    _NAMED_API_KEY,
+    r"password\s*=",
+    r"word",
+    r"pass(?:phrase)?",
+    r"(?i)secret",
+    r"\d{4}-\d{2}",
+    r"x*",
+]
+
+_LINES = [
+    'STRIPE = "sk_live_abcdefgh12345678"',
+    'billing_api_key = "0123456789abcdef"',
+    "password = hunter2  # passphrase, sword",
+    "SECRET and Secret and secret",
+    "released 2024-05 and 1999-12",
+    "",
+    "nothing to see here",
+    "sk_test_short",
+    "PASSWORD=upper",
+]
+
+
+def _brute_force(patterns: list[str], lines: list[str]) -> list[list[tuple[int, list[str]]]]:
+    results = []
+    for pattern in patterns:
+        compiled = re.compile(pattern)
+        hits = []
+        for line_index, line in enumerate(lines):
+            matches = [match.group(0) for match in compiled.finditer(line)]
+            if matches:
+                hits.append((line_index, matches))
+        results.append(hits)
+    return results
+
+
+def test_required_literals_are_pulled_from_the_parsed_regex() -> None:
+    assert required_literals(_PROVIDER_TOKEN) == {"live", "test"}
+    assert required_literals(_NAMED_API_KEY) == {
+        "api_key",
+        "API_KEY",
+        "access_token",
+        "ACCESS_TOKEN",
+    }
+    assert required_literals(r"x(?:abc)+y") == {"abc"}
+    assert required_literals(r"token(?:_value)?") == {"token"}
+    assert required_literals(r"(?:abcd)?ef") is None
+    assert required_literals(r"(?i)secret") is None
+    assert required_literals(r"(?i:secret)") is None
+    assert required_literals(r"ab|cd") is None
+    assert required_literals(r"x*") is None
+
+
+def test_prefiltered_lines_give_exactly_the_brute_force_matches() -> None:
+    matcher = RegexRuleMatcher(_PATTERNS)
+    every_rule = list(range(len(_PATTERNS)))
+
+    candidate_lines = matcher.candidate_lines(_LINES, every_rule)
+    prefiltered = [
+        [
+            (line_index, [match.group(0) for match in matcher.patterns[rule].finditer(line)])
+            for line_index in candidate_lines[rule]
+            if matcher.patterns[rule].search(_LINES[line_index])
+            for line in [_LINES[line_index]]
+        ]
+        for rule in every_rule
+    ]
+
+    assert prefiltered == _brute_force(_PATTERNS, _LINES)
+    # Overlapping literals are all seen: `word` inside `password`, `pass` inside both.
+    assert candidate_lines[3] == [2]
+    assert candidate_lines[4] == [2]
+    # Literal-anchored rules skip the lines that cannot match them.
+    assert candidate_lines[0] == [0, 7]
+
+
+def test_candidate_lines_only_answers_for_the_requested_rules() -> None:
+    matcher = RegexRuleMatcher(_PATTERNS)
+
+    assert matcher.candidate_lines(_LINES, [2, 7]) == [[2], list(range(len(_LINES)))]
+    assert matcher.candidate_lines([], [0, 7]) == [[], []]
+
+
+def test_the_regex_leg_reads_each_file_once_for_the_whole_ruleset(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for index, line in enumerate(_LINES):
+        (tmp_path / f"mod_{index}.py").write_text(f"{line}\n{line}\n", encoding="utf-8")
+    rules = [
+        {"id": f"rule-{index}", "engine": "regex", "language": "python", "pattern": pattern}
+        for index, pattern in enumerate(_PATTERNS)
+    ]
+    reads: list[str] = []
+    pristine = Path.read_text
+
+    def _counting_read_text(self: Path, *args: object, **kwargs: object) -> str:
+        if sys._getframe(1).f_code.co_name == "_run_ast_scan_payload":  # not inline-suppression
+            reads.append(self.name)
+        return pristine(self, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Path, "read_text", _counting_read_text)
+    project_cfg = {
+        "root_dir": tmp_path,
+        "config_path": tmp_path / "sgconfig.yml",
+        "language": "python",
+    }
+
+    payload = _run_ast_scan_payload(
+        project_cfg, rules, routing_reason="test", include_evidence_snippets=True
+    )
+
+    assert sorted(reads) == sorted(f"mod_{index}.py" for index in range(len(_LINES)))
+    expected = _brute_force(_PATTERNS, _LINES)
+    for finding, hits in zip(payload["findings"], expected, strict=True):
+        assert finding["matches"] == 2 * sum(len(matches) for _, matches in hits)
+        assert [Path(path).name for path in finding["files"]] == sorted(
+            f"mod_{line_index}.py" for line_index, _ in hits
+        )
+
+
+def test_builtin_regex_rules_all_get_a_literal_prefilter() -> None:
+    patterns = [
+        str(rule["pattern"])
+        for pack in _RULE_PACKS.values()
+        for rules in pack["languages"].values()
+        for rule in rules
+        if rule.get("engine") == "regex"
+    ]
+
+    assert patterns
+    assert all(required_literals(pattern) is not None for pattern in patterns)
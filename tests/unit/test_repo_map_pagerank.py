@@ -0,0 +1,83 @@
+"""The CSR PageRank reproduces the dict loop's ranks, key order and deadline contract."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from tensor_grep.cli import repo_map, repo_map_pagerank
+
+pytest.importorskip("numpy")
+
+
+def _graph(file_count: int, *, duplicates: int = 0) -> tuple[list[str], dict[str, set[str]]]:
+    rng = random.Random(file_count + duplicates)
+    files = [f"/repo/src/mod_{index}.py" for index in range(file_count)]
+    externals = [f"/repo/vendor/ext_{index}.py" for index in range(12)]
+    reverse: dict[str, set[str]] = {}
+    for current in files:
+        # About a third of the files are never imported and spill their rank to the seeds.
+        if rng.random() < 0.35:
+            continue
+        importers = set(rng.sample(files, rng.randint(1, 6)))
+        if rng.random() < 0.1:
+            importers.add(rng.choice(externals))
+        reverse[current] = importers
+    return files + rng.sample(files, duplicates), reverse
+
+
+def _assert_close(actual: dict[str, float], expected: dict[str, float]) -> None:
+    assert list(actual) == list(expected)
+    assert all(abs(actual[path] - rank) <= 1e-9 for path, rank in expected.items())
+
+
+def _dict_ranks(
+    seeds: list[str], files: list[str], reverse: dict[str, set[str]]
+) -> dict[str, float]:
+    ranks: dict[str, float] | None = repo_map_pagerank._dict_pagerank(
+        seeds, files, reverse, alpha=0.85, iterations=12, deadline_monotonic=None
+    )
+    assert ranks is not None
+    return ranks
+
+
+@pytest.mark.parametrize("duplicates", [0, 5])
+def test_csr_ranks_match_the_dict_loop(duplicates: int) -> None:
+    repo_map_pagerank.clear_import_graph_cache()
+    files, reverse = _graph(600, duplicates=duplicates)
+    seeds = files[3:9]
+
+    actual = repo_map._personalized_reverse_import_pagerank(seeds, files, reverse)
+
+    _assert_close(actual, _dict_ranks(seeds, files, reverse))
+    assert any(path.startswith("/repo/vendor/") for path in actual)
+
+
+def test_a_warm_call_on_an_unchanged_graph_reuses_the_csr() -> None:
+    repo_map_pagerank.clear_import_graph_cache()
+    files, reverse = _graph(400)
+
+    repo_map._personalized_reverse_import_pagerank(files[:2], files, reverse)
+    graph = next(iter(repo_map_pagerank._CSR_CACHE.values())).graph
+    # Callers rebuild the reverse map per query; an equal rebuild still hits.
+    rebuilt = {current: set(importers) for current, importers in reverse.items()}
+    warm = repo_map._personalized_reverse_import_pagerank(files[5:7], list(files), rebuilt)
+
+    assert [entry.graph for entry in repo_map_pagerank._CSR_CACHE.values()] == [graph]
+    _assert_close(warm, _dict_ranks(files[5:7], files, reverse))
+    rebuilt[files[0]] = {files[1]}
+    repo_map._personalized_reverse_import_pagerank(files[:2], files, rebuilt)
+    assert len(repo_map_pagerank._CSR_CACHE) == 2
+
+
+def test_the_csr_route_abandons_at_the_deadline() -> None:
+    files, reverse = _graph(300)
+    flag = repo_map._DeadlineBreakFlag()
+
+    ranks = repo_map._personalized_reverse_import_pagerank(
+        files[:1], files, reverse, deadline_monotonic=0.0, deadline_hit=flag
+    )
+
+    assert ranks == {}
+    assert flag.hit
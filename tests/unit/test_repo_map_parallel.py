@@ -0,0 +1,126 @@
+"""build_repo_map's process-pool parse stage: same payload as the serial loop, deadline-aware."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import time
+from pathlib import Path
+
+import pytest
+
+import tensor_grep.cli.repo_map as repo_map
+import tensor_grep.cli.repo_map_parse as repo_map_parse
+
+
+def _make_repo(root: Path, count: int) -> None:
+    src = root / "src"
+    src.mkdir(parents=True)
+    for index in range(count):
+        (src / f"m{index}.py").write_text(
+            f"import os\n\n\ndef f{index}():\n    return os.getcwd()\n", encoding="utf-8"
+        )
+    (src / "ui.ts").write_text(
+        "import { f } from './lib';\nexport function render() { return f(); }\n", encoding="utf-8"
+    )
+    tests = root / "tests"
+    tests.mkdir()
+    (tests / "test_m0.py").write_text("def test_f0():\n    assert True\n", encoding="utf-8")
+
+
+@pytest.fixture
+def small_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(repo_map, "_PARALLEL_PARSE_MIN_FILES", 1)
+    monkeypatch.setattr(repo_map, "_PARALLEL_PARSE_CHUNK_FILES", 3)
+
+
+def test_pooled_parse_matches_serial_payload(tmp_path: Path, small_pool: None) -> None:
+    _make_repo(tmp_path, 8)
+
+    serial = repo_map.build_repo_map(str(tmp_path), jobs=1)
+    pooled = repo_map.build_repo_map(str(tmp_path), jobs=2)
+
+    assert pooled == serial
+    assert len(serial["symbols"]) >= 8
+
+
+def test_pool_failure_falls_back_to_serial(
+    tmp_path: Path, small_pool: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _make_repo(tmp_path, 4)
+    serial = repo_map.build_repo_map(str(tmp_path), jobs=1)
+
+    class _NoProcesses:
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            raise OSError("no multiprocessing here")
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", _NoProcesses)
+
+    assert repo_map.build_repo_map(str(tmp_path), jobs=2) == serial
+
+
+def test_unreached_files_mark_the_map_partial(
+    tmp_path: Path, small_pool: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _make_repo(tmp_path, 4)
+
+    def _half_parsed(context_files, context_root, jobs, deadline_monotonic, collector):
+        assert jobs == 2 and deadline_monotonic is not None
+        return [
+            repo_map._imports_and_symbols_for_path(current) if index % 2 == 0 else None
+            for index, current in enumerate(context_files)
+        ]
+
+    monkeypatch.setattr(repo_map, "_parse_context_files_parallel", _half_parsed)
+    result = repo_map.build_repo_map(
+        str(tmp_path), jobs=2, deadline_monotonic=time.monotonic() + 60.0
+    )
+
+    assert result["partial"] is True
+    # The pool finished every other file, but like the serial loop the map keeps only the prefix
+    # before the first unreached one: no holes in the middle.
+    assert result["deadline_limit"]["files_scanned"] == 1
+    assert result["symbols"], "files the pool finished must be kept"
+
+
+def test_worker_chunk_stops_at_the_wall_clock_deadline(tmp_path: Path) -> None:
+    _make_repo(tmp_path, 2)
+    paths = [str(tmp_path / "src" / "m0.py"), str(tmp_path / "src" / "m1.py")]
+
+    assert repo_map_parse._parse_file_chunk(paths, time.time() - 1.0, False) == ([], [])
+    parsed, timings = repo_map_parse._parse_file_chunk(paths, None, True)
+    assert [symbols[0]["name"] for _, symbols in parsed] == ["f0", "f1"]
+    assert len(timings) == 2
+
+
+def test_jobs_resolution(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(repo_map_parse.os, "cpu_count", lambda: 32)
+    monkeypatch.delenv("TENSOR_GREP_REPO_MAP_JOBS", raising=False)
+    # The pool is opt-in: no --jobs and no env var keeps the parse serial.
+    assert repo_map_parse._repo_map_jobs() == 1
+    assert repo_map_parse._repo_map_jobs(3) == 3
+    assert repo_map_parse._repo_map_jobs(0) == 8
+    monkeypatch.setenv("TENSOR_GREP_REPO_MAP_JOBS", "0")
+    assert repo_map_parse._repo_map_jobs() == 8
+    monkeypatch.setenv("TENSOR_GREP_REPO_MAP_JOBS", "oops")
+    assert repo_map_parse._repo_map_jobs() == 1
+
+
+def test_a_patched_parser_keeps_the_parse_in_process(
+    tmp_path: Path, small_pool: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _make_repo(tmp_path, 4)
+    real_parse = repo_map._imports_and_symbols_for_path
+    parsed: list[str] = []
+
+    def _recording(current, **kwargs):
+        parsed.append(Path(current).name)
+        return real_parse(current, **kwargs)
+
+    def _no_pool(*args: object, **kwargs: object) -> None:
+        raise AssertionError("spawned workers would run the unpatched parser")
+
+    monkeypatch.setattr(repo_map, "_imports_and_symbols_for_path", _recording)
+    monkeypatch.setattr(repo_map, "_parse_context_files_parallel", _no_pool)
+    repo_map.build_repo_map(str(tmp_path), jobs=2)
+
+    assert "m0.py" in parsed
@@ -0,0 +1,161 @@
+"""Cold repo-map builds reuse per-file parses persisted under ``.tensor-grep/``."""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tensor_grep.cli import repo_map, repo_map_parse_store
+from tensor_grep.cli.repo_map_parse_store import ParsedFile, ParseStore, parse_store_path
+
+
+def _write_aged(path: Path, text: str, *, age_seconds: int = 60) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    past = time.time() - age_seconds
+    os.utime(path, (past, past))
+
+
+def _repo(root: Path) -> Path:
+    _write_aged(root / "pkg" / "core.py", "import os\n\n\ndef alpha():\n    return os.sep\n")
+    _write_aged(root / "pkg" / "util.py", "from pkg.core import alpha\n\n\nclass Beta:\n    pass\n")
+    _write_aged(root / "tests" / "test_core.py", "from pkg.core import alpha\n")
+    return root
+
+
+def _counting_parses(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    # Every file the build had to parse is handed to the store afterwards.
+    parsed: list[str] = []
+    original = ParseStore.store
+
+    def _spy(self: ParseStore, fresh: Iterable[tuple[Path, ParsedFile]]) -> None:
+        fresh = list(fresh)
+        parsed.extend(path.name for path, _parsed in fresh)
+        original(self, fresh)
+
+    monkeypatch.setattr(ParseStore, "store", _spy)
+    return parsed
+
+
+def _build(root: Path) -> dict[str, Any]:
+    return repo_map.build_repo_map(root, jobs=1)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_store(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("TENSOR_GREP_PARSE_STORE_DIR", str(tmp_path / "parse-store-cache"))
+    monkeypatch.delenv("TENSOR_GREP_PARSE_STORE", raising=False)
+
+
+def test_a_second_cold_build_is_served_from_the_store(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = _repo(tmp_path)
+    monkeypatch.setenv("TENSOR_GREP_PARSE_STORE", "0")
+    unstored = _build(root)
+    monkeypatch.setenv("TENSOR_GREP_PARSE_STORE", "1")
+
+    first = _build(root)
+    assert parse_store_path(root).is_file()
+    assert parse_store_path(root).is_relative_to(tmp_path / "parse-store-cache")
+    assert not (root / ".tensor-grep").exists()
+    parsed = _counting_parses(monkeypatch)
+    second = _build(root)
+
+    assert parsed == []
+    assert second == first == unstored
+
+
+def test_a_touched_file_is_reused_and_an_edited_one_reparsed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = _repo(tmp_path)
+    _build(root)
+    past = time.time() - 30
+    os.utime(root / "pkg" / "core.py", (past, past))
+    _write_aged(root / "pkg" / "util.py", "from pkg.core import alpha\n\n\nclass Gama:\n    pass\n")
+    parsed = _counting_parses(monkeypatch)
+
+    payload = _build(root)
+
+    assert parsed == ["util.py"]
+    assert "Gama" in {symbol["name"] for symbol in payload["symbols"]}
+    parsed.clear()
+    _build(root)
+    assert parsed == []
+
+
+def test_fresh_files_and_other_extractors_never_hit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "fresh.py").write_text("def gamma():\n    pass\n", encoding="utf-8")
+    _build(tmp_path)
+    assert not parse_store_path(tmp_path).exists()
+
+    root = _repo(tmp_path / "aged")
+    _build(root)
+    monkeypatch.setattr(repo_map_parse_store, "extractor_fingerprint", lambda: "other")
+    parsed = _counting_parses(monkeypatch)
+    _build(root)
+
+    assert sorted(parsed) == ["core.py", "test_core.py", "util.py"]
+
+
+def test_incremental_builds_take_unchanged_changeset_files_from_the_store(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = _repo(tmp_path)
+    previous = _build(root)
+    _write_aged(root / "pkg" / "extra.py", "def delta():\n    pass\n")
+    parsed = _counting_parses(monkeypatch)
+
+    payload = repo_map.build_repo_map_incremental(
+        previous, {"modified": [str(root / "pkg" / "core.py")]}
+    )
+
+    assert parsed == ["extra.py"]
+    assert {"alpha", "Beta", "delta"} <= {symbol["name"] for symbol in payload["symbols"]}
+
+
+def test_a_same_size_write_during_the_parse_is_never_vouched_for(tmp_path: Path) -> None:
+    root = _repo(tmp_path)
+    core = root / "pkg" / "core.py"
+    store = ParseStore.open(root)
+    assert store is not None and store.lookup([core]) == {}
+    # The parse saw the old bytes; a same-size write lands before the result is stored.
+    parsed_before_the_write: ParsedFile = (["os"], [{"name": "alpha"}])
+    _write_aged(core, core.read_text(encoding="utf-8").replace("alpha", "omega"), age_seconds=30)
+    store.store([(core, parsed_before_the_write)])
+    store.close()
+
+    reopened = ParseStore.open(root)
+    assert reopened is not None
+    assert reopened.lookup([core]) == {}
+    reopened.close()
+
+
+def test_a_grammar_upgrade_changes_the_extractor_fingerprint(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import importlib.metadata
+
+    real_version = importlib.metadata.version
+    upgraded: set[str] = set()
+
+    def _version(distribution: str) -> str:
+        return "9.9.9" if distribution in upgraded else real_version(distribution)
+
+    monkeypatch.setattr(importlib.metadata, "version", _version)
+    repo_map_parse_store.extractor_fingerprint.cache_clear()
+    before = repo_map_parse_store.extractor_fingerprint()
+    upgraded.add("tree-sitter-go")
+    repo_map_parse_store.extractor_fingerprint.cache_clear()
+    after = repo_map_parse_store.extractor_fingerprint()
+    repo_map_parse_store.extractor_fingerprint.cache_clear()
+
+    assert before != after
@@ -0,0 +1,277 @@
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from tensor_grep.backends.cpu_backend import CPUBackend
+from tensor_grep.cli.main import app
+from tensor_grep.core.config import SearchConfig
+from tensor_grep.core.repo_trigram_index import (
+    RepoTrigramIndex,
+    build_repo_trigram_index,
+    narrow_candidate_files,
+    prune_repo_trigram_indexes,
+    repo_index_dir,
+    repo_index_literal,
+    repo_trigram_index_status,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_index_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("TENSOR_GREP_REPO_INDEX_DIR", str(tmp_path / "index-cache"))
+    monkeypatch.delenv("TENSOR_GREP_REPO_INDEX", raising=False)
+
+
+def _make_repo(root: Path) -> list[str]:
+    (root / "src").mkdir(parents=True)
+    (root / "src" / "hit.py").write_text("x = 'Needle in here'\n", encoding="utf-8")
+    (root / "src" / "miss.py").write_text("nothing to see\n", encoding="utf-8")
+    (root / "notes.txt").write_text("needles and pins\n", encoding="utf-8")
+    return _age(root)
+
+
+def _files(root: Path) -> list[str]:
+    return sorted(str(path) for path in root.rglob("*") if path.is_file())
+
+
+def _age(root: Path) -> list[str]:
+    # Files modified within the racy-timestamp window are never indexed.
+    past = time.time() - 60
+    for path in _files(root):
+        os.utime(path, (past, past))
+    return _files(root)
+
+
+def _bump(path: Path, text: str) -> None:
+    stat_result = path.stat()
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+
+def _narrow(root: Path, pattern: str, **config_overrides):
+    return narrow_candidate_files(
+        _files(root),
+        pattern,
+        SearchConfig(**config_overrides),
+        backend_name="CPUBackend",
+        search_paths=[str(root)],
+    )
+
+
+def test_narrowing_keeps_only_files_containing_the_literal_case_folded(tmp_path):
+    root = tmp_path / "repo"
+    build_repo_trigram_index(root, _make_repo(root))
+
+    narrowing = _narrow(root, "needle")
+    assert narrowing is not None
+    assert [Path(path).name for path in narrowing.files] == ["notes.txt", "hit.py"]
+    assert narrowing.candidates_before == 3
+    assert narrowing.unindexed_files == 0
+
+    # A case-sensitive query folds the same way: the index is a superset filter, the backend
+    # still decides the real match.
+    assert _narrow(root, "Needle").candidates_after == 2
+    assert _narrow(root, "zzz-absent").files == []
+
+
+def test_unindexed_and_changed_files_always_stay_candidates(tmp_path):
+    root = tmp_path / "repo"
+    build_repo_trigram_index(root, _make_repo(root))
+    (root / "src" / "new.py").write_text("needle\n", encoding="utf-8")
+    _bump(root / "src" / "miss.py", "now a needle\n")
+
+    narrowing = _narrow(root, "needle")
+    assert narrowing is not None
+    assert {Path(path).name for path in narrowing.files} == {
+        "notes.txt",
+        "hit.py",
+        "miss.py",
+        "new.py",
+    }
+    assert narrowing.unindexed_files == 2
+
+
+def test_files_modified_within_the_racy_window_are_never_trusted(tmp_path):
+    root = tmp_path / "repo"
+    files = _make_repo(root)
+    (root / "src" / "fresh.py").write_text("fresh\n", encoding="utf-8")
+    report = build_repo_trigram_index(root, _files(root))
+    assert (report.added_files, report.skipped_files) == (3, 1)
+
+    # A same-size rewrite that keeps the indexed (size, mtime_ns): only the racy guard catches
+    # it, so the file is searched instead of excluded on its old trigrams.
+    miss = root / "src" / "miss.py"
+    now_ns = time.time_ns()
+    os.utime(miss, ns=(now_ns, now_ns))
+    build_repo_trigram_index(root, files)
+    stat_result = miss.stat()
+    miss.write_text("needle to see.\n", encoding="utf-8")
+    os.utime(miss, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+    assert miss.stat().st_size == stat_result.st_size
+
+    narrowing = _narrow(root, "needle")
+    assert narrowing is not None
+    assert {Path(path).name for path in narrowing.files} == {
+        "notes.txt",
+        "hit.py",
+        "miss.py",
+        "fresh.py",
+    }
+    assert narrowing.unindexed_files == 2
+
+
+def test_narrowing_is_skipped_where_a_file_filter_would_change_output(tmp_path):
+    root = tmp_path / "repo"
+    build_repo_trigram_index(root, _make_repo(root))
+
+    assert _narrow(root, "needle", invert_match=True) is None
+    assert _narrow(root, "needle", files_without_match=True) is None
+    assert _narrow(root, "needle", count=True, include_zero=True) is None
+    assert _narrow(root, "née") is None
+    assert _narrow(root, "a|b") is None
+    assert (
+        narrow_candidate_files(
+            _files(root),
+            "needle",
+            SearchConfig(),
+            backend_name="RipgrepBackend",
+            search_paths=[str(root)],
+        )
+        is None
+    )
+
+
+def test_repo_index_literal_reuses_the_cpu_prefilter_literal():
+    assert repo_index_literal("foo.*barbaz", SearchConfig()) == b"barbaz"
+    assert repo_index_literal("a.b(c)", SearchConfig(fixed_strings=True)) == b"a.b(c)"
+    assert repo_index_literal("ab", SearchConfig()) is None
+    assert repo_index_literal("needle", SearchConfig(encoding="utf-16")) is None
+
+
+def test_incremental_build_rereads_only_changed_files_and_tombstones_deleted(tmp_path):
+    root = tmp_path / "repo"
+    files = _make_repo(root)
+    first = build_repo_trigram_index(root, files)
+    assert (first.full_rebuild, first.added_files, first.segments) == (True, 3, 1)
+
+    unchanged = build_repo_trigram_index(root, files)
+    assert (unchanged.changed, unchanged.reused_files) == (False, 3)
+
+    _bump(root / "src" / "miss.py", "a needle now\n")
+    (root / "notes.txt").unlink()
+    second = build_repo_trigram_index(root, _files(root))
+    assert (second.updated_files, second.removed_files, second.reused_files) == (1, 1, 1)
+
+    with RepoTrigramIndex.load(root) as index:
+        assert index.live_file_count == 2
+        ids = index.candidate_file_ids(b"needle")
+        assert {index.entries[file_id][0] for file_id in ids} == {"src/hit.py", "src/miss.py"}
+
+
+def test_many_incremental_builds_compact_segments(tmp_path):
+    root = tmp_path / "repo"
+    files = _make_repo(root)
+    build_repo_trigram_index(root, files)
+    target = root / "src" / "miss.py"
+    for round_number in range(12):
+        _bump(target, f"round {round_number} needle\n")
+        report = build_repo_trigram_index(root, files)
+        assert report.segments <= 8
+
+    with RepoTrigramIndex.load(root) as index:
+        assert index.live_file_count == 3
+        assert index.candidate_file_ids(b"round 11")
+        assert not index.candidate_file_ids(b"round 10")
+
+
+def test_torn_segment_disables_the_index_instead_of_dropping_files(tmp_path):
+    root = tmp_path / "repo"
+    build_repo_trigram_index(root, _make_repo(root))
+    (segment,) = repo_index_dir(root.resolve()).glob("seg-*.tgr")
+    segment.write_bytes(segment.read_bytes()[:-1])
+
+    assert RepoTrigramIndex.load(root) is None
+    assert _narrow(root, "needle") is None
+    # The next build notices and starts over.
+    assert build_repo_trigram_index(root, _files(root)).full_rebuild is True
+
+
+def test_prune_compacts_and_removes_indexes_of_missing_roots(tmp_path):
+    root = tmp_path / "repo"
+    build_repo_trigram_index(root, _make_repo(root))
+    gone = tmp_path / "gone"
+    gone.mkdir()
+    (gone / "a.txt").write_text("needle\n", encoding="utf-8")
+    build_repo_trigram_index(gone, _age(gone))
+    gone_resolved = str(gone.resolve())
+    (gone / "a.txt").unlink()
+    gone.rmdir()
+    (root / "notes.txt").unlink()
+
+    result = prune_repo_trigram_indexes(root)
+    assert result["compacted"] is True
+    assert result["removed_entries"] == 1
+    assert result["removed_indexes"] == [gone_resolved]
+
+    status = repo_trigram_index_status(root)
+    assert (status["indexed_files"], status["tombstones"], status["segments"]) == (2, 0, 1)
+    assert status["stale_files"] == 0
+
+
+class _CpuPipeline:
+    def __init__(self, force_cpu=False, config=None):
+        self.backend = CPUBackend()
+        self.selected_backend_name = "CPUBackend"
+        self.selected_backend_reason = "unit_test_cpu_pipeline"
+        self.selected_gpu_device_ids = []
+        self.selected_gpu_chunk_plan_mb = []
+
+    def get_backend(self):
+        return self.backend
+
+
+def test_cli_index_build_then_search_reports_candidate_reduction(monkeypatch, tmp_path):
+    root = tmp_path / "repo"
+    _make_repo(root)
+    monkeypatch.chdir(root)
+    monkeypatch.setattr("tensor_grep.core.pipeline.Pipeline", _CpuPipeline)
+    monkeypatch.setattr(
+        "tensor_grep.backends.ripgrep_backend.RipgrepBackend.is_available", lambda self: False
+    )
+    monkeypatch.setattr("tensor_grep.cli.main.resolve_native_tg_binary", lambda: None)
+    monkeypatch.setenv("TENSOR_GREP_CPU_REGEX_INDEX", "0")
+    runner = CliRunner()
+
+    built = runner.invoke(app, ["index", "build", ".", "--json"])
+    assert built.exit_code == 0, built.output
+    assert json.loads(built.output)["indexed_files"] == 3
+
+    result = runner.invoke(app, ["search", "-i", "needle", ".", "--stats"])
+    assert result.exit_code == 0, result.output
+    assert "hit.py" in result.output and "notes.txt" in result.output
+    assert "miss.py" not in result.output
+    assert "candidate_files=3 searched_files=2 unindexed_files=0" in result.output
+
+    status = runner.invoke(app, ["index", "status", ".", "--json"])
+    assert json.loads(status.output)["exists"] is True
+
+
+def test_index_registered_in_all_four_sites() -> None:
+    from tensor_grep.core.registration_check import extract_members
+
+    repo_root = Path(__file__).resolve().parents[2]
+    typer_group_names = {group.name for group in app.registered_groups}
+    assert "index" in typer_group_names
+    assert "index" in extract_members(
+        str(repo_root / "src" / "tensor_grep" / "cli" / "commands.py"), "KNOWN_COMMANDS"
+    )
+    assert "index" in extract_members(
+        str(repo_root / "tests" / "e2e" / "test_routing_parity.py"), "PUBLIC_TOP_LEVEL_COMMANDS"
+    )
+    rust_main = (repo_root / "rust_core" / "src" / "main.rs").read_text(encoding="utf-8")
+    assert '#[command(name = "index", disable_help_flag = true)]' in rust_main
+    assert 'Commands::Index { args } => handle_python_passthrough("index", args)' in rust_main
@@ -103,3 +103,62 @@ def test_bm25_camelcase_tokenization_matches() -> None:
 def test_bm25_respects_top_k() -> None:
     idx = Bm25Index(_chunks("alpha beta", "alpha gamma", "alpha delta"))
     assert len(idx.query("alpha", top_k=2)) == 2
+
+
+def _reference_ranking(chunks: list[Chunk], query: str, top_k: int) -> list[tuple[int, float]]:
+    """The original doc-at-a-time scorer, kept verbatim as the bit-identity oracle."""
+    import math
+    from collections import Counter
+
+    from tensor_grep.core.retrieval_lexical import split_terms
+
+    k1, b = 1.5, 0.75
+    doc_terms = [split_terms(chunk.text) for chunk in chunks]
+    tfs = [Counter(terms) for terms in doc_terms]
+    doc_len = [len(terms) for terms in doc_terms]
+    n = len(chunks)
+    avgdl = (sum(doc_len) / n) if n else 0.0
+    if not chunks or avgdl == 0.0:
+        return []
+    df: Counter[str] = Counter()
+    for terms in doc_terms:
+        for term in set(terms):
+            df[term] += 1
+    idf = {term: math.log(1.0 + (n - freq + 0.5) / (freq + 0.5)) for term, freq in df.items()}
+    unique_terms = list(dict.fromkeys(split_terms(query)))
+    scored: dict[int, float] = {}
+    for i, tf in enumerate(tfs):
+        score = 0.0
+        for term in unique_terms:
+            freq = tf.get(term, 0)
+            if freq == 0:
+                continue
+            denom = freq + k1 * (1.0 - b + b * doc_len[i] / avgdl)
+            score += idf.get(term, 0.0) * (freq * (k1 + 1.0)) / denom
+        if score > 0.0:
+            scored[i] = score
+    return sorted(scored.items(), key=lambda item: (-item[1], item[0]))[:top_k]
+
+
+@pytest.mark.parametrize("numpy_min_docs", [10**9, 0])
+def test_inverted_index_ranking_is_bit_identical_to_doc_at_a_time(
+    monkeypatch: pytest.MonkeyPatch, numpy_min_docs: int
+) -> None:
+    import random
+
+    if numpy_min_docs == 0:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr("tensor_grep.core.retrieval_bm25._NUMPY_MIN_DOCS", numpy_min_docs)
+    rng = random.Random(1234)
+    vocab = [f"tok{i}" for i in range(40)] + ["cache", "parse", "token", "index"]
+    for _round in range(6):
+        # Many duplicate documents force exact score ties at the top-k boundary.
+        texts = [" ".join(rng.choices(vocab, k=rng.randint(0, 30))) for _ in range(60)]
+        texts += texts[:20]
+        chunks = _chunks(*texts)
+        index = Bm25Index(chunks)
+        assert (index._norm_array is not None) == (numpy_min_docs == 0)
+        for _query in range(15):
+            query = " ".join(rng.choices([*vocab, "absent"], k=rng.randint(1, 4)))
+            for top_k in (0, 1, 3, 10, 500, -2):
+                assert index.query(query, top_k=top_k) == _reference_ranking(chunks, query, top_k)
@@ -18,6 +18,7 @@ import numpy as np
 import pytest
 
 from tensor_grep.backends.base import BackendExecutionError
+from tensor_grep.core import retrieval_dense
 from tensor_grep.core.retrieval_chunker import Chunk
 from tensor_grep.core.retrieval_dense import (
     DenseIndex,
@@ -199,6 +200,93 @@ class TestDenseIndexShapeValidation:
         assert [chunk_idx for chunk_idx, _ in ranked] == [0, 1]
 
 
+class _SeededModel:
+    """Pseudo-random but deterministic per-text vectors, with deliberate duplicate texts."""
+
+    dim = 8
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        rows = [
+            np.random.default_rng(sum(text.encode("utf-8"))).standard_normal(self.dim)
+            for text in texts
+        ]
+        return np.asarray(rows, dtype=np.float32)
+
+
+def _seeded_chunks(count: int) -> list[Chunk]:
+    # `i % 37` repeats texts, so exact score ties are common and the tie-break is exercised.
+    return [
+        Chunk(file_path=f"f{i}.py", start_line=1, end_line=1, text=f"text {i % 37}")
+        for i in range(count)
+    ]
+
+
+class TestDenseSearchModes:
+    @pytest.mark.parametrize("top_k", [1, 5, 40, 0, 500])
+    def test_exact_top_k_matches_a_full_sort(self, top_k: int) -> None:
+        index = DenseIndex(_seeded_chunks(200), _SeededModel())
+        query_vec = retrieval_dense._l2_normalize(_SeededModel().encode(["needle"]))[0]
+        scores = index._matrix @ query_vec
+        expected = sorted(enumerate(scores.tolist()), key=lambda item: (-item[1], item[0]))
+        assert index.query("needle", top_k=top_k) == expected[:top_k]
+
+    def test_ivf_probing_every_cell_is_exact(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(retrieval_dense, "_IVF_MIN_CHUNKS", 100)
+        index = DenseIndex(_seeded_chunks(400), _SeededModel())
+        exact = index.query("needle", top_k=15)
+
+        monkeypatch.setenv("TG_DENSE_INDEX", "ivf")
+        monkeypatch.setenv("TG_DENSE_IVF_NPROBE", "1000")
+        assert index.mode == "ivf"
+        assert index.query("needle", top_k=15) == exact
+
+        monkeypatch.setenv("TG_DENSE_IVF_NPROBE", "1")
+        narrowed = index.query("needle", top_k=15)
+        full = dict(index.query("needle", top_k=400))
+        assert 0 < len(narrowed) <= 15
+        assert [score for _, score in narrowed] == pytest.approx([
+            full[chunk_idx] for chunk_idx, _ in narrowed
+        ])
+
+    def test_small_corpora_and_unknown_modes_stay_exact(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        index = DenseIndex(_seeded_chunks(50), _SeededModel())
+        monkeypatch.setenv("TG_DENSE_INDEX", "ivf")
+        assert index.mode == "exact"
+        monkeypatch.setenv("TG_DENSE_INDEX", "annoy")
+        assert retrieval_dense.current_dense_index_mode() == "exact"
+
+    def test_hnsw_is_served_by_ivf_with_a_note(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        monkeypatch.setattr(retrieval_dense, "_hnsw_fallback_noted", False)
+        monkeypatch.setenv("TG_DENSE_INDEX", "hnsw")
+        assert retrieval_dense.current_dense_index_mode() == "ivf"
+        assert retrieval_dense.current_dense_index_mode() == "ivf"
+        assert capsys.readouterr().err.count("TG_DENSE_INDEX=hnsw") == 1
+
+    def test_benchmark_reports_recall_for_every_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import importlib.util
+        from pathlib import Path
+
+        monkeypatch.setattr(retrieval_dense, "_IVF_MIN_CHUNKS", 100)
+        path = Path(__file__).resolve().parents[2] / "benchmarks" / "eval_dense_ann.py"
+        spec = importlib.util.spec_from_file_location("eval_dense_ann", path)
+        assert spec and spec.loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+
+        corpus, queries = module.synthetic_corpus(2000, 16, 10, clusters=32)
+        legacy_ms, results = module.run_eval(corpus, queries, top_k=5, nprobes=[None, 10_000])
+        assert legacy_ms > 0
+        assert [result.mode for result in results] == ["exact", "ivf", "ivf"]
+        assert results[0].recall_at_k == 1.0
+        assert results[-1].recall_at_k == 1.0
+        assert 0.0 < results[1].recall_at_k <= 1.0
+
+
 def _real_dense_model_dir():
     candidate = default_model_dir()
     return candidate if candidate.is_dir() else None
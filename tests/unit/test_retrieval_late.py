@@ -27,6 +27,7 @@ from tensor_grep.core.retrieval_late import (
     LateModel,
     LateReranker,
     LateRerankUnavailableError,
+    TokenEmbeddingCache,
     build_late_encoder,
     default_model_dir,
     late_available,
@@ -146,6 +147,58 @@ def test_rerank_empty_pool_returns_empty() -> None:
     assert reranker.rerank("query", [], []) == []
 
 
+def test_batched_maxsim_matches_the_per_doc_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Ragged docs (including an empty one) and a tiny block cap, so padding, masking and the
+    # block split are all exercised against the direct per-doc definition.
+    import tensor_grep.core.retrieval_late as retrieval_late
+
+    monkeypatch.setattr(retrieval_late, "_MAXSIM_BLOCK_ELEMENTS", 40)
+    rng = np.random.default_rng(3)
+    query_matrix = rng.standard_normal((4, 3)).astype(np.float32)
+    docs = [rng.standard_normal((length, 3)).astype(np.float32) for length in (5, 0, 1, 9, 2)]
+
+    expected = [
+        float((query_matrix @ doc.T).max(axis=1).sum()) if doc.size else 0.0 for doc in docs
+    ]
+
+    assert maxsim_scores(query_matrix, docs) == pytest.approx(expected, rel=1e-6)
+    assert maxsim_scores(np.zeros((0, 3), dtype=np.float32), docs) == [0.0] * len(docs)
+
+
+def test_token_cache_skips_reencoding_unchanged_chunks() -> None:
+    encoded: list[str] = []
+
+    def _encode(text: str) -> np.ndarray:
+        encoded.append(text)
+        return np.array([[1.0, 0.0]] if text.startswith("a") else [[0.0, 1.0]], dtype=np.float32)
+
+    cache = TokenEmbeddingCache()
+    reranker = LateReranker(_encode, token_cache=cache)
+
+    first = reranker.rerank("a-query", ["a1", "b1", "a1"], [0, 1, 2])
+    second = LateReranker(_encode, token_cache=cache).rerank("a-query", ["b1", "a1"], [0, 1])
+
+    assert first == [0, 2, 1]
+    assert second == [1, 0]
+    assert encoded == ["a-query", "a1", "b1", "a-query"]
+    assert (cache.hits, cache.misses) == (3, 2)
+
+
+def test_token_cache_evicts_least_recently_used_past_its_byte_budget() -> None:
+    cache = TokenEmbeddingCache(max_bytes=16)
+    row = np.zeros((1, 2), dtype=np.float32)  # 8 bytes: room for two entries
+    cache.put(b"a", row)
+    cache.put(b"b", row)
+    assert cache.get(b"a") is not None
+    cache.put(b"c", row)
+    cache.put(b"huge", np.zeros((4, 2), dtype=np.float32))
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") is not None
+    assert cache.get(b"c") is not None
+    assert cache.get(b"huge") is None
+
+
 # -------------------------------------------------------------------------------------------
 # T3 -- ONNX encoder behind the `rerank` extra. NO real model in these unit tests (fail-closed
 # contract via monkeypatched imports / garbage bytes); see TestRealFetchedModel at the bottom
@@ -8,7 +8,6 @@ only a genuine total failure (exit>2, or exit 2 with nothing parsed) stays fail-
 from __future__ import annotations
 
 import json as _json
-import subprocess
 from types import SimpleNamespace
 
 import pytest
@@ -35,8 +34,18 @@ def _patch_rg(monkeypatch, fake):
     monkeypatch.setattr(RipgrepBackend, "_get_binary_name", lambda self: "rg")
 
 
-def test_search_exit2_with_matches_keeps_partial_and_flags_incomplete(monkeypatch) -> None:
-    _patch_rg(monkeypatch, _fake(2, _match() + "\n", "rg: b.log: No such file or directory"))
+def _patch_rg_json(monkeypatch, popen):
+    # search() streams `rg --json` through popen_rg_json rather than run_subprocess.
+    monkeypatch.setattr(rb, "popen_rg_json", popen)
+    monkeypatch.setattr(RipgrepBackend, "_get_binary_name", lambda self: "rg")
+
+
+def test_search_exit2_with_matches_keeps_partial_and_flags_incomplete(
+    monkeypatch, canned_rg_json
+) -> None:
+    _patch_rg_json(
+        monkeypatch, canned_rg_json(2, _match() + "\n", "rg: b.log: No such file or directory")
+    )
     result = RipgrepBackend().search("a.log", "ERROR", SearchConfig())
     assert result.total_matches == 1  # partial results KEPT (was: discarded via raise)
     assert result.result_incomplete is True
@@ -46,41 +55,38 @@ def test_search_exit2_with_matches_keeps_partial_and_flags_incomplete(monkeypatc
     assert result.incomplete_reason_class == "unreadable_path"
 
 
-def test_search_exit2_zero_parsed_still_fails_closed(monkeypatch) -> None:
+def test_search_exit2_zero_parsed_still_fails_closed(monkeypatch, canned_rg_json) -> None:
     # exit 2 with NOTHING parsed = a genuine failure (e.g. regex syntax) -> raise, byte-identical.
-    _patch_rg(monkeypatch, _fake(2, "", "regex parse error"))
+    _patch_rg_json(monkeypatch, canned_rg_json(2, "", "regex parse error"))
     with pytest.raises(RuntimeError, match="exit code 2"):
         RipgrepBackend().search("a.log", "ERROR", SearchConfig())
 
 
-def test_search_exit_gt2_always_fails_closed_even_with_matches(monkeypatch) -> None:
-    _patch_rg(monkeypatch, _fake(3, _match() + "\n", "fatal"))
+def test_search_exit_gt2_always_fails_closed_even_with_matches(monkeypatch, canned_rg_json) -> None:
+    _patch_rg_json(monkeypatch, canned_rg_json(3, _match() + "\n", "fatal"))
     with pytest.raises(RuntimeError, match="exit code 3"):
         RipgrepBackend().search("a.log", "ERROR", SearchConfig())
 
 
-def test_search_exit01_unchanged(monkeypatch) -> None:
-    _patch_rg(monkeypatch, _fake(0, _match() + "\n"))
+def test_search_exit01_unchanged(monkeypatch, canned_rg_json) -> None:
+    _patch_rg_json(monkeypatch, canned_rg_json(0, _match() + "\n"))
     result = RipgrepBackend().search("a.log", "ERROR", SearchConfig())
     assert result.total_matches == 1
     assert result.result_incomplete is False
     assert result.incomplete_reason_class is None
 
 
-def test_search_timeout_returns_incomplete_envelope_not_crash(monkeypatch) -> None:
+def test_search_timeout_returns_incomplete_envelope_not_crash(monkeypatch, canned_rg_json) -> None:
     """Fable review of #400, finding H2: the aggregate JSON path had NO handler for a
     timed-out rg subprocess, so ``subprocess.TimeoutExpired`` fell into the broad
     ``except Exception``, got wrapped as a ``RuntimeError``, and propagated as an
     uncaught traceback (exit 1, no JSON envelope, all partial results lost). Fix: catch
     it before the broad except and return a well-formed ``result_incomplete`` envelope,
-    matching the rg-exit-2 partial-result contract above.
+    matching the rg-exit-2 partial-result contract above. The streamed route kills the hung rg
+    at the same timeout and returns the same envelope.
     """
-
-    def _raise_timeout(*_args, **_kwargs):
-        raise subprocess.TimeoutExpired(cmd=["rg"], timeout=5, output="")
-
-    monkeypatch.setattr(rb, "run_subprocess", _raise_timeout)
-    monkeypatch.setattr(RipgrepBackend, "_get_binary_name", lambda self: "rg")
+    _patch_rg_json(monkeypatch, canned_rg_json(hang=True))
+    monkeypatch.setenv("TG_RG_TIMEOUT_SECONDS", "0.05")
 
     # Must not raise -- this is the crash the fix eliminates.
     result = RipgrepBackend().search("a.log", "ERROR", SearchConfig())
@@ -92,18 +98,15 @@ def test_search_timeout_returns_incomplete_envelope_not_crash(monkeypatch) -> No
     assert result.incomplete_reason_class == "timeout"
 
 
-def test_search_timeout_recovers_partial_matches_from_flushed_stdout(monkeypatch) -> None:
-    """subprocess.run(capture_output=True) attaches whatever stdout the child had already
-    flushed to TimeoutExpired.stdout -- the aggregate timeout handler should re-use the
-    same NDJSON parser to recover any complete match records instead of discarding them.
+def test_search_timeout_recovers_partial_matches_from_flushed_stdout(
+    monkeypatch, canned_rg_json
+) -> None:
+    """Whatever complete match records rg had already flushed before the timeout killed it are
+    kept in the incomplete envelope instead of being discarded.
     """
     flushed_stdout = _match(path="a.log", text="ERROR seen before timeout") + "\n"
-
-    def _raise_timeout(*_args, **_kwargs):
-        raise subprocess.TimeoutExpired(cmd=["rg"], timeout=5, output=flushed_stdout)
-
-    monkeypatch.setattr(rb, "run_subprocess", _raise_timeout)
-    monkeypatch.setattr(RipgrepBackend, "_get_binary_name", lambda self: "rg")
+    _patch_rg_json(monkeypatch, canned_rg_json(0, flushed_stdout, hang=True))
+    monkeypatch.setenv("TG_RG_TIMEOUT_SECONDS", "0.05")
 
     result = RipgrepBackend().search("a.log", "ERROR", SearchConfig())
 
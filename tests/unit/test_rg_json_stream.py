@@ -0,0 +1,135 @@
+"""`rg --json` is decoded as rg writes it, and a satisfied consumer stops the child.
+
+CI has no real rg, so a tiny stand-in script replays canned NDJSON (optionally hanging after it)
+through a real pipe: the real `popen_rg_json`, not a canned process, is what runs here.
+"""
+
+from __future__ import annotations
+
+import json as _json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from tensor_grep.backends.base import BackendExecutionError
+from tensor_grep.backends.ripgrep_backend import RipgrepBackend, RipgrepJsonStream
+from tensor_grep.core.config import SearchConfig
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses a /bin/sh stand-in for rg")
+
+
+def _record(kind: str, path: str, text: str, line: int) -> str:
+    # ensure_ascii=False: rg writes U+2028 and friends unescaped inside a record.
+    return _json.dumps(
+        {
+            "type": kind,
+            "data": {"path": {"text": path}, "lines": {"text": text + "\n"}, "line_number": line},
+        },
+        ensure_ascii=False,
+    )
+
+
+def _fake_rg(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    records: list[str],
+    *,
+    exit_code: int = 0,
+    stderr: str = "",
+    hang_seconds: float = 0,
+) -> None:
+    payload = tmp_path / "records.ndjson"
+    payload.write_text("".join(record + "\n" for record in records), encoding="utf-8")
+    script = tmp_path / "fake_rg.py"
+    script.write_text(
+        "import sys, time\n"
+        f"sys.stdout.write(open({str(payload)!r}, encoding='utf-8').read())\n"
+        "sys.stdout.flush()\n"
+        f"sys.stderr.write({stderr!r})\n"
+        f"time.sleep({hang_seconds})\n"
+        f"sys.exit({exit_code})\n",
+        encoding="utf-8",
+    )
+    launcher = tmp_path / "rg"
+    launcher.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n', encoding="utf-8")
+    launcher.chmod(0o755)
+    monkeypatch.setattr(RipgrepBackend, "_get_binary_name", lambda self: str(launcher))
+
+
+_RECORDS = [
+    _json.dumps({"type": "begin", "data": {"path": {"text": "a.py"}}}),
+    _record("match", "a.py", "x = target\u2028y", 1),
+    _record("context", "a.py", "pass", 2),
+    _record("match", "b.py", "target()", 7),
+    _record("match", "b.py", "return target", 9),
+]
+
+
+def test_streamed_search_decodes_every_match_and_context_record(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _fake_rg(tmp_path, monkeypatch, _RECORDS)
+
+    result = RipgrepBackend().search(["a.py", "b.py"], "target", SearchConfig())
+
+    assert [(line.file, line.line_number) for line in result.matches] == [
+        ("a.py", 1),
+        ("a.py", 2),
+        ("b.py", 7),
+        ("b.py", 9),
+    ]
+    assert result.matched_file_paths == ["a.py", "b.py"]
+    assert result.match_counts_by_file == {"a.py": 1, "b.py": 2}
+    assert result.total_matches == 3
+    assert result.matches[0].text == "x = target\u2028y"
+    assert result.result_incomplete is False
+
+
+def test_rg_exit_codes_keep_their_meaning_on_the_streamed_route(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _fake_rg(tmp_path, monkeypatch, _RECORDS[:2], exit_code=2, stderr="rg: c.py: denied")
+    partial = RipgrepBackend().search("a.py", "target", SearchConfig())
+    assert partial.total_matches == 1
+    assert partial.incomplete_reason_class == "unreadable_path"
+    assert "denied" in (partial.incomplete_reason or "")
+
+    _fake_rg(tmp_path, monkeypatch, [], exit_code=2, stderr="regex parse error")
+    with pytest.raises(BackendExecutionError, match="exit code 2: regex parse error"):
+        RipgrepBackend().search("a.py", "(", SearchConfig())
+
+
+def test_a_consumer_that_stops_reading_kills_rg_instead_of_waiting(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _fake_rg(tmp_path, monkeypatch, _RECORDS, hang_seconds=30)
+    backend = RipgrepBackend()
+    cmd = backend._build_cmd(file_path="a.py", pattern="target", config=None, json_mode=True)
+    stream = RipgrepJsonStream(cmd, "a.py")
+    started = time.monotonic()
+
+    lines = iter(stream)
+    first = next(lines)
+    lines.close()  # type: ignore[attr-defined]
+
+    assert time.monotonic() - started < 15
+    assert first.line_number == 1
+    assert stream.returncode is not None and stream.returncode < 0
+    assert stream.timed_out is False
+    with pytest.raises(RuntimeError, match="once"):
+        list(stream)
+
+
+def test_a_hung_rg_times_out_with_what_it_already_wrote(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _fake_rg(tmp_path, monkeypatch, _RECORDS[:2], hang_seconds=30)
+    monkeypatch.setenv("TG_RG_TIMEOUT_SECONDS", "1")
+
+    result = RipgrepBackend().search("a.py", "target", SearchConfig())
+
+    assert result.total_matches == 1
+    assert result.incomplete_reason_class == "timeout"
+    assert "1s timeout" in (result.incomplete_reason or "")
@@ -1,11 +1,12 @@
 """Round-5 Q1+Q2: rg NDJSON must split on newline only (not str.splitlines, which also breaks on
 U+2028/U+2029/U+0085 that rg emits unescaped inside match text), and file-list membership must be
-O(1). CI-safe: mocks run_subprocess, never spawns real rg."""
+O(1). CI-safe: replays canned rg output through popen_rg_json, never spawns real rg."""
 
 import json
-from types import SimpleNamespace
 from unittest.mock import patch
 
+import pytest
+
 from tensor_grep.backends.ripgrep_backend import RipgrepBackend
 from tensor_grep.core.config import SearchConfig
 
@@ -13,20 +14,20 @@ U2028 = chr(0x2028)  # LINE SEPARATOR: str.splitlines() splits here; str.split(c
 U0085 = chr(0x0085)  # NEXT LINE: same class of bug
 
 
-def _fake(returncode: int, stdout: str, stderr: str = "") -> SimpleNamespace:
-    return SimpleNamespace(returncode=returncode, stdout=stdout, stderr=stderr)
-
+@pytest.fixture
+def _search(canned_rg_json):
+    def _run(stdout: str, config: SearchConfig | None = None):
+        be = RipgrepBackend()
+        with (
+            patch.object(be, "_get_binary_name", return_value="rg"),
+            patch(
+                "tensor_grep.backends.ripgrep_backend.popen_rg_json",
+                side_effect=canned_rg_json(0, stdout),
+            ),
+        ):
+            return be.search("a.py", "foo", config or SearchConfig())
 
-def _search(stdout: str, config: SearchConfig | None = None):
-    be = RipgrepBackend()
-    with (
-        patch.object(be, "_get_binary_name", return_value="rg"),
-        patch(
-            "tensor_grep.backends.ripgrep_backend.run_subprocess",
-            return_value=_fake(0, stdout),
-        ),
-    ):
-        return be.search("a.py", "foo", config or SearchConfig())
+    return _run
 
 
 def _match(path: str, text: str = "x", line: int = 1) -> str:
@@ -46,7 +47,7 @@ def _match(path: str, text: str = "x", line: int = 1) -> str:
 
 
 class TestQ1UnicodeLineBoundarySplit:
-    def test_u2028_in_match_text_is_not_dropped(self) -> None:
+    def test_u2028_in_match_text_is_not_dropped(self, _search) -> None:
         rec = _match("a.py", text="foo" + U2028 + "bar")
         assert U2028 in rec and "\n" not in rec  # raw separator inside a single JSON record
         res = _search(rec + "\n")
@@ -55,7 +56,7 @@ class TestQ1UnicodeLineBoundarySplit:
         assert res.total_matches == 1
         assert res.matches and res.matches[0].file == "a.py"
 
-    def test_u0085_next_line_char_is_not_dropped(self) -> None:
+    def test_u0085_next_line_char_is_not_dropped(self, _search) -> None:
         rec = _match("a.py", text="foo" + U0085 + "baz")
         assert U0085 in rec and "\n" not in rec
         res = _search(rec + "\n")
@@ -63,14 +64,14 @@ class TestQ1UnicodeLineBoundarySplit:
 
 
 class TestQ2MembershipOrderAndCounts:
-    def test_first_seen_order_preserved_no_dupes(self) -> None:
+    def test_first_seen_order_preserved_no_dupes(self, _search) -> None:
         stdout = "\n".join([_match("z.py"), _match("a.py"), _match("z.py")]) + "\n"
         res = _search(stdout)
         assert res.matched_file_paths == ["z.py", "a.py"]  # first-seen order, z not duplicated
         assert res.match_counts_by_file == {"z.py": 2, "a.py": 1}
         assert res.total_matches == 3
 
-    def test_single_file_many_matches(self) -> None:
+    def test_single_file_many_matches(self, _search) -> None:
         stdout = "\n".join(_match("a.py", line=i) for i in range(1, 6)) + "\n"
         res = _search(stdout)
         assert res.matched_file_paths == ["a.py"]
@@ -7,19 +7,15 @@ from tensor_grep.backends.ripgrep_backend import RipgrepBackend
 from tensor_grep.core.config import SearchConfig
 
 
-def test_should_include_before_and_after_context_flags():
+def test_should_include_before_and_after_context_flags(canned_rg_json):
     backend = RipgrepBackend()
     config = SearchConfig(before_context=2, after_context=3)
 
-    mock_result = MagicMock()
-    mock_result.returncode = 1
-    mock_result.stdout = ""
-    mock_result.stderr = ""
-
     with (
         patch.object(backend, "_get_binary_name", return_value="rg"),
         patch(
-            "tensor_grep.backends.ripgrep_backend.run_subprocess", return_value=mock_result
+            "tensor_grep.backends.ripgrep_backend.popen_rg_json",
+            side_effect=canned_rg_json(1),
         ) as run,
     ):
         backend.search("test.log", "ERROR", config=config)
@@ -29,19 +25,15 @@ def test_should_include_before_and_after_context_flags():
     assert "-A" in cmd and "3" in cmd
 
 
-def test_should_forward_no_ignore_flag():
+def test_should_forward_no_ignore_flag(canned_rg_json):
     backend = RipgrepBackend()
     config = SearchConfig(no_ignore=True)
 
-    mock_result = MagicMock()
-    mock_result.returncode = 1
-    mock_result.stdout = ""
-    mock_result.stderr = ""
-
     with (
         patch.object(backend, "_get_binary_name", return_value="rg"),
         patch(
-            "tensor_grep.backends.ripgrep_backend.run_subprocess", return_value=mock_result
+            "tensor_grep.backends.ripgrep_backend.popen_rg_json",
+            side_effect=canned_rg_json(1),
         ) as run,
     ):
         backend.search("test.log", "ERROR", config=config)
@@ -200,14 +192,11 @@ def test_build_cmd_unrestricted_double_and_triple_suppress_root_ignore_injection
         assert flag in cmd, (level, cmd)
 
 
-def test_json_context_events_do_not_inflate_match_totals():
+def test_json_context_events_do_not_inflate_match_totals(canned_rg_json):
     backend = RipgrepBackend()
     config = SearchConfig(context=1)
 
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stderr = ""
-    mock_result.stdout = "\n".join([
+    stdout = "\n".join([
         '{"type":"begin","data":{"path":{"text":"app.log"}}}',
         '{"type":"context","data":{"path":{"text":"app.log"},"lines":{"text":"before\\n"},"line_number":1}}',
         '{"type":"match","data":{"path":{"text":"app.log"},"lines":{"text":"ERROR here\\n"},"line_number":2}}',
@@ -217,7 +206,10 @@ def test_json_context_events_do_not_inflate_match_totals():
 
     with (
         patch.object(backend, "_get_binary_name", return_value="rg"),
-        patch("tensor_grep.backends.ripgrep_backend.run_subprocess", return_value=mock_result),
+        patch(
+            "tensor_grep.backends.ripgrep_backend.popen_rg_json",
+            side_effect=canned_rg_json(0, stdout),
+        ),
     ):
         result = backend.search("app.log", "ERROR", config=config)
 
@@ -362,7 +354,7 @@ def test_should_forward_no_line_number_for_plain_text_output():
     assert "--line-number" not in cmd
 
 
-def test_should_forward_advertised_ignore_and_config_flags():
+def test_should_forward_advertised_ignore_and_config_flags(canned_rg_json):
     backend = RipgrepBackend()
     config = SearchConfig(
         ignore_file=[".custom-ignore", ".repo-ignore"],
@@ -382,15 +374,11 @@ def test_should_forward_advertised_ignore_and_config_flags():
         no_config=True,
     )
 
-    mock_result = MagicMock()
-    mock_result.returncode = 1
-    mock_result.stdout = ""
-    mock_result.stderr = ""
-
     with (
         patch.object(backend, "_get_binary_name", return_value="rg"),
         patch(
-            "tensor_grep.backends.ripgrep_backend.run_subprocess", return_value=mock_result
+            "tensor_grep.backends.ripgrep_backend.popen_rg_json",
+            side_effect=canned_rg_json(1),
         ) as run,
     ):
         backend.search("test.log", "ERROR", config=config)
@@ -421,19 +409,15 @@ def test_should_forward_advertised_ignore_and_config_flags():
     assert ["--type-clear", "web"] == cmd[cmd.index("--type-clear") :][:2]
 
 
-def test_should_forward_glob_flags():
+def test_should_forward_glob_flags(canned_rg_json):
     backend = RipgrepBackend()
     config = SearchConfig(glob=["*.log", "!*.tmp"])
 
-    mock_result = MagicMock()
-    mock_result.returncode = 1
-    mock_result.stdout = ""
-    mock_result.stderr = ""
-
     with (
         patch.object(backend, "_get_binary_name", return_value="rg"),
         patch(
-            "tensor_grep.backends.ripgrep_backend.run_subprocess", return_value=mock_result
+            "tensor_grep.backends.ripgrep_backend.popen_rg_json",
+            side_effect=canned_rg_json(1),
         ) as run,
     ):
         backend.search("test.log", "ERROR", config=config)
@@ -506,23 +490,21 @@ def test_should_separate_single_dash_path_with_end_of_options():
     assert cmd[-2:] == ["--", "-weird-name"]
 
 
-def test_should_raise_on_rg_fatal_error():
+def test_should_raise_on_rg_fatal_error(canned_rg_json):
     backend = RipgrepBackend()
 
-    mock_result = MagicMock()
-    mock_result.returncode = 2
-    mock_result.stdout = ""
-    mock_result.stderr = "regex parse error"
-
     with (
         patch.object(backend, "_get_binary_name", return_value="rg"),
-        patch("tensor_grep.backends.ripgrep_backend.run_subprocess", return_value=mock_result),
+        patch(
+            "tensor_grep.backends.ripgrep_backend.popen_rg_json",
+            side_effect=canned_rg_json(2, "", "regex parse error"),
+        ),
     ):
         with pytest.raises(RuntimeError, match="exit code 2"):
             backend.search("test.log", "(")
 
 
-def test_should_raise_backend_execution_error_on_rg_fatal_exit_code():
+def test_should_raise_backend_execution_error_on_rg_fatal_exit_code(canned_rg_json):
     """audit #79: a fatal rg exit code previously raised a bare RuntimeError, which is
     invisible to a caller's `except BackendExecutionError` handler (e.g. main.py's
     per-file CPU-fallback retry, cli/main.py:6756-6761) -- it fell into the broad
@@ -533,24 +515,22 @@ def test_should_raise_backend_execution_error_on_rg_fatal_exit_code():
 
     backend = RipgrepBackend()
 
-    mock_result = MagicMock()
-    mock_result.returncode = 2
-    mock_result.stdout = ""
-    mock_result.stderr = "regex parse error"
-
     with (
         patch.object(backend, "_get_binary_name", return_value="rg"),
-        patch("tensor_grep.backends.ripgrep_backend.run_subprocess", return_value=mock_result),
+        patch(
+            "tensor_grep.backends.ripgrep_backend.popen_rg_json",
+            side_effect=canned_rg_json(2, "", "regex parse error"),
+        ),
     ):
         with pytest.raises(BackendExecutionError):
             backend.search("test.log", "(")
 
 
 def test_should_raise_backend_execution_error_on_unexpected_subprocess_failure():
-    """audit #79: an unexpected exception from run_subprocess (e.g. an OSError launching
-    rg) fell into search()'s broad `except Exception` and was re-raised as a bare
-    RuntimeError. It must now be BackendExecutionError so the CLI's per-file loop retries
-    on the CPU backend instead of crashing with an uncaught traceback (audit B2/I1)."""
+    """audit #79: an unexpected exception spawning rg (e.g. an OSError launching it) fell
+    into search()'s broad `except Exception` and was re-raised as a bare RuntimeError. It must
+    now be BackendExecutionError so the CLI's per-file loop retries on the CPU backend instead
+    of crashing with an uncaught traceback (audit B2/I1)."""
     from tensor_grep.backends.base import BackendExecutionError
 
     backend = RipgrepBackend()
@@ -558,7 +538,7 @@ def test_should_raise_backend_execution_error_on_unexpected_subprocess_failure()
     with (
         patch.object(backend, "_get_binary_name", return_value="rg"),
         patch(
-            "tensor_grep.backends.ripgrep_backend.run_subprocess",
+            "tensor_grep.backends.ripgrep_backend.popen_rg_json",
             side_effect=OSError("boom"),
         ),
     ):
@@ -623,22 +603,18 @@ def test_count_single_file_without_filename_parses_bare_count():
     assert result.total_matches == 5
 
 
-def test_should_forward_sort_flags_in_json_mode():
+def test_should_forward_sort_flags_in_json_mode(canned_rg_json):
     """Audit MED: --sort/--sortr/--sort-files change RESULT ORDER and rg honors them with
     --json, but they were gated behind `not json_mode` — and search() always uses json_mode,
     so the requested ordering was silently dropped."""
     backend = RipgrepBackend()
     config = SearchConfig(sort_by="path")
 
-    mock_result = MagicMock()
-    mock_result.returncode = 1
-    mock_result.stdout = ""
-    mock_result.stderr = ""
-
     with (
         patch.object(backend, "_get_binary_name", return_value="rg"),
         patch(
-            "tensor_grep.backends.ripgrep_backend.run_subprocess", return_value=mock_result
+            "tensor_grep.backends.ripgrep_backend.popen_rg_json",
+            side_effect=canned_rg_json(1),
         ) as run,
     ):
         backend.search("test.log", "ERROR", config=config)
@@ -653,10 +629,10 @@ def test_empty_file_path_list_returns_empty_not_cwd_scan():
     CWD scan (scope-widening footgun), instead of an empty search."""
     backend = RipgrepBackend()
 
-    with patch("tensor_grep.backends.ripgrep_backend.run_subprocess") as run:
+    with patch("tensor_grep.backends.ripgrep_backend.popen_rg_json") as popen:
         result = backend.search([], "ERROR", config=SearchConfig())
 
-    run.assert_not_called()  # no path-less rg command emitted
+    popen.assert_not_called()  # no path-less rg command emitted
     assert result.total_matches == 0
     assert result.total_files == 0
 
@@ -798,20 +774,19 @@ def test_passthrough_should_forward_passthru_flag():
     assert exit_code == 0
 
 
-def test_search_should_emit_runtime_routing_metadata():
+def test_search_should_emit_runtime_routing_metadata(canned_rg_json):
     backend = RipgrepBackend()
 
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stderr = ""
-    mock_result.stdout = (
-        '{"type":"match","data":{"path":{"text":"a.log"},"lines":{"text":"ERROR one\\n"},'
-        '"line_number":2}}\n'
-    )
-
     with (
         patch.object(backend, "_get_binary_name", return_value="rg"),
-        patch("tensor_grep.backends.ripgrep_backend.run_subprocess", return_value=mock_result),
+        patch(
+            "tensor_grep.backends.ripgrep_backend.popen_rg_json",
+            side_effect=canned_rg_json(
+                0,
+                '{"type":"match","data":{"path":{"text":"a.log"},"lines":{"text":"ERROR one\\n"},'
+                '"line_number":2}}\n',
+            ),
+        ),
     ):
         result = backend.search("a.log", "ERROR", config=SearchConfig())
 
@@ -822,22 +797,19 @@ def test_search_should_emit_runtime_routing_metadata():
     assert result.routing_worker_count == 1
 
 
-def test_search_should_keep_line_numbers_in_json_mode():
+def test_search_should_keep_line_numbers_in_json_mode(canned_rg_json):
     backend = RipgrepBackend()
     config = SearchConfig(line_number=False)
 
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stderr = ""
-    mock_result.stdout = (
-        '{"type":"match","data":{"path":{"text":"a.log"},"lines":{"text":"ERROR one\\n"},'
-        '"line_number":2}}\n'
-    )
-
     with (
         patch.object(backend, "_get_binary_name", return_value="rg"),
         patch(
-            "tensor_grep.backends.ripgrep_backend.run_subprocess", return_value=mock_result
+            "tensor_grep.backends.ripgrep_backend.popen_rg_json",
+            side_effect=canned_rg_json(
+                0,
+                '{"type":"match","data":{"path":{"text":"a.log"},"lines":{"text":"ERROR one\\n"},'
+                '"line_number":2}}\n',
+            ),
         ) as run,
     ):
         result = backend.search("a.log", "ERROR", config=config)
@@ -1034,13 +1006,12 @@ def test_decode_rg_field_fail_closed_on_garbage():
     assert _decode_rg_field({"bytes": "@@@not-base64@@@"}) == ""
 
 
-def test_ripgrep_backend_decodes_non_utf8_lines_bytes(monkeypatch):
+def test_ripgrep_backend_decodes_non_utf8_lines_bytes(monkeypatch, canned_rg_json):
     # Deterministic: feed a synthetic rg --json record whose match content is `lines.bytes`
     # (base64) exactly as rg emits for a non-UTF-8 file. Mocked (not a real rg run) so the
     # test can't depend on rg's version-specific binary/non-UTF-8 handling on CI.
     import base64 as _b64
     import json as _json
-    from types import SimpleNamespace
 
     import tensor_grep.backends.ripgrep_backend as rb
 
@@ -1052,10 +1023,9 @@ def test_ripgrep_backend_decodes_non_utf8_lines_bytes(monkeypatch):
             "line_number": 3,
         },
     }
-    fake = SimpleNamespace(returncode=0, stdout=_json.dumps(record) + "\n", stderr="")
-    monkeypatch.setattr(rb, "run_subprocess", lambda *a, **k: fake)
+    monkeypatch.setattr(rb, "popen_rg_json", canned_rg_json(0, _json.dumps(record) + "\n"))
     # CI has no real rg binary; stub the resolver (the fake name is never executed because
-    # run_subprocess is mocked) so this stays a pure parser test.
+    # popen_rg_json is replaced) so this stays a pure parser test.
     monkeypatch.setattr(RipgrepBackend, "_get_binary_name", lambda self: "rg")
 
     result = RipgrepBackend().search("/repo/binary.bin", "foo", SearchConfig())
@@ -0,0 +1,144 @@
+import random
+import threading
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from tensor_grep.backends.cpu_backend import CPUBackend
+from tensor_grep.cli.main import app
+from tensor_grep.cli.search_executor import iter_file_outcomes, resolve_search_workers
+from tensor_grep.core.result import MatchLine, SearchResult
+
+_FAR_FUTURE = time.monotonic() + 3600
+
+
+def _result_for(path: str) -> SearchResult:
+    return SearchResult(
+        matches=[MatchLine(line_number=1, text=path, file=path)], total_files=1, total_matches=1
+    )
+
+
+def _collect(outcomes):
+    collected = []
+    for current_file, outcome in outcomes:
+        collected.append((current_file, None if outcome is None else outcome()))
+    return collected
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_outcomes_are_yielded_in_candidate_order(workers):
+    files = [f"f{index}" for index in range(40)]
+    rng = random.Random(7)
+    delays = {path: rng.uniform(0, 0.005) for path in files}
+
+    def _search(path):
+        time.sleep(delays[path])
+        return _result_for(path)
+
+    collected = _collect(iter_file_outcomes(files, _search, workers=workers, deadline=_FAR_FUTURE))
+    assert [path for path, _ in collected] == files
+    assert [result.matches[0].text for _, result in collected] == files
+
+
+def test_parallel_outcomes_actually_overlap():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def _search(path):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return _result_for(path)
+
+    _collect(iter_file_outcomes(["a", "b", "c", "d"], _search, workers=4, deadline=_FAR_FUTURE))
+    assert peak > 1
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_deadline_ends_the_walk_with_an_ordered_prefix(monkeypatch, workers):
+    expired = threading.Event()
+    monkeypatch.setattr(
+        "tensor_grep.backends.cpu_backend.native_walk_deadline_exceeded",
+        lambda deadline: expired.is_set(),
+    )
+    files = [f"f{index}" for index in range(30)]
+
+    def _search(path):
+        if path == "f5":
+            expired.set()
+        return _result_for(path)
+
+    collected = _collect(iter_file_outcomes(files, _search, workers=workers, deadline=0.0))
+    searched = [path for path, result in collected if result is not None]
+    assert collected[-1][1] is None
+    assert searched == files[: len(searched)]
+    assert "f5" in searched
+    assert len(collected) == len(searched) + 1
+
+
+def test_exceptions_surface_in_candidate_order():
+    def _search(path):
+        if path in {"b", "d"}:
+            raise ValueError(path)
+        return _result_for(path)
+
+    outcomes = iter_file_outcomes(["a", "b", "c", "d"], _search, workers=4, deadline=_FAR_FUTURE)
+    first_file, first = next(outcomes)
+    assert (first_file, first().matches[0].text) == ("a", "a")
+    second_file, second = next(outcomes)
+    assert second_file == "b"
+    with pytest.raises(ValueError, match=r"^b$"):
+        second()
+    outcomes.close()
+
+
+def test_resolve_search_workers_precedence(monkeypatch):
+    monkeypatch.delenv("TG_THREADS", raising=False)
+    assert resolve_search_workers(3, backend_name="CPUBackend", file_count=10) == 3
+    assert resolve_search_workers(16, backend_name="CPUBackend", file_count=5) == 5
+    assert resolve_search_workers(4, backend_name="TorchBackend", file_count=10) == 1
+    assert resolve_search_workers(4, backend_name="CPUBackend", file_count=1) == 1
+    monkeypatch.setenv("TG_THREADS", "2")
+    assert resolve_search_workers(0, backend_name="RustCoreBackend", file_count=10) == 2
+    assert resolve_search_workers(6, backend_name="RustCoreBackend", file_count=10) == 6
+    monkeypatch.setenv("TG_THREADS", "nope")
+    assert resolve_search_workers(0, backend_name="CPUBackend", file_count=100) >= 1
+
+
+class _CpuPipeline:
+    def __init__(self, force_cpu=False, config=None):
+        self.backend = CPUBackend()
+        self.selected_backend_name = "CPUBackend"
+        self.selected_backend_reason = "unit_test_cpu_pipeline"
+        self.selected_gpu_device_ids = []
+        self.selected_gpu_chunk_plan_mb = []
+
+    def get_backend(self):
+        return self.backend
+
+
+def test_cli_parallel_search_output_matches_sequential(monkeypatch, tmp_path):
+    for index in range(24):
+        lines = [f"line {line} needle {index}" for line in range(index % 5 + 1)]
+        (tmp_path / f"file{index:02d}.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("tensor_grep.core.pipeline.Pipeline", _CpuPipeline)
+    monkeypatch.setattr(
+        "tensor_grep.backends.ripgrep_backend.RipgrepBackend.is_available", lambda self: False
+    )
+    monkeypatch.setattr("tensor_grep.cli.main.resolve_native_tg_binary", lambda: None)
+    monkeypatch.setenv("TENSOR_GREP_CPU_REGEX_INDEX", "0")
+    monkeypatch.setenv("TENSOR_GREP_REPO_INDEX", "0")
+    runner = CliRunner()
+
+    sequential = runner.invoke(app, ["search", "needle", ".", "--threads", "1"])
+    parallel = runner.invoke(app, ["search", "needle", ".", "--threads", "6"])
+    assert sequential.exit_code == parallel.exit_code == 0
+    assert parallel.output == sequential.output
+    assert sequential.output.count("needle") == sum(index % 5 + 1 for index in range(24))
@@ -1,18 +1,26 @@
 """Tests for the persisted chunk-BM25 semantic index (build/save/load + staleness fingerprint)."""
 
 import json
+import mmap
 import os
 from pathlib import Path
 
 import pytest
 
+import tensor_grep.core.semantic_index as semantic_index
+from tensor_grep.core.retrieval_chunker import chunk_file
 from tensor_grep.core.semantic_index import (
+    _CORPUS_HEADER,
     _META_NAME,
+    _SECTIONS,
     INDEX_VERSION,
+    SemanticChunkCache,
     build_and_save,
     compute_fingerprint,
     default_index_dir,
     load_or_warn,
+    semantic_index_status,
+    update_index,
 )
 
 
@@ -127,3 +135,266 @@ def test_load_or_warn_rejects_stale_schema_version(
     assert load_or_warn(idx_dir) is None
     err = capsys.readouterr().err.lower()
     assert "schema version" in err
+
+
+def _bump(path: Path, text: str) -> None:
+    stat_result = path.stat()
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+
+def _repo(root: Path) -> list[str]:
+    root.mkdir()
+    (root / "invoice.py").write_text(
+        "def make_invoice(invoice_id):\n    return invoice_id\n", encoding="utf-8"
+    )
+    (root / "render.py").write_text("def render_html(node):\n    return node\n", encoding="utf-8")
+    (root / "notes.md").write_text("invoice totals are rounded\n", encoding="utf-8")
+    # Backdated out of the racy window, so the index may trust the files' stamps.
+    for path in root.iterdir():
+        os.utime(path, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
+    return sorted(str(path) for path in root.iterdir())
+
+
+def test_update_index_rechunks_only_changed_files(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    files = _repo(root)
+    idx_dir = tmp_path / "idx"
+    _index, first = update_index(files, idx_dir)
+    assert (first.full_rebuild, first.chunked_files, first.reused_files) == (True, 3, 0)
+
+    _bump(root / "render.py", "def render_invoice(node):\n    return node\n")
+    (root / "notes.md").unlink()
+    remaining = [path for path in files if not path.endswith("notes.md")]
+    index, second = update_index(remaining, idx_dir)
+    assert (second.full_rebuild, second.chunked_files, second.reused_files) == (False, 1, 1)
+    assert second.removed_files == 1
+    assert {chunk.file_path for chunk in index.chunks} == set(remaining)
+    assert "render_invoice" in index.chunks[-1].text
+
+    # The spliced index is exactly what a from-scratch build produces.
+    rebuilt, full = update_index(remaining, tmp_path / "fresh", full=True)
+    assert [chunk.text for chunk in rebuilt.chunks] == [chunk.text for chunk in index.chunks]
+    assert full.full_rebuild is True
+    assert load_or_warn(idx_dir) is not None
+
+
+def test_chunk_cache_returns_the_callers_path_spelling(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "repo"
+    files = _repo(root)
+    idx_dir = tmp_path / "idx"
+    build_and_save(files, idx_dir)
+    monkeypatch.chdir(root)
+
+    cache = SemanticChunkCache.load(idx_dir)
+    assert cache is not None
+    chunks = cache.chunk("invoice.py")
+    assert cache.reused_files == 1 and cache.chunked_files == 0
+    assert chunks and all(chunk.file_path == "invoice.py" for chunk in chunks)
+
+    # Different chunk geometry or chunker mode never reuses the stored corpus.
+    assert SemanticChunkCache.load(idx_dir, chunk_size=10) is None
+    monkeypatch.setenv("TG_CHUNKER", "structural")
+    assert SemanticChunkCache.load(idx_dir) is None
+
+
+def test_files_written_within_the_racy_window_are_never_trusted(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "repo"
+    files = _repo(root)
+    fresh = root / "render.py"
+    fresh.write_text("def render_html(node):\n    return node\n", encoding="utf-8")
+    idx_dir = tmp_path / "idx"
+    build_and_save(files, idx_dir)
+
+    # Chunked inside the window: stored with a stamp no stat matches, so it is re-chunked.
+    cache = SemanticChunkCache.load(idx_dir)
+    assert cache is not None
+    for path in files:
+        cache.chunk(path)
+    assert (cache.reused_files, cache.chunked_files) == (2, 1)
+    assert semantic_index_status(idx_dir)["stale_files"] == 1
+
+    # A stamp stored while the file was settled is not trusted again once the clock says the
+    # file was written within the window: a same-size rewrite in that tick keeps its stamp.
+    build_and_save(files, idx_dir)
+    invoice_mtime_ns = (root / "invoice.py").stat().st_mtime_ns
+    monkeypatch.setattr(semantic_index.time, "time_ns", lambda: invoice_mtime_ns + 1_000_000_000)
+    cache = SemanticChunkCache.load(idx_dir)
+    assert cache is not None
+    cache.chunk(str(root / "invoice.py"))
+    assert (cache.reused_files, cache.chunked_files) == (0, 1)
+
+
+def test_torn_index_pair_is_not_reused(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    root = tmp_path / "repo"
+    files = _repo(root)
+    idx_dir = tmp_path / "idx"
+    build_and_save(files, idx_dir)
+    (corpus_path,) = idx_dir.glob("corpus-*.tgsi")
+    corpus_path.write_bytes(corpus_path.read_bytes()[:-1])
+
+    assert SemanticChunkCache.load(idx_dir) is None
+    assert load_or_warn(idx_dir) is None
+    assert "corrupt corpus" in capsys.readouterr().err
+    assert update_index(files, idx_dir)[1].full_rebuild is True
+    assert load_or_warn(idx_dir) is not None
+
+
+def test_rejected_corpus_files_are_unmapped(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "repo"
+    files = _repo(root)
+    idx_dir = tmp_path / "idx"
+    build_and_save(files, idx_dir)
+    (corpus_path,) = idx_dir.glob("corpus-*.tgsi")
+    intact = corpus_path.read_bytes()
+    mapped: list[mmap.mmap] = []
+
+    class _Recording(mmap.mmap):
+        def __new__(cls, *args: object, **kwargs: object) -> "_Recording":
+            data = super().__new__(cls, *args, **kwargs)
+            mapped.append(data)
+            return data
+
+    monkeypatch.setattr(mmap, "mmap", _Recording)
+    # A torn header check, then a blob-length check that runs once the columns are mapped.
+    header = _CORPUS_HEADER.unpack_from(intact, 0)
+    chunk_count, sections = header[3], header[7:]
+    last_text_offset = sections[_SECTIONS.index("text_offsets")] + 8 * chunk_count
+    skewed = bytearray(intact)
+    skewed[last_text_offset] ^= 0x01
+    for damaged in (intact[:-1], bytes(skewed)):
+        corpus_path.write_bytes(damaged)
+        assert SemanticChunkCache.load(idx_dir) is None
+
+    assert len(mapped) == 2
+    assert all(data.closed for data in mapped)
+
+
+def test_mapped_corpus_ranks_exactly_like_the_in_memory_index(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    root.mkdir()
+    files = []
+    for index in range(12):
+        path = root / f"mod{index:02d}.py"
+        body = [f"def handler_{index}(invoice, total):"]
+        body += [f"    invoice_total_{line} = total * {line}  # café" for line in range(index * 7)]
+        path.write_text("\n".join(body) + "\n", encoding="utf-8")
+        files.append(str(path))
+    idx_dir = tmp_path / "idx"
+    built = build_and_save(files, idx_dir)
+
+    loaded = load_or_warn(idx_dir)
+    assert loaded is not None
+    assert list(loaded.chunks) == list(built.chunks)
+    for query in ("invoice total", "handler_3", "café", "missing term", "totalInvoice"):
+        assert loaded.query(query, top_k=5) == built.query(query, top_k=5)
+        assert loaded.query(query, top_k=0) == built.query(query, top_k=0)
+
+
+def test_rebuild_swaps_the_corpus_and_drops_legacy_files(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    files = _repo(root)
+    idx_dir = tmp_path / "idx"
+    idx_dir.mkdir()
+    (idx_dir / "bm25_chunks.json").write_text("[]", encoding="utf-8")
+    build_and_save(files, idx_dir)
+    (first,) = idx_dir.glob("corpus-*.tgsi")
+    assert not (idx_dir / "bm25_chunks.json").exists()
+
+    _bump(root / "render.py", "def render_invoice(node):\n    return node\n")
+    build_and_save(files, idx_dir)
+    (second,) = idx_dir.glob("corpus-*.tgsi")
+    assert second != first
+    meta = json.loads((idx_dir / _META_NAME).read_text(encoding="utf-8"))
+    assert meta["corpus"] == second.name
+    assert semantic_index_status(idx_dir)["corpus_bytes"] == second.stat().st_size
+
+
+def test_unchanged_files_rank_off_the_stored_postings(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    files = _repo(root)
+    idx_dir = tmp_path / "idx"
+    built = build_and_save(files, idx_dir)
+
+    cache = SemanticChunkCache.load(idx_dir)
+    assert cache is not None
+    for path in files:
+        cache.chunk(path)
+    stored = cache.stored_index()
+    assert stored is not None and not cache.changed
+    assert stored.query("invoice") == built.query("invoice")
+
+    # A different walk order, or a changed file, needs a fresh in-memory index.
+    reordered = SemanticChunkCache.load(idx_dir)
+    assert reordered is not None
+    for path in reversed(files):
+        reordered.chunk(path)
+    assert reordered.stored_index() is None
+
+
+def test_rerank_by_bm25_with_chunk_cache_matches_uncached(tmp_path: Path) -> None:
+    from tensor_grep.core.reranker import rerank_by_bm25
+    from tensor_grep.core.result import MatchLine, SearchResult
+
+    root = tmp_path / "repo"
+    files = _repo(root)
+    build_and_save(files, tmp_path / "idx")
+    result = SearchResult(
+        matches=[MatchLine(line_number=1, text="x", file=path) for path in files],
+        total_files=3,
+        total_matches=3,
+    )
+    cache = SemanticChunkCache.load(tmp_path / "idx")
+    assert cache is not None
+
+    cached = rerank_by_bm25(result, "invoice", files, chunk_cache=cache)
+    assert cached.matches == rerank_by_bm25(result, "invoice", files).matches
+    assert cache.reused_files == 3 and cache.chunked_files == 0
+
+
+def test_find_reuses_and_refreshes_a_built_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from typer.testing import CliRunner
+
+    from tensor_grep.cli.main import app
+
+    monkeypatch.delenv("TG_SEMANTIC_INDEX_DIR", raising=False)
+    monkeypatch.setattr(
+        "tensor_grep.core.retrieval_dense.dense_available",
+        lambda: (False, "semantic ranking unavailable: model2vec not installed -- test stub"),
+    )
+    root = tmp_path / "repo"
+    _repo(root)
+    runner = CliRunner()
+    unindexed = runner.invoke(app, ["find", "invoice", str(root), "--json"])
+    assert unindexed.exit_code == 0, unindexed.output
+
+    built = runner.invoke(app, ["index", "semantic", str(root), "--json"])
+    assert built.exit_code == 0, built.output
+    assert json.loads(built.stdout)["chunked_files"] == 3
+
+    chunked: list[str] = []
+    real_chunk_file = chunk_file
+
+    def _counting_chunk_file(path: str, **kwargs: int) -> list:
+        chunked.append(path)
+        return real_chunk_file(path, **kwargs)
+
+    monkeypatch.setattr("tensor_grep.core.semantic_index.chunk_file", _counting_chunk_file)
+    indexed = runner.invoke(app, ["find", "invoice", str(root), "--json"])
+    assert indexed.exit_code == 0, indexed.output
+    assert json.loads(indexed.stdout)["matches"] == json.loads(unindexed.stdout)["matches"]
+    assert chunked == []
+
+    _bump(root / "render.py", "def render_invoice(invoice):\n    return invoice\n")
+    runner.invoke(app, ["find", "invoice", str(root), "--json"])
+    assert [Path(path).name for path in chunked] == ["render.py"]
+    status = semantic_index_status(root / ".tg_semantic_index")
+    assert (status["indexed_files"], status["stale_files"]) == (3, 0)
@@ -0,0 +1,205 @@
+"""The warm daemon's change journal: staleness checks narrowed to what changed since the last
+clean one, with the full stat sweep / re-walk as the fallback whenever the journal cannot say."""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import tensor_grep.cli.session_journal as session_journal
+import tensor_grep.cli.session_store as session_store
+from tensor_grep.cli.session_journal import (
+    ChangeJournal,
+    DirectoryMtimeJournal,
+    InotifyJournal,
+    start_change_journal,
+    stop_change_journal,
+)
+from tensor_grep.cli.session_store import (
+    _resolve_root,
+    _stale_changeset,
+    get_session,
+    open_session,
+    refresh_session,
+)
+
+
+def _repo(tmp_path: Path) -> Path:
+    root = tmp_path / "proj"
+    (root / "pkg").mkdir(parents=True)
+    for i in range(4):
+        (root / "pkg" / f"mod{i}.py").write_text(f"def fn{i}():\n    return {i}\n", "utf-8")
+    return _resolve_root(root)
+
+
+def _settle(root: Path) -> None:
+    # Backdate every directory so the polling journal does not treat its first scan as racy.
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, ns=(1_000_000_000, 1_000_000_000))
+
+
+class _WalkCounter:
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.calls = 0
+        original = session_store._iter_repo_files
+
+        def _counting(*args: Any, **kwargs: Any) -> list[Path]:
+            self.calls += 1
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(session_store, "_iter_repo_files", _counting)
+
+
+@pytest.fixture(params=["inotify", "poll"])
+def journaled_session(
+    request: pytest.FixtureRequest, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[tuple[Path, dict[str, Any], ChangeJournal]]:
+    if request.param == "inotify" and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux-only")
+    monkeypatch.setenv("TG_SESSION_DAEMON_JOURNAL", request.param)
+    root = _repo(tmp_path)
+    opened = open_session(str(root))
+    payload = get_session(opened.session_id, str(root))
+    _settle(root)
+    journal = start_change_journal(root)
+    assert journal is not None
+    if request.param == "inotify" and not isinstance(journal, InotifyJournal):
+        stop_change_journal(journal)
+        pytest.skip("inotify unavailable here")
+    assert journal.backend == request.param
+    try:
+        yield root, payload, journal
+    finally:
+        stop_change_journal(journal)
+
+
+def test_clean_checks_skip_the_walk_until_a_file_is_added(
+    journaled_session: tuple[Path, dict[str, Any], ChangeJournal],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root, payload, _ = journaled_session
+    walks = _WalkCounter(monkeypatch)
+
+    assert _stale_changeset(payload) == {"added": [], "modified": [], "removed": []}
+    assert walks.calls == 1
+    assert _stale_changeset(payload) == {"added": [], "modified": [], "removed": []}
+    assert walks.calls == 1
+
+    target = root / "pkg" / "mod1.py"
+    target.write_text("def fn1():\n    return 'edited'\n", "utf-8")
+    assert _stale_changeset(payload)["modified"] == [str(target)]
+    assert walks.calls == 1
+
+    new_file = root / "pkg" / "extra.py"
+    new_file.write_text("def extra():\n    return 0\n", "utf-8")
+    changeset = _stale_changeset(payload)
+    assert changeset["added"] == [str(new_file)]
+    assert walks.calls == 2
+
+
+def test_removed_files_are_reported_without_a_full_sweep(
+    journaled_session: tuple[Path, dict[str, Any], ChangeJournal],
+) -> None:
+    root, payload, _ = journaled_session
+    assert _stale_changeset(payload, detect_added_files=False) == {
+        "added": [],
+        "modified": [],
+        "removed": [],
+    }
+    gone = root / "pkg" / "mod2.py"
+    gone.unlink()
+
+    assert _stale_changeset(payload, detect_added_files=False)["removed"] == [str(gone)]
+
+
+def test_inotify_journal_narrows_to_changed_paths(tmp_path: Path) -> None:
+    if not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux-only")
+    root = _repo(tmp_path)
+    try:
+        journal = InotifyJournal(root)
+    except OSError:
+        pytest.skip("inotify unavailable here")
+    try:
+        start = journal.cursor()
+        (root / "pkg" / "mod0.py").write_text("x = 1\n", "utf-8")
+        journal.cursor()
+        assert journal.changed_paths_since(start) == {str(root / "pkg" / "mod0.py")}
+        assert journal.tree_changed_since(start) is False
+
+        # A new directory could hide files no watch saw being created: back to a full sweep.
+        middle = journal.cursor()
+        (root / "pkg" / "sub").mkdir()
+        journal.cursor()
+        assert journal.changed_paths_since(middle) is None
+        assert journal.tree_changed_since(middle) is True
+    finally:
+        journal.close()
+
+
+def test_refresh_uses_a_precomputed_changeset(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = _repo(tmp_path)
+    opened = open_session(str(root))
+    target = root / "pkg" / "mod3.py"
+    target.write_text("def renamed():\n    return 3\n", "utf-8")
+
+    def _no_rederive(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("refresh_session re-derived the changeset it was given")
+
+    monkeypatch.setattr(session_store, "_stale_changeset", _no_rederive)
+    result = refresh_session(
+        opened.session_id,
+        str(root),
+        changeset={"added": [], "modified": [str(target)], "removed": []},
+    )
+
+    assert result.refresh_type == "incremental"
+    symbols = get_session(opened.session_id, str(root))["repo_map"]["symbols"]
+    assert "renamed" in {symbol["name"] for symbol in symbols}
+
+
+def test_an_unlistable_directory_keeps_the_journal_from_vouching_for_the_tree(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = _repo(tmp_path)
+    _settle(root)
+    hidden = root / "pkg"
+    real_scandir = os.scandir
+
+    def _denied(path: Any) -> Any:
+        if Path(path) == hidden:
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(session_journal.os, "scandir", _denied)
+    journal = DirectoryMtimeJournal(root)
+    start = journal.cursor()
+
+    # Nothing changed on disk, yet every sync rescans: the subtree under pkg/ is unaccounted for.
+    assert journal.cursor() != start
+    assert journal.tree_changed_since(start) is True
+
+
+def test_a_file_added_within_one_coarse_mtime_tick_still_moves_the_cursor(tmp_path: Path) -> None:
+    root = _repo(tmp_path)
+    # A filesystem with one-second timestamps: the add below lands in the tick pkg/ is stamped
+    # with, so its directory mtime does not move.
+    tick_ns = time.time_ns() - 1_000_000_000
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, ns=(tick_ns, tick_ns))
+    journal = DirectoryMtimeJournal(root)
+    start = journal.cursor()
+
+    (root / "pkg" / "extra.py").write_text("def extra():\n    return 0\n", "utf-8")
+    os.utime(root / "pkg", ns=(tick_ns, tick_ns))
+
+    journal.cursor()
+    assert journal.tree_changed_since(start) is True
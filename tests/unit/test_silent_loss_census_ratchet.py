@@ -149,6 +149,11 @@ KNOWN_SILENT_LOSS_SITES: dict[str, int] = {
     # it exists to catch. Filed as a task to model the return-and-disclose shape properly rather
     # than by loosening the predicate.
     "checkpoint_store.py": 6,
+    # AUDITED (checkpoint blob store), accepted: `_reusable_paths` skips an entry it cannot lstat
+    # while collecting the paths whose bytes the blob store already holds. That set only SHRINKS
+    # the free-space requirement; a skipped entry is counted as new bytes, the conservative side,
+    # and the copy loop itself still fails loud on an unreadable source.
+    "checkpoint_blobs.py": 1,
     # AUDITED #292, all 8 accepted. The LSP legs (`_external_definitions` :15585,
     # `_external_references` :15693) skip a symbol whose LSP request failed, which lowers
     # `lsp_count` -- and `_provider_agreement` (:15258-15281) turns `native_count > lsp_count`
@@ -195,6 +200,15 @@ KNOWN_SILENT_LOSS_SITES: dict[str, int] = {
     # No `_UnreadablePathFlag` path: this module deliberately does not import `repo_map`
     # (cycle), and a boolean confirmation surface has no `unreadable_paths` consumer.
     "lang_c_cpp_include.py": 2,
+    # AUDITED (repo trigram index), all 3 accepted. The index only NARROWS the candidate set; a
+    # file it does not cover is always searched. `build_repo_trigram_index` skipping a file it
+    # cannot stat or read leaves it out of the manifest (unindexed) and counts it in `skipped`;
+    # `prune_repo_trigram_indexes` skipping an unreadable manifest in the cache dir only means
+    # a dead root's index is not reclaimed this time.
+    "repo_trigram_index.py": 3,
+    # AUDITED (late-interaction rerank), accepted: FALLBACK-ASSIGN. `_token_cache_for` stamps a
+    # model file it cannot stat as `missing` in the cache key and keeps going; nothing is dropped.
+    "retrieval_late.py": 1,
 }
 
 
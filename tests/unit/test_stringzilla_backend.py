@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from tensor_grep.backends.stringzilla_backend import StringZillaBackend
@@ -191,6 +193,8 @@ def test_stringzilla_rejects_stale_pre_fix_persistent_index(tmp_path, monkeypatc
 
     log_file = tmp_path / "sys.log"
     log_file.write_bytes(b"alpha needle one\r\nbeta line two\r\n")
+    # Settled: a file written within the racy window is never persisted.
+    os.utime(log_file, ns=(1_000_000_000_000_000_000, 1_000_000_000_000_000_000))
 
     backend = StringZillaBackend()
     cache_path = backend._get_index_cache_path(str(log_file), False, False)
@@ -198,7 +202,7 @@ def test_stringzilla_rejects_stale_pre_fix_persistent_index(tmp_path, monkeypatc
     # assertion + comment on CPUBackend's sibling test
     # (test_rejects_stale_pre_fix_persistent_literal_index) for why the payload-only check
     # below cannot catch a filename regression that silently drops the `-v{VERSION}` suffix.
-    assert cache_path.name.endswith(f"-v{_STRING_INDEX_CACHE_FORMAT_VERSION}.json")
+    assert cache_path.name.endswith(f"-v{_STRING_INDEX_CACHE_FORMAT_VERSION}.tgi")
     cache_path.parent.mkdir(parents=True, exist_ok=True)
     stale_payload = {
         # No "format_version" key at all -- the exact pre-#262 on-disk shape.
@@ -214,9 +218,15 @@ def test_stringzilla_rejects_stale_pre_fix_persistent_index(tmp_path, monkeypatc
     assert result.routing_reason == "stringzilla_fixed_strings_index"  # fresh, not "_cache"
     assert result.matches[0].text == "alpha needle one\r"
 
-    rewritten = json.loads(cache_path.read_text(encoding="utf-8"))
-    assert rewritten["format_version"] == _STRING_INDEX_CACHE_FORMAT_VERSION
-    assert rewritten["lines"] == ["alpha needle one\r", "beta line two\r"]
+    from tensor_grep.core.line_trigram_index import MappedLineTrigramIndex
+
+    with MappedLineTrigramIndex.open(
+        cache_path,
+        source_path=str(log_file),
+        file_signature=backend._build_file_signature(str(log_file)),
+    ) as rewritten:
+        assert list(rewritten.lines) == ["alpha needle one\r", "beta line two\r"]
+        assert rewritten["alp"] == [0]
 
 
 def test_stringzilla_invalidates_persistent_trigram_index_when_file_changes(tmp_path, monkeypatch):
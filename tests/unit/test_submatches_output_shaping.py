@@ -8,7 +8,6 @@ occurrence's true byte column. Non-rg backends / context lines (no submatches) a
 from __future__ import annotations
 
 import json as _json
-from types import SimpleNamespace
 
 import tensor_grep.backends.ripgrep_backend as rb
 from tensor_grep.backends.ripgrep_backend import RipgrepBackend
@@ -31,7 +30,7 @@ def _multi_match_line() -> MatchLine:
     )
 
 
-def test_backend_stashes_submatches_without_inflating_count(monkeypatch) -> None:
+def test_backend_stashes_submatches_without_inflating_count(monkeypatch, canned_rg_json) -> None:
     record = {
         "type": "match",
         "data": {
@@ -44,8 +43,7 @@ def test_backend_stashes_submatches_without_inflating_count(monkeypatch) -> None
             ],
         },
     }
-    fake = SimpleNamespace(returncode=0, stdout=_json.dumps(record) + "\n", stderr="")
-    monkeypatch.setattr(rb, "run_subprocess", lambda *a, **k: fake)
+    monkeypatch.setattr(rb, "popen_rg_json", canned_rg_json(0, _json.dumps(record) + "\n"))
     monkeypatch.setattr(RipgrepBackend, "_get_binary_name", lambda self: "rg")
 
     result = RipgrepBackend().search("a.log", "foo", SearchConfig())
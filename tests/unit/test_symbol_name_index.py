@@ -0,0 +1,92 @@
+from tensor_grep.core.symbol_name_index import (
+    SymbolNameIndex,
+    cached_symbol_name_index,
+    symbol_name_index_for_map,
+)
+
+
+def _symbol(name: str, file: str, line: int = 1, kind: str = "function") -> dict:
+    return {"name": name, "file": file, "line": line, "kind": kind}
+
+
+def _names(records: list[dict]) -> list[str]:
+    return [str(record["name"]) for record in records]
+
+
+def _linear_substring_names(symbols: list[dict], query: str) -> set[str]:
+    return {str(symbol["name"]) for symbol in symbols if query in str(symbol["name"]).lower()}
+
+
+_SYMBOLS = [
+    _symbol("create_invoice", "billing.py", 3),
+    _symbol("Invoice", "models.py", 1, "class"),
+    _symbol("InvoiceStore", "models.py", 20, "class"),
+    _symbol("reinvoice", "jobs.py", 5),
+    _symbol("HTTPServer", "server.py", 1, "class"),
+    _symbol("parse", "billing.py", 40),
+    _symbol("parse", "models.py", 60),
+]
+
+
+def test_ranking_prefers_exact_then_prefix_then_camel_humps_then_substrings():
+    index = SymbolNameIndex(_SYMBOLS)
+
+    assert _names(index.search("invoice", limit=10)) == [
+        "Invoice",
+        "InvoiceStore",
+        "create_invoice",
+        "reinvoice",
+    ]
+    assert _names(index.search("ci", limit=10)) == ["create_invoice"]
+    assert _names(index.search("crInv", limit=10)) == ["create_invoice"]
+    assert _names(index.search("hs", limit=10)) == ["HTTPServer"]
+    assert _names(index.search("server", limit=10)) == ["HTTPServer"]
+
+
+def test_search_returns_at_most_limit_records_and_every_substring_match():
+    index = SymbolNameIndex(_SYMBOLS)
+
+    assert _names(index.search("invoice", limit=2)) == ["Invoice", "InvoiceStore"]
+    assert [(record["file"], record["line"]) for record in index.search("parse", limit=10)] == [
+        ("billing.py", 40),
+        ("models.py", 60),
+    ]
+    for query in ("voic", "nvo", "ser", "e"):
+        found = set(_names(index.search(query, limit=100)))
+        assert _linear_substring_names(_SYMBOLS, query) <= found
+
+
+def test_exact_and_per_file_lookups_keep_map_order():
+    index = SymbolNameIndex(_SYMBOLS)
+
+    assert index.exact("parse") == [_SYMBOLS[5], _SYMBOLS[6]]
+    assert index.exact("PARSE") == []
+    assert _names(index.in_file("models.py")) == ["Invoice", "InvoiceStore", "parse"]
+
+
+def test_replacing_files_updates_a_copy_and_matches_a_fresh_build():
+    index = SymbolNameIndex(_SYMBOLS)
+    index.search("inv", limit=10)
+    replacement = [_symbol("invoice_total", "billing.py", 3), _symbol("parse", "billing.py", 9)]
+
+    updated = index.replacing_files({"billing.py"}, replacement)
+
+    fresh = SymbolNameIndex(
+        [symbol for symbol in _SYMBOLS if symbol["file"] != "billing.py"] + replacement
+    )
+    for query in ("inv", "ci", "it", "parse", "total", ""):
+        assert updated.search(query, limit=10) == fresh.search(query, limit=10)
+    assert "create_invoice" in _names(index.search("inv", limit=10))
+    assert "create_invoice" not in _names(updated.search("inv", limit=10))
+    assert _names(index.in_file("billing.py")) == ["create_invoice", "parse"]
+
+
+def test_the_index_is_cached_with_the_symbol_list_it_was_built_from():
+    repo_map = {"symbols": list(_SYMBOLS)}
+
+    index = symbol_name_index_for_map(repo_map)
+
+    assert symbol_name_index_for_map(repo_map) is index
+    assert cached_symbol_name_index({"symbols": list(_SYMBOLS)}) is None
+    repo_map["symbols"] = [*repo_map["symbols"], _symbol("late", "late.py")]
+    assert symbol_name_index_for_map(repo_map) is not index